@@ -2,9 +2,11 @@
 
 from typing import Dict, List  # noqa: F401
 import importlib
+import json
 import pkgutil
 
 from api_hub.apis.api_specs_api_base import BaseAPISpecsApi
+from api_hub.impl_registry import impl_registry
 import openapi_server.impl
 
 from fastapi import (  # noqa: F401
@@ -17,16 +19,26 @@ from fastapi import (  # noqa: F401
     HTTPException,
     Path,
     Query,
+    Request,
     Response,
     Security,
     status,
 )
 
 from api_hub.models.extra_models import TokenModel  # noqa: F401
-from pydantic import Field, StrictInt
-from typing import Any, List
+from api_hub.conditional import Validators, has_conditional_headers, is_not_modified, not_modified_response, set_validator_headers, version_etag
+from api_hub.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, Page, parse_ids, set_pagination_headers
+from api_hub.streaming import NDJSON_MEDIA_TYPE, streaming_list_response
+from pydantic import Field, StrictInt, StrictStr, TypeAdapter
+from typing import Any, List, Optional, Union
 from typing_extensions import Annotated
 from api_hub.models.api_spec import APISpec
+from api_hub.models.api_spec_diff import APISpecDiff
+from api_hub.models.api_spec_revision import APISpecRevision
+from api_hub.models.api_spec_search_result import APISpecSearchResult
+from api_hub.models.api_spec_summary import APISpecSummary
+from api_hub.models.api_spec_usage import APISpecUsage
+from api_hub.models.batch_item_result import BatchItemResult
 
 
 router = APIRouter()
@@ -35,12 +47,69 @@ ns_pkg = openapi_server.impl
 for _, name, _ in pkgutil.iter_modules(ns_pkg.__path__, ns_pkg.__name__ + "."):
     importlib.import_module(name)
 
+# 구현체는 애플리케이션 수명 동안 한 번만 생성되어 의존성으로 주입된다.
+get_impl = impl_registry.provider(BaseAPISpecsApi)
+
+# 요약 목록 직렬화기 (요청된 필드만 출력)
+_summaries_adapter = TypeAdapter(List[APISpecSummary])
+
+
+# /api_specs/{api_spec_id}보다 먼저 등록해야 search, usages가 api_spec_id로 해석되지 않는다.
+@router.get(
+    "/api_specs/search",
+    responses={
+        200: {"model": List[APISpecSearchResult], "description": "API specifications matching the search terms, most relevant first", "headers": {"X-Next-Cursor": {"description": "The cursor of the next page", "schema": {"type": "string"}}, "Link": {"description": "The URL of the next page (rel=\"next\")", "schema": {"type": "string"}}}},
+        400: {"description": "Invalid cursor"},
+    },
+    tags=["API Specs"],
+    summary="Search API specifications",
+    response_model_by_alias=True,
+)
+async def api_specs_search_get(
+    request: Request,
+    response: Response,
+    q: Annotated[StrictStr, Field(min_length=1, description="The search terms (paths, operationIds, tags, summaries, schema names, title and description)")] = Query(..., description="The search terms (paths, operationIds, tags, summaries, schema names, title and description)", alias="q", min_length=1),
+    limit: Annotated[Optional[int], Field(le=MAX_PAGE_SIZE, ge=1, description="The maximum number of items to return")] = Query(DEFAULT_PAGE_SIZE, description="The maximum number of items to return", alias="limit", ge=1, le=MAX_PAGE_SIZE),
+    cursor: Annotated[Optional[StrictStr], Field(description="The cursor returned by the previous page (X-Next-Cursor)")] = Query(None, description="The cursor returned by the previous page (X-Next-Cursor)", alias="cursor"),
+    project_id: Annotated[Optional[int], Field(description="Only search API specifications of this project")] = Query(None, description="Only search API specifications of this project", alias="project_id"),
+    impl: BaseAPISpecsApi = Depends(get_impl),
+) -> List[APISpecSearchResult]:
+    page = await impl.api_specs_search_get(q, limit, cursor, project_id)
+    set_pagination_headers(request, response, page)
+    return page.items
+
+
+@router.get(
+    "/api_specs/usages",
+    responses={
+        200: {"model": List[APISpecUsage], "description": "API specifications declaring or referencing the component, or declaring the operation", "headers": {"X-Next-Cursor": {"description": "The cursor of the next page", "schema": {"type": "string"}}, "Link": {"description": "The URL of the next page (rel=\"next\")", "schema": {"type": "string"}}}},
+        400: {"description": "Exactly one of component or operation is required, invalid operation or invalid cursor"},
+    },
+    tags=["API Specs"],
+    summary="Find usages of a component or operation across API specifications",
+    response_model_by_alias=True,
+)
+async def api_specs_usages_get(
+    request: Request,
+    response: Response,
+    component: Annotated[Optional[StrictStr], Field(description="The component name (User, schemas/User or #/components/schemas/User)")] = Query(None, description="The component name (User, schemas/User or #/components/schemas/User)", alias="component"),
+    operation: Annotated[Optional[StrictStr], Field(description="The operation in the form 'METHOD /path' (e.g. POST /orders)")] = Query(None, description="The operation in the form 'METHOD /path' (e.g. POST /orders)", alias="operation"),
+    limit: Annotated[Optional[int], Field(le=MAX_PAGE_SIZE, ge=1, description="The maximum number of items to return")] = Query(DEFAULT_PAGE_SIZE, description="The maximum number of items to return", alias="limit", ge=1, le=MAX_PAGE_SIZE),
+    cursor: Annotated[Optional[StrictStr], Field(description="The cursor returned by the previous page (X-Next-Cursor)")] = Query(None, description="The cursor returned by the previous page (X-Next-Cursor)", alias="cursor"),
+    impl: BaseAPISpecsApi = Depends(get_impl),
+) -> List[APISpecUsage]:
+    page = await impl.api_specs_usages_get(component, operation, limit, cursor)
+    set_pagination_headers(request, response, page)
+    return page.items
+
 
 @router.delete(
     "/api_specs/{api_spec_id}",
     responses={
         204: {"description": "API specification deleted successfully"},
         404: {"description": "API specification not found"},
+        412: {"description": "The API specification has been modified (If-Match does not match)"},
+        428: {"description": "If-Match header is required"},
     },
     tags=["API Specs"],
     summary="Delete API specification",
@@ -48,53 +117,210 @@ for _, name, _ in pkgutil.iter_modules(ns_pkg.__path__, ns_pkg.__name__ + "."):
 )
 async def api_specs_api_spec_id_delete(
     api_spec_id: Annotated[StrictInt, Field(description="The ID of the API specification to delete")] = Path(..., description="The ID of the API specification to delete"),
+    if_match: Annotated[Optional[StrictStr], Field(description="The ETag of the API specification the request is based on (\"*\" for any version)")] = Header(None, description="The ETag of the API specification the request is based on (\"*\" for any version)", alias="If-Match"),
+    impl: BaseAPISpecsApi = Depends(get_impl),
 ) -> None:
-    if not BaseAPISpecsApi.subclasses:
-        raise HTTPException(status_code=500, detail="Not implemented")
-    return await BaseAPISpecsApi.subclasses[0]().api_specs_api_spec_id_delete(api_spec_id)
+    return await impl.api_specs_api_spec_id_delete(api_spec_id, if_match)
 
 
 @router.get(
     "/api_specs/{api_spec_id}",
     responses={
-        200: {"model": APISpec, "description": "API specification details"},
+        200: {"model": APISpec, "description": "API specification details", "headers": {"ETag": {"description": "Strong entity tag of the API specification", "schema": {"type": "string"}}, "Last-Modified": {"description": "Last modification date of the API specification", "schema": {"type": "string"}}}},
+        304: {"description": "Not modified (If-None-Match / If-Modified-Since matched)"},
         404: {"description": "API specification not found"},
     },
     tags=["API Specs"],
     summary="Get API specification by ID",
     response_model_by_alias=True,
+    response_model=None,
 )
 async def api_specs_api_spec_id_get(
+    request: Request,
     api_spec_id: Annotated[StrictInt, Field(description="The ID of the API specification to retrieve")] = Path(..., description="The ID of the API specification to retrieve"),
-) -> APISpec:
-    if not BaseAPISpecsApi.subclasses:
-        raise HTTPException(status_code=500, detail="Not implemented")
-    return await BaseAPISpecsApi.subclasses[0]().api_specs_api_spec_id_get(api_spec_id)
+    impl: BaseAPISpecsApi = Depends(get_impl),
+) -> Response:
+    # 조건부 요청이면 변경이 없을 때 spec_content를 읽지 않고 304 응답
+    if has_conditional_headers(request):
+        validators = await impl.api_specs_api_spec_id_validators(api_spec_id)
+        if validators is not None and is_not_modified(request, validators):
+            return not_modified_response(validators)
+    # 저장된 JSON 본문을 재검증/재인코딩 없이 그대로 응답 (검증자는 본문과 같은 조회/캐시 항목에서 가져온다)
+    body, validators = await impl.api_specs_api_spec_id_get_json_with_validators(api_spec_id)
+    api_spec = Response(content=body, media_type="application/json")
+    if validators is not None:
+        set_validator_headers(api_spec, validators)
+    return api_spec
 
 
 @router.put(
     "/api_specs/{api_spec_id}",
     responses={
-        200: {"model": APISpec, "description": "API specification updated successfully"},
+        200: {"model": APISpec, "description": "API specification updated successfully", "headers": {"ETag": {"description": "Entity tag of the API specification version, send it back in If-Match", "schema": {"type": "string"}}}},
         400: {"description": "Invalid input"},
+        404: {"description": "API specification not found"},
+        412: {"description": "The API specification has been modified (If-Match does not match)"},
+        428: {"description": "If-Match header is required"},
     },
     tags=["API Specs"],
     summary="Update API specification",
     response_model_by_alias=True,
 )
 async def api_specs_api_spec_id_put(
+    response: Response,
     api_spec_id: Annotated[StrictInt, Field(description="The ID of the API specification to update")] = Path(..., description="The ID of the API specification to update"),
     api_spec: APISpec = Body(None, description=""),
+    if_match: Annotated[Optional[StrictStr], Field(description="The ETag of the API specification the request is based on (\"*\" for any version)")] = Header(None, description="The ETag of the API specification the request is based on (\"*\" for any version)", alias="If-Match"),
+    impl: BaseAPISpecsApi = Depends(get_impl),
+) -> APISpec:
+    updated = await impl.api_specs_api_spec_id_put(api_spec_id, api_spec, if_match)
+    # 다음 수정의 If-Match로 쓸 새 ETag
+    response.headers["ETag"] = version_etag(updated.row_version)
+    return updated
+
+
+# PATCH 요청 본문 형식 (application/json은 배열이면 JSON Patch, 객체이면 Merge Patch)
+JSON_PATCH_MEDIA_TYPE = "application/json-patch+json"
+MERGE_PATCH_MEDIA_TYPE = "application/merge-patch+json"
+
+
+@router.patch(
+    "/api_specs/{api_spec_id}",
+    responses={
+        200: {"model": APISpec, "description": "API specification patched successfully", "headers": {"ETag": {"description": "Strong entity tag of the patched API specification", "schema": {"type": "string"}}}},
+        400: {"description": "Invalid JSON body"},
+        404: {"description": "API specification not found"},
+        412: {"description": "The API specification has been modified (If-Match does not match)"},
+        415: {"description": "Unsupported patch media type"},
+        422: {"description": "The patch cannot be applied"},
+        428: {"description": "If-Match header is required"},
+    },
+    tags=["API Specs"],
+    summary="Patch API specification content",
+    response_model_by_alias=True,
+    openapi_extra={"requestBody": {"required": True, "content": {
+        JSON_PATCH_MEDIA_TYPE: {"schema": {"type": "array", "items": {"type": "object"}}},
+        MERGE_PATCH_MEDIA_TYPE: {"schema": {"type": "object"}},
+    }}},
+)
+async def api_specs_api_spec_id_patch(
+    request: Request,
+    response: Response,
+    api_spec_id: Annotated[StrictInt, Field(description="The ID of the API specification to patch")] = Path(..., description="The ID of the API specification to patch"),
+    if_match: Annotated[Optional[StrictStr], Field(description="The ETag of the API specification the patch is based on")] = Header(None, description="The ETag of the API specification the patch is based on", alias="If-Match"),
+    impl: BaseAPISpecsApi = Depends(get_impl),
 ) -> APISpec:
-    if not BaseAPISpecsApi.subclasses:
-        raise HTTPException(status_code=500, detail="Not implemented")
-    return await BaseAPISpecsApi.subclasses[0]().api_specs_api_spec_id_put(api_spec_id, api_spec)
+    try:
+        patch = json.loads(await request.body())
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid JSON body")
+    media_type = request.headers.get("content-type", "").split(";")[0].strip().lower()
+    if media_type == JSON_PATCH_MEDIA_TYPE:
+        merge = False
+    elif media_type == MERGE_PATCH_MEDIA_TYPE:
+        merge = True
+    elif media_type == "application/json":
+        merge = not isinstance(patch, list)
+    else:
+        raise HTTPException(status_code=415, detail=f"Unsupported media type; use {JSON_PATCH_MEDIA_TYPE} or {MERGE_PATCH_MEDIA_TYPE}")
+
+    api_spec = await impl.api_specs_api_spec_id_patch(api_spec_id, patch, merge, if_match)
+    # 다음 수정의 If-Match로 쓸 새 ETag
+    response.headers["ETag"] = version_etag(api_spec.row_version)
+    return api_spec
+
+
+@router.get(
+    "/api_specs/{api_spec_id}/content",
+    responses={
+        200: {"description": "The values referenced by the JSON pointers, keyed by pointer", "content": {"application/json": {"schema": {"type": "object", "additionalProperties": True}}}, "headers": {"ETag": {"description": "Strong entity tag of the partial content", "schema": {"type": "string"}}, "Last-Modified": {"description": "Last modification date of the API specification", "schema": {"type": "string"}}}},
+        304: {"description": "Not modified (If-None-Match / If-Modified-Since matched)"},
+        400: {"description": "Invalid JSON pointer or too many pointers"},
+        404: {"description": "API specification or referenced value not found"},
+    },
+    tags=["API Specs"],
+    summary="Get parts of an API specification content by JSON pointer",
+    response_model_by_alias=True,
+    response_model=None,
+)
+async def api_specs_api_spec_id_content_get(
+    request: Request,
+    api_spec_id: Annotated[StrictInt, Field(description="The ID of the API specification")] = Path(..., description="The ID of the API specification"),
+    pointer: Annotated[List[StrictStr], Field(description="JSON pointers (RFC 6901) into spec_content, e.g. /paths/~1users (repeat for several parts)")] = Query(..., description="JSON pointers (RFC 6901) into spec_content, e.g. /paths/~1users (repeat for several parts)", alias="pointer"),
+    impl: BaseAPISpecsApi = Depends(get_impl),
+) -> Response:
+    # 스펙이 바뀌지 않았으면 부분 내용도 같으므로 spec_content를 읽지 않고 304 응답
+    validators = await impl.api_specs_api_spec_id_validators(api_spec_id)
+    if validators is not None:
+        validators = validators.for_variant("content", *pointer)
+        if is_not_modified(request, validators):
+            return not_modified_response(validators)
+    content = Response(content=await impl.api_specs_api_spec_id_content_get(api_spec_id, pointer), media_type="application/json")
+    if validators is not None:
+        set_validator_headers(content, validators)
+    return content
+
+
+@router.get(
+    "/api_specs/{api_spec_id}/diff/{other_id}",
+    responses={
+        200: {"model": APISpecDiff, "description": "Structural differences from the API specification to the other one"},
+        404: {"description": "API specification not found"},
+    },
+    tags=["API Specs"],
+    summary="Compare two API specifications",
+    response_model_by_alias=True,
+)
+async def api_specs_api_spec_id_diff_other_id_get(
+    api_spec_id: Annotated[StrictInt, Field(description="The ID of the base API specification")] = Path(..., description="The ID of the base API specification"),
+    other_id: Annotated[StrictInt, Field(description="The ID of the API specification to compare with")] = Path(..., description="The ID of the API specification to compare with"),
+    impl: BaseAPISpecsApi = Depends(get_impl),
+) -> APISpecDiff:
+    return await impl.api_specs_api_spec_id_diff_other_id_get(api_spec_id, other_id)
+
+
+@router.get(
+    "/api_specs/{api_spec_id}/revisions",
+    responses={
+        200: {"model": List[APISpecRevision], "description": "Revisions of the API specification, newest first"},
+        404: {"description": "API specification not found"},
+    },
+    tags=["API Specs"],
+    summary="List revisions of an API specification",
+    response_model_by_alias=True,
+)
+async def api_specs_api_spec_id_revisions_get(
+    api_spec_id: Annotated[StrictInt, Field(description="The ID of the API specification")] = Path(..., description="The ID of the API specification"),
+    limit: Annotated[Optional[int], Field(le=MAX_PAGE_SIZE, ge=1, description="The maximum number of revisions to return")] = Query(DEFAULT_PAGE_SIZE, description="The maximum number of revisions to return", alias="limit", ge=1, le=MAX_PAGE_SIZE),
+    before: Annotated[Optional[int], Field(ge=1, description="Only return revisions older than this revision number")] = Query(None, description="Only return revisions older than this revision number", alias="before", ge=1),
+    impl: BaseAPISpecsApi = Depends(get_impl),
+) -> List[APISpecRevision]:
+    return await impl.api_specs_api_spec_id_revisions_get(api_spec_id, limit, before)
+
+
+@router.get(
+    "/api_specs/{api_spec_id}/revisions/{revision}",
+    responses={
+        200: {"model": APISpecRevision, "description": "The API specification reconstructed at the revision"},
+        404: {"description": "API specification or revision not found"},
+    },
+    tags=["API Specs"],
+    summary="Get a revision of an API specification",
+    response_model_by_alias=True,
+)
+async def api_specs_api_spec_id_revisions_revision_get(
+    api_spec_id: Annotated[StrictInt, Field(description="The ID of the API specification")] = Path(..., description="The ID of the API specification"),
+    revision: Annotated[StrictInt, Field(description="The revision number")] = Path(..., description="The revision number"),
+    impl: BaseAPISpecsApi = Depends(get_impl),
+) -> APISpecRevision:
+    return await impl.api_specs_api_spec_id_revisions_revision_get(api_spec_id, revision)
 
 
 @router.get(
     "/api_specs",
     responses={
-        200: {"model": List[APISpec], "description": "List of API specifications"},
+        200: {"model": List[APISpec], "description": "List of API specifications", "content": {NDJSON_MEDIA_TYPE: {}}, "headers": {"X-Next-Cursor": {"description": "The cursor of the next page", "schema": {"type": "string"}}, "Link": {"description": "The URL of the next page (rel=\"next\")", "schema": {"type": "string"}}, "ETag": {"description": "Strong entity tag of the response", "schema": {"type": "string"}}, "Last-Modified": {"description": "Last modification date of the response", "schema": {"type": "string"}}}},
+        304: {"description": "Not modified (If-None-Match / If-Modified-Since matched)"},
         404: {"description": "API specifications not found"},
     },
     tags=["API Specs"],
@@ -102,10 +328,113 @@ async def api_specs_api_spec_id_put(
     response_model_by_alias=True,
 )
 async def api_specs_get(
+    request: Request,
+    response: Response,
+    limit: Annotated[Optional[int], Field(le=MAX_PAGE_SIZE, ge=1, description="The maximum number of items to return")] = Query(DEFAULT_PAGE_SIZE, description="The maximum number of items to return", alias="limit", ge=1, le=MAX_PAGE_SIZE),
+    cursor: Annotated[Optional[StrictStr], Field(description="The cursor returned by the previous page (X-Next-Cursor)")] = Query(None, description="The cursor returned by the previous page (X-Next-Cursor)", alias="cursor"),
+    sort: Annotated[Optional[StrictStr], Field(description="The sort key of the page (id or updated_at)")] = Query("id", description="The sort key of the page (id or updated_at)", alias="sort", pattern="^(id|updated_at)$"),
+    stream: Annotated[Optional[StrictStr], Field(description="Stream all API specifications as NDJSON (ndjson) or a chunked JSON array (json) instead of a single page")] = Query(None, description="Stream all API specifications as NDJSON (ndjson) or a chunked JSON array (json) instead of a single page", alias="stream", pattern="^(ndjson|json)$"),
+    project_id: Annotated[Optional[int], Field(description="Only return API specifications of this project")] = Query(None, description="Only return API specifications of this project", alias="project_id"),
+    include_content: Annotated[Optional[bool], Field(description="Whether to include spec_content. When false, APISpecSummary items are returned")] = Query(True, description="Whether to include spec_content. When false, APISpecSummary items are returned", alias="include_content"),
+    fields: Annotated[Optional[StrictStr], Field(description="Comma separated APISpecSummary properties to return (implies include_content=false)")] = Query(None, description="Comma separated APISpecSummary properties to return (implies include_content=false)", alias="fields"),
+    ids: Annotated[Optional[StrictStr], Field(description="Comma separated IDs to return in request order (ignores paging parameters)")] = Query(None, description="Comma separated IDs to return in request order (ignores paging parameters)", alias="ids"),
+    impl: BaseAPISpecsApi = Depends(get_impl),
 ) -> List[APISpec]:
-    if not BaseAPISpecsApi.subclasses:
-        raise HTTPException(status_code=500, detail="Not implemented")
-    return await BaseAPISpecsApi.subclasses[0]().api_specs_get()
+    if ids is not None:
+        return await impl.api_specs_by_ids_get(parse_ids(ids))
+    if stream:
+        return streaming_list_response(impl.api_specs_stream(), stream)
+    # 조건부 요청이면 변경이 없을 때 목록을 읽지 않고 304 응답
+    if has_conditional_headers(request):
+        validators = await _list_validators(request, impl, limit, cursor, sort, project_id)
+        if validators is not None and is_not_modified(request, validators):
+            return not_modified_response(validators)
+    if fields or not include_content:
+        return await _api_spec_summaries(request, impl, limit, cursor, sort, project_id, fields)
+    page = await impl.api_specs_get(limit, cursor, sort, project_id)
+    _set_page_headers(request, response, page)
+    return page.items
+
+
+@router.get(
+    "/projects/{project_id}/api_specs",
+    responses={
+        200: {"model": List[APISpecSummary], "description": "List of API specifications of the project", "headers": {"X-Next-Cursor": {"description": "The cursor of the next page", "schema": {"type": "string"}}, "Link": {"description": "The URL of the next page (rel=\"next\")", "schema": {"type": "string"}}, "ETag": {"description": "Strong entity tag of the response", "schema": {"type": "string"}}, "Last-Modified": {"description": "Last modification date of the response", "schema": {"type": "string"}}}},
+        304: {"description": "Not modified (If-None-Match / If-Modified-Since matched)"},
+    },
+    tags=["API Specs"],
+    summary="Get API specifications of a project",
+    response_model_by_alias=True,
+    response_model=None,
+)
+async def projects_project_id_api_specs_get(
+    request: Request,
+    response: Response,
+    project_id: Annotated[StrictInt, Field(description="The ID of the project")] = Path(..., description="The ID of the project"),
+    limit: Annotated[Optional[int], Field(le=MAX_PAGE_SIZE, ge=1, description="The maximum number of items to return")] = Query(DEFAULT_PAGE_SIZE, description="The maximum number of items to return", alias="limit", ge=1, le=MAX_PAGE_SIZE),
+    cursor: Annotated[Optional[StrictStr], Field(description="The cursor returned by the previous page (X-Next-Cursor)")] = Query(None, description="The cursor returned by the previous page (X-Next-Cursor)", alias="cursor"),
+    sort: Annotated[Optional[StrictStr], Field(description="The sort key of the page (id or updated_at)")] = Query("id", description="The sort key of the page (id or updated_at)", alias="sort", pattern="^(id|updated_at)$"),
+    include_content: Annotated[Optional[bool], Field(description="Whether to include spec_content. When false, APISpecSummary items are returned")] = Query(False, description="Whether to include spec_content. When false, APISpecSummary items are returned", alias="include_content"),
+    fields: Annotated[Optional[StrictStr], Field(description="Comma separated APISpecSummary properties to return (implies include_content=false)")] = Query(None, description="Comma separated APISpecSummary properties to return (implies include_content=false)", alias="fields"),
+    impl: BaseAPISpecsApi = Depends(get_impl),
+) -> Union[List[APISpecSummary], List[APISpec]]:
+    # 조건부 요청이면 변경이 없을 때 목록을 읽지 않고 304 응답
+    if has_conditional_headers(request):
+        validators = await _list_validators(request, impl, limit, cursor, sort, project_id)
+        if validators is not None and is_not_modified(request, validators):
+            return not_modified_response(validators)
+    if fields or not include_content:
+        return await _api_spec_summaries(request, impl, limit, cursor, sort, project_id, fields)
+    page = await impl.api_specs_get(limit, cursor, sort, project_id)
+    _set_page_headers(request, response, page)
+    return page.items
+
+
+async def _list_validators(
+    request: Request,
+    impl: BaseAPISpecsApi,
+    limit: int,
+    cursor: Optional[str],
+    sort: str,
+    project_id: Optional[int],
+) -> Optional[Validators]:
+    """목록 페이지 검증자를 요청 경로/쿼리(표현)별로 구분하여 반환한다. (조건부 요청의 304 검사용)"""
+    return _variant(request, await impl.api_specs_validators(limit, cursor, sort, project_id))
+
+
+def _variant(request: Request, validators: Optional[Validators]) -> Optional[Validators]:
+    """검증자를 요청 경로/쿼리(표현)별로 구분한 검증자로 바꾼다."""
+    if validators is None:
+        return None
+    return validators.for_variant(request.url.path, request.url.query)
+
+
+def _set_page_headers(request: Request, response: Response, page: Page) -> None:
+    """페이지를 조회한 행으로 계산한 검증자와 다음 페이지 헤더를 설정한다."""
+    validators = _variant(request, page.validators)
+    if validators is not None:
+        set_validator_headers(response, validators)
+    set_pagination_headers(request, response, page)
+
+
+async def _api_spec_summaries(
+    request: Request,
+    impl: BaseAPISpecsApi,
+    limit: int,
+    cursor: Optional[str],
+    sort: str,
+    project_id: Optional[int],
+    fields: Optional[str],
+) -> Response:
+    """spec_content를 제외한 요약 목록을 요청된 필드만 직렬화하여 반환한다."""
+    field_names = [name.strip() for name in fields.split(",") if name.strip()] if fields else None
+    page = await impl.api_specs_summaries_get(limit, cursor, sort, project_id, field_names)
+    summaries = Response(
+        content=_summaries_adapter.dump_json(page.items, by_alias=True, exclude_unset=True),
+        media_type="application/json",
+    )
+    _set_page_headers(request, summaries, page)
+    return summaries
 
 
 @router.post(
@@ -120,7 +449,24 @@ async def api_specs_get(
 )
 async def api_specs_post(
     api_spec: APISpec = Body(None, description=""),
+    impl: BaseAPISpecsApi = Depends(get_impl),
 ) -> APISpec:
-    if not BaseAPISpecsApi.subclasses:
-        raise HTTPException(status_code=500, detail="Not implemented")
-    return await BaseAPISpecsApi.subclasses[0]().api_specs_post(api_spec)
+    return await impl.api_specs_post(api_spec)
+
+
+@router.post(
+    "/api_specs:batch",
+    responses={
+        200: {"model": List[BatchItemResult], "description": "Per-item results of the batch (status 201, 400 or 409 per item)"},
+        400: {"description": "Invalid input or batch too large"},
+        409: {"description": "Batch insert failed (no item was created)"},
+    },
+    tags=["API Specs"],
+    summary="Create API specifications in batch",
+    response_model_by_alias=True,
+)
+async def api_specs_batch_post(
+    api_specs: List[APISpec] = Body(..., description=""),
+    impl: BaseAPISpecsApi = Depends(get_impl),
+) -> List[BatchItemResult]:
+    return await impl.api_specs_batch_post(api_specs)
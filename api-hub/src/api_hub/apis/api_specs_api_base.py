@@ -1,11 +1,19 @@
 # coding: utf-8
 
-from typing import ClassVar, Dict, List, Tuple  # noqa: F401
+from typing import AsyncIterator, ClassVar, Dict, List, Tuple  # noqa: F401
 
-from pydantic import Field, StrictInt
-from typing import Any, List
+from pydantic import Field, StrictBool, StrictInt, StrictStr
+from typing import Any, List, Optional
 from typing_extensions import Annotated
 from api_hub.models.api_spec import APISpec
+from api_hub.models.api_spec_diff import APISpecDiff
+from api_hub.models.api_spec_revision import APISpecRevision
+from api_hub.models.api_spec_search_result import APISpecSearchResult
+from api_hub.models.api_spec_usage import APISpecUsage
+from api_hub.models.api_spec_summary import APISpecSummary
+from api_hub.conditional import Validators
+from api_hub.models.batch_item_result import BatchItemResult
+from api_hub.pagination import Page
 
 
 class BaseAPISpecsApi:
@@ -17,6 +25,7 @@ class BaseAPISpecsApi:
     async def api_specs_api_spec_id_delete(
         self,
         api_spec_id: Annotated[StrictInt, Field(description="The ID of the API specification to delete")],
+        if_match: Annotated[Optional[StrictStr], Field(description="The ETag of the API specification the request is based on (\"*\" for any version)")] = None,
     ) -> None:
         ...
 
@@ -28,20 +37,153 @@ class BaseAPISpecsApi:
         ...
 
 
+    async def api_specs_api_spec_id_validators(
+        self,
+        api_spec_id: Annotated[StrictInt, Field(description="The ID of the API specification to retrieve")],
+    ) -> Validators:
+        ...
+
+
+    async def api_specs_api_spec_id_get_json(
+        self,
+        api_spec_id: Annotated[StrictInt, Field(description="The ID of the API specification to retrieve")],
+    ) -> bytes:
+        """직렬화된 APISpec JSON 본문을 반환한다. 구현체가 재정의하지 않으면 모델을 직렬화한다."""
+        api_spec = await self.api_specs_api_spec_id_get(api_spec_id)
+        return api_spec.model_dump_json(by_alias=True).encode()
+
+
+    async def api_specs_api_spec_id_get_json_with_validators(
+        self,
+        api_spec_id: Annotated[StrictInt, Field(description="The ID of the API specification to retrieve")],
+    ) -> Tuple[bytes, Optional[Validators]]:
+        """JSON 본문과 그 본문을 만든 행의 검증자를 반환한다. 구현체가 재정의하지 않으면 검증자 없이 본문만 반환한다."""
+        return await self.api_specs_api_spec_id_get_json(api_spec_id), None
+
+
     async def api_specs_api_spec_id_put(
         self,
         api_spec_id: Annotated[StrictInt, Field(description="The ID of the API specification to update")],
         api_spec: APISpec,
+        if_match: Annotated[Optional[StrictStr], Field(description="The ETag of the API specification the request is based on (\"*\" for any version)")] = None,
     ) -> APISpec:
         ...
 
 
-    async def api_specs_get(
+    async def api_specs_api_spec_id_patch(
+        self,
+        api_spec_id: Annotated[StrictInt, Field(description="The ID of the API specification to patch")],
+        patch: Annotated[Any, Field(description="JSON Patch operations or JSON Merge Patch document")],
+        merge: Annotated[StrictBool, Field(description="Whether the patch is a JSON Merge Patch")],
+        if_match: Annotated[Optional[StrictStr], Field(description="The ETag of the API specification the patch is based on")],
+    ) -> APISpec:
+        ...
+
+
+    async def api_specs_api_spec_id_content_get(
+        self,
+        api_spec_id: Annotated[StrictInt, Field(description="The ID of the API specification")],
+        pointers: Annotated[List[StrictStr], Field(description="JSON pointers into spec_content")],
+    ) -> bytes:
+        ...
+
+
+    async def api_specs_api_spec_id_diff_other_id_get(
+        self,
+        api_spec_id: Annotated[StrictInt, Field(description="The ID of the base API specification")],
+        other_id: Annotated[StrictInt, Field(description="The ID of the API specification to compare with")],
+    ) -> APISpecDiff:
+        ...
+
+
+    async def api_specs_search_get(
+        self,
+        q: Annotated[StrictStr, Field(description="The search terms")],
+        limit: Annotated[Optional[StrictInt], Field(description="The maximum number of items to return")],
+        cursor: Annotated[Optional[StrictStr], Field(description="The cursor returned by the previous page (X-Next-Cursor)")],
+        project_id: Annotated[Optional[StrictInt], Field(description="Only search API specifications of this project")],
+    ) -> Page[APISpecSearchResult]:
+        ...
+
+
+    async def api_specs_usages_get(
+        self,
+        component: Annotated[Optional[StrictStr], Field(description="The component name")],
+        operation: Annotated[Optional[StrictStr], Field(description="The operation in the form 'METHOD /path'")],
+        limit: Annotated[Optional[StrictInt], Field(description="The maximum number of items to return")],
+        cursor: Annotated[Optional[StrictStr], Field(description="The cursor returned by the previous page (X-Next-Cursor)")],
+    ) -> Page[APISpecUsage]:
+        ...
+
+
+    async def api_specs_api_spec_id_revisions_get(
+        self,
+        api_spec_id: Annotated[StrictInt, Field(description="The ID of the API specification")],
+        limit: Annotated[Optional[StrictInt], Field(description="The maximum number of revisions to return")],
+        before: Annotated[Optional[StrictInt], Field(description="Only return revisions older than this revision number")],
+    ) -> List[APISpecRevision]:
+        ...
+
+
+    async def api_specs_api_spec_id_revisions_revision_get(
+        self,
+        api_spec_id: Annotated[StrictInt, Field(description="The ID of the API specification")],
+        revision: Annotated[StrictInt, Field(description="The revision number")],
+    ) -> APISpecRevision:
+        ...
+
+
+    async def api_specs_batch_post(
+        self,
+        api_specs: List[APISpec],
+    ) -> List[BatchItemResult]:
+        ...
+
+
+    async def api_specs_by_ids_get(
         self,
+        ids: Annotated[List[StrictInt], Field(description="The IDs of the API specifications to return")],
     ) -> List[APISpec]:
         ...
 
 
+    async def api_specs_get(
+        self,
+        limit: Annotated[Optional[StrictInt], Field(description="The maximum number of items to return")],
+        cursor: Annotated[Optional[StrictStr], Field(description="The cursor returned by the previous page (X-Next-Cursor)")],
+        sort: Annotated[Optional[StrictStr], Field(description="The sort key of the page (id or updated_at)")],
+        project_id: Annotated[Optional[StrictInt], Field(description="Only return API specifications of this project")],
+    ) -> Page[APISpec]:
+        ...
+
+
+    async def api_specs_summaries_get(
+        self,
+        limit: Annotated[Optional[StrictInt], Field(description="The maximum number of items to return")],
+        cursor: Annotated[Optional[StrictStr], Field(description="The cursor returned by the previous page (X-Next-Cursor)")],
+        sort: Annotated[Optional[StrictStr], Field(description="The sort key of the page (id or updated_at)")],
+        project_id: Annotated[Optional[StrictInt], Field(description="Only return API specifications of this project")],
+        fields: Annotated[Optional[List[StrictStr]], Field(description="APISpecSummary properties to return")],
+    ) -> Page[APISpecSummary]:
+        ...
+
+
+    async def api_specs_validators(
+        self,
+        limit: Annotated[Optional[StrictInt], Field(description="The maximum number of items to return")],
+        cursor: Annotated[Optional[StrictStr], Field(description="The cursor returned by the previous page (X-Next-Cursor)")],
+        sort: Annotated[Optional[StrictStr], Field(description="The sort key of the page (id or updated_at)")],
+        project_id: Annotated[Optional[StrictInt], Field(description="Only return API specifications of this project")],
+    ) -> Validators:
+        ...
+
+
+    def api_specs_stream(
+        self,
+    ) -> AsyncIterator[APISpec]:
+        ...
+
+
     async def api_specs_post(
         self,
         api_spec: APISpec,
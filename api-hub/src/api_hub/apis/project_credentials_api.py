@@ -5,6 +5,7 @@ import importlib
 import pkgutil
 
 from api_hub.apis.project_credentials_api_base import BaseProjectCredentialsApi
+from api_hub.impl_registry import impl_registry
 import openapi_server.impl
 
 from fastapi import (  # noqa: F401
@@ -17,14 +18,17 @@ from fastapi import (  # noqa: F401
     HTTPException,
     Path,
     Query,
+    Request,
     Response,
     Security,
     status,
 )
 
 from api_hub.models.extra_models import TokenModel  # noqa: F401
-from pydantic import Field, StrictInt
-from typing import Any, List
+from api_hub.conditional import version_etag
+from api_hub.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, set_pagination_headers
+from pydantic import Field, StrictInt, StrictStr
+from typing import Any, List, Optional
 from typing_extensions import Annotated
 from api_hub.models.project_credential import ProjectCredential
 
@@ -35,11 +39,14 @@ ns_pkg = openapi_server.impl
 for _, name, _ in pkgutil.iter_modules(ns_pkg.__path__, ns_pkg.__name__ + "."):
     importlib.import_module(name)
 
+# 구현체는 애플리케이션 수명 동안 한 번만 생성되어 의존성으로 주입된다.
+get_impl = impl_registry.provider(BaseProjectCredentialsApi)
+
 
 @router.get(
     "/project_credentials",
     responses={
-        200: {"model": List[ProjectCredential], "description": "List of project credentials"},
+        200: {"model": List[ProjectCredential], "description": "List of project credentials", "headers": {"X-Next-Cursor": {"description": "The cursor of the next page", "schema": {"type": "string"}}, "Link": {"description": "The URL of the next page (rel=\"next\")", "schema": {"type": "string"}}}},
         404: {"description": "Project credentials not found"},
     },
     tags=["Project Credentials"],
@@ -47,10 +54,15 @@ for _, name, _ in pkgutil.iter_modules(ns_pkg.__path__, ns_pkg.__name__ + "."):
     response_model_by_alias=True,
 )
 async def project_credentials_get(
+    request: Request,
+    response: Response,
+    limit: Annotated[Optional[int], Field(le=MAX_PAGE_SIZE, ge=1, description="The maximum number of items to return")] = Query(DEFAULT_PAGE_SIZE, description="The maximum number of items to return", alias="limit", ge=1, le=MAX_PAGE_SIZE),
+    cursor: Annotated[Optional[StrictStr], Field(description="The cursor returned by the previous page (X-Next-Cursor)")] = Query(None, description="The cursor returned by the previous page (X-Next-Cursor)", alias="cursor"),
+    impl: BaseProjectCredentialsApi = Depends(get_impl),
 ) -> List[ProjectCredential]:
-    if not BaseProjectCredentialsApi.subclasses:
-        raise HTTPException(status_code=500, detail="Not implemented")
-    return await BaseProjectCredentialsApi.subclasses[0]().project_credentials_get()
+    page = await impl.project_credentials_get(limit, cursor)
+    set_pagination_headers(request, response, page)
+    return page.items
 
 
 @router.post(
@@ -65,10 +77,9 @@ async def project_credentials_get(
 )
 async def project_credentials_post(
     project_credential: ProjectCredential = Body(None, description=""),
+    impl: BaseProjectCredentialsApi = Depends(get_impl),
 ) -> ProjectCredential:
-    if not BaseProjectCredentialsApi.subclasses:
-        raise HTTPException(status_code=500, detail="Not implemented")
-    return await BaseProjectCredentialsApi.subclasses[0]().project_credentials_post(project_credential)
+    return await impl.project_credentials_post(project_credential)
 
 
 @router.delete(
@@ -76,6 +87,8 @@ async def project_credentials_post(
     responses={
         204: {"description": "Project credential deleted successfully"},
         404: {"description": "Project credential not found"},
+        412: {"description": "The project credential has been modified (If-Match does not match)"},
+        428: {"description": "If-Match header is required"},
     },
     tags=["Project Credentials"],
     summary="Delete project credential",
@@ -83,16 +96,16 @@ async def project_credentials_post(
 )
 async def project_credentials_project_credential_id_delete(
     project_credential_id: Annotated[StrictInt, Field(description="The ID of the project credential to delete")] = Path(..., description="The ID of the project credential to delete"),
+    if_match: Annotated[Optional[StrictStr], Field(description="The ETag of the project credential the request is based on (\"*\" for any version)")] = Header(None, description="The ETag of the project credential the request is based on (\"*\" for any version)", alias="If-Match"),
+    impl: BaseProjectCredentialsApi = Depends(get_impl),
 ) -> None:
-    if not BaseProjectCredentialsApi.subclasses:
-        raise HTTPException(status_code=500, detail="Not implemented")
-    return await BaseProjectCredentialsApi.subclasses[0]().project_credentials_project_credential_id_delete(project_credential_id)
+    return await impl.project_credentials_project_credential_id_delete(project_credential_id, if_match)
 
 
 @router.get(
     "/project_credentials/{project_credential_id}",
     responses={
-        200: {"model": ProjectCredential, "description": "Project credential details"},
+        200: {"model": ProjectCredential, "description": "Project credential details", "headers": {"ETag": {"description": "Entity tag of the project credential version, send it back in If-Match", "schema": {"type": "string"}}}},
         404: {"description": "Project credential not found"},
     },
     tags=["Project Credentials"],
@@ -100,27 +113,36 @@ async def project_credentials_project_credential_id_delete(
     response_model_by_alias=True,
 )
 async def project_credentials_project_credential_id_get(
+    response: Response,
     project_credential_id: Annotated[StrictInt, Field(description="The ID of the project credential to retrieve")] = Path(..., description="The ID of the project credential to retrieve"),
+    impl: BaseProjectCredentialsApi = Depends(get_impl),
 ) -> ProjectCredential:
-    if not BaseProjectCredentialsApi.subclasses:
-        raise HTTPException(status_code=500, detail="Not implemented")
-    return await BaseProjectCredentialsApi.subclasses[0]().project_credentials_project_credential_id_get(project_credential_id)
+    found = await impl.project_credentials_project_credential_id_get(project_credential_id)
+    response.headers["ETag"] = version_etag(found.row_version)
+    return found
 
 
 @router.put(
     "/project_credentials/{project_credential_id}",
     responses={
-        200: {"model": ProjectCredential, "description": "Project credential updated successfully"},
+        200: {"model": ProjectCredential, "description": "Project credential updated successfully", "headers": {"ETag": {"description": "Entity tag of the project credential version, send it back in If-Match", "schema": {"type": "string"}}}},
         400: {"description": "Invalid input"},
+        404: {"description": "Project credential not found"},
+        412: {"description": "The project credential has been modified (If-Match does not match)"},
+        428: {"description": "If-Match header is required"},
     },
     tags=["Project Credentials"],
     summary="Update project credential",
     response_model_by_alias=True,
 )
 async def project_credentials_project_credential_id_put(
+    response: Response,
     project_credential_id: Annotated[StrictInt, Field(description="The ID of the project credential to update")] = Path(..., description="The ID of the project credential to update"),
     project_credential: ProjectCredential = Body(None, description=""),
+    if_match: Annotated[Optional[StrictStr], Field(description="The ETag of the project credential the request is based on (\"*\" for any version)")] = Header(None, description="The ETag of the project credential the request is based on (\"*\" for any version)", alias="If-Match"),
+    impl: BaseProjectCredentialsApi = Depends(get_impl),
 ) -> ProjectCredential:
-    if not BaseProjectCredentialsApi.subclasses:
-        raise HTTPException(status_code=500, detail="Not implemented")
-    return await BaseProjectCredentialsApi.subclasses[0]().project_credentials_project_credential_id_put(project_credential_id, project_credential)
+    updated = await impl.project_credentials_project_credential_id_put(project_credential_id, project_credential, if_match)
+    # 다음 수정의 If-Match로 쓸 새 ETag
+    response.headers["ETag"] = version_etag(updated.row_version)
+    return updated
@@ -2,10 +2,11 @@
 
 from typing import ClassVar, Dict, List, Tuple  # noqa: F401
 
-from pydantic import Field, StrictInt
-from typing import Any, List
+from pydantic import Field, StrictInt, StrictStr
+from typing import Any, List, Optional
 from typing_extensions import Annotated
 from api_hub.models.project_credential import ProjectCredential
+from api_hub.pagination import Page
 
 
 class BaseProjectCredentialsApi:
@@ -16,7 +17,9 @@ class BaseProjectCredentialsApi:
         BaseProjectCredentialsApi.subclasses = BaseProjectCredentialsApi.subclasses + (cls,)
     async def project_credentials_get(
         self,
-    ) -> List[ProjectCredential]:
+        limit: Annotated[Optional[StrictInt], Field(description="The maximum number of items to return")],
+        cursor: Annotated[Optional[StrictStr], Field(description="The cursor returned by the previous page (X-Next-Cursor)")],
+    ) -> Page[ProjectCredential]:
         ...
 
 
@@ -30,6 +33,7 @@ class BaseProjectCredentialsApi:
     async def project_credentials_project_credential_id_delete(
         self,
         project_credential_id: Annotated[StrictInt, Field(description="The ID of the project credential to delete")],
+        if_match: Annotated[Optional[StrictStr], Field(description="The ETag of the project credential the request is based on (\"*\" for any version)")] = None,
     ) -> None:
         ...
 
@@ -45,5 +49,6 @@ class BaseProjectCredentialsApi:
         self,
         project_credential_id: Annotated[StrictInt, Field(description="The ID of the project credential to update")],
         project_credential: ProjectCredential,
+        if_match: Annotated[Optional[StrictStr], Field(description="The ETag of the project credential the request is based on (\"*\" for any version)")] = None,
     ) -> ProjectCredential:
         ...
@@ -5,6 +5,7 @@ import importlib
 import pkgutil
 
 from api_hub.apis.project_members_api_base import BaseProjectMembersApi
+from api_hub.impl_registry import impl_registry
 import openapi_server.impl
 
 from fastapi import (  # noqa: F401
@@ -17,16 +18,19 @@ from fastapi import (  # noqa: F401
     HTTPException,
     Path,
     Query,
+    Request,
     Response,
     Security,
     status,
 )
 
 from api_hub.models.extra_models import TokenModel  # noqa: F401
-from pydantic import Field, StrictInt
-from typing import Any, List
+from api_hub.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, set_pagination_headers
+from pydantic import Field, StrictInt, StrictStr
+from typing import Any, List, Optional
 from typing_extensions import Annotated
 from api_hub.models.project_member import ProjectMember
+from api_hub.models.batch_item_result import BatchItemResult
 
 
 router = APIRouter()
@@ -35,11 +39,14 @@ ns_pkg = openapi_server.impl
 for _, name, _ in pkgutil.iter_modules(ns_pkg.__path__, ns_pkg.__name__ + "."):
     importlib.import_module(name)
 
+# 구현체는 애플리케이션 수명 동안 한 번만 생성되어 의존성으로 주입된다.
+get_impl = impl_registry.provider(BaseProjectMembersApi)
+
 
 @router.get(
     "/project_members",
     responses={
-        200: {"model": List[ProjectMember], "description": "List of project members"},
+        200: {"model": List[ProjectMember], "description": "List of project members", "headers": {"X-Next-Cursor": {"description": "The cursor of the next page", "schema": {"type": "string"}}, "Link": {"description": "The URL of the next page (rel=\"next\")", "schema": {"type": "string"}}}},
         404: {"description": "Project members not found"},
     },
     tags=["Project Members"],
@@ -47,10 +54,15 @@ for _, name, _ in pkgutil.iter_modules(ns_pkg.__path__, ns_pkg.__name__ + "."):
     response_model_by_alias=True,
 )
 async def project_members_get(
+    request: Request,
+    response: Response,
+    limit: Annotated[Optional[int], Field(le=MAX_PAGE_SIZE, ge=1, description="The maximum number of items to return")] = Query(DEFAULT_PAGE_SIZE, description="The maximum number of items to return", alias="limit", ge=1, le=MAX_PAGE_SIZE),
+    cursor: Annotated[Optional[StrictStr], Field(description="The cursor returned by the previous page (X-Next-Cursor)")] = Query(None, description="The cursor returned by the previous page (X-Next-Cursor)", alias="cursor"),
+    impl: BaseProjectMembersApi = Depends(get_impl),
 ) -> List[ProjectMember]:
-    if not BaseProjectMembersApi.subclasses:
-        raise HTTPException(status_code=500, detail="Not implemented")
-    return await BaseProjectMembersApi.subclasses[0]().project_members_get()
+    page = await impl.project_members_get(limit, cursor)
+    set_pagination_headers(request, response, page)
+    return page.items
 
 
 @router.post(
@@ -65,10 +77,27 @@ async def project_members_get(
 )
 async def project_members_post(
     project_member: ProjectMember = Body(None, description=""),
+    impl: BaseProjectMembersApi = Depends(get_impl),
 ) -> ProjectMember:
-    if not BaseProjectMembersApi.subclasses:
-        raise HTTPException(status_code=500, detail="Not implemented")
-    return await BaseProjectMembersApi.subclasses[0]().project_members_post(project_member)
+    return await impl.project_members_post(project_member)
+
+
+@router.post(
+    "/project_members:batch",
+    responses={
+        200: {"model": List[BatchItemResult], "description": "Per-item results of the batch (status 201, 400 or 409 per item)"},
+        400: {"description": "Invalid input or batch too large"},
+        409: {"description": "Batch insert failed (no item was created)"},
+    },
+    tags=["Project Members"],
+    summary="Add project members in batch",
+    response_model_by_alias=True,
+)
+async def project_members_batch_post(
+    project_members: List[ProjectMember] = Body(..., description=""),
+    impl: BaseProjectMembersApi = Depends(get_impl),
+) -> List[BatchItemResult]:
+    return await impl.project_members_batch_post(project_members)
 
 
 @router.delete(
@@ -83,10 +112,9 @@ async def project_members_post(
 )
 async def project_members_project_member_id_delete(
     project_member_id: Annotated[StrictInt, Field(description="The ID of the project member to delete")] = Path(..., description="The ID of the project member to delete"),
+    impl: BaseProjectMembersApi = Depends(get_impl),
 ) -> None:
-    if not BaseProjectMembersApi.subclasses:
-        raise HTTPException(status_code=500, detail="Not implemented")
-    return await BaseProjectMembersApi.subclasses[0]().project_members_project_member_id_delete(project_member_id)
+    return await impl.project_members_project_member_id_delete(project_member_id)
 
 
 @router.get(
@@ -101,10 +129,9 @@ async def project_members_project_member_id_delete(
 )
 async def project_members_project_member_id_get(
     project_member_id: Annotated[StrictInt, Field(description="The ID of the project member to retrieve")] = Path(..., description="The ID of the project member to retrieve"),
+    impl: BaseProjectMembersApi = Depends(get_impl),
 ) -> ProjectMember:
-    if not BaseProjectMembersApi.subclasses:
-        raise HTTPException(status_code=500, detail="Not implemented")
-    return await BaseProjectMembersApi.subclasses[0]().project_members_project_member_id_get(project_member_id)
+    return await impl.project_members_project_member_id_get(project_member_id)
 
 
 @router.put(
@@ -120,7 +147,6 @@ async def project_members_project_member_id_get(
 async def project_members_project_member_id_put(
     project_member_id: Annotated[StrictInt, Field(description="The ID of the project member to update")] = Path(..., description="The ID of the project member to update"),
     project_member: ProjectMember = Body(None, description=""),
+    impl: BaseProjectMembersApi = Depends(get_impl),
 ) -> ProjectMember:
-    if not BaseProjectMembersApi.subclasses:
-        raise HTTPException(status_code=500, detail="Not implemented")
-    return await BaseProjectMembersApi.subclasses[0]().project_members_project_member_id_put(project_member_id, project_member)
+    return await impl.project_members_project_member_id_put(project_member_id, project_member)
@@ -2,10 +2,12 @@
 
 from typing import ClassVar, Dict, List, Tuple  # noqa: F401
 
-from pydantic import Field, StrictInt
-from typing import Any, List
+from pydantic import Field, StrictInt, StrictStr
+from typing import Any, List, Optional
 from typing_extensions import Annotated
 from api_hub.models.project_member import ProjectMember
+from api_hub.models.batch_item_result import BatchItemResult
+from api_hub.pagination import Page
 
 
 class BaseProjectMembersApi:
@@ -16,7 +18,9 @@ class BaseProjectMembersApi:
         BaseProjectMembersApi.subclasses = BaseProjectMembersApi.subclasses + (cls,)
     async def project_members_get(
         self,
-    ) -> List[ProjectMember]:
+        limit: Annotated[Optional[StrictInt], Field(description="The maximum number of items to return")],
+        cursor: Annotated[Optional[StrictStr], Field(description="The cursor returned by the previous page (X-Next-Cursor)")],
+    ) -> Page[ProjectMember]:
         ...
 
 
@@ -27,6 +31,13 @@ class BaseProjectMembersApi:
         ...
 
 
+    async def project_members_batch_post(
+        self,
+        project_members: List[ProjectMember],
+    ) -> List[BatchItemResult]:
+        ...
+
+
     async def project_members_project_member_id_delete(
         self,
         project_member_id: Annotated[StrictInt, Field(description="The ID of the project member to delete")],
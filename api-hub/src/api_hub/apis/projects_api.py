@@ -5,6 +5,7 @@ import importlib
 import pkgutil
 
 from api_hub.apis.projects_api_base import BaseProjectsApi
+from api_hub.impl_registry import impl_registry
 import openapi_server.impl
 
 from fastapi import (  # noqa: F401
@@ -17,16 +18,21 @@ from fastapi import (  # noqa: F401
     HTTPException,
     Path,
     Query,
+    Request,
     Response,
     Security,
     status,
 )
 
 from api_hub.models.extra_models import TokenModel  # noqa: F401
-from pydantic import Field, StrictInt
-from typing import Any, List
+from api_hub.conditional import has_conditional_headers, is_not_modified, not_modified_response, set_validator_headers, version_etag
+from api_hub.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, parse_ids, set_pagination_headers
+from api_hub.streaming import NDJSON_MEDIA_TYPE, streaming_list_response
+from pydantic import Field, StrictInt, StrictStr
+from typing import Any, List, Optional
 from typing_extensions import Annotated
 from api_hub.models.project import Project
+from api_hub.models.batch_item_result import BatchItemResult
 
 
 router = APIRouter()
@@ -35,11 +41,15 @@ ns_pkg = openapi_server.impl
 for _, name, _ in pkgutil.iter_modules(ns_pkg.__path__, ns_pkg.__name__ + "."):
     importlib.import_module(name)
 
+# 구현체는 애플리케이션 수명 동안 한 번만 생성되어 의존성으로 주입된다.
+get_impl = impl_registry.provider(BaseProjectsApi)
+
 
 @router.get(
     "/projects",
     responses={
-        200: {"model": List[Project], "description": "List of projects"},
+        200: {"model": List[Project], "description": "List of projects", "content": {NDJSON_MEDIA_TYPE: {}}, "headers": {"X-Next-Cursor": {"description": "The cursor of the next page", "schema": {"type": "string"}}, "Link": {"description": "The URL of the next page (rel=\"next\")", "schema": {"type": "string"}}, "ETag": {"description": "Strong entity tag of the response", "schema": {"type": "string"}}, "Last-Modified": {"description": "Last modification date of the response", "schema": {"type": "string"}}}},
+        304: {"description": "Not modified (If-None-Match / If-Modified-Since matched)"},
         404: {"description": "Projects not found"},
     },
     tags=["Projects"],
@@ -47,10 +57,32 @@ for _, name, _ in pkgutil.iter_modules(ns_pkg.__path__, ns_pkg.__name__ + "."):
     response_model_by_alias=True,
 )
 async def projects_get(
+    request: Request,
+    response: Response,
+    limit: Annotated[Optional[int], Field(le=MAX_PAGE_SIZE, ge=1, description="The maximum number of items to return")] = Query(DEFAULT_PAGE_SIZE, description="The maximum number of items to return", alias="limit", ge=1, le=MAX_PAGE_SIZE),
+    cursor: Annotated[Optional[StrictStr], Field(description="The cursor returned by the previous page (X-Next-Cursor)")] = Query(None, description="The cursor returned by the previous page (X-Next-Cursor)", alias="cursor"),
+    sort: Annotated[Optional[StrictStr], Field(description="The sort key of the page (id or updated_at)")] = Query("id", description="The sort key of the page (id or updated_at)", alias="sort", pattern="^(id|updated_at)$"),
+    stream: Annotated[Optional[StrictStr], Field(description="Stream all projects as NDJSON (ndjson) or a chunked JSON array (json) instead of a single page")] = Query(None, description="Stream all projects as NDJSON (ndjson) or a chunked JSON array (json) instead of a single page", alias="stream", pattern="^(ndjson|json)$"),
+    ids: Annotated[Optional[StrictStr], Field(description="Comma separated IDs to return in request order (ignores paging parameters)")] = Query(None, description="Comma separated IDs to return in request order (ignores paging parameters)", alias="ids"),
+    impl: BaseProjectsApi = Depends(get_impl),
 ) -> List[Project]:
-    if not BaseProjectsApi.subclasses:
-        raise HTTPException(status_code=500, detail="Not implemented")
-    return await BaseProjectsApi.subclasses[0]().projects_get()
+    if ids is not None:
+        return await impl.projects_by_ids_get(parse_ids(ids))
+    if stream:
+        return streaming_list_response(impl.projects_stream(), stream)
+    # 조건부 요청이면 변경이 없을 때 목록을 읽지 않고 304 응답
+    if has_conditional_headers(request):
+        validators = await impl.projects_validators(limit, cursor, sort)
+        if validators is not None:
+            validators = validators.for_variant(request.url.path, request.url.query)
+            if is_not_modified(request, validators):
+                return not_modified_response(validators)
+    page = await impl.projects_get(limit, cursor, sort)
+    # 검증자는 응답한 페이지와 같은 조회에서 계산한 값을 사용한다
+    if page.validators is not None:
+        set_validator_headers(response, page.validators.for_variant(request.url.path, request.url.query))
+    set_pagination_headers(request, response, page)
+    return page.items
 
 
 @router.post(
@@ -65,10 +97,26 @@ async def projects_get(
 )
 async def projects_post(
     project: Project = Body(None, description=""),
+    impl: BaseProjectsApi = Depends(get_impl),
 ) -> Project:
-    if not BaseProjectsApi.subclasses:
-        raise HTTPException(status_code=500, detail="Not implemented")
-    return await BaseProjectsApi.subclasses[0]().projects_post(project)
+    return await impl.projects_post(project)
+
+
+@router.post(
+    "/projects:archive",
+    responses={
+        200: {"model": List[BatchItemResult], "description": "Per-item results of the batch (status 200 or 404 per item)"},
+        400: {"description": "Invalid input or batch too large"},
+    },
+    tags=["Projects"],
+    summary="Archive projects in batch",
+    response_model_by_alias=True,
+)
+async def projects_archive_post(
+    project_ids: List[StrictInt] = Body(..., description="The IDs of the projects to archive"),
+    impl: BaseProjectsApi = Depends(get_impl),
+) -> List[BatchItemResult]:
+    return await impl.projects_archive_post(project_ids)
 
 
 @router.delete(
@@ -76,6 +124,8 @@ async def projects_post(
     responses={
         204: {"description": "Project deleted successfully"},
         404: {"description": "Project not found"},
+        412: {"description": "The project has been modified (If-Match does not match)"},
+        428: {"description": "If-Match header is required"},
     },
     tags=["Projects"],
     summary="Delete project",
@@ -83,16 +133,16 @@ async def projects_post(
 )
 async def projects_project_id_delete(
     project_id: Annotated[StrictInt, Field(description="The ID of the project to delete")] = Path(..., description="The ID of the project to delete"),
+    if_match: Annotated[Optional[StrictStr], Field(description="The ETag of the project the request is based on (\"*\" for any version)")] = Header(None, description="The ETag of the project the request is based on (\"*\" for any version)", alias="If-Match"),
+    impl: BaseProjectsApi = Depends(get_impl),
 ) -> None:
-    if not BaseProjectsApi.subclasses:
-        raise HTTPException(status_code=500, detail="Not implemented")
-    return await BaseProjectsApi.subclasses[0]().projects_project_id_delete(project_id)
+    return await impl.projects_project_id_delete(project_id, if_match)
 
 
 @router.get(
     "/projects/{project_id}",
     responses={
-        200: {"model": Project, "description": "Project details"},
+        200: {"model": Project, "description": "Project details", "headers": {"ETag": {"description": "Entity tag of the project version, send it back in If-Match", "schema": {"type": "string"}}}},
         404: {"description": "Project not found"},
     },
     tags=["Projects"],
@@ -100,27 +150,36 @@ async def projects_project_id_delete(
     response_model_by_alias=True,
 )
 async def projects_project_id_get(
+    response: Response,
     project_id: Annotated[StrictInt, Field(description="The ID of the project to retrieve")] = Path(..., description="The ID of the project to retrieve"),
+    impl: BaseProjectsApi = Depends(get_impl),
 ) -> Project:
-    if not BaseProjectsApi.subclasses:
-        raise HTTPException(status_code=500, detail="Not implemented")
-    return await BaseProjectsApi.subclasses[0]().projects_project_id_get(project_id)
+    found = await impl.projects_project_id_get(project_id)
+    response.headers["ETag"] = version_etag(found.row_version)
+    return found
 
 
 @router.put(
     "/projects/{project_id}",
     responses={
-        200: {"model": Project, "description": "Project updated successfully"},
+        200: {"model": Project, "description": "Project updated successfully", "headers": {"ETag": {"description": "Entity tag of the project version, send it back in If-Match", "schema": {"type": "string"}}}},
         400: {"description": "Invalid input"},
+        404: {"description": "Project not found"},
+        412: {"description": "The project has been modified (If-Match does not match)"},
+        428: {"description": "If-Match header is required"},
     },
     tags=["Projects"],
     summary="Update project",
     response_model_by_alias=True,
 )
 async def projects_project_id_put(
+    response: Response,
     project_id: Annotated[StrictInt, Field(description="The ID of the project to update")] = Path(..., description="The ID of the project to update"),
     project: Project = Body(None, description=""),
+    if_match: Annotated[Optional[StrictStr], Field(description="The ETag of the project the request is based on (\"*\" for any version)")] = Header(None, description="The ETag of the project the request is based on (\"*\" for any version)", alias="If-Match"),
+    impl: BaseProjectsApi = Depends(get_impl),
 ) -> Project:
-    if not BaseProjectsApi.subclasses:
-        raise HTTPException(status_code=500, detail="Not implemented")
-    return await BaseProjectsApi.subclasses[0]().projects_project_id_put(project_id, project)
+    updated = await impl.projects_project_id_put(project_id, project, if_match)
+    # 다음 수정의 If-Match로 쓸 새 ETag
+    response.headers["ETag"] = version_etag(updated.row_version)
+    return updated
@@ -1,11 +1,14 @@
 # coding: utf-8
 
-from typing import ClassVar, Dict, List, Tuple  # noqa: F401
+from typing import AsyncIterator, ClassVar, Dict, List, Tuple  # noqa: F401
 
-from pydantic import Field, StrictInt
-from typing import Any, List
+from pydantic import Field, StrictInt, StrictStr
+from typing import Any, List, Optional
 from typing_extensions import Annotated
 from api_hub.models.project import Project
+from api_hub.conditional import Validators
+from api_hub.models.batch_item_result import BatchItemResult
+from api_hub.pagination import Page
 
 
 class BaseProjectsApi:
@@ -14,12 +17,44 @@ class BaseProjectsApi:
     def __init_subclass__(cls, **kwargs):
         super().__init_subclass__(**kwargs)
         BaseProjectsApi.subclasses = BaseProjectsApi.subclasses + (cls,)
-    async def projects_get(
+    async def projects_archive_post(
+        self,
+        project_ids: List[StrictInt],
+    ) -> List[BatchItemResult]:
+        ...
+
+
+    async def projects_by_ids_get(
         self,
+        ids: Annotated[List[StrictInt], Field(description="The IDs of the projects to return")],
     ) -> List[Project]:
         ...
 
 
+    async def projects_get(
+        self,
+        limit: Annotated[Optional[StrictInt], Field(description="The maximum number of items to return")],
+        cursor: Annotated[Optional[StrictStr], Field(description="The cursor returned by the previous page (X-Next-Cursor)")],
+        sort: Annotated[Optional[StrictStr], Field(description="The sort key of the page (id or updated_at)")],
+    ) -> Page[Project]:
+        ...
+
+
+    async def projects_validators(
+        self,
+        limit: Annotated[Optional[StrictInt], Field(description="The maximum number of items to return")],
+        cursor: Annotated[Optional[StrictStr], Field(description="The cursor returned by the previous page (X-Next-Cursor)")],
+        sort: Annotated[Optional[StrictStr], Field(description="The sort key of the page (id or updated_at)")],
+    ) -> Validators:
+        ...
+
+
+    def projects_stream(
+        self,
+    ) -> AsyncIterator[Project]:
+        ...
+
+
     async def projects_post(
         self,
         project: Project,
@@ -30,6 +65,7 @@ class BaseProjectsApi:
     async def projects_project_id_delete(
         self,
         project_id: Annotated[StrictInt, Field(description="The ID of the project to delete")],
+        if_match: Annotated[Optional[StrictStr], Field(description="The ETag of the project the request is based on (\"*\" for any version)")] = None,
     ) -> None:
         ...
 
@@ -45,5 +81,6 @@ class BaseProjectsApi:
         self,
         project_id: Annotated[StrictInt, Field(description="The ID of the project to update")],
         project: Project,
+        if_match: Annotated[Optional[StrictStr], Field(description="The ETag of the project the request is based on (\"*\" for any version)")] = None,
     ) -> Project:
         ...
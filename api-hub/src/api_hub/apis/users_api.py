@@ -5,6 +5,7 @@ import importlib
 import pkgutil
 
 from api_hub.apis.users_api_base import BaseUsersApi
+from api_hub.impl_registry import impl_registry
 import openapi_server.impl
 
 from fastapi import (  # noqa: F401
@@ -17,14 +18,17 @@ from fastapi import (  # noqa: F401
     HTTPException,
     Path,
     Query,
+    Request,
     Response,
     Security,
     status,
 )
 
 from api_hub.models.extra_models import TokenModel  # noqa: F401
-from pydantic import Field, StrictInt
-from typing import Any, List
+from api_hub.conditional import version_etag
+from api_hub.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, parse_ids, set_pagination_headers
+from pydantic import Field, StrictInt, StrictStr
+from typing import Any, List, Optional
 from typing_extensions import Annotated
 from api_hub.models.user import User
 
@@ -35,11 +39,14 @@ ns_pkg = openapi_server.impl
 for _, name, _ in pkgutil.iter_modules(ns_pkg.__path__, ns_pkg.__name__ + "."):
     importlib.import_module(name)
 
+# 구현체는 애플리케이션 수명 동안 한 번만 생성되어 의존성으로 주입된다.
+get_impl = impl_registry.provider(BaseUsersApi)
+
 
 @router.get(
     "/users",
     responses={
-        200: {"model": List[User], "description": "List of users"},
+        200: {"model": List[User], "description": "List of users", "headers": {"X-Next-Cursor": {"description": "The cursor of the next page", "schema": {"type": "string"}}, "Link": {"description": "The URL of the next page (rel=\"next\")", "schema": {"type": "string"}}}},
         404: {"description": "Users not found"},
     },
     tags=["Users"],
@@ -47,10 +54,19 @@ for _, name, _ in pkgutil.iter_modules(ns_pkg.__path__, ns_pkg.__name__ + "."):
     response_model_by_alias=True,
 )
 async def users_get(
+    request: Request,
+    response: Response,
+    limit: Annotated[Optional[int], Field(le=MAX_PAGE_SIZE, ge=1, description="The maximum number of items to return")] = Query(DEFAULT_PAGE_SIZE, description="The maximum number of items to return", alias="limit", ge=1, le=MAX_PAGE_SIZE),
+    cursor: Annotated[Optional[StrictStr], Field(description="The cursor returned by the previous page (X-Next-Cursor)")] = Query(None, description="The cursor returned by the previous page (X-Next-Cursor)", alias="cursor"),
+    sort: Annotated[Optional[StrictStr], Field(description="The sort key of the page (id or updated_at)")] = Query("id", description="The sort key of the page (id or updated_at)", alias="sort", pattern="^(id|updated_at)$"),
+    ids: Annotated[Optional[StrictStr], Field(description="Comma separated IDs to return in request order (ignores paging parameters)")] = Query(None, description="Comma separated IDs to return in request order (ignores paging parameters)", alias="ids"),
+    impl: BaseUsersApi = Depends(get_impl),
 ) -> List[User]:
-    if not BaseUsersApi.subclasses:
-        raise HTTPException(status_code=500, detail="Not implemented")
-    return await BaseUsersApi.subclasses[0]().users_get()
+    if ids is not None:
+        return await impl.users_by_ids_get(parse_ids(ids))
+    page = await impl.users_get(limit, cursor, sort)
+    set_pagination_headers(request, response, page)
+    return page.items
 
 
 @router.post(
@@ -65,10 +81,9 @@ async def users_get(
 )
 async def users_post(
     user: User = Body(None, description=""),
+    impl: BaseUsersApi = Depends(get_impl),
 ) -> User:
-    if not BaseUsersApi.subclasses:
-        raise HTTPException(status_code=500, detail="Not implemented")
-    return await BaseUsersApi.subclasses[0]().users_post(user)
+    return await impl.users_post(user)
 
 
 @router.delete(
@@ -76,6 +91,8 @@ async def users_post(
     responses={
         204: {"description": "User deleted successfully"},
         404: {"description": "User not found"},
+        412: {"description": "The user has been modified (If-Match does not match)"},
+        428: {"description": "If-Match header is required"},
     },
     tags=["Users"],
     summary="Delete user",
@@ -83,16 +100,16 @@ async def users_post(
 )
 async def users_user_id_delete(
     user_id: Annotated[StrictInt, Field(description="The ID of the user to delete")] = Path(..., description="The ID of the user to delete"),
+    if_match: Annotated[Optional[StrictStr], Field(description="The ETag of the user the request is based on (\"*\" for any version)")] = Header(None, description="The ETag of the user the request is based on (\"*\" for any version)", alias="If-Match"),
+    impl: BaseUsersApi = Depends(get_impl),
 ) -> None:
-    if not BaseUsersApi.subclasses:
-        raise HTTPException(status_code=500, detail="Not implemented")
-    return await BaseUsersApi.subclasses[0]().users_user_id_delete(user_id)
+    return await impl.users_user_id_delete(user_id, if_match)
 
 
 @router.get(
     "/users/{user_id}",
     responses={
-        200: {"model": User, "description": "User details"},
+        200: {"model": User, "description": "User details", "headers": {"ETag": {"description": "Entity tag of the user version, send it back in If-Match", "schema": {"type": "string"}}}},
         404: {"description": "User not found"},
     },
     tags=["Users"],
@@ -100,27 +117,36 @@ async def users_user_id_delete(
     response_model_by_alias=True,
 )
 async def users_user_id_get(
+    response: Response,
     user_id: Annotated[StrictInt, Field(description="The ID of the user to retrieve")] = Path(..., description="The ID of the user to retrieve"),
+    impl: BaseUsersApi = Depends(get_impl),
 ) -> User:
-    if not BaseUsersApi.subclasses:
-        raise HTTPException(status_code=500, detail="Not implemented")
-    return await BaseUsersApi.subclasses[0]().users_user_id_get(user_id)
+    found = await impl.users_user_id_get(user_id)
+    response.headers["ETag"] = version_etag(found.row_version)
+    return found
 
 
 @router.put(
     "/users/{user_id}",
     responses={
-        200: {"model": User, "description": "User updated successfully"},
+        200: {"model": User, "description": "User updated successfully", "headers": {"ETag": {"description": "Entity tag of the user version, send it back in If-Match", "schema": {"type": "string"}}}},
         400: {"description": "Invalid input"},
+        404: {"description": "User not found"},
+        412: {"description": "The user has been modified (If-Match does not match)"},
+        428: {"description": "If-Match header is required"},
     },
     tags=["Users"],
     summary="Update user",
     response_model_by_alias=True,
 )
 async def users_user_id_put(
+    response: Response,
     user_id: Annotated[StrictInt, Field(description="The ID of the user to update")] = Path(..., description="The ID of the user to update"),
     user: User = Body(None, description=""),
+    if_match: Annotated[Optional[StrictStr], Field(description="The ETag of the user the request is based on (\"*\" for any version)")] = Header(None, description="The ETag of the user the request is based on (\"*\" for any version)", alias="If-Match"),
+    impl: BaseUsersApi = Depends(get_impl),
 ) -> User:
-    if not BaseUsersApi.subclasses:
-        raise HTTPException(status_code=500, detail="Not implemented")
-    return await BaseUsersApi.subclasses[0]().users_user_id_put(user_id, user)
+    updated = await impl.users_user_id_put(user_id, user, if_match)
+    # 다음 수정의 If-Match로 쓸 새 ETag
+    response.headers["ETag"] = version_etag(updated.row_version)
+    return updated
@@ -2,10 +2,11 @@
 
 from typing import ClassVar, Dict, List, Tuple  # noqa: F401
 
-from pydantic import Field, StrictInt
-from typing import Any, List
+from pydantic import Field, StrictInt, StrictStr
+from typing import Any, List, Optional
 from typing_extensions import Annotated
 from api_hub.models.user import User
+from api_hub.pagination import Page
 
 
 class BaseUsersApi:
@@ -14,12 +15,22 @@ class BaseUsersApi:
     def __init_subclass__(cls, **kwargs):
         super().__init_subclass__(**kwargs)
         BaseUsersApi.subclasses = BaseUsersApi.subclasses + (cls,)
-    async def users_get(
+    async def users_by_ids_get(
         self,
+        ids: Annotated[List[StrictInt], Field(description="The IDs of the users to return")],
     ) -> List[User]:
         ...
 
 
+    async def users_get(
+        self,
+        limit: Annotated[Optional[StrictInt], Field(description="The maximum number of items to return")],
+        cursor: Annotated[Optional[StrictStr], Field(description="The cursor returned by the previous page (X-Next-Cursor)")],
+        sort: Annotated[Optional[StrictStr], Field(description="The sort key of the page (id or updated_at)")],
+    ) -> Page[User]:
+        ...
+
+
     async def users_post(
         self,
         user: User,
@@ -30,6 +41,7 @@ class BaseUsersApi:
     async def users_user_id_delete(
         self,
         user_id: Annotated[StrictInt, Field(description="The ID of the user to delete")],
+        if_match: Annotated[Optional[StrictStr], Field(description="The ETag of the user the request is based on (\"*\" for any version)")] = None,
     ) -> None:
         ...
 
@@ -45,5 +57,6 @@ class BaseUsersApi:
         self,
         user_id: Annotated[StrictInt, Field(description="The ID of the user to update")],
         user: User,
+        if_match: Annotated[Optional[StrictStr], Field(description="The ETag of the user the request is based on (\"*\" for any version)")] = None,
     ) -> User:
         ...
@@ -0,0 +1,366 @@
+# coding: utf-8
+
+"""
+impl 조회 결과 캐시 모듈
+
+자주 읽히고 드물게 바뀌는 단건 조회(API 스펙, 프로젝트)를 캐시에 보관하여
+반복 조회 시 데이터베이스를 거치지 않게 한다. 쓰기(put/delete) 시 해당 키를 무효화한다.
+
+백엔드 (CACHE_BACKEND):
+    memory: 프로세스 메모리 LRU + TTL 캐시 (기본값, 워커마다 독립)
+    redis: Redis 프로토콜 서버를 공유 저장소로 사용하고, 워커별 로컬 캐시를 앞에 둔다.
+           무효화는 Redis pub/sub 채널로 발행되어 모든 워커가 로컬 항목을 제거한다.
+           값은 캐시별 CacheCodec(JSON)으로 직렬화한다. (pickle은 Redis에 쓸 수 있으면 임의 코드를 실행할 수 있어 사용하지 않는다.)
+
+이벤트 루프(async 함수)에서는 aget/aset/adelete를 사용한다. redis 백엔드는 네트워크 왕복을
+스레드에서 실행하여 이벤트 루프를 막지 않는다.
+
+Environment variables:
+    CACHE_BACKEND: memory 또는 redis (기본 memory)
+    CACHE_REDIS_URL: redis 백엔드 연결 URL (기본 redis://localhost:6379/0)
+    CACHE_MAX_SIZE: 캐시별 최대 항목 수 (기본 1024, 0이면 캐시 비활성화)
+    CACHE_TTL_SECONDS: 항목 유효 시간(초) (기본 60, 0이면 만료 없음)
+
+Metrics:
+    {name}.hits / {name}.misses: 조회 적중/실패 수
+    {name}.evictions: 크기 제한으로 제거된 항목 수
+    {name}.expirations: TTL 만료로 제거된 항목 수
+    {name}.size: 현재 항목 수
+    {name}.invalidations_received: 다른 워커로부터 받은 무효화 수 (redis)
+"""
+
+import asyncio
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, List, Optional, Tuple
+
+from api_hub.metrics import registry
+
+CACHE_BACKEND = os.getenv("CACHE_BACKEND", "memory")
+CACHE_REDIS_URL = os.getenv("CACHE_REDIS_URL", "redis://localhost:6379/0")
+CACHE_MAX_SIZE = int(os.getenv("CACHE_MAX_SIZE", "1024"))
+CACHE_TTL_SECONDS = float(os.getenv("CACHE_TTL_SECONDS", "60"))
+
+# Redis 키/채널 접두사
+REDIS_KEY_PREFIX = "api_hub:"
+INVALIDATION_CHANNEL = REDIS_KEY_PREFIX + "cache.invalidate"
+
+# 조회 결과가 없음을 나타내는 값 (None도 캐시할 수 있도록 구분)
+MISSING = object()
+
+
+class CacheCodec:
+    """
+    공유 저장소(Redis)에 저장할 값의 직렬화 방식 (기본: JSON으로 표현 가능한 값)
+
+    Example:
+        project_cache = create_cache("cache.projects", codec=ModelCodec(Project))
+    """
+
+    def dumps(self, value: Any) -> bytes:
+        return json.dumps(value, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+    def loads(self, data: bytes) -> Any:
+        return json.loads(data)
+
+
+class ModelCodec(CacheCodec):
+    """pydantic 모델 값을 model_dump_json / model_validate_json으로 직렬화하는 코덱"""
+
+    def __init__(self, model: Any):
+        self.model = model
+
+    def dumps(self, value: Any) -> bytes:
+        return value.model_dump_json(by_alias=True).encode("utf-8")
+
+    def loads(self, data: bytes) -> Any:
+        return self.model.model_validate_json(data)
+
+
+class CacheBackend:
+    """
+    캐시 백엔드 인터페이스
+
+    get은 항목이 없으면 MISSING을 반환한다. delete/clear는 다른 워커의 항목까지 무효화해야 한다.
+    """
+
+    name: str
+
+    def get(self, key: Hashable) -> Any:
+        raise NotImplementedError
+
+    def set(self, key: Hashable, value: Any) -> None:
+        raise NotImplementedError
+
+    def delete(self, key: Hashable) -> None:
+        raise NotImplementedError
+
+    def clear(self) -> None:
+        raise NotImplementedError
+
+    def close(self) -> None:
+        """백엔드가 사용하는 연결/스레드를 정리한다."""
+
+    # 이벤트 루프에서 호출하는 메서드 (네트워크 I/O가 없는 백엔드는 그대로 실행)
+    async def aget(self, key: Hashable) -> Any:
+        return self.get(key)
+
+    async def aset(self, key: Hashable, value: Any) -> None:
+        self.set(key, value)
+
+    async def adelete(self, key: Hashable) -> None:
+        self.delete(key)
+
+
+class LRUCache(CacheBackend):
+    """
+    크기 제한 LRU + TTL 메모리 캐시 (스레드 안전)
+
+    Example:
+        api_spec_cache = LRUCache("cache.api_specs")
+        api_spec = await api_spec_cache.aget(api_spec_id)
+        if api_spec is MISSING:
+            api_spec = load(api_spec_id)
+            await api_spec_cache.aset(api_spec_id, api_spec)
+    """
+
+    def __init__(
+        self,
+        name: str,
+        max_size: int = CACHE_MAX_SIZE,
+        ttl: float = CACHE_TTL_SECONDS,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.name = name
+        self.max_size = max_size
+        self.ttl = ttl
+        self._clock = clock
+        self._entries: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = registry.counter(f"{name}.hits")
+        self.misses = registry.counter(f"{name}.misses")
+        self.evictions = registry.counter(f"{name}.evictions")
+        self.expirations = registry.counter(f"{name}.expirations")
+        registry.register_collector(f"{name}.size", lambda: len(self._entries))
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_size > 0
+
+    def get(self, key: Hashable) -> Any:
+        """
+        키의 값을 반환한다. 없거나 만료되었으면 MISSING을 반환한다.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses.inc()
+                return MISSING
+            expires_at, value = entry
+            if expires_at and expires_at <= self._clock():
+                del self._entries[key]
+                self.expirations.inc()
+                self.misses.inc()
+                return MISSING
+            self._entries.move_to_end(key)
+            self.hits.inc()
+            return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """
+        키에 값을 저장한다. 최대 크기를 넘으면 가장 오래 사용되지 않은 항목을 제거한다.
+        """
+        if not self.enabled:
+            return
+        expires_at = self._clock() + self.ttl if self.ttl > 0 else 0.0
+        with self._lock:
+            self._entries[key] = (expires_at, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self.evictions.inc()
+
+    def delete(self, key: Hashable) -> None:
+        """키를 무효화한다."""
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        """모든 항목을 무효화한다."""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class RedisCacheBackend(CacheBackend):
+    """
+    Redis 프로토콜 공유 캐시 + 워커별 로컬 LRU 캐시
+
+    값은 codec(기본 JSON)으로 직렬화하여 TTL과 함께 Redis에 저장한다. 조회는 로컬 캐시를 먼저 확인하고,
+    없으면 Redis에서 읽어 로컬 캐시에 채운다. delete/clear는 Redis에서 항목을 지운 뒤
+    INVALIDATION_CHANNEL로 무효화를 발행하며, 각 워커의 구독 스레드가 로컬 항목을 제거한다.
+    aget/aset/adelete는 Redis 호출을 스레드에서 실행한다. (로컬 캐시 적중 시에는 스레드를 쓰지 않음)
+
+    Example:
+        backend = RedisCacheBackend("cache.projects", redis.Redis.from_url(url), codec=ModelCodec(Project))
+    """
+
+    def __init__(
+        self,
+        name: str,
+        client: Any,
+        max_size: int = CACHE_MAX_SIZE,
+        ttl: float = CACHE_TTL_SECONDS,
+        subscribe: bool = True,
+        codec: Optional[CacheCodec] = None,
+    ):
+        self.name = name
+        self.client = client
+        self.codec = codec or CacheCodec()
+        self.ttl = ttl
+        self.local = LRUCache(f"{name}.local", max_size=max_size, ttl=ttl)
+        self.hits = registry.counter(f"{name}.hits")
+        self.misses = registry.counter(f"{name}.misses")
+        self.invalidations_received = registry.counter(f"{name}.invalidations_received")
+        self._listener = None
+        if subscribe:
+            pubsub = client.pubsub(ignore_subscribe_messages=True)
+            pubsub.subscribe(**{INVALIDATION_CHANNEL: self.handle_invalidation})
+            self._listener = pubsub.run_in_thread(sleep_time=1.0, daemon=True)
+
+    def _redis_key(self, key: Hashable) -> str:
+        return f"{REDIS_KEY_PREFIX}{self.name}:{key}"
+
+    def get(self, key: Hashable) -> Any:
+        value = self.local.get(str(key))
+        if value is not MISSING:
+            self.hits.inc()
+            return value
+        return self._get_shared(key)
+
+    def _get_shared(self, key: Hashable) -> Any:
+        # Redis에서 읽어 로컬 캐시에 채운다.
+        data = self.client.get(self._redis_key(key))
+        if data is None:
+            self.misses.inc()
+            return MISSING
+        self.hits.inc()
+        value = self.codec.loads(data)
+        self.local.set(str(key), value)
+        return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        if not self.local.enabled:
+            return
+        data = self.codec.dumps(value)
+        if self.ttl > 0:
+            self.client.set(self._redis_key(key), data, px=int(self.ttl * 1000))
+        else:
+            self.client.set(self._redis_key(key), data)
+        self.local.set(str(key), value)
+
+    def delete(self, key: Hashable) -> None:
+        self.local.delete(str(key))
+        self.client.delete(self._redis_key(key))
+        self.client.publish(INVALIDATION_CHANNEL, f"{self.name}\x1f{key}")
+
+    def clear(self) -> None:
+        self.local.clear()
+        keys = list(self.client.scan_iter(match=self._redis_key("*")))
+        if keys:
+            self.client.delete(*keys)
+        self.client.publish(INVALIDATION_CHANNEL, f"{self.name}\x1f*")
+
+    async def aget(self, key: Hashable) -> Any:
+        value = self.local.get(str(key))
+        if value is not MISSING:
+            self.hits.inc()
+            return value
+        return await asyncio.to_thread(self._get_shared, key)
+
+    async def aset(self, key: Hashable, value: Any) -> None:
+        if self.local.enabled:
+            await asyncio.to_thread(self.set, key, value)
+
+    async def adelete(self, key: Hashable) -> None:
+        # 로컬 항목은 바로 제거하고 Redis 삭제/무효화 발행만 스레드에서 실행
+        self.local.delete(str(key))
+        await asyncio.to_thread(self.delete, key)
+
+    def handle_invalidation(self, message: dict) -> None:
+        """
+        무효화 메시지("<캐시 이름>\\x1f<키>", 키가 *이면 전체)를 받아 로컬 항목을 제거한다.
+        자신이 발행한 메시지도 수신하지만 이미 제거된 항목이므로 영향이 없다.
+        """
+        data = message.get("data")
+        if isinstance(data, bytes):
+            data = data.decode("utf-8")
+        name, _, key = str(data).partition("\x1f")
+        if name != self.name:
+            return
+        self.invalidations_received.inc()
+        if key == "*":
+            self.local.clear()
+        else:
+            self.local.delete(key)
+
+    def close(self) -> None:
+        if self._listener is not None:
+            self._listener.stop()
+            self._listener = None
+
+
+# 생성된 모든 캐시 (테스트/운영 중 일괄 무효화용)
+_caches: List[CacheBackend] = []
+_redis_client: Optional[Any] = None
+
+
+def _get_redis_client() -> Any:
+    global _redis_client
+    if _redis_client is None:
+        try:
+            import redis
+        except ImportError as e:
+            raise RuntimeError("CACHE_BACKEND=redis requires the redis package (pip install redis)") from e
+        _redis_client = redis.Redis.from_url(CACHE_REDIS_URL)
+    return _redis_client
+
+
+def create_cache(name: str, backend: Optional[str] = None, codec: Optional[CacheCodec] = None) -> CacheBackend:
+    """
+    설정된 백엔드(CACHE_BACKEND)로 캐시를 생성하는 함수
+
+    Args:
+        name (str): 캐시 이름 (메트릭/Redis 키 접두사로 사용)
+        backend (Optional[str]): memory 또는 redis (기본: CACHE_BACKEND)
+        codec (Optional[CacheCodec]): redis 백엔드의 값 직렬화 방식 (기본: JSON, memory 백엔드는 객체를 그대로 보관)
+
+    Returns:
+        CacheBackend: 생성된 캐시
+    """
+    backend = backend or CACHE_BACKEND
+    if backend == "memory":
+        cache = LRUCache(name)
+    elif backend == "redis":
+        cache = RedisCacheBackend(name, _get_redis_client(), codec=codec)
+    else:
+        raise ValueError(f"Unsupported CACHE_BACKEND: {backend}")
+    _caches.append(cache)
+    return cache
+
+
+def clear_caches() -> None:
+    """생성된 모든 캐시를 비운다."""
+    for cache in _caches:
+        cache.clear()
+
+
+def close_caches() -> None:
+    """생성된 모든 캐시의 연결/구독 스레드를 정리한다."""
+    for cache in _caches:
+        cache.close()
@@ -0,0 +1,198 @@
+# coding: utf-8
+
+"""
+조건부 요청(ETag / If-None-Match, Last-Modified / If-Modified-Since, If-Match) 처리 모듈
+
+스펙/목록 조회 전에 식별자·수정일·내용 해시 같은 가벼운 컬럼만 읽어 검증자(Validators)를 만들고,
+클라이언트가 가진 값과 같으면 본문을 읽지 않고 304 Not Modified로 응답한다.
+수정 요청은 If-Match로 클라이언트가 읽은 버전(row_version을 담은 ETag)을 전제 조건으로 받아,
+row_version을 비교하는 단일 UPDATE(compare-and-swap)로 수정하고 그 사이에 바뀌었으면 412로 거절한다.
+
+사용 예:
+    validators = await impl.api_specs_api_spec_id_validators(api_spec_id)
+    if is_not_modified(request, validators):
+        return not_modified_response(validators)
+"""
+
+import hashlib
+import re
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Any, Dict, Iterable, List, Optional, Sequence
+
+from fastapi import HTTPException, Request, Response
+
+# version_etag로 만든 ETag ("v<row_version>")
+_VERSION_ETAG = re.compile(r'^"v(\d+)"$')
+
+
+@dataclass(frozen=True)
+class Validators:
+    """
+    응답 표현의 검증자
+
+    Attributes:
+        etag (str): 강한 ETag (따옴표 포함)
+        last_modified (Optional[datetime]): 마지막 수정일
+    """
+    etag: str
+    last_modified: Optional[datetime] = None
+
+    def for_variant(self, *parts: Any) -> "Validators":
+        """같은 데이터의 다른 표현(쿼리 파라미터 등)을 구분하는 ETag로 바꾼 검증자를 반환한다."""
+        return Validators(etag=make_etag(self.etag, *parts), last_modified=self.last_modified)
+
+
+def make_etag(*parts: Any) -> str:
+    """
+    주어진 값들로 강한 ETag를 만드는 함수
+
+    Returns:
+        str: "<sha256 앞 32자리>" 형태의 ETag
+    """
+    digest = hashlib.sha256("\x1f".join(str(part) for part in parts).encode("utf-8"))
+    return f'"{digest.hexdigest()[:32]}"'
+
+
+def rows_validators(rows: Iterable[Any], columns: Sequence[str], *parts: Any) -> Validators:
+    """
+    목록 페이지 행들의 columns 값으로 검증자를 만드는 함수
+    속성으로 값을 읽으므로 ORM 행과 같은 컬럼만 조회한 결과가 같은 ETag가 된다.
+
+    Args:
+        rows (Iterable): columns와 updated_at 속성을 가진 행 (ORM 행 또는 컬럼 단위 조회 결과)
+        columns (Sequence[str]): ETag에 반영할 컬럼 이름 (id, updated_at, row_version 등)
+        parts: ETag에 함께 반영할 값 (다음 페이지 커서 등)
+
+    Returns:
+        Validators: 행 전체의 ETag와 가장 최근 updated_at
+    """
+    rows = list(rows)
+    updated = [row.updated_at for row in rows if row.updated_at is not None]
+    return Validators(
+        etag=make_etag(*parts, *(tuple(getattr(row, name) for name in columns) for row in rows)),
+        last_modified=max(updated) if updated else None,
+    )
+
+
+def http_date(value: datetime) -> str:
+    """datetime을 HTTP 날짜 형식으로 변환한다. (타임존이 없으면 서버 로컬 시간으로 간주)"""
+    return format_datetime(value.astimezone(timezone.utc), usegmt=True)
+
+
+def validator_headers(validators: Validators) -> Dict[str, str]:
+    """ETag, Last-Modified 응답 헤더를 반환한다."""
+    headers = {"ETag": validators.etag}
+    if validators.last_modified is not None:
+        headers["Last-Modified"] = http_date(validators.last_modified)
+    return headers
+
+
+def set_validator_headers(response: Response, validators: Validators) -> None:
+    """응답에 ETag, Last-Modified 헤더를 설정한다."""
+    response.headers.update(validator_headers(validators))
+
+
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    # If-None-Match는 약한 비교를 사용한다 (W/ 접두사 무시)
+    if if_none_match.strip() == "*":
+        return True
+    candidates = (tag.strip() for tag in if_none_match.split(","))
+    return any((tag[2:] if tag.startswith("W/") else tag) == etag for tag in candidates)
+
+
+def has_conditional_headers(request: Request) -> bool:
+    """요청에 If-None-Match 또는 If-Modified-Since 헤더가 있는지 확인한다. (없으면 304 검사용 조회를 생략할 수 있다.)"""
+    return "if-none-match" in request.headers or "if-modified-since" in request.headers
+
+
+def is_not_modified(request: Request, validators: Validators) -> bool:
+    """
+    요청의 조건부 헤더가 현재 검증자와 일치하는지 확인하는 함수
+    If-None-Match가 있으면 If-Modified-Since는 무시한다. (RFC 9110)
+
+    Returns:
+        bool: 304 Not Modified로 응답해도 되면 True
+    """
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        return _etag_matches(if_none_match, validators.etag)
+
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since is None or validators.last_modified is None:
+        return False
+    try:
+        since = parsedate_to_datetime(if_modified_since)
+    except (TypeError, ValueError):
+        return False
+    if since.tzinfo is None:
+        since = since.replace(tzinfo=timezone.utc)
+    # HTTP 날짜는 초 단위이므로 마이크로초는 버리고 비교
+    return validators.last_modified.astimezone(timezone.utc).replace(microsecond=0) <= since
+
+
+def not_modified_response(validators: Validators) -> Response:
+    """본문 없는 304 Not Modified 응답을 반환한다."""
+    return Response(status_code=304, headers=validator_headers(validators))
+
+
+def version_etag(row_version: int) -> str:
+    """
+    행 버전(row_version)을 담은 강한 ETag를 만드는 함수 (If-Match에서 버전을 바로 꺼낼 수 있음)
+
+    Examples:
+        >>> version_etag(3)
+        '"v3"'
+    """
+    return f'"v{row_version}"'
+
+
+def if_match_versions(if_match: Optional[str]) -> Optional[List[int]]:
+    """
+    If-Match 헤더에서 클라이언트가 기대하는 row_version 목록을 꺼내는 함수 (강한 비교, 약한 ETag는 무시)
+
+    Args:
+        if_match (Optional[str]): If-Match 요청 헤더 값
+
+    Returns:
+        Optional[List[int]]: 기대하는 row_version 목록 (*이면 None, 버전이 아닌 ETag만 있으면 빈 목록)
+
+    Raises:
+        HTTPException: If-Match가 없으면 428 Precondition Required
+
+    Examples:
+        >>> if_match_versions('"v3", "v4"')
+        [3, 4]
+        >>> if_match_versions("*") is None
+        True
+    """
+    if if_match is None:
+        raise HTTPException(status_code=428, detail="If-Match header is required")
+    if if_match.strip() == "*":
+        return None
+    versions = []
+    for tag in if_match.split(","):
+        match = _VERSION_ETAG.match(tag.strip())
+        if match:
+            versions.append(int(match.group(1)))
+    return versions
+
+
+def precondition_failed() -> HTTPException:
+    """If-Match가 현재 ETag와 다를 때의 412 Precondition Failed 예외를 반환하는 함수"""
+    return HTTPException(status_code=412, detail="Resource has been modified (If-Match does not match the current ETag)")
+
+
+def precondition_failed_or_not_found(exists: bool, detail: str) -> HTTPException:
+    """
+    row_version 비교 수정(compare_and_swap)이 실패했을 때의 예외를 반환하는 함수
+
+    Args:
+        exists (bool): 조건(row_version 제외)에 맞는 행이 있는지 여부
+        detail (str): 행이 없을 때의 404 메시지
+
+    Returns:
+        HTTPException: 행이 있으면 412 Precondition Failed (그 사이 다른 요청이 수정함), 없으면 404
+    """
+    return precondition_failed() if exists else HTTPException(status_code=404, detail=detail)
@@ -0,0 +1,81 @@
+# coding: utf-8
+
+"""
+데이터베이스 관리 CLI
+
+컨테이너 시작 시 애플리케이션 워커보다 먼저 한 번 실행하여 스키마를 준비한다.
+(MySQL에서는 GET_LOCK으로 직렬화되므로 여러 파드가 동시에 실행해도 안전하다.)
+검색/사용처 색인 테이블을 새로 만든 경우(업그레이드) 또는 --reindex를 지정한 경우 기존 API 스펙으로 색인을 채운다.
+
+Example:
+    DATABASE_URL=mysql+pymysql://user:password@db:3306/api_hub api-hub-init-db
+"""
+
+import argparse
+import logging
+import sys
+from typing import List, Optional
+
+from sqlalchemy.orm import Session
+
+from api_hub.db import database
+from api_hub.log import setup_logging, shutdown_logging
+from openapi_server.impl.api_specs_api import REINDEX_BATCH_SIZE, reindex_api_specs
+
+# 새로 만들어지면 기존 API 스펙으로 채워야 하는 색인 테이블
+INDEX_TABLES = ("api_spec_search", "api_spec_usages")
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    api-hub-init-db 진입점: 없는 테이블, 컬럼, 인덱스를 생성하고 필요하면 색인을 다시 만든 뒤 결과와 소요 시간을 출력한다.
+
+    Returns:
+        int: 종료 코드 (0: 성공, 1: 실패)
+    """
+    parser = argparse.ArgumentParser(prog="api-hub-init-db", description="Create missing Open API Hub tables, columns and indexes.")
+    parser.add_argument(
+        "--lock-timeout",
+        type=int,
+        default=database.INIT_DB_LOCK_TIMEOUT,
+        help="seconds to wait for the schema lock held by another process (MySQL only)",
+    )
+    parser.add_argument(
+        "--reindex",
+        action="store_true",
+        help="rebuild the search and usage indexes from all API specs (done automatically when the index tables are created)",
+    )
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=REINDEX_BATCH_SIZE,
+        help="number of API specs to index per transaction",
+    )
+    args = parser.parse_args(argv)
+    setup_logging()
+
+    try:
+        result = database.init_db(lock_timeout=args.lock_timeout)
+        reindexed = None
+        if args.reindex or set(INDEX_TABLES) & set(result.created_tables):
+            with Session(database.engine) as db:
+                reindexed = reindex_api_specs(db, args.batch_size)
+    except Exception:
+        logging.getLogger(__name__).exception("Failed to initialize database")
+        return 1
+    finally:
+        database.engine.dispose()
+        shutdown_logging()
+    print(
+        f"tables created: {len(result.created_tables)}, "
+        f"columns added: {len(result.added_columns)}, "
+        f"indexes created: {len(result.created_indexes)}, "
+        f"elapsed: {result.elapsed:.3f}s"
+    )
+    if reindexed is not None:
+        print(f"api specs reindexed: {reindexed}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,154 @@
+# coding: utf-8
+
+"""
+커넥션 풀 계측/예열 모듈
+
+커넥션 대기 시간과 타임아웃은 풀에서 커넥션을 꺼내는 _do_get을 감싸 측정하고,
+신규 연결/무효화 수는 SQLAlchemy 풀 이벤트로 수집한다.
+
+Metrics ({name}은 instrument_pool에 전달한 이름, 예: db.pool):
+    {name}.checked_out: 사용 중인 커넥션 수
+    {name}.checked_in: 풀에서 대기 중인 커넥션 수
+    {name}.overflow: pool_size를 넘어 생성된 커넥션 수 (음수면 아직 생성되지 않은 여유분)
+    {name}.wait_seconds: 커넥션을 얻기까지 걸린 시간 히스토그램 (신규 연결 시간 포함)
+    {name}.timeouts: pool_timeout 초과로 실패한 요청 수
+    {name}.connects: 새로 맺은 DB 연결 수
+    {name}.invalidations: 무효화된 연결 수 (pool_pre_ping으로 발견한 끊긴 연결 포함)
+"""
+
+import time
+from typing import Any, Callable, List, Optional
+
+from sqlalchemy import event, exc
+from sqlalchemy.engine import Engine
+from sqlalchemy.pool import AsyncAdaptedQueuePool, Pool, QueuePool
+
+from api_hub.metrics import DEFAULT_BUCKETS, registry
+
+# 커넥션 대기 시간 히스토그램 버킷 (pool_timeout 기본값 30초까지 구분)
+WAIT_BUCKETS = DEFAULT_BUCKETS + (30.0,)
+
+
+class PoolMetrics:
+    """
+    커넥션 풀 하나의 지표 묶음
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+        self.wait_seconds = registry.histogram(f"{name}.wait_seconds", WAIT_BUCKETS)
+        self.timeouts = registry.counter(f"{name}.timeouts")
+        self.connects = registry.counter(f"{name}.connects")
+        self.invalidations = registry.counter(f"{name}.invalidations")
+
+
+class _InstrumentedPoolMixin:
+    """
+    커넥션을 꺼낼 때 대기 시간과 타임아웃을 기록하는 풀 믹스인
+    """
+
+    metrics: Optional[PoolMetrics] = None
+
+    def _do_get(self) -> Any:
+        metrics = self.metrics
+        if metrics is None:
+            return super()._do_get()
+        started = time.perf_counter()
+        try:
+            return super()._do_get()
+        except exc.TimeoutError:
+            metrics.timeouts.inc()
+            raise
+        finally:
+            metrics.wait_seconds.observe(time.perf_counter() - started)
+
+    def recreate(self) -> Pool:
+        # engine.dispose() 등으로 풀이 다시 만들어져도 같은 지표에 기록한다.
+        pool = super().recreate()
+        pool.metrics = self.metrics
+        return pool
+
+
+class InstrumentedQueuePool(_InstrumentedPoolMixin, QueuePool):
+    """대기 시간/타임아웃을 기록하는 QueuePool (동기 엔진용)"""
+
+
+class InstrumentedAsyncAdaptedQueuePool(_InstrumentedPoolMixin, AsyncAdaptedQueuePool):
+    """대기 시간/타임아웃을 기록하는 AsyncAdaptedQueuePool (비동기 엔진용)"""
+
+
+def _pool_stat(engine: Engine, method: str) -> Callable[[], Any]:
+    # engine.dispose() 이후에도 현재 풀을 보도록 호출 시점에 engine.pool을 조회한다.
+    def collect() -> Any:
+        stat = getattr(engine.pool, method, None)
+        return stat() if stat is not None else None
+    return collect
+
+
+def instrument_pool(engine: Engine, name: str) -> PoolMetrics:
+    """
+    엔진의 커넥션 풀 지표를 레지스트리에 등록하는 함수
+    대기 시간/타임아웃은 Instrumented*QueuePool을 사용하는 엔진에서만 기록된다.
+
+    Args:
+        engine (Engine): 대상 엔진 (비동기 엔진은 sync_engine을 전달)
+        name (str): 지표 이름 접두사 (예: db.pool)
+
+    Returns:
+        PoolMetrics: 등록된 지표
+    """
+    metrics = PoolMetrics(name)
+    if isinstance(engine.pool, _InstrumentedPoolMixin):
+        engine.pool.metrics = metrics
+    event.listen(engine, "connect", lambda *args: metrics.connects.inc())
+    event.listen(engine, "invalidate", lambda *args: metrics.invalidations.inc())
+    registry.register_collector(f"{name}.checked_out", _pool_stat(engine, "checkedout"))
+    registry.register_collector(f"{name}.checked_in", _pool_stat(engine, "checkedin"))
+    registry.register_collector(f"{name}.overflow", _pool_stat(engine, "overflow"))
+    return metrics
+
+
+def _warm_up_size(engine: Engine, size: Optional[int]) -> int:
+    if size is not None:
+        return size
+    pool_size = getattr(engine.pool, "size", None)
+    return pool_size() if pool_size is not None else 0
+
+
+def warm_up_pool(engine: Engine, size: Optional[int] = None) -> int:
+    """
+    커넥션을 size개(기본: pool_size) 동시에 열었다가 반환하여 풀을 미리 채우는 함수
+    배포 직후 첫 요청들이 TCP 연결/인증 시간을 기다리지 않게 한다.
+
+    Args:
+        engine (Engine): 대상 엔진
+        size (Optional[int]): 열어 둘 커넥션 수
+
+    Returns:
+        int: 연 커넥션 수
+    """
+    connections: List[Any] = []
+    try:
+        for _ in range(_warm_up_size(engine, size)):
+            connections.append(engine.connect())
+    finally:
+        for connection in connections:
+            connection.close()
+    return len(connections)
+
+
+async def warm_up_async_pool(engine: Any, size: Optional[int] = None) -> int:
+    """
+    비동기 엔진(AsyncEngine)의 풀을 미리 채우는 함수 (warm_up_pool 참고)
+
+    Returns:
+        int: 연 커넥션 수
+    """
+    connections: List[Any] = []
+    try:
+        for _ in range(_warm_up_size(engine.sync_engine, size)):
+            connections.append(await engine.connect())
+    finally:
+        for connection in connections:
+            await connection.close()
+    return len(connections)
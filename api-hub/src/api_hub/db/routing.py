@@ -0,0 +1,163 @@
+# coding: utf-8
+
+"""
+읽기 복제본(read replica) 라우팅 모듈
+
+읽기 쿼리는 복제본으로, 쓰기와 쓰기 이후의 읽기(read-after-write)는 주(primary) DB로 보낸다.
+복제 지연으로 방금 쓴 데이터가 보이지 않는 문제를 막기 위해, 쓰기를 한 클라이언트의 요청은
+DB_STICKY_PRIMARY_SECONDS 동안 주 DB에서 읽는다.
+
+요청 단위 상태는 contextvar(RoutingState)로 전달된다. PrimaryStickinessMiddleware가 요청마다
+상태를 만들고, RoutingSession이 쓰기를 기록하면 응답 전에 클라이언트를 고정(sticky) 목록에 등록한다.
+(고정 목록은 워커별 메모리에 보관된다.)
+
+Example:
+    SessionLocal = sessionmaker(class_=RoutingSession, primary=engine, replicas=ReplicaSet([replica_engine]))
+    app.add_middleware(PrimaryStickinessMiddleware)
+"""
+
+import hashlib
+import itertools
+import threading
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Any, Iterator, Optional, Sequence
+
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session
+from sqlalchemy.sql import Delete, Insert, Update
+
+from api_hub.cache import MISSING, LRUCache
+from api_hub.metrics import registry
+
+# 복제본에서 읽을 수 있는 HTTP 메서드 (그 외 메서드 요청은 전체를 주 DB로 처리)
+SAFE_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+
+
+@dataclass
+class RoutingState:
+    """
+    요청 단위 라우팅 상태
+
+    Attributes:
+        use_primary (bool): True이면 읽기도 주 DB로 보낸다.
+        wrote (bool): 이 요청에서 쓰기가 일어났는지 여부
+    """
+    use_primary: bool = False
+    wrote: bool = False
+
+
+# 현재 요청의 라우팅 상태 (미들웨어 밖에서는 None: 세션 단위로만 판단)
+routing_state: ContextVar[Optional[RoutingState]] = ContextVar("routing_state", default=None)
+
+
+class ReplicaSet:
+    """
+    복제본 엔진 목록 (여러 스레드에서 안전한 라운드 로빈 선택)
+    """
+
+    def __init__(self, engines: Sequence[Engine] = ()):
+        self.engines = list(engines)
+        self._cycle = itertools.cycle(self.engines)
+        self._lock = threading.Lock()
+
+    def __bool__(self) -> bool:
+        return bool(self.engines)
+
+    def __iter__(self) -> Iterator[Engine]:
+        return iter(self.engines)
+
+    def next(self) -> Engine:
+        """다음 복제본 엔진을 반환한다."""
+        with self._lock:
+            return next(self._cycle)
+
+
+class RoutingSession(Session):
+    """
+    쿼리 종류에 따라 주 DB/복제본 엔진을 선택하는 세션
+
+    - INSERT/UPDATE/DELETE, flush, SELECT ... FOR UPDATE: 주 DB
+    - 같은 세션에서 쓰기 이후의 읽기, 요청 상태가 use_primary인 경우: 주 DB
+    - 그 외 읽기: 복제본 (라운드 로빈)
+    """
+
+    def __init__(self, *args: Any, primary: Engine, replicas: ReplicaSet, **kwargs: Any):
+        super().__init__(*args, **kwargs)
+        self.primary = primary
+        self.replicas = replicas
+        self._wrote = False
+
+    def get_bind(self, mapper: Any = None, clause: Any = None, **kwargs: Any) -> Engine:
+        if self._flushing or isinstance(clause, (Insert, Update, Delete)) or getattr(clause, "_for_update_arg", None) is not None:
+            self._mark_write()
+            return self.primary
+        state = routing_state.get()
+        if self._wrote or not self.replicas or (state is not None and state.use_primary):
+            return self.primary
+        return self.replicas.next()
+
+    def _mark_write(self) -> None:
+        self._wrote = True
+        state = routing_state.get()
+        if state is not None:
+            state.wrote = True
+            state.use_primary = True
+
+
+def client_key(scope: dict) -> str:
+    """
+    요청을 보낸 클라이언트를 식별하는 키를 반환하는 함수
+    X-Client-Id 헤더, Authorization 헤더(해시), 클라이언트 주소 순으로 사용한다.
+    """
+    headers = dict(scope.get("headers") or [])
+    client_id = headers.get(b"x-client-id")
+    if client_id:
+        return "id:" + client_id.decode("latin-1")
+    authorization = headers.get(b"authorization")
+    if authorization:
+        return "auth:" + hashlib.sha256(authorization).hexdigest()
+    client = scope.get("client")
+    return "addr:" + (client[0] if client else "-")
+
+
+class PrimaryStickinessMiddleware:
+    """
+    요청마다 RoutingState를 설정하는 ASGI 미들웨어
+
+    - 안전하지 않은 메서드(POST/PUT/PATCH/DELETE 등) 요청은 전체를 주 DB에서 처리한다.
+    - 쓰기가 일어난 요청의 클라이언트는 sticky_seconds 동안 읽기도 주 DB에서 처리한다.
+
+    Metrics:
+        db.routing.sticky_clients.size: 현재 주 DB에 고정된 클라이언트 수
+        db.routing.sticky_hits: 고정으로 인해 주 DB에서 처리된 읽기 요청 수
+    """
+
+    def __init__(self, app: Any, sticky_seconds: float = 5.0, max_clients: int = 10000):
+        self.app = app
+        self.sticky_seconds = sticky_seconds
+        self.sticky_clients = LRUCache("db.routing.sticky_clients", max_size=max_clients, ttl=sticky_seconds)
+        self.sticky_hits = registry.counter("db.routing.sticky_hits")
+
+    async def __call__(self, scope: dict, receive: Any, send: Any) -> None:
+        if scope["type"] != "http" or self.sticky_seconds <= 0:
+            await self.app(scope, receive, send)
+            return
+
+        key = client_key(scope)
+        state = RoutingState(use_primary=scope.get("method") not in SAFE_METHODS)
+        if not state.use_primary and self.sticky_clients.get(key) is not MISSING:
+            state.use_primary = True
+            self.sticky_hits.inc()
+
+        async def send_wrapper(message: dict) -> None:
+            # 응답을 보내기 전에 고정하여 클라이언트의 다음 요청이 항상 주 DB에서 읽도록 한다.
+            if message["type"] == "http.response.start" and state.wrote:
+                self.sticky_clients.set(key, True)
+            await send(message)
+
+        token = routing_state.set(state)
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            routing_state.reset(token)
@@ -0,0 +1,109 @@
+# coding: utf-8
+
+"""
+동기 impl 작업 오프로드용 스레드 풀 모듈
+
+동기 모드(DB_ASYNC_MODE=false)에서 블로킹 데이터베이스 작업을 이벤트 루프가 아닌
+크기가 제한된 전용 스레드 풀에서 실행한다. 스레드 풀 크기는 DB 커넥션 풀
+(DB_POOL_SIZE + DB_MAX_OVERFLOW)과 별도로 IMPL_THREADPOOL_SIZE로 설정한다.
+"""
+
+import asyncio
+import contextvars
+import os
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Optional, TypeVar
+
+from api_hub.metrics import registry
+
+T = TypeVar("T")
+
+# 스레드 풀 크기 (0이면 오프로드하지 않고 이벤트 루프에서 직접 실행)
+IMPL_THREADPOOL_SIZE = int(os.getenv("IMPL_THREADPOOL_SIZE", "0"))
+
+
+class BoundedThreadPool:
+    """
+    대기열 깊이와 대기 시간을 측정하는 크기 제한 스레드 풀
+
+    Metrics:
+        {name}.queue_depth: 제출되었지만 아직 실행되지 않은 작업 수
+        {name}.active: 실행 중인 작업 수
+        {name}.wait_seconds: 제출부터 실행 시작까지의 대기 시간 히스토그램
+        {name}.completed: 완료된 작업 수
+
+    Example:
+        pool = BoundedThreadPool(max_workers=8)
+        result = await pool.run(blocking_fn, arg)
+    """
+
+    def __init__(self, max_workers: int, name: str = "impl_threadpool"):
+        self.max_workers = max_workers
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix=name)
+        self.queue_depth = registry.gauge(f"{name}.queue_depth")
+        self.active = registry.gauge(f"{name}.active")
+        self.wait_seconds = registry.histogram(f"{name}.wait_seconds")
+        self.completed = registry.counter(f"{name}.completed")
+        registry.gauge(f"{name}.max_workers").set(max_workers)
+
+    async def run(self, fn: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        """
+        fn(*args, **kwargs)를 스레드 풀에서 실행하고 결과를 기다린다.
+        호출자의 contextvars는 작업 스레드로 복사된다.
+
+        Args:
+            fn (Callable): 실행할 블로킹 함수
+
+        Returns:
+            fn의 반환값
+        """
+        submitted_at = time.perf_counter()
+        self.queue_depth.inc()
+
+        def _task() -> T:
+            # 대기열에서 빠져 실행을 시작한 시점 기록
+            self.queue_depth.dec()
+            self.wait_seconds.observe(time.perf_counter() - submitted_at)
+            self.active.inc()
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                self.active.dec()
+                self.completed.inc()
+
+        def _done(future: "Future[T]") -> None:
+            # 실행 전에 취소된 작업(예: 클라이언트 연결 종료로 대기 중인 코루틴 취소)은 _task가 실행되지 않으므로 여기서 대기열 깊이를 줄인다.
+            # (실행을 시작한 작업은 취소되지 않는다.)
+            if future.cancelled():
+                self.queue_depth.dec()
+
+        context = contextvars.copy_context()
+        try:
+            future = self._executor.submit(context.run, _task)
+        except BaseException:
+            self.queue_depth.dec()
+            raise
+        future.add_done_callback(_done)
+        return await asyncio.wrap_future(future)
+
+    def shutdown(self) -> None:
+        """
+        실행 중인 작업이 끝날 때까지 기다린 후 스레드 풀을 종료한다.
+        """
+        self._executor.shutdown(wait=True)
+
+
+# 애플리케이션 전역 impl 스레드 풀 (비활성화 시 None)
+impl_threadpool: Optional[BoundedThreadPool] = (
+    BoundedThreadPool(IMPL_THREADPOOL_SIZE) if IMPL_THREADPOOL_SIZE > 0 else None
+)
+
+
+def shutdown_impl_threadpool() -> None:
+    """
+    impl 스레드 풀을 종료하는 함수
+    애플리케이션 종료 시 호출됩니다.
+    """
+    if impl_threadpool is not None:
+        impl_threadpool.shutdown()
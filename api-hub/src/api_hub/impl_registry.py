@@ -0,0 +1,122 @@
+# coding: utf-8
+
+"""
+API 구현체(impl) 레지스트리 모듈
+
+각 BaseXApi의 구현 클래스를 애플리케이션 시작 시 한 번만 생성하여 싱글턴으로 보관하고,
+FastAPI 의존성으로 라우터에 주입한다. 구현체는 선택적으로 다음 수명 주기 훅을 정의할 수 있다.
+
+    async def on_startup(self) -> None   # 애플리케이션 시작 시 (캐시 워밍업 등)
+    async def on_shutdown(self) -> None  # 애플리케이션 종료 시 (자원 정리 등)
+
+테스트에서는 override()로 구현체를 교체할 수 있다.
+
+Example:
+    get_impl = impl_registry.provider(BaseUsersApi)
+
+    @router.get("/users")
+    async def users_get(impl: BaseUsersApi = Depends(get_impl)) -> List[User]:
+        return await impl.users_get()
+"""
+
+import inspect
+from typing import Any, Callable, Dict, List, Type, TypeVar
+
+from fastapi import HTTPException
+
+T = TypeVar("T")
+
+
+class ImplRegistry:
+    """
+    BaseXApi 클래스 -> 구현체 싱글턴 인스턴스 레지스트리
+    """
+
+    def __init__(self):
+        self._bases: List[type] = []
+        self._instances: Dict[type, Any] = {}
+        self._overrides: Dict[type, Any] = {}
+        self._providers: Dict[type, Callable[[], Any]] = {}
+
+    def register(self, base: type) -> None:
+        """
+        레지스트리가 관리할 BaseXApi 클래스를 등록한다.
+        """
+        if base not in self._bases:
+            self._bases.append(base)
+
+    def get(self, base: Type[T]) -> T:
+        """
+        base의 구현체 인스턴스를 반환한다.
+        startup() 이전에 호출되면 이 시점에 인스턴스를 생성한다.
+
+        Raises:
+            HTTPException: 구현 클래스가 없을 경우 (500)
+        """
+        if base in self._overrides:
+            return self._overrides[base]
+        instance = self._instances.get(base)
+        if instance is None:
+            if not base.subclasses:
+                raise HTTPException(status_code=500, detail="Not implemented")
+            instance = self._instances[base] = base.subclasses[0]()
+        return instance
+
+    def provider(self, base: Type[T]) -> Callable[[], T]:
+        """
+        base의 구현체를 반환하는 FastAPI 의존성 함수를 반환한다.
+        base마다 동일한 함수 객체를 반환하므로 app.dependency_overrides의 키로도 사용할 수 있다.
+        """
+        self.register(base)
+        if base not in self._providers:
+            def _provide() -> T:
+                return self.get(base)
+
+            _provide.__name__ = f"get_{base.__name__}_impl"
+            self._providers[base] = _provide
+        return self._providers[base]
+
+    def override(self, base: type, impl: Any) -> None:
+        """
+        base의 구현체를 impl로 교체한다. (테스트용)
+        """
+        self._overrides[base] = impl
+
+    def clear_overrides(self) -> None:
+        """
+        override()로 교체한 구현체를 모두 해제한다.
+        """
+        self._overrides.clear()
+
+    async def startup(self) -> None:
+        """
+        등록된 모든 BaseXApi의 구현체를 생성하고 on_startup 훅을 호출한다.
+        """
+        for base in self._bases:
+            if base.subclasses:
+                await _call_hook(self.get(base), "on_startup")
+
+    async def shutdown(self) -> None:
+        """
+        생성된 구현체의 on_shutdown 훅을 호출하고 인스턴스를 해제한다.
+        """
+        instances = list(self._instances.values())
+        self._instances.clear()
+        for instance in instances:
+            await _call_hook(instance, "on_shutdown")
+
+
+async def _call_hook(instance: Any, name: str) -> None:
+    """
+    구현체에 수명 주기 훅이 정의되어 있으면 호출한다. (동기/비동기 모두 지원)
+    """
+    hook = getattr(instance, name, None)
+    if hook is None:
+        return
+    result = hook()
+    if inspect.isawaitable(result):
+        await result
+
+
+# 애플리케이션 전역 구현체 레지스트리
+impl_registry = ImplRegistry()
@@ -0,0 +1,137 @@
+# coding: utf-8
+
+"""
+구조화 로깅 모듈
+
+요청 처리 스레드는 로그 레코드를 큐에 넣기만 하고(QueueHandler), 포맷과 출력은
+별도 스레드(QueueListener)에서 처리하여 로그 I/O가 요청 처리를 막지 않는다.
+로그는 한 줄에 하나의 JSON 객체로 출력되며, extra로 전달한 값은 필드로 함께 기록된다.
+
+요청/응답 본문(스펙 내용 등) 같은 큰 페이로드는 기본적으로 기록하지 않는다.
+LOG_PAYLOADS=true 이고 DEBUG 레벨일 때 LOG_PAYLOAD_SAMPLE_RATE 비율로만 잘라서 기록한다.
+
+Environment variables:
+    LOG_LEVEL: 로그 레벨 (기본 INFO)
+    LOG_FORMAT: json 또는 text (기본 json)
+    LOG_PAYLOADS: 페이로드 로깅 여부 (기본 False)
+    LOG_PAYLOAD_SAMPLE_RATE: 페이로드 로깅 샘플링 비율 0~1 (기본 0.01)
+    LOG_PAYLOAD_MAX_CHARS: 기록할 페이로드 최대 길이 (기본 1024)
+
+Example:
+    logger = logging.getLogger(__name__)
+    logger.info("API spec created", extra={"api_spec_id": api_spec_id})
+    log_payload(logger, "API spec request", lambda: api_spec.model_dump_json())
+"""
+
+import json
+import logging
+import logging.handlers
+import os
+import queue
+import random
+import sys
+from datetime import datetime, timezone
+from typing import Any, Callable, Optional, Union
+
+LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO").upper()
+LOG_FORMAT = os.getenv("LOG_FORMAT", "json")
+LOG_PAYLOADS = os.getenv("LOG_PAYLOADS", "False").lower() == "true"
+LOG_PAYLOAD_SAMPLE_RATE = float(os.getenv("LOG_PAYLOAD_SAMPLE_RATE", "0.01"))
+LOG_PAYLOAD_MAX_CHARS = int(os.getenv("LOG_PAYLOAD_MAX_CHARS", "1024"))
+
+# LogRecord 기본 속성 (이 외의 속성은 extra로 전달된 필드로 간주)
+_RECORD_ATTRIBUTES = frozenset(vars(logging.LogRecord("", 0, "", 0, "", (), None))) | {"message", "asctime", "taskName"}
+
+
+class JsonFormatter(logging.Formatter):
+    """
+    로그 레코드를 한 줄 JSON으로 포맷하는 포매터
+    """
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "ts": datetime.fromtimestamp(record.created, timezone.utc).isoformat(),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        for key, value in vars(record).items():
+            if key not in _RECORD_ATTRIBUTES and not key.startswith("_"):
+                entry[key] = value
+        if record.exc_info:
+            entry["exc_info"] = self.formatException(record.exc_info)
+        return json.dumps(entry, ensure_ascii=False, default=str)
+
+
+_listener: Optional[logging.handlers.QueueListener] = None
+_handler: Optional[logging.handlers.QueueHandler] = None
+
+
+def setup_logging(level: str = LOG_LEVEL, fmt: str = LOG_FORMAT) -> None:
+    """
+    루트 로거에 QueueHandler를 설치하고 출력 스레드(QueueListener)를 시작하는 함수
+    여러 번 호출해도 한 번만 설치된다.
+
+    Args:
+        level (str): 로그 레벨
+        fmt (str): json 또는 text
+    """
+    global _listener, _handler
+    if _listener is not None:
+        return
+    output = logging.StreamHandler(sys.stderr)
+    if fmt == "json":
+        output.setFormatter(JsonFormatter())
+    else:
+        output.setFormatter(logging.Formatter("%(asctime)s %(levelname)s %(name)s: %(message)s"))
+
+    records: "queue.Queue[logging.LogRecord]" = queue.Queue(-1)
+    _handler = logging.handlers.QueueHandler(records)
+    root = logging.getLogger()
+    root.addHandler(_handler)
+    root.setLevel(level)
+    _listener = logging.handlers.QueueListener(records, output, respect_handler_level=True)
+    _listener.start()
+
+
+def shutdown_logging() -> None:
+    """QueueHandler를 제거하고, 출력 스레드를 멈추기 전에 큐에 남은 로그를 모두 출력한다."""
+    global _listener, _handler
+    if _handler is not None:
+        logging.getLogger().removeHandler(_handler)
+        _handler = None
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+
+
+def log_payload(
+    logger: logging.Logger,
+    message: str,
+    payload: Union[str, Callable[[], str]],
+    **fields: Any,
+) -> None:
+    """
+    페이로드를 샘플링하여 DEBUG 레벨로 기록하는 함수
+    LOG_PAYLOADS가 꺼져 있거나 샘플링에서 제외되면 payload를 만들지 않는다. (직렬화 비용 없음)
+
+    Args:
+        logger (logging.Logger): 기록할 로거
+        message (str): 로그 메시지
+        payload (Union[str, Callable[[], str]]): 페이로드 또는 페이로드를 만드는 함수
+        fields: 함께 기록할 필드
+    """
+    if not LOG_PAYLOADS or not logger.isEnabledFor(logging.DEBUG):
+        return
+    if random.random() >= LOG_PAYLOAD_SAMPLE_RATE:
+        return
+    text = payload() if callable(payload) else payload
+    logger.debug(
+        message,
+        extra={
+            **fields,
+            "payload": text[:LOG_PAYLOAD_MAX_CHARS],
+            "payload_size": len(text),
+            "payload_truncated": len(text) > LOG_PAYLOAD_MAX_CHARS,
+        },
+    )
@@ -12,6 +12,8 @@
 """  # noqa: E501
 
 
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 
 from api_hub.apis.api_specs_api import router as APISpecsApiRouter
@@ -19,15 +21,48 @@ from api_hub.apis.project_credentials_api import router as ProjectCredentialsApi
 from api_hub.apis.project_members_api import router as ProjectMembersApiRouter
 from api_hub.apis.projects_api import router as ProjectsApiRouter
 from api_hub.apis.users_api import router as UsersApiRouter
+from api_hub.cache import close_caches
+from api_hub.db import database
+from api_hub.db.database import close_async_db, warm_up_pools
+from api_hub.db.routing import PrimaryStickinessMiddleware
+from api_hub.db.threadpool import shutdown_impl_threadpool
+from api_hub.impl_registry import impl_registry
+from api_hub.log import setup_logging, shutdown_logging
+from api_hub.metrics import registry
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    setup_logging()
+    await warm_up_pools()
+    await impl_registry.startup()
+    yield
+    await impl_registry.shutdown()
+    shutdown_impl_threadpool()
+    close_caches()
+    await close_async_db()
+    shutdown_logging()
+
 
 app = FastAPI(
     title="Open API Hub API",
     description="API specification for Open API Hub project. This API is designed to manage users, projects, project members, API specifications, and project credentials.",
     version="1.0.0",
+    lifespan=lifespan,
 )
 
+# 읽기 복제본 사용 시 쓰기를 한 클라이언트의 읽기를 잠시 주 DB로 보낸다.
+if database.replicas:
+    app.add_middleware(PrimaryStickinessMiddleware, sticky_seconds=database.DB_STICKY_PRIMARY_SECONDS)
+
 app.include_router(APISpecsApiRouter)
 app.include_router(ProjectCredentialsApiRouter)
 app.include_router(ProjectMembersApiRouter)
 app.include_router(ProjectsApiRouter)
 app.include_router(UsersApiRouter)
+
+
+@app.get("/metrics", include_in_schema=False)
+async def metrics() -> dict:
+    """운영 지표 스냅샷 (스레드 풀, 커넥션 풀, 캐시 등)"""
+    return registry.snapshot()
@@ -0,0 +1,167 @@
+# coding: utf-8
+
+"""
+애플리케이션 메트릭 모듈
+
+스레드 풀, 커넥션 풀, 캐시 등의 운영 지표를 프로세스 내에서 수집하고
+/metrics 엔드포인트에서 JSON 스냅샷으로 제공한다.
+"""
+
+import threading
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+# 기본 히스토그램 버킷 (초 단위)
+DEFAULT_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+class Counter:
+    """
+    단조 증가하는 카운터
+    """
+
+    def __init__(self):
+        self._value = 0
+        self._lock = threading.Lock()
+
+    def inc(self, amount: int = 1) -> None:
+        with self._lock:
+            self._value += amount
+
+    @property
+    def value(self) -> int:
+        return self._value
+
+    def snapshot(self) -> int:
+        return self._value
+
+
+class Gauge:
+    """
+    증가/감소가 가능한 현재 값 지표
+    """
+
+    def __init__(self):
+        self._value = 0
+        self._lock = threading.Lock()
+
+    def set(self, value: float) -> None:
+        with self._lock:
+            self._value = value
+
+    def inc(self, amount: float = 1) -> None:
+        with self._lock:
+            self._value += amount
+
+    def dec(self, amount: float = 1) -> None:
+        with self._lock:
+            self._value -= amount
+
+    @property
+    def value(self) -> float:
+        return self._value
+
+    def snapshot(self) -> float:
+        return self._value
+
+
+class Histogram:
+    """
+    관측값 분포를 버킷별 누적 개수로 기록하는 히스토그램
+    """
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_BUCKETS):
+        self._buckets = tuple(sorted(buckets))
+        self._counts = [0] * len(self._buckets)
+        self._count = 0
+        self._sum = 0.0
+        self._max = 0.0
+        self._lock = threading.Lock()
+
+    def observe(self, value: float) -> None:
+        with self._lock:
+            self._count += 1
+            self._sum += value
+            self._max = max(self._max, value)
+            for i, bound in enumerate(self._buckets):
+                if value <= bound:
+                    self._counts[i] += 1
+
+    @property
+    def count(self) -> int:
+        return self._count
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            buckets = {str(bound): count for bound, count in zip(self._buckets, self._counts)}
+            buckets["+Inf"] = self._count
+            return {
+                "count": self._count,
+                "sum": self._sum,
+                "max": self._max,
+                "avg": self._sum / self._count if self._count else 0.0,
+                "buckets": buckets,
+            }
+
+
+class MetricsRegistry:
+    """
+    이름으로 지표를 등록/조회하는 레지스트리
+
+    Example:
+        wait_time = registry.histogram("impl_threadpool.wait_seconds")
+        wait_time.observe(0.012)
+        registry.snapshot()
+    """
+
+    def __init__(self):
+        self._metrics: Dict[str, Any] = {}
+        self._collectors: Dict[str, Callable[[], Any]] = {}
+        self._lock = threading.Lock()
+
+    def _get_or_create(self, name: str, factory: Callable[[], Any]) -> Any:
+        with self._lock:
+            if name not in self._metrics:
+                self._metrics[name] = factory()
+            return self._metrics[name]
+
+    def counter(self, name: str) -> Counter:
+        return self._get_or_create(name, Counter)
+
+    def gauge(self, name: str) -> Gauge:
+        return self._get_or_create(name, Gauge)
+
+    def histogram(self, name: str, buckets: Optional[Sequence[float]] = None) -> Histogram:
+        return self._get_or_create(name, lambda: Histogram(buckets or DEFAULT_BUCKETS))
+
+    def register_collector(self, name: str, collector: Callable[[], Any]) -> None:
+        """
+        스냅샷 시점에 값을 계산하는 수집 함수를 등록한다.
+
+        Args:
+            name (str): 지표 이름
+            collector (Callable): 현재 값을 반환하는 함수
+        """
+        with self._lock:
+            self._collectors[name] = collector
+
+    def names(self) -> List[str]:
+        return sorted(list(self._metrics) + list(self._collectors))
+
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        등록된 모든 지표의 현재 값을 반환한다.
+
+        Returns:
+            Dict[str, Any]: 지표 이름 -> 값
+        """
+        with self._lock:
+            metrics = dict(self._metrics)
+            collectors = dict(self._collectors)
+        result = {name: metric.snapshot() for name, metric in metrics.items()}
+        for name, collector in collectors.items():
+            result[name] = collector()
+        return dict(sorted(result.items()))
+
+
+# 애플리케이션 전역 메트릭 레지스트리
+registry = MetricsRegistry()
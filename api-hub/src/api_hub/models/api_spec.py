@@ -42,7 +42,8 @@ class APISpec(BaseModel):
     access_role: Optional[StrictStr] = Field(default=None, description="The role required to access the API.")
     created_by: Optional[StrictInt] = Field(default=None, description="The unique identifier of the user who created the API specification.")
     created_at: Optional[datetime] = Field(default=None, description="The date and time when the API specification was created.")
-    __properties: ClassVar[List[str]] = ["id", "project_id", "version", "title", "description", "spec_content", "is_archived", "access_role", "created_by", "created_at"]
+    row_version: Optional[StrictInt] = Field(default=None, description="The version of the API specification row, incremented on every change. Send its ETag (\"v<row_version>\") as If-Match when updating or deleting.")
+    __properties: ClassVar[List[str]] = ["id", "project_id", "version", "title", "description", "spec_content", "is_archived", "access_role", "created_by", "created_at", "row_version"]
 
     model_config = {
         "populate_by_name": True,
@@ -102,7 +103,8 @@ class APISpec(BaseModel):
             "is_archived": obj.get("is_archived"),
             "access_role": obj.get("access_role"),
             "created_by": obj.get("created_by"),
-            "created_at": obj.get("created_at")
+            "created_at": obj.get("created_at"),
+            "row_version": obj.get("row_version")
         })
         return _obj
 
@@ -0,0 +1,119 @@
+# coding: utf-8
+
+"""
+    Open API Hub API
+
+    API specification for Open API Hub project. This API is designed to manage users, projects, project members, API specifications, and project credentials.
+
+    The version of the OpenAPI document: 1.0.0
+    Generated by OpenAPI Generator (https://openapi-generator.tech)
+
+    Do not edit the class manually.
+"""  # noqa: E501
+
+
+from __future__ import annotations
+import pprint
+import re  # noqa: F401
+import json
+
+
+
+
+from pydantic import BaseModel, ConfigDict, Field, StrictBool, StrictInt, StrictStr
+from api_hub.models.api_spec_diff_change import APISpecDiffChange
+from typing import Any, ClassVar, Dict, List, Optional
+try:
+    from typing import Self
+except ImportError:
+    from typing_extensions import Self
+
+class APISpecDiff(BaseModel):
+    """
+    APISpecDiff
+    """ # noqa: E501
+    api_spec_id: Optional[StrictInt] = Field(default=None, description="The unique identifier of the base API specification.")
+    other_api_spec_id: Optional[StrictInt] = Field(default=None, description="The unique identifier of the API specification compared against the base.")
+    identical: Optional[StrictBool] = Field(default=None, description="Indicates whether both specifications have the same content.")
+    added_paths: Optional[List[StrictStr]] = Field(default=None, description="Paths that exist only in the other specification.")
+    removed_paths: Optional[List[StrictStr]] = Field(default=None, description="Paths that exist only in the base specification.")
+    changed_paths: Optional[List[StrictStr]] = Field(default=None, description="Paths that exist in both specifications with different definitions.")
+    added_operations: Optional[List[StrictStr]] = Field(default=None, description="Operations (METHOD /path) that exist only in the other specification.")
+    removed_operations: Optional[List[StrictStr]] = Field(default=None, description="Operations (METHOD /path) that exist only in the base specification.")
+    changed_operations: Optional[List[StrictStr]] = Field(default=None, description="Operations (METHOD /path) that exist in both specifications with different definitions.")
+    added_schemas: Optional[List[StrictStr]] = Field(default=None, description="Component schemas that exist only in the other specification.")
+    removed_schemas: Optional[List[StrictStr]] = Field(default=None, description="Component schemas that exist only in the base specification.")
+    changed_schemas: Optional[List[StrictStr]] = Field(default=None, description="Component schemas that exist in both specifications with different definitions.")
+    breaking_changes: Optional[List[StrictStr]] = Field(default=None, description="Changes that may break existing clients of the base specification.")
+    changes: Optional[List[APISpecDiffChange]] = Field(default=None, description="Value-level changes as JSON pointers.")
+    truncated: Optional[StrictBool] = Field(default=None, description="Indicates whether the list of value-level changes was truncated.")
+    __properties: ClassVar[List[str]] = ["api_spec_id", "other_api_spec_id", "identical", "added_paths", "removed_paths", "changed_paths", "added_operations", "removed_operations", "changed_operations", "added_schemas", "removed_schemas", "changed_schemas", "breaking_changes", "changes", "truncated"]
+
+    model_config = {
+        "populate_by_name": True,
+        "validate_assignment": True,
+        "protected_namespaces": (),
+    }
+
+
+    def to_str(self) -> str:
+        """Returns the string representation of the model using alias"""
+        return pprint.pformat(self.model_dump(by_alias=True))
+
+    def to_json(self) -> str:
+        """Returns the JSON representation of the model using alias"""
+        # TODO: pydantic v2: use .model_dump_json(by_alias=True, exclude_unset=True) instead
+        return json.dumps(self.to_dict())
+
+    @classmethod
+    def from_json(cls, json_str: str) -> Self:
+        """Create an instance of APISpecDiff from a JSON string"""
+        return cls.from_dict(json.loads(json_str))
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the dictionary representation of the model using alias.
+
+        This has the following differences from calling pydantic's
+        `self.model_dump(by_alias=True)`:
+
+        * `None` is only added to the output dict for nullable fields that
+          were set at model initialization. Other fields with value `None`
+          are ignored.
+        """
+        _dict = self.model_dump(
+            by_alias=True,
+            exclude={
+            },
+            exclude_none=True,
+        )
+        return _dict
+
+    @classmethod
+    def from_dict(cls, obj: Dict) -> Self:
+        """Create an instance of APISpecDiff from a dict"""
+        if obj is None:
+            return None
+
+        if not isinstance(obj, dict):
+            return cls.model_validate(obj)
+
+        _obj = cls.model_validate({
+            "api_spec_id": obj.get("api_spec_id"),
+            "other_api_spec_id": obj.get("other_api_spec_id"),
+            "identical": obj.get("identical"),
+            "added_paths": obj.get("added_paths"),
+            "removed_paths": obj.get("removed_paths"),
+            "changed_paths": obj.get("changed_paths"),
+            "added_operations": obj.get("added_operations"),
+            "removed_operations": obj.get("removed_operations"),
+            "changed_operations": obj.get("changed_operations"),
+            "added_schemas": obj.get("added_schemas"),
+            "removed_schemas": obj.get("removed_schemas"),
+            "changed_schemas": obj.get("changed_schemas"),
+            "breaking_changes": obj.get("breaking_changes"),
+            "changes": [APISpecDiffChange.from_dict(_item) for _item in obj["changes"]] if obj.get("changes") is not None else None,
+            "truncated": obj.get("truncated")
+        })
+        return _obj
+
+
@@ -0,0 +1,103 @@
+# coding: utf-8
+
+"""
+    Open API Hub API
+
+    API specification for Open API Hub project. This API is designed to manage users, projects, project members, API specifications, and project credentials.
+
+    The version of the OpenAPI document: 1.0.0
+    Generated by OpenAPI Generator (https://openapi-generator.tech)
+
+    Do not edit the class manually.
+"""  # noqa: E501
+
+
+from __future__ import annotations
+import pprint
+import re  # noqa: F401
+import json
+
+
+
+
+from datetime import datetime
+from pydantic import BaseModel, ConfigDict, Field, StrictBool, StrictInt, StrictStr
+from typing import Any, ClassVar, Dict, List, Optional
+try:
+    from typing import Self
+except ImportError:
+    from typing_extensions import Self
+
+class APISpecRevision(BaseModel):
+    """
+    APISpecRevision
+    """ # noqa: E501
+    api_spec_id: Optional[StrictInt] = Field(default=None, description="The unique identifier of the API specification.")
+    revision: Optional[StrictInt] = Field(default=None, description="The revision number of the API specification (starting at 1).")
+    is_snapshot: Optional[StrictBool] = Field(default=None, description="Indicates whether the revision is stored as a full snapshot rather than a JSON patch against the previous revision.")
+    spec_content_hash: Optional[StrictStr] = Field(default=None, description="The SHA-256 hash of the stored specification content at this revision.")
+    created_by: Optional[StrictInt] = Field(default=None, description="The unique identifier of the user who created the revision.")
+    created_at: Optional[datetime] = Field(default=None, description="The date and time when the revision was created.")
+    spec_content: Optional[StrictStr] = Field(default=None, description="The content of the API specification at this revision (only when fetching a single revision).")
+    __properties: ClassVar[List[str]] = ["api_spec_id", "revision", "is_snapshot", "spec_content_hash", "created_by", "created_at", "spec_content"]
+
+    model_config = {
+        "populate_by_name": True,
+        "validate_assignment": True,
+        "protected_namespaces": (),
+    }
+
+
+    def to_str(self) -> str:
+        """Returns the string representation of the model using alias"""
+        return pprint.pformat(self.model_dump(by_alias=True))
+
+    def to_json(self) -> str:
+        """Returns the JSON representation of the model using alias"""
+        # TODO: pydantic v2: use .model_dump_json(by_alias=True, exclude_unset=True) instead
+        return json.dumps(self.to_dict())
+
+    @classmethod
+    def from_json(cls, json_str: str) -> Self:
+        """Create an instance of APISpecRevision from a JSON string"""
+        return cls.from_dict(json.loads(json_str))
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the dictionary representation of the model using alias.
+
+        This has the following differences from calling pydantic's
+        `self.model_dump(by_alias=True)`:
+
+        * `None` is only added to the output dict for nullable fields that
+          were set at model initialization. Other fields with value `None`
+          are ignored.
+        """
+        _dict = self.model_dump(
+            by_alias=True,
+            exclude={
+            },
+            exclude_none=True,
+        )
+        return _dict
+
+    @classmethod
+    def from_dict(cls, obj: Dict) -> Self:
+        """Create an instance of APISpecRevision from a dict"""
+        if obj is None:
+            return None
+
+        if not isinstance(obj, dict):
+            return cls.model_validate(obj)
+
+        _obj = cls.model_validate({
+            "api_spec_id": obj.get("api_spec_id"),
+            "revision": obj.get("revision"),
+            "is_snapshot": obj.get("is_snapshot"),
+            "spec_content_hash": obj.get("spec_content_hash"),
+            "created_by": obj.get("created_by"),
+            "created_at": obj.get("created_at"),
+            "spec_content": obj.get("spec_content")
+        })
+        return _obj
+
+
@@ -0,0 +1,100 @@
+# coding: utf-8
+
+"""
+    Open API Hub API
+
+    API specification for Open API Hub project. This API is designed to manage users, projects, project members, API specifications, and project credentials.
+
+    The version of the OpenAPI document: 1.0.0
+    Generated by OpenAPI Generator (https://openapi-generator.tech)
+
+    Do not edit the class manually.
+"""  # noqa: E501
+
+
+from __future__ import annotations
+import pprint
+import re  # noqa: F401
+import json
+
+
+
+
+from pydantic import BaseModel, ConfigDict, Field, StrictFloat, StrictInt, StrictStr
+from typing import Any, ClassVar, Dict, List, Optional, Union
+try:
+    from typing import Self
+except ImportError:
+    from typing_extensions import Self
+
+class APISpecSearchResult(BaseModel):
+    """
+    APISpecSearchResult
+    """ # noqa: E501
+    id: Optional[StrictInt] = Field(default=None, description="The unique identifier of the API specification.")
+    project_id: Optional[StrictInt] = Field(default=None, description="The unique identifier of the project associated with the API specification.")
+    version: Optional[StrictStr] = Field(default=None, description="The version of the API specification.")
+    title: Optional[StrictStr] = Field(default=None, description="The title of the API specification.")
+    description: Optional[StrictStr] = Field(default=None, description="The description of the API specification.")
+    score: Optional[Union[StrictFloat, StrictInt]] = Field(default=None, description="The relevance score of the match (higher is more relevant).")
+    __properties: ClassVar[List[str]] = ["id", "project_id", "version", "title", "description", "score"]
+
+    model_config = {
+        "populate_by_name": True,
+        "validate_assignment": True,
+        "protected_namespaces": (),
+    }
+
+
+    def to_str(self) -> str:
+        """Returns the string representation of the model using alias"""
+        return pprint.pformat(self.model_dump(by_alias=True))
+
+    def to_json(self) -> str:
+        """Returns the JSON representation of the model using alias"""
+        # TODO: pydantic v2: use .model_dump_json(by_alias=True, exclude_unset=True) instead
+        return json.dumps(self.to_dict())
+
+    @classmethod
+    def from_json(cls, json_str: str) -> Self:
+        """Create an instance of APISpecSearchResult from a JSON string"""
+        return cls.from_dict(json.loads(json_str))
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the dictionary representation of the model using alias.
+
+        This has the following differences from calling pydantic's
+        `self.model_dump(by_alias=True)`:
+
+        * `None` is only added to the output dict for nullable fields that
+          were set at model initialization. Other fields with value `None`
+          are ignored.
+        """
+        _dict = self.model_dump(
+            by_alias=True,
+            exclude={
+            },
+            exclude_none=True,
+        )
+        return _dict
+
+    @classmethod
+    def from_dict(cls, obj: Dict) -> Self:
+        """Create an instance of APISpecSearchResult from a dict"""
+        if obj is None:
+            return None
+
+        if not isinstance(obj, dict):
+            return cls.model_validate(obj)
+
+        _obj = cls.model_validate({
+            "id": obj.get("id"),
+            "project_id": obj.get("project_id"),
+            "version": obj.get("version"),
+            "title": obj.get("title"),
+            "description": obj.get("description"),
+            "score": obj.get("score")
+        })
+        return _obj
+
+
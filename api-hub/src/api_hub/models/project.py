@@ -38,7 +38,8 @@ class Project(BaseModel):
     is_archived: Optional[StrictBool] = Field(default=None, description="Indicates whether the project is archived.")
     created_by: Optional[StrictInt] = Field(default=None, description="The unique identifier of the user who created the project.")
     created_at: Optional[datetime] = Field(default=None, description="The date and time when the project was created.")
-    __properties: ClassVar[List[str]] = ["id", "name", "description", "is_archived", "created_by", "created_at"]
+    row_version: Optional[StrictInt] = Field(default=None, description="The version of the project row, incremented on every change. Send its ETag (\"v<row_version>\") as If-Match when updating or deleting.")
+    __properties: ClassVar[List[str]] = ["id", "name", "description", "is_archived", "created_by", "created_at", "row_version"]
 
     model_config = {
         "populate_by_name": True,
@@ -94,7 +95,8 @@ class Project(BaseModel):
             "description": obj.get("description"),
             "is_archived": obj.get("is_archived"),
             "created_by": obj.get("created_by"),
-            "created_at": obj.get("created_at")
+            "created_at": obj.get("created_at"),
+            "row_version": obj.get("row_version")
         })
         return _obj
 
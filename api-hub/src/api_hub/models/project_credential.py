@@ -40,7 +40,8 @@ class ProjectCredential(BaseModel):
     created_by: Optional[StrictInt] = Field(default=None, description="The unique identifier of the user who created the project credential.")
     created_at: Optional[datetime] = Field(default=None, description="The date and time when the project credential was created.")
     expires_at: Optional[datetime] = Field(default=None, description="The date and time when the project credential expires.")
-    __properties: ClassVar[List[str]] = ["id", "project_id", "api_key_name", "api_key", "api_secret", "created_by", "created_at", "expires_at"]
+    row_version: Optional[StrictInt] = Field(default=None, description="The version of the project credential row, incremented on every change. Send its ETag (\"v<row_version>\") as If-Match when updating or deleting.")
+    __properties: ClassVar[List[str]] = ["id", "project_id", "api_key_name", "api_key", "api_secret", "created_by", "created_at", "expires_at", "row_version"]
 
     model_config = {
         "populate_by_name": True,
@@ -98,7 +99,8 @@ class ProjectCredential(BaseModel):
             "api_secret": obj.get("api_secret"),
             "created_by": obj.get("created_by"),
             "created_at": obj.get("created_at"),
-            "expires_at": obj.get("expires_at")
+            "expires_at": obj.get("expires_at"),
+            "row_version": obj.get("row_version")
         })
         return _obj
 
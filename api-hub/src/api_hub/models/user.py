@@ -37,7 +37,8 @@ class User(BaseModel):
     password: Optional[StrictStr] = Field(default=None, description="The password of the user.")
     full_name: Optional[StrictStr] = Field(default=None, description="The full name of the user.")
     created_at: Optional[datetime] = Field(default=None, description="The date and time when the user was created.")
-    __properties: ClassVar[List[str]] = ["id", "email", "password", "full_name", "created_at"]
+    row_version: Optional[StrictInt] = Field(default=None, description="The version of the user row, incremented on every change. Send its ETag (\"v<row_version>\") as If-Match when updating or deleting.")
+    __properties: ClassVar[List[str]] = ["id", "email", "password", "full_name", "created_at", "row_version"]
 
     model_config = {
         "populate_by_name": True,
@@ -92,7 +93,8 @@ class User(BaseModel):
             "email": obj.get("email"),
             "password": obj.get("password"),
             "full_name": obj.get("full_name"),
-            "created_at": obj.get("created_at")
+            "created_at": obj.get("created_at"),
+            "row_version": obj.get("row_version")
         })
         return _obj
 
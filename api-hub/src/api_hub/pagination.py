@@ -0,0 +1,179 @@
+# coding: utf-8
+
+"""
+목록 API 키셋(커서) 페이지네이션 모듈
+
+OFFSET 대신 마지막으로 반환한 행의 정렬 키를 커서로 전달하여
+`WHERE (정렬키) > (커서) ORDER BY 정렬키 LIMIT n` 형태로 조회한다.
+테이블 크기와 무관하게 인덱스 탐색 한 번으로 다음 페이지를 가져올 수 있다.
+
+정렬 키:
+    id: id 오름차순
+    updated_at: (updated_at, id) 오름차순 (updated_at이 NULL인 행은 제외됨)
+"""
+
+import base64
+import json
+import os
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Callable, Dict, Generic, List, Optional, Sequence, TypeVar
+
+from fastapi import HTTPException, Request, Response
+from sqlalchemy import and_, or_
+from sqlalchemy.orm import Query
+
+from api_hub.conditional import Validators, rows_validators
+
+T = TypeVar("T")
+
+# 페이지 크기 설정
+DEFAULT_PAGE_SIZE = int(os.getenv("PAGE_SIZE_DEFAULT", "100"))
+MAX_PAGE_SIZE = int(os.getenv("PAGE_SIZE_MAX", "1000"))
+
+# 지원하는 정렬 키
+SORT_KEYS = ("id", "updated_at")
+
+# 다음 페이지 커서를 전달하는 응답 헤더
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+
+@dataclass
+class Page(Generic[T]):
+    """
+    목록 조회 결과 한 페이지
+
+    Attributes:
+        items (List[T]): 페이지 항목
+        next_cursor (Optional[str]): 다음 페이지 커서 (마지막 페이지이면 None)
+        validators (Optional[Validators]): 페이지 항목과 같은 조회에서 계산한 검증자 (validator_columns를 지정한 경우)
+    """
+    items: List[T] = field(default_factory=list)
+    next_cursor: Optional[str] = None
+    validators: Optional[Validators] = None
+
+
+def encode_cursor(values: Dict[str, Any]) -> str:
+    """
+    커서 값을 URL-safe base64 문자열로 인코딩하는 함수
+    """
+    raw = json.dumps(values, separators=(",", ":"), default=str).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Dict[str, Any]:
+    """
+    encode_cursor로 인코딩된 커서를 디코딩하는 함수
+
+    Raises:
+        HTTPException: 커서 형식이 올바르지 않을 경우 (400)
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+        if not isinstance(values, dict) or not isinstance(values.get("id"), int):
+            raise ValueError(cursor)
+        return values
+    except (ValueError, UnicodeError):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+
+def paginate(
+    query: Query,
+    model: Any,
+    limit: int,
+    cursor: Optional[str] = None,
+    sort: str = "id",
+    convert: Optional[Callable[[Any], T]] = None,
+    validator_columns: Optional[Sequence[str]] = None,
+) -> Page:
+    """
+    ORM 쿼리에 키셋 조건/정렬/LIMIT을 적용하여 한 페이지를 조회하는 함수
+
+    Args:
+        query (Query): 필터가 적용된 ORM 쿼리
+        model: 조회 대상 모델 클래스 (id, updated_at 컬럼 사용)
+        limit (int): 페이지 크기 (MAX_PAGE_SIZE로 제한)
+        cursor (Optional[str]): 이전 페이지의 next_cursor
+        sort (str): 정렬 키 (id 또는 updated_at)
+        convert (Callable): 조회된 행을 응답 모델로 변환하는 함수
+        validator_columns (Optional[Sequence[str]]): 지정 시 조회한 행의 이 컬럼들로 페이지 검증자도 계산
+
+    Returns:
+        Page: 페이지 항목과 다음 페이지 커서
+
+    Raises:
+        HTTPException: 커서가 올바르지 않거나 정렬 키와 맞지 않을 경우 (400)
+    """
+    if sort not in SORT_KEYS:
+        raise HTTPException(status_code=400, detail=f"Unsupported sort key: {sort}")
+    limit = max(1, min(limit, MAX_PAGE_SIZE))
+
+    # 정렬 기준 컬럼 (항상 id를 마지막 키로 사용하여 순서를 고정)
+    if sort == "updated_at":
+        order_by = (model.updated_at.asc(), model.id.asc())
+        # updated_at이 NULL인 행(ORM 기본값 없이 생성된 기존 행 등)은 커서로 표현할 수 없으므로 제외
+        query = query.filter(model.updated_at.isnot(None))
+    else:
+        order_by = (model.id.asc(),)
+
+    # 커서 이후의 행만 조회
+    if cursor:
+        values = decode_cursor(cursor)
+        if values.get("sort", "id") != sort:
+            raise HTTPException(status_code=400, detail="Cursor does not match sort key")
+        if sort == "updated_at":
+            try:
+                updated_at = datetime.fromisoformat(values["updated_at"])
+            except (KeyError, TypeError, ValueError):
+                raise HTTPException(status_code=400, detail="Invalid cursor")
+            query = query.filter(or_(
+                model.updated_at > updated_at,
+                and_(model.updated_at == updated_at, model.id > values["id"]),
+            ))
+        else:
+            query = query.filter(model.id > values["id"])
+
+    # 다음 페이지 존재 여부 확인을 위해 limit + 1건 조회
+    rows = query.order_by(*order_by).limit(limit + 1).all()
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        last = rows[-1]
+        values = {"sort": sort, "id": last.id}
+        if sort == "updated_at":
+            values["updated_at"] = last.updated_at.isoformat()
+        next_cursor = encode_cursor(values)
+
+    # 응답 본문과 같은 행으로 검증자를 만들어 ETag가 다른 버전을 가리키지 않게 한다
+    validators = rows_validators(rows, validator_columns, next_cursor) if validator_columns else None
+    items = [convert(row) for row in rows] if convert else rows
+    return Page(items=items, next_cursor=next_cursor, validators=validators)
+
+
+def parse_ids(ids: str) -> List[int]:
+    """
+    쉼표로 구분된 ID 목록(ids=3,1,2)을 요청 순서대로 파싱하는 함수 (중복 제거)
+
+    Raises:
+        HTTPException: 정수가 아닌 값이 있거나 MAX_PAGE_SIZE개를 넘는 경우 (400)
+    """
+    try:
+        values = [int(value) for value in ids.split(",") if value.strip()]
+    except ValueError:
+        raise HTTPException(status_code=400, detail="ids must be a comma separated list of integers")
+    values = list(dict.fromkeys(values))
+    if len(values) > MAX_PAGE_SIZE:
+        raise HTTPException(status_code=400, detail=f"At most {MAX_PAGE_SIZE} ids can be requested")
+    return values
+
+
+def set_pagination_headers(request: Request, response: Response, page: Page) -> None:
+    """
+    다음 페이지가 있으면 X-Next-Cursor, Link(rel="next") 응답 헤더를 설정하는 함수
+    """
+    if page.next_cursor is None:
+        return
+    next_url = request.url.include_query_params(cursor=page.next_cursor)
+    response.headers[NEXT_CURSOR_HEADER] = page.next_cursor
+    response.headers["Link"] = f'<{next_url}>; rel="next"'
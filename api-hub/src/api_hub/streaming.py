@@ -0,0 +1,55 @@
+# coding: utf-8
+
+"""
+목록 스트리밍 응답 모듈
+
+impl 계층이 서버 사이드 커서로 읽어 내보내는 항목을 NDJSON 또는 JSON 배열로
+한 건씩 직렬화하여 전송한다. 응답 전체를 메모리에 만들지 않으므로
+결과 크기와 무관하게 워커 메모리 사용량이 일정하다.
+"""
+
+from typing import AsyncIterator
+
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel
+
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+JSON_MEDIA_TYPE = "application/json"
+
+# 지원하는 스트리밍 형식 (stream 쿼리 파라미터 값)
+STREAM_FORMATS = ("ndjson", "json")
+
+
+async def ndjson_lines(items: AsyncIterator[BaseModel]) -> AsyncIterator[bytes]:
+    """
+    항목마다 한 줄의 JSON을 내보내는 함수 (NDJSON)
+    """
+    async for item in items:
+        yield item.model_dump_json(by_alias=True).encode("utf-8") + b"\n"
+
+
+async def json_array_chunks(items: AsyncIterator[BaseModel]) -> AsyncIterator[bytes]:
+    """
+    항목을 하나씩 직렬화하여 JSON 배열로 내보내는 함수
+    """
+    separator = b"["
+    async for item in items:
+        yield separator + item.model_dump_json(by_alias=True).encode("utf-8")
+        separator = b","
+    yield b"[]" if separator == b"[" else b"]"
+
+
+def streaming_list_response(items: AsyncIterator[BaseModel], stream_format: str) -> StreamingResponse:
+    """
+    항목 스트림을 요청한 형식의 StreamingResponse로 반환하는 함수
+
+    Args:
+        items (AsyncIterator[BaseModel]): impl 계층이 내보내는 항목 스트림
+        stream_format (str): ndjson 또는 json
+
+    Returns:
+        StreamingResponse: 스트리밍 응답
+    """
+    if stream_format == "ndjson":
+        return StreamingResponse(ndjson_lines(items), media_type=NDJSON_MEDIA_TYPE)
+    return StreamingResponse(json_array_chunks(items), media_type=JSON_MEDIA_TYPE)
@@ -0,0 +1,254 @@
+# coding: utf-8
+
+"""
+API 스펙 리비전 저장소
+
+spec_content가 바뀔 때마다 리비전을 하나 추가한다. 리비전은 이전 리비전 대비 JSON Patch(델타)로
+저장하고, SPEC_REVISION_SNAPSHOT_INTERVAL개마다(또는 델타가 전체 문서보다 클 때) 전체 문서(스냅샷)를 저장한다.
+특정 리비전은 그 이전의 가장 가까운 스냅샷에 델타를 차례로 적용하여 복원한다.
+
+spec_content가 JSON 객체/배열 문자열이면 구조 단위로 비교하고, 그 외의 문자열은 문자열 전체를 하나의 값으로 다룬다.
+(복원된 JSON 문서는 공백 없이 다시 직렬화되므로 원본 문자열과 서식이 다를 수 있다.)
+
+Metrics:
+    api_spec_revisions.snapshot_bytes: 스냅샷으로 저장한 바이트 수
+    api_spec_revisions.delta_bytes: 델타로 저장한 바이트 수
+    api_spec_revisions.full_bytes: 모든 리비전을 전체 문서로 저장했을 때의 바이트 수 (절감량 비교용)
+"""
+
+import json
+import os
+from datetime import datetime
+from typing import Any, List, Optional
+
+from sqlalchemy import BigInteger, Boolean, Column, DateTime, Integer, String, Text, UniqueConstraint, func, select
+from sqlalchemy.orm import Session
+
+from api_hub.db.database import Base, BigIntegerPK
+from api_hub.metrics import registry
+from api_hub.models.api_spec_revision import APISpecRevision
+from openapi_server.utils.json_patch import apply_patch, diff
+from openapi_server.utils.util import content_hash, dump_spec_content
+
+# 스냅샷 간격 (1, 1 + N, 1 + 2N, ... 번째 리비전은 전체 문서로 저장)
+SPEC_REVISION_SNAPSHOT_INTERVAL = int(os.getenv("SPEC_REVISION_SNAPSHOT_INTERVAL", "10"))
+
+_snapshot_bytes = registry.counter("api_spec_revisions.snapshot_bytes")
+_delta_bytes = registry.counter("api_spec_revisions.delta_bytes")
+_full_bytes = registry.counter("api_spec_revisions.full_bytes")
+
+
+class APISpecRevisionDB(Base):
+    """
+    API 스펙 리비전 데이터베이스 모델 클래스
+    schema.sql의 api_spec_revisions 테이블 구조를 따름
+    """
+    __tablename__ = 'api_spec_revisions'
+    __table_args__ = (
+        UniqueConstraint('api_spec_id', 'revision', name='uq_api_spec_revisions_api_spec_id_revision'),
+    )
+    id = Column(BigIntegerPK, primary_key=True, autoincrement=True, comment='API 스펙 리비전 아이디')
+    api_spec_id = Column(BigInteger, nullable=False, comment='API 스펙 아이디')
+    revision = Column(Integer, nullable=False, comment='리비전 번호 (1부터 증가)')
+    is_snapshot = Column(Boolean, nullable=False, comment='전체 문서(스냅샷) 여부, 아니면 이전 리비전 대비 JSON Patch')
+    content = Column(Text, nullable=False, comment='스냅샷 JSON 문서 또는 JSON Patch')
+    spec_content_hash = Column(String(64), nullable=False, comment='이 리비전의 spec_content SHA-256 해시')
+    created_by = Column(BigInteger, comment='리비전 생성자 아이디')
+    created_at = Column(DateTime, default=datetime.now, nullable=False, comment='리비전 생성일')
+
+    def toAPISpecRevision(self, spec_content: Optional[str] = None) -> APISpecRevision:
+        """
+        데이터베이스 모델을 API 모델로 변환
+
+        Args:
+            spec_content (Optional[str]): 복원한 spec_content (목록 조회에서는 생략)
+
+        Returns:
+            APISpecRevision: API 모델 객체
+        """
+        return APISpecRevision(
+            api_spec_id=self.api_spec_id,
+            revision=self.revision,
+            is_snapshot=self.is_snapshot,
+            spec_content_hash=self.spec_content_hash,
+            created_by=self.created_by,
+            created_at=self.created_at,
+            spec_content=spec_content,
+        )
+
+
+def spec_document(spec_content: Any) -> Any:
+    """
+    spec_content를 비교용 JSON 문서로 변환하는 함수
+    JSON 객체/배열 문자열이면 파싱한 값을, 그 외에는 값을 그대로 반환한다.
+    """
+    if isinstance(spec_content, str):
+        try:
+            document = json.loads(spec_content)
+        except ValueError:
+            return spec_content
+        return document if isinstance(document, (dict, list)) else spec_content
+    return spec_content
+
+
+def spec_content_from_document(document: Any) -> str:
+    """spec_document로 만든 문서를 spec_content 문자열로 되돌리는 함수"""
+    if isinstance(document, str):
+        return document
+    return json.dumps(document, ensure_ascii=False, separators=(",", ":"))
+
+
+def _spec_content_hash(spec_content: str) -> str:
+    # api_specs.spec_content_hash와 같은 값 (저장 형식의 해시)
+    return content_hash(dump_spec_content(spec_content)[0])
+
+
+def _is_snapshot_revision(revision: int) -> bool:
+    return SPEC_REVISION_SNAPSHOT_INTERVAL <= 1 or (revision - 1) % SPEC_REVISION_SNAPSHOT_INTERVAL == 0
+
+
+def latest_revision(db: Session, api_spec_id: int) -> int:
+    """API 스펙의 마지막 리비전 번호를 반환한다. (없으면 0)"""
+    return db.scalar(select(func.max(APISpecRevisionDB.revision)).where(APISpecRevisionDB.api_spec_id == api_spec_id)) or 0
+
+
+def new_revision(
+    api_spec_id: int,
+    revision: int,
+    spec_content: str,
+    previous_spec_content: Optional[str] = None,
+    created_by: Optional[int] = None,
+    created_at: Optional[datetime] = None,
+) -> APISpecRevisionDB:
+    """
+    추가할 리비전 객체를 만드는 함수
+    스냅샷 주기이거나 이전 내용이 없거나 델타가 전체 문서보다 크면 스냅샷으로 저장한다.
+
+    Args:
+        api_spec_id (int): API 스펙 ID
+        revision (int): 새 리비전 번호
+        spec_content (str): 새 spec_content
+        previous_spec_content (Optional[str]): 이전 리비전의 spec_content
+        created_by (Optional[int]): 생성자 ID
+        created_at (Optional[datetime]): 생성일
+
+    Returns:
+        APISpecRevisionDB: 추가할 리비전 (세션에 추가하지 않음)
+    """
+    document = spec_document(spec_content)
+    snapshot = json.dumps(document, ensure_ascii=False, separators=(",", ":"))
+    content, is_snapshot = snapshot, True
+    if previous_spec_content is not None and not _is_snapshot_revision(revision):
+        delta = json.dumps(diff(spec_document(previous_spec_content), document), ensure_ascii=False, separators=(",", ":"))
+        if len(delta) < len(snapshot):
+            content, is_snapshot = delta, False
+
+    _full_bytes.inc(len(snapshot))
+    (_snapshot_bytes if is_snapshot else _delta_bytes).inc(len(content))
+    return APISpecRevisionDB(
+        api_spec_id=api_spec_id,
+        revision=revision,
+        is_snapshot=is_snapshot,
+        content=content,
+        spec_content_hash=_spec_content_hash(spec_content),
+        created_by=created_by,
+        created_at=created_at or datetime.now(),
+    )
+
+
+def add_revision(
+    db: Session,
+    api_spec_id: int,
+    spec_content: str,
+    previous_spec_content: Optional[str] = None,
+    created_by: Optional[int] = None,
+) -> APISpecRevisionDB:
+    """
+    spec_content 변경을 새 리비전으로 추가하는 함수 (커밋은 호출자가 한다.)
+    리비전이 없는 기존 스펙은 이전 내용을 먼저 1번 리비전(스냅샷)으로 기록한다.
+    동시 수정 시 리비전 번호가 겹치지 않도록 호출자는 같은 트랜잭션에서 api_specs 행을 먼저 수정(row_version 비교 UPDATE)하여 잠근 상태여야 한다.
+
+    Args:
+        db (Session): 데이터베이스 세션
+        api_spec_id (int): API 스펙 ID
+        spec_content (str): 새 spec_content
+        previous_spec_content (Optional[str]): 수정 전 spec_content (생성 시 None)
+        created_by (Optional[int]): 수정자 ID
+
+    Returns:
+        APISpecRevisionDB: 추가된 리비전
+    """
+    revision = latest_revision(db, api_spec_id)
+    if revision == 0 and previous_spec_content is not None:
+        revision = 1
+        db.add(new_revision(api_spec_id, revision, previous_spec_content))
+    added = new_revision(api_spec_id, revision + 1, spec_content, previous_spec_content, created_by)
+    db.add(added)
+    return added
+
+
+def list_revisions(db: Session, api_spec_id: int, limit: int, before: Optional[int] = None) -> List[APISpecRevision]:
+    """
+    API 스펙의 리비전을 최신순으로 조회하는 함수 (내용 컬럼은 읽지 않음)
+
+    Args:
+        db (Session): 데이터베이스 세션
+        api_spec_id (int): API 스펙 ID
+        limit (int): 최대 개수
+        before (Optional[int]): 이 리비전 번호보다 이전 리비전만 조회 (다음 페이지용)
+
+    Returns:
+        List[APISpecRevision]: 리비전 목록 (spec_content 제외)
+    """
+    columns = [
+        APISpecRevisionDB.api_spec_id,
+        APISpecRevisionDB.revision,
+        APISpecRevisionDB.is_snapshot,
+        APISpecRevisionDB.spec_content_hash,
+        APISpecRevisionDB.created_by,
+        APISpecRevisionDB.created_at,
+    ]
+    statement = select(*columns).where(APISpecRevisionDB.api_spec_id == api_spec_id)
+    if before is not None:
+        statement = statement.where(APISpecRevisionDB.revision < before)
+    statement = statement.order_by(APISpecRevisionDB.revision.desc()).limit(limit)
+    return [APISpecRevision.model_validate(dict(row._mapping)) for row in db.execute(statement)]
+
+
+def load_revision(db: Session, api_spec_id: int, revision: int) -> Optional[APISpecRevision]:
+    """
+    특정 리비전을 가장 가까운 이전 스냅샷과 그 이후 델타들로 복원하는 함수
+
+    Args:
+        db (Session): 데이터베이스 세션
+        api_spec_id (int): API 스펙 ID
+        revision (int): 리비전 번호
+
+    Returns:
+        Optional[APISpecRevision]: spec_content가 채워진 리비전 (없으면 None)
+    """
+    snapshot = db.scalar(
+        select(func.max(APISpecRevisionDB.revision)).where(
+            APISpecRevisionDB.api_spec_id == api_spec_id,
+            APISpecRevisionDB.is_snapshot == True,
+            APISpecRevisionDB.revision <= revision,
+        )
+    )
+    if snapshot is None:
+        return None
+    rows = db.scalars(
+        select(APISpecRevisionDB)
+        .where(
+            APISpecRevisionDB.api_spec_id == api_spec_id,
+            APISpecRevisionDB.revision >= snapshot,
+            APISpecRevisionDB.revision <= revision,
+        )
+        .order_by(APISpecRevisionDB.revision)
+    ).all()
+    if not rows or rows[-1].revision != revision:
+        return None
+
+    document = json.loads(rows[0].content)
+    for row in rows[1:]:
+        document = apply_patch(document, json.loads(row.content))
+    return rows[-1].toAPISpecRevision(spec_content_from_document(document))
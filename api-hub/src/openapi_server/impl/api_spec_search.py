@@ -0,0 +1,270 @@
+# coding: utf-8
+
+"""
+API 스펙 전문 검색 색인
+
+API 스펙을 생성/수정할 때 spec_content에서 검색어(경로, operationId, 태그, 요약, 스키마 이름)를 추출하여
+api_spec_search 테이블에 제목/설명과 함께 저장한다. 삭제(보관)된 스펙은 색인에서 제거한다.
+
+검색은 데이터베이스의 역색인을 사용한다.
+    MySQL: api_spec_search의 FULLTEXT 인덱스 (MATCH ... AGAINST, 자연어 모드 관련도 순)
+    SQLite: api_spec_search를 원본으로 하는 FTS5 외부 콘텐츠 테이블(api_spec_search_fts, 트리거로 동기화)
+            (porter 어간 추출, bm25 관련도 순, 제목 > 설명 > 검색어 순으로 가중치)
+
+Environment variables:
+    SEARCH_TERMS_MAX_CHARS: 스펙 하나에서 색인할 검색어의 최대 길이 (기본 1000000)
+"""
+
+import os
+import re
+from typing import Any, Dict, Iterable, List, Optional
+
+from fastapi import HTTPException
+from sqlalchemy import DDL, BigInteger, Column, Index, String, Text, delete, event, insert, select, text, update
+from sqlalchemy.dialects.mysql import MEDIUMTEXT, match
+from sqlalchemy.orm import Session
+
+from api_hub.db.database import Base, BigIntegerPK
+from api_hub.models.api_spec_search_result import APISpecSearchResult
+from api_hub.pagination import MAX_PAGE_SIZE, Page, decode_cursor, encode_cursor
+from openapi_server.utils.spec_diff import HTTP_METHODS, load_document
+
+SEARCH_TERMS_MAX_CHARS = int(os.getenv("SEARCH_TERMS_MAX_CHARS", "1000000"))
+
+# 검색어에서 사용할 단어 수 (FTS 쿼리가 너무 길어지지 않도록 제한)
+SEARCH_QUERY_MAX_WORDS = 16
+
+# SQLite FTS5 bm25 컬럼 가중치 (title, description, terms)
+_BM25_WEIGHTS = (10.0, 3.0, 1.0)
+
+_CAMEL_CASE = re.compile(r"(?<=[a-z0-9])(?=[A-Z])")
+_WORD = re.compile(r"(\w+)(\*?)", re.UNICODE)
+
+
+class APISpecSearchDB(Base):
+    """
+    API 스펙 검색 색인 데이터베이스 모델 클래스
+    schema.sql의 api_spec_search 테이블 구조를 따름
+    """
+    __tablename__ = 'api_spec_search'
+    __table_args__ = (
+        Index('ix_api_spec_search_project_id', 'project_id'),
+        Index('ix_api_spec_search_fulltext', 'title', 'description', 'terms', mysql_prefix='FULLTEXT').ddl_if(dialect='mysql'),
+    )
+    api_spec_id = Column(BigIntegerPK, primary_key=True, autoincrement=False, comment='API 스펙 아이디')
+    project_id = Column(BigInteger, comment='프로젝트 아이디')
+    title = Column(String(255), nullable=False, comment='API 스펙 제목')
+    description = Column(Text, comment='API 스펙 설명')
+    terms = Column(Text().with_variant(MEDIUMTEXT(), 'mysql'), nullable=False, comment='spec_content에서 추출한 검색어 (줄 단위)')
+
+
+# SQLite에서는 FTS5 외부 콘텐츠 테이블과 동기화 트리거를 함께 생성/삭제한다.
+for _statement in (
+    "CREATE VIRTUAL TABLE api_spec_search_fts USING fts5("
+    "title, description, terms, content='api_spec_search', content_rowid='api_spec_id', tokenize='porter unicode61')",
+    "CREATE TRIGGER api_spec_search_ai AFTER INSERT ON api_spec_search BEGIN "
+    "INSERT INTO api_spec_search_fts(rowid, title, description, terms) "
+    "VALUES (new.api_spec_id, new.title, new.description, new.terms); END",
+    "CREATE TRIGGER api_spec_search_ad AFTER DELETE ON api_spec_search BEGIN "
+    "INSERT INTO api_spec_search_fts(api_spec_search_fts, rowid, title, description, terms) "
+    "VALUES ('delete', old.api_spec_id, old.title, old.description, old.terms); END",
+    "CREATE TRIGGER api_spec_search_au AFTER UPDATE ON api_spec_search BEGIN "
+    "INSERT INTO api_spec_search_fts(api_spec_search_fts, rowid, title, description, terms) "
+    "VALUES ('delete', old.api_spec_id, old.title, old.description, old.terms); "
+    "INSERT INTO api_spec_search_fts(rowid, title, description, terms) "
+    "VALUES (new.api_spec_id, new.title, new.description, new.terms); END",
+):
+    event.listen(APISpecSearchDB.__table__, "after_create", DDL(_statement).execute_if(dialect="sqlite"))
+event.listen(APISpecSearchDB.__table__, "after_drop", DDL("DROP TABLE IF EXISTS api_spec_search_fts").execute_if(dialect="sqlite"))
+
+
+def _with_words(name: str) -> List[str]:
+    # getUserById -> getUserById, get User By Id (단어 단위로도 검색되도록)
+    split = _CAMEL_CASE.sub(" ", name)
+    return [name] if split == name else [name, split]
+
+
+def extract_search_terms(spec_content: Any) -> str:
+    """
+    spec_content에서 검색어를 추출하는 함수
+    OpenAPI 문서이면 info.title, 태그, 경로, operationId, 요약, 스키마 이름을, 그 외의 문자열은 문자열 자체를 사용한다.
+
+    Args:
+        spec_content (Any): API 스펙 내용 (JSON 또는 YAML 문자열)
+
+    Returns:
+        str: 줄 단위로 나열한 검색어 (최대 SEARCH_TERMS_MAX_CHARS자)
+
+    Examples:
+        >>> extract_search_terms('{"paths": {"/users": {"get": {"operationId": "listUsers"}}}}')
+        '/users\\nlistUsers\\nlist Users'
+    """
+    document = load_document(spec_content)
+    if not isinstance(document, dict):
+        return (document if isinstance(document, str) else "")[:SEARCH_TERMS_MAX_CHARS]
+
+    terms: List[str] = []
+    info = document.get("info")
+    if isinstance(info, dict) and isinstance(info.get("title"), str):
+        terms.append(info["title"])
+    for tag in document.get("tags") or []:
+        if isinstance(tag, dict) and isinstance(tag.get("name"), str):
+            terms.append(tag["name"])
+
+    paths = document.get("paths")
+    for path, item in (paths.items() if isinstance(paths, dict) else ()):
+        terms.append(str(path))
+        if not isinstance(item, dict):
+            continue
+        for method in HTTP_METHODS:
+            operation = item.get(method)
+            if not isinstance(operation, dict):
+                continue
+            if isinstance(operation.get("operationId"), str):
+                terms.extend(_with_words(operation["operationId"]))
+            if isinstance(operation.get("summary"), str):
+                terms.append(operation["summary"])
+            terms.extend(tag for tag in operation.get("tags") or [] if isinstance(tag, str))
+
+    components = document.get("components")
+    schemas = components.get("schemas") if isinstance(components, dict) else document.get("definitions")
+    for name in (schemas if isinstance(schemas, dict) else ()):
+        terms.extend(_with_words(str(name)))
+
+    return "\n".join(dict.fromkeys(terms))[:SEARCH_TERMS_MAX_CHARS]
+
+
+def search_row(api_spec_id: int, project_id: Optional[int], title: str, description: Optional[str], spec_content: Any) -> Dict[str, Any]:
+    """색인 테이블에 추가할 행(dict)을 만드는 함수"""
+    return {
+        "api_spec_id": api_spec_id,
+        "project_id": project_id,
+        "title": title,
+        "description": description,
+        "terms": extract_search_terms(spec_content),
+    }
+
+
+def index_api_specs(db: Session, rows: Iterable[Dict[str, Any]]) -> None:
+    """
+    API 스펙을 색인에 추가하거나 다시 색인하는 함수 (커밋은 호출자가 한다.)
+
+    Args:
+        db (Session): 데이터베이스 세션
+        rows (Iterable[Dict[str, Any]]): search_row로 만든 행 목록
+    """
+    rows = list(rows)
+    if not rows:
+        return
+    db.execute(delete(APISpecSearchDB).where(APISpecSearchDB.api_spec_id.in_([row["api_spec_id"] for row in rows])))
+    db.execute(insert(APISpecSearchDB), rows)
+
+
+def update_search_metadata(db: Session, api_spec_id: int, values: Dict[str, Any]) -> bool:
+    """
+    색인된 API 스펙의 프로젝트/제목/설명만 수정하는 함수 (검색어는 다시 추출하지 않음)
+
+    Returns:
+        bool: 색인에 있어 수정되었는지 여부 (False면 호출자가 index_api_specs로 색인해야 함)
+    """
+    result = db.execute(update(APISpecSearchDB).where(APISpecSearchDB.api_spec_id == api_spec_id).values(**values))
+    return result.rowcount > 0
+
+
+def remove_from_index(db: Session, api_spec_id: int) -> None:
+    """API 스펙을 색인에서 제거하는 함수 (커밋은 호출자가 한다.)"""
+    db.execute(delete(APISpecSearchDB).where(APISpecSearchDB.api_spec_id == api_spec_id))
+
+
+def _fts_query(q: str) -> str:
+    # 사용자 입력을 FTS5 문법으로 해석하지 않도록 단어마다 따옴표로 감싸 AND로 결합한다.
+    # 접두어 검색은 일치 문서가 많아 느려질 수 있으므로 단어 끝에 *를 붙인 경우에만 사용한다. (예: ord*)
+    words = _WORD.findall(q)[:SEARCH_QUERY_MAX_WORDS]
+    return " ".join('"{}"{}'.format(word, star) for word, star in words)
+
+
+def search_api_specs(
+    db: Session,
+    q: str,
+    limit: int,
+    cursor: Optional[str] = None,
+    project_id: Optional[int] = None,
+) -> Page[APISpecSearchResult]:
+    """
+    색인에서 검색어와 일치하는 API 스펙을 관련도 순으로 조회하는 함수
+    관련도 순서는 키셋으로 이어갈 수 없으므로 커서에는 다음 페이지의 시작 위치(offset)를 담는다.
+    (일치하는 문서 집합 안에서만 건너뛰므로 전체 스펙 수와 무관하다.)
+
+    Args:
+        db (Session): 데이터베이스 세션
+        q (str): 검색어
+        limit (int): 페이지 크기
+        cursor (Optional[str]): 이전 페이지의 next_cursor
+        project_id (Optional[int]): 이 프로젝트의 스펙만 검색
+
+    Returns:
+        Page[APISpecSearchResult]: 관련도 순 검색 결과와 다음 페이지 커서
+
+    Raises:
+        HTTPException: 커서가 올바르지 않을 경우 (400)
+    """
+    limit = max(1, min(limit, MAX_PAGE_SIZE))
+    offset = 0
+    if cursor:
+        offset = decode_cursor(cursor).get("offset")
+        if not isinstance(offset, int) or offset < 0:
+            raise HTTPException(status_code=400, detail="Invalid cursor")
+
+    if db.get_bind().dialect.name == "sqlite":
+        fts_query = _fts_query(q)
+        if not fts_query:
+            return Page(items=[])
+        weights = ", ".join(str(weight) for weight in _BM25_WEIGHTS)
+        statement = text(
+            "SELECT s.api_spec_id, s.project_id, a.version, s.title, s.description, "
+            f"-bm25(api_spec_search_fts, {weights}) AS score "
+            "FROM api_spec_search_fts "
+            "JOIN api_spec_search s ON s.api_spec_id = api_spec_search_fts.rowid "
+            "JOIN api_specs a ON a.id = s.api_spec_id "
+            "WHERE api_spec_search_fts MATCH :q "
+            + ("AND s.project_id = :project_id " if project_id is not None else "")
+            + "ORDER BY score DESC, s.api_spec_id LIMIT :limit OFFSET :offset"
+        )
+        params = {"q": fts_query, "project_id": project_id, "limit": limit + 1, "offset": offset}
+        rows = db.execute(statement, params).all()
+    else:
+        versions = Base.metadata.tables["api_specs"]
+        score = match(APISpecSearchDB.title, APISpecSearchDB.description, APISpecSearchDB.terms, against=q).in_natural_language_mode()
+        statement = (
+            select(
+                APISpecSearchDB.api_spec_id,
+                APISpecSearchDB.project_id,
+                versions.c.version,
+                APISpecSearchDB.title,
+                APISpecSearchDB.description,
+                score.label("score"),
+            )
+            .join(versions, versions.c.id == APISpecSearchDB.api_spec_id)
+            .where(score > 0)
+        )
+        if project_id is not None:
+            statement = statement.where(APISpecSearchDB.project_id == project_id)
+        statement = statement.order_by(score.desc(), APISpecSearchDB.api_spec_id).limit(limit + 1).offset(offset)
+        rows = db.execute(statement).all()
+
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        next_cursor = encode_cursor({"id": rows[-1].api_spec_id, "offset": offset + limit})
+    items = [
+        APISpecSearchResult(
+            id=row.api_spec_id,
+            project_id=row.project_id,
+            version=row.version,
+            title=row.title,
+            description=row.description,
+            score=float(row.score),
+        )
+        for row in rows
+    ]
+    return Page(items=items, next_cursor=next_cursor)
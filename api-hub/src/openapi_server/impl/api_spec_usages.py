@@ -0,0 +1,231 @@
+# coding: utf-8
+
+"""
+API 스펙 사용처(usage) 색인
+
+API 스펙을 생성/수정할 때 spec_content에서 다음 항목을 추출하여 api_spec_usages 테이블에 저장한다.
+"어떤 스펙이 User 스키마나 POST /orders 오퍼레이션을 쓰는가"를 모든 spec_content를 파싱하지 않고
+(name, kind) 인덱스 조회 한 번으로 답하기 위한 색인이다.
+
+    component: 선언된 컴포넌트 (name 예: schemas/User, parameters/Limit)
+    operation: 선언된 오퍼레이션 (name 예: POST /orders)
+    ref: $ref 참조 (name은 참조 대상, source는 참조하는 컴포넌트/오퍼레이션/경로)
+
+로컬 참조(#/components/schemas/User)와 Swagger 2.0 참조(#/definitions/User)는 컴포넌트 이름 형식(schemas/User)으로
+정규화하여 저장하고, 외부 파일 참조는 원래 문자열 그대로 저장한다.
+"""
+
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+from fastapi import HTTPException
+from sqlalchemy import BigInteger, Column, Index, String, delete, insert
+from sqlalchemy.orm import Session
+
+from api_hub.db.database import Base, BigIntegerPK
+from api_hub.models.api_spec_usage import APISpecUsage
+from api_hub.pagination import Page, paginate
+from openapi_server.utils.json_patch import unescape_token
+from openapi_server.utils.spec_diff import HTTP_METHODS
+
+# 저장할 이름의 최대 길이 (인덱스 키 길이 제한)
+USAGE_NAME_MAX_LENGTH = 512
+
+# Swagger 2.0 최상위 컴포넌트 -> OpenAPI 3 components 하위 이름
+_SWAGGER_COMPONENTS = {
+    "definitions": "schemas",
+    "parameters": "parameters",
+    "responses": "responses",
+    "securityDefinitions": "securitySchemes",
+}
+
+
+class APISpecUsageDB(Base):
+    """
+    API 스펙 사용처 색인 데이터베이스 모델 클래스
+    schema.sql의 api_spec_usages 테이블 구조를 따름
+    """
+    __tablename__ = 'api_spec_usages'
+    __table_args__ = (
+        Index('ix_api_spec_usages_name_kind', 'name', 'kind', 'id'),
+        Index('ix_api_spec_usages_api_spec_id', 'api_spec_id'),
+    )
+    id = Column(BigIntegerPK, primary_key=True, autoincrement=True, comment='사용처 아이디')
+    api_spec_id = Column(BigInteger, nullable=False, comment='API 스펙 아이디')
+    kind = Column(String(16), nullable=False, comment='component, operation, ref')
+    name = Column(String(USAGE_NAME_MAX_LENGTH), nullable=False, comment='컴포넌트 이름, 오퍼레이션(METHOD /path) 또는 $ref 대상')
+    source = Column(String(USAGE_NAME_MAX_LENGTH), comment='$ref를 포함한 컴포넌트/오퍼레이션/경로')
+
+    def toAPISpecUsage(self) -> APISpecUsage:
+        """
+        데이터베이스 모델을 API 모델로 변환
+
+        Returns:
+            APISpecUsage: API 모델 객체
+        """
+        return APISpecUsage(api_spec_id=self.api_spec_id, kind=self.kind, name=self.name, source=self.source)
+
+
+def normalize_ref(ref: str) -> str:
+    """
+    $ref 값을 컴포넌트 이름 형식으로 정규화하는 함수 (외부 참조는 그대로 반환)
+
+    Examples:
+        >>> normalize_ref("#/components/schemas/User")
+        'schemas/User'
+        >>> normalize_ref("#/definitions/User")
+        'schemas/User'
+        >>> normalize_ref("common.yaml#/components/schemas/Error")
+        'common.yaml#/components/schemas/Error'
+    """
+    if not ref.startswith("#/"):
+        return ref
+    tokens = [unescape_token(token) for token in ref[2:].split("/")]
+    if tokens[0] == "components" and len(tokens) >= 3:
+        return "/".join(tokens[1:])
+    if tokens[0] in _SWAGGER_COMPONENTS and len(tokens) >= 2:
+        return "/".join([_SWAGGER_COMPONENTS[tokens[0]]] + tokens[1:])
+    return ref
+
+
+def normalize_component(component: str) -> str:
+    """컴포넌트 조회 값을 정규화하는 함수 (User -> schemas/User, #/components/schemas/User -> schemas/User)"""
+    if component.startswith("#/"):
+        return normalize_ref(component)
+    return component if "/" in component else f"schemas/{component}"
+
+
+def normalize_operation(operation: str) -> str:
+    """
+    오퍼레이션 조회 값을 정규화하는 함수
+
+    Raises:
+        HTTPException: METHOD /path 형식이 아닐 경우 (400)
+    """
+    method, _, path = operation.strip().partition(" ")
+    if method.lower() not in HTTP_METHODS or not path.strip():
+        raise HTTPException(status_code=400, detail="operation must be in the form 'METHOD /path'")
+    return f"{method.upper()} {path.strip()}"
+
+
+def _collect_refs(value: Any, source: Optional[str], edges: Set[Tuple[str, Optional[str]]]) -> None:
+    # 재귀 대신 스택으로 순회 (깊게 중첩된 스키마에서도 재귀 한도에 걸리지 않도록)
+    stack = [value]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, dict):
+            ref = node.get("$ref")
+            if isinstance(ref, str):
+                edges.add((normalize_ref(ref), source))
+            stack.extend(node.values())
+        elif isinstance(node, list):
+            stack.extend(node)
+
+
+def extract_usages(document: Any) -> List[Tuple[str, str, Optional[str]]]:
+    """
+    파싱한 스펙 문서에서 사용처 항목을 추출하는 함수
+
+    Args:
+        document (Any): 파싱한 spec_content (load_document 결과)
+
+    Returns:
+        List[Tuple[str, str, Optional[str]]]: (kind, name, source) 목록 (중복 제거)
+    """
+    if not isinstance(document, dict):
+        return []
+    usages: List[Tuple[str, str, Optional[str]]] = []
+    edges: Set[Tuple[str, Optional[str]]] = set()
+
+    sections: List[Tuple[str, Any]] = []
+    components = document.get("components")
+    if isinstance(components, dict):
+        sections.extend(components.items())
+    for key, component_type in _SWAGGER_COMPONENTS.items():
+        if key in document:
+            sections.append((component_type, document[key]))
+    for component_type, entries in sections:
+        if not isinstance(entries, dict):
+            continue
+        for name, definition in entries.items():
+            component = f"{component_type}/{name}"
+            usages.append(("component", component, None))
+            _collect_refs(definition, component, edges)
+
+    paths = document.get("paths")
+    for path, item in (paths.items() if isinstance(paths, dict) else ()):
+        if not isinstance(item, dict):
+            continue
+        for key, value in item.items():
+            if key in HTTP_METHODS:
+                operation = f"{key.upper()} {path}"
+                usages.append(("operation", operation, None))
+                _collect_refs(value, operation, edges)
+            else:
+                # 경로 공통 parameters 등은 경로를 source로 기록
+                _collect_refs(value, str(path), edges)
+
+    # components/paths 이외의 위치(webhooks 등)의 참조는 source 없이 기록
+    for key, value in document.items():
+        if key not in ("components", "paths") and key not in _SWAGGER_COMPONENTS:
+            _collect_refs(value, None, edges)
+
+    usages.extend(("ref", target, source) for target, source in sorted(edges, key=lambda edge: (edge[0], edge[1] or "")))
+    return list(dict.fromkeys(usages))
+
+
+def usage_rows(api_spec_id: int, document: Any) -> List[Dict[str, Any]]:
+    """색인 테이블에 추가할 행(dict) 목록을 만드는 함수"""
+    return [
+        {
+            "api_spec_id": api_spec_id,
+            "kind": kind,
+            "name": name[:USAGE_NAME_MAX_LENGTH],
+            "source": source[:USAGE_NAME_MAX_LENGTH] if source is not None else None,
+        }
+        for kind, name, source in extract_usages(document)
+    ]
+
+
+def index_usages(db: Session, api_spec_ids: Iterable[int], rows: List[Dict[str, Any]]) -> None:
+    """
+    API 스펙들의 사용처 색인을 교체하는 함수 (커밋은 호출자가 한다.)
+
+    Args:
+        db (Session): 데이터베이스 세션
+        api_spec_ids (Iterable[int]): 다시 색인할 API 스펙 ID 목록 (기존 항목 삭제)
+        rows (List[Dict[str, Any]]): usage_rows로 만든 새 항목
+    """
+    api_spec_ids = list(api_spec_ids)
+    if api_spec_ids:
+        db.execute(delete(APISpecUsageDB).where(APISpecUsageDB.api_spec_id.in_(api_spec_ids)))
+    if rows:
+        db.execute(insert(APISpecUsageDB), rows)
+
+
+def remove_usages(db: Session, api_spec_id: int) -> None:
+    """API 스펙을 사용처 색인에서 제거하는 함수 (커밋은 호출자가 한다.)"""
+    db.execute(delete(APISpecUsageDB).where(APISpecUsageDB.api_spec_id == api_spec_id))
+
+
+def find_usages(
+    db: Session,
+    name: str,
+    kinds: Tuple[str, ...],
+    limit: int,
+    cursor: Optional[str] = None,
+) -> Page[APISpecUsage]:
+    """
+    이름이 name인 사용처 항목을 (name, kind, id) 인덱스로 조회하는 함수
+
+    Args:
+        db (Session): 데이터베이스 세션
+        name (str): 정규화한 컴포넌트 이름 또는 오퍼레이션
+        kinds (Tuple[str, ...]): 조회할 항목 종류
+        limit (int): 페이지 크기
+        cursor (Optional[str]): 이전 페이지의 next_cursor
+
+    Returns:
+        Page[APISpecUsage]: id 순 사용처 목록
+    """
+    query = db.query(APISpecUsageDB).filter(APISpecUsageDB.name == name, APISpecUsageDB.kind.in_(kinds))
+    return paginate(query, APISpecUsageDB, limit, cursor, convert=APISpecUsageDB.toAPISpecUsage)
@@ -1,36 +1,163 @@
 # coding: utf-8
 
-from typing import List, Dict, Any
+from typing import List, Dict, Any, AsyncIterator, Optional, Tuple
 from api_hub.apis.api_specs_api_base import BaseAPISpecsApi
 from api_hub.models.api_spec import APISpec
+from api_hub.models.api_spec_summary import APISpecSummary
 from fastapi import Depends, HTTPException
 from sqlalchemy.orm import Session, relationship
-from api_hub.db.database import DatabaseSessionManager, get_db, Base
+from api_hub.db.database import DatabaseSessionManager, get_db, Base, BigIntegerPK, DB_BATCH_SIZE_MAX, compare_and_swap, insert_many, row_exists, run_in_session, select_by_ids, stream_in_session
+from api_hub.models.batch_item_result import BatchItemResult
+from api_hub.pagination import DEFAULT_PAGE_SIZE, Page, paginate
 
+from dataclasses import dataclass
 from datetime import datetime
-from sqlalchemy import Column, Integer, String, Text, DateTime, Boolean, BigInteger, JSON
-from sqlalchemy.ext.declarative import declarative_base
+from sqlalchemy import Column, Integer, String, Text, DateTime, Boolean, BigInteger, JSON, select, text, tuple_, update, Index, UniqueConstraint
+from sqlalchemy.exc import IntegrityError
 import json
-from openapi_server.utils.util import safe_json_dumps, parse_json_content
+import logging
+import os
+from openapi_server.utils.util import safe_json_dumps, parse_json_content, dump_spec_content, wrapped_content_literal, content_hash
+from api_hub.conditional import Validators, if_match_versions, precondition_failed, precondition_failed_or_not_found, version_etag
+from api_hub.cache import MISSING, CacheCodec, LRUCache, create_cache
+from api_hub.log import log_payload
+from api_hub.models.api_spec_diff import APISpecDiff
+from api_hub.models.api_spec_revision import APISpecRevision
+from openapi_server.utils.spec_diff import HashNode, diff_specs, hash_tree, load_document
+from openapi_server.utils.json_patch import JsonPatchError, apply_patch, merge_patch, parse_pointer, resolve_pointer
+from api_hub.models.api_spec_search_result import APISpecSearchResult
+from openapi_server.impl.api_spec_search import index_api_specs, remove_from_index, search_api_specs, search_row, update_search_metadata
+from api_hub.models.api_spec_usage import APISpecUsage
+from openapi_server.impl.api_spec_usages import find_usages, index_usages, normalize_component, normalize_operation, remove_usages, usage_rows
+from openapi_server.impl.api_spec_revisions import APISpecRevisionDB, add_revision, list_revisions, load_revision, new_revision, spec_content_from_document
 
-class APISpecDB(declarative_base()):
+logger = logging.getLogger(__name__)
+
+# 목록 요약 조회 시 반환 가능한 필드 (spec_content 제외)
+SUMMARY_FIELDS = tuple(APISpecSummary.model_fields)
+
+# 목록 페이지 ETag에 반영하는 컬럼 (spec_content 대신 내용 해시 사용)
+LIST_VALIDATOR_COLUMNS = ("id", "updated_at", "row_version", "spec_content_hash")
+
+
+@dataclass
+class CachedAPISpec:
+    """
+    캐시에 보관하는 API 스펙 단건 조회 결과
+
+    Attributes:
+        body (bytes): 직렬화된 APISpec JSON 본문
+        validators (Validators): ETag / Last-Modified 검증자
+        api_spec (Optional[APISpec]): 모델 조회 시 본문에서 만든 APISpec (처음 조회할 때 채움)
+    """
+    body: bytes
+    validators: Validators
+    api_spec: Optional[APISpec] = None
+
+
+class CachedAPISpecCodec(CacheCodec):
+    """CachedAPISpec을 공유 캐시에 JSON으로 저장하는 코덱 (api_spec은 조회 시 body에서 다시 만든다.)"""
+
+    def dumps(self, value: CachedAPISpec) -> bytes:
+        last_modified = value.validators.last_modified
+        return super().dumps({
+            "body": value.body.decode("utf-8"),
+            "etag": value.validators.etag,
+            "last_modified": last_modified.isoformat() if last_modified is not None else None,
+        })
+
+    def loads(self, data: bytes) -> CachedAPISpec:
+        values = super().loads(data)
+        last_modified = values["last_modified"]
+        return CachedAPISpec(
+            body=values["body"].encode("utf-8"),
+            validators=Validators(
+                etag=values["etag"],
+                last_modified=datetime.fromisoformat(last_modified) if last_modified is not None else None,
+            ),
+        )
+
+
+# API 스펙 단건 조회 캐시 (api_spec_id -> CachedAPISpec)
+api_spec_cache = create_cache("cache.api_specs", codec=CachedAPISpecCodec())
+
+# API 스펙 비교 결과 캐시 ((기준 spec_content_hash, 비교 spec_content_hash) -> diff_specs 결과)
+# 내용 해시가 키이므로 스펙이 수정되어도 무효화할 필요가 없다.
+api_spec_diff_cache = create_cache("cache.api_spec_diffs")
+
+# 파싱한 스펙 문서 트리 캐시 (spec_content_hash -> HashNode, 계산한 하위 트리 해시도 함께 재사용)
+# 큰 파이썬 객체라 Redis로 공유하지 않고 프로세스 메모리에만 둔다.
+SPEC_TREE_CACHE_SIZE = int(os.getenv("SPEC_TREE_CACHE_SIZE", "16"))
+spec_tree_cache = LRUCache("cache.api_spec_trees", max_size=SPEC_TREE_CACHE_SIZE)
+
+# 검색/사용처 색인을 다시 만들 때 한 번에 읽고 커밋할 API 스펙 수
+REINDEX_BATCH_SIZE = int(os.getenv("REINDEX_BATCH_SIZE", "200"))
+
+# 부분 조회 한 번에 요청할 수 있는 JSON Pointer 최대 개수
+SPEC_CONTENT_POINTERS_MAX = int(os.getenv("SPEC_CONTENT_POINTERS_MAX", "100"))
+
+
+def spec_tree(row: Any) -> HashNode:
+    """
+    행의 spec_content를 파싱한 문서 트리를 반환하는 함수 (spec_content_hash로 캐시)
+
+    Args:
+        row: spec_content, spec_content_wrapped, spec_content_hash 속성을 가진 행
+
+    Returns:
+        HashNode: 파싱한 문서의 루트 노드
+    """
+    tree = spec_tree_cache.get(row.spec_content_hash) if row.spec_content_hash is not None else MISSING
+    if tree is MISSING:
+        tree = hash_tree(load_document(stored_spec_content(row)))
+        if row.spec_content_hash is not None:
+            spec_tree_cache.set(row.spec_content_hash, tree)
+    return tree
+
+
+def stored_spec_content(row: Any) -> Any:
+    """
+    저장 형식(spec_content, spec_content_wrapped)에서 원래 spec_content 값을 꺼내는 함수
+
+    Args:
+        row: spec_content, spec_content_wrapped 속성을 가진 행
+
+    Returns:
+        원래 spec_content 값 (감싸 저장된 경우 문자열)
+    """
+    if row.spec_content_wrapped:
+        return json.loads(wrapped_content_literal(row.spec_content))
+    return parse_json_content(row.spec_content)
+
+
+class APISpecDB(Base):
     """
     API 스펙 데이터베이스 모델 클래스
     schema.sql의 api_specs 테이블 구조를 따름
     """
     __tablename__ = 'api_specs'
-    id = Column(BigInteger, primary_key=True, autoincrement=True, comment='API 스펙 아이디')
+    __table_args__ = (
+        # 프로젝트별 목록/요약 조회 (project_id = ? AND is_archived = 0)
+        Index('ix_api_specs_project_id_is_archived', 'project_id', 'is_archived'),
+        # 목록 키셋 페이지네이션 (is_archived = 0 ORDER BY updated_at, id)
+        Index('ix_api_specs_is_archived_updated_at', 'is_archived', 'updated_at', 'id'),
+        UniqueConstraint('project_id', 'version', name='uq_api_specs_project_id_version'),
+    )
+    id = Column(BigIntegerPK, primary_key=True, autoincrement=True, comment='API 스펙 아이디')
     project_id = Column(BigInteger, nullable=False, comment='프로젝트 아이디')
     version = Column(String(50), nullable=False, comment='API 스펙 버전')
     title = Column(String(100), nullable=False, comment='API 스펙 제목')
     description = Column(String(500), nullable=True, comment='API 스펙 설명')
     spec_content = Column(Text, nullable=False, comment='API 스펙 내용 (JSON 형식)')
+    spec_content_hash = Column(String(64), nullable=True, comment='spec_content SHA-256 해시 (ETag 계산용)')
+    spec_content_wrapped = Column(Boolean, nullable=True, comment='spec_content를 {"content": ...}로 감싸 저장했는지 여부')
     is_archived = Column(Boolean, default=False, comment='API 스펙 삭제 여부')
     access_role = Column(String(50), nullable=True, comment='API 접근 권한')
     created_by = Column(BigInteger, comment='API 스펙 생성자 아이디')
     created_at = Column(DateTime, default=datetime.now, nullable=False, comment='API 스펙 생성일')
     updated_by = Column(BigInteger, comment='API 스펙 수정자 아이디')
     updated_at = Column(DateTime, default=datetime.now, onupdate=datetime.now, comment='API 스펙 수정일')
+    row_version = Column(BigInteger, nullable=False, default=1, server_default=text('1'), comment='행 버전 (수정할 때마다 1 증가, 낙관적 동시성 제어)')
 
     def toAPISpec(self):
         """
@@ -40,9 +167,7 @@ class APISpecDB(declarative_base()):
             APISpec: API 모델 객체
         """
         # 저장된 spec_content는 JSON 문자열이므로 파싱
-        parsed_content = parse_json_content(self.spec_content)
-        
-        print("---------------:::", self.spec_content)
+        parsed_content = json.loads(self.spec_content_literal()) if self.spec_content_wrapped else parse_json_content(self.spec_content)
 
         return APISpec(
             id=self.id,
@@ -56,17 +181,50 @@ class APISpecDB(declarative_base()):
             created_by=self.created_by,
             created_at=self.created_at,
             updated_by=self.updated_by,
-            updated_at=self.updated_at
+            updated_at=self.updated_at,
+            row_version=self.row_version
         )
+    def spec_content_literal(self) -> str:
+        """
+        응답 본문에 그대로 넣을 spec_content 값의 JSON 리터럴을 반환
+        감싸 저장된 경우 저장된 문자열을 잘라내기만 하고, 마커가 없는 기존 데이터만 파싱한다.
+
+        Returns:
+            str: spec_content 값의 JSON 리터럴
+        """
+        if self.spec_content_wrapped:
+            return wrapped_content_literal(self.spec_content)
+        return json.dumps(parse_json_content(self.spec_content))
+
+    def toAPISpecJSON(self) -> bytes:
+        """
+        데이터베이스 모델을 APISpec JSON 응답 본문으로 직렬화
+        spec_content는 저장된 JSON을 다시 파싱/검증하지 않고 그대로 이어 붙인다.
+
+        Returns:
+            bytes: APISpec JSON 본문
+        """
+        head = APISpec(
+            id=self.id,
+            project_id=self.project_id,
+            version=self.version,
+            title=self.title,
+            description=self.description,
+            is_archived=self.is_archived,
+            access_role=self.access_role,
+            created_by=self.created_by,
+            created_at=self.created_at,
+            row_version=self.row_version,
+        ).model_dump_json(by_alias=True, exclude={"spec_content"})
+        return f'{head[:-1]},"spec_content":{self.spec_content_literal()}}}'.encode()
+
     def toAPISpecDB(self, api_spec: APISpec):
         """
         데이터베이스 모델을 API 모델로 변환
         
         Returns:
             APISpec: API 모델 객체
-        """ 
-
-        print("---------------:::", api_spec)
+        """
         return APISpecDB(
             project_id=api_spec.project_id,
             version=api_spec.version,
@@ -81,23 +239,153 @@ class APISpecDB(declarative_base()):
             updated_at=api_spec.updated_at
         )   
     
+
+def reindex_api_specs(db: Session, batch_size: int = REINDEX_BATCH_SIZE) -> int:
+    """
+    삭제되지 않은 모든 API 스펙으로 검색 색인과 사용처 색인을 다시 만드는 함수
+    색인 테이블이 생기기 전에 저장된 스펙을 채우기 위해 api-hub-init-db에서 실행한다.
+    id 순 키셋으로 batch_size개씩 읽어 배치마다 커밋하므로 스펙 수와 무관하게 메모리 사용량이 일정하다.
+
+    Args:
+        db (Session): 데이터베이스 세션
+        batch_size (int): 한 번에 읽고 커밋할 스펙 수
+
+    Returns:
+        int: 색인한 API 스펙 수
+    """
+    columns = (APISpecDB.id, APISpecDB.project_id, APISpecDB.title, APISpecDB.description, APISpecDB.spec_content, APISpecDB.spec_content_wrapped)
+    indexed, last_id = 0, None
+    while True:
+        statement = select(*columns).where(APISpecDB.is_archived == False)
+        if last_id is not None:
+            statement = statement.where(APISpecDB.id > last_id)
+        rows = db.execute(statement.order_by(APISpecDB.id).limit(batch_size)).all()
+        if not rows:
+            return indexed
+        documents = [load_document(stored_spec_content(row)) for row in rows]
+        ids = [row.id for row in rows]
+        index_api_specs(db, [
+            search_row(row.id, row.project_id, row.title, row.description, document) for row, document in zip(rows, documents)
+        ])
+        index_usages(db, ids, [item for api_spec_id, document in zip(ids, documents) for item in usage_rows(api_spec_id, document)])
+        db.commit()
+        indexed += len(rows)
+        last_id = ids[-1]
+
+
 class APISpecsApiImpl(BaseAPISpecsApi):
     """
     API Specs API 구현 클래스
     BaseAPISpecsApi를 상속받아 API 스펙 관련 API 엔드포인트를 구현합니다.
     """
 
-    async def api_specs_get(self) -> List[APISpec]:
+    async def api_specs_get(self, limit: int = DEFAULT_PAGE_SIZE, cursor: Optional[str] = None, sort: str = "id", project_id: Optional[int] = None) -> Page[APISpec]:
         """
-        모든 API 스펙 목록을 반환하는 메서드
+        API 스펙 목록을 키셋 페이지 단위로 반환하는 메서드
         
+        Args:
+            limit (int): 페이지 크기
+            cursor (Optional[str]): 이전 페이지의 다음 페이지 커서
+            sort (str): 정렬 키 (id 또는 updated_at)
+            project_id (Optional[int]): 지정 시 해당 프로젝트의 API 스펙만 조회
+
+        Returns:
+            Page[APISpec]: API 스펙 객체 페이지 (같은 행으로 계산한 검증자 포함)
+        """
+        def _query(db: Session) -> Page[APISpec]:
+            # 데이터베이스에서 API 스펙 한 페이지 반환 (삭제되지 않은 API 스펙만)
+            query = db.query(APISpecDB).filter(APISpecDB.is_archived == False)
+            if project_id is not None:
+                query = query.filter(APISpecDB.project_id == project_id)
+            return paginate(query, APISpecDB, limit, cursor, sort, convert=APISpecDB.toAPISpec, validator_columns=LIST_VALIDATOR_COLUMNS)
+
+        return await run_in_session(_query)
+
+    async def api_specs_by_ids_get(self, ids: List[int]) -> List[APISpec]:
+        """
+        여러 ID의 API 스펙을 IN 절 쿼리로 한 번에 조회하는 메서드
+
+        Args:
+            ids (List[int]): 조회할 API 스펙 ID 목록
+
         Returns:
-            List[APISpec]: API 스펙 객체 리스트
+            List[APISpec]: 요청 순서의 API 스펙 목록 (없거나 삭제된 ID는 제외)
         """
-        with DatabaseSessionManager() as db:
-            # 데이터베이스에서 모든 API 스펙 반환 (삭제되지 않은 API 스펙만)
-            api_specs = db.query(APISpecDB).filter(APISpecDB.is_archived == False).all() if db else []
-            return [api_spec.toAPISpec() for api_spec in api_specs]
+        def _query(db: Session) -> List[APISpec]:
+            rows = select_by_ids(db, APISpecDB, ids, APISpecDB.is_archived == False)
+            return [row.toAPISpec() for row in rows]
+
+        return await run_in_session(_query)
+
+    async def api_specs_summaries_get(self, limit: int = DEFAULT_PAGE_SIZE, cursor: Optional[str] = None, sort: str = "id", project_id: Optional[int] = None, fields: Optional[List[str]] = None) -> Page[APISpecSummary]:
+        """
+        spec_content를 제외한 API 스펙 요약 목록을 키셋 페이지 단위로 반환하는 메서드
+        필요한 컬럼만 SELECT 하므로 큰 spec_content를 데이터베이스에서 읽지 않는다.
+
+        Args:
+            limit (int): 페이지 크기
+            cursor (Optional[str]): 이전 페이지의 다음 페이지 커서
+            sort (str): 정렬 키 (id 또는 updated_at)
+            project_id (Optional[int]): 지정 시 해당 프로젝트의 API 스펙만 조회
+            fields (Optional[List[str]]): 반환할 APISpecSummary 필드 (기본: 전체 요약 필드)
+
+        Returns:
+            Page[APISpecSummary]: API 스펙 요약 객체 페이지 (같은 행으로 계산한 검증자 포함)
+
+        Raises:
+            HTTPException: 알 수 없는 필드를 요청한 경우 (400)
+        """
+        fields = fields or list(SUMMARY_FIELDS)
+        unknown = [name for name in fields if name not in SUMMARY_FIELDS]
+        if unknown:
+            raise HTTPException(status_code=400, detail=f"Unknown fields: {', '.join(unknown)}")
+
+        def _to_summary(row) -> APISpecSummary:
+            return APISpecSummary(**{name: getattr(row, name) for name in fields})
+
+        def _query(db: Session) -> Page[APISpecSummary]:
+            # 요청 필드 + 페이지 커서/검증자에 필요한 컬럼만 조회
+            columns = dict.fromkeys(list(LIST_VALIDATOR_COLUMNS) + fields)
+            query = db.query(*[getattr(APISpecDB, name) for name in columns]).filter(APISpecDB.is_archived == False)
+            if project_id is not None:
+                query = query.filter(APISpecDB.project_id == project_id)
+            return paginate(query, APISpecDB, limit, cursor, sort, convert=_to_summary, validator_columns=LIST_VALIDATOR_COLUMNS)
+
+        return await run_in_session(_query)
+
+    async def api_specs_validators(self, limit: int = DEFAULT_PAGE_SIZE, cursor: Optional[str] = None, sort: str = "id", project_id: Optional[int] = None) -> Validators:
+        """
+        API 스펙 목록 한 페이지의 검증자(ETag, Last-Modified)를 계산하는 메서드 (조건부 요청의 304 검사용)
+        LIST_VALIDATOR_COLUMNS 컬럼만 조회하므로 spec_content를 읽지 않는다.
+
+        Args:
+            limit (int): 페이지 크기
+            cursor (Optional[str]): 이전 페이지의 다음 페이지 커서
+            sort (str): 정렬 키 (id 또는 updated_at)
+            project_id (Optional[int]): 지정 시 해당 프로젝트의 API 스펙만 조회
+
+        Returns:
+            Validators: 페이지 검증자
+        """
+        def _query(db: Session) -> Validators:
+            query = db.query(*[getattr(APISpecDB, name) for name in LIST_VALIDATOR_COLUMNS]).filter(APISpecDB.is_archived == False)
+            if project_id is not None:
+                query = query.filter(APISpecDB.project_id == project_id)
+            return paginate(query, APISpecDB, limit, cursor, sort, validator_columns=LIST_VALIDATOR_COLUMNS).validators
+
+        return await run_in_session(_query)
+
+    def api_specs_stream(self) -> AsyncIterator[APISpec]:
+        """
+        모든 API 스펙을 id 순으로 한 건씩 내보내는 메서드 (내보내기/대시보드용 스트리밍)
+        서버 사이드 커서(yield_per)로 읽으므로 전체 목록을 메모리에 적재하지 않는다.
+
+        Returns:
+            AsyncIterator[APISpec]: API 스펙 객체 스트림
+        """
+        # 삭제되지 않은 API 스펙만 id 순으로 조회
+        statement = select(APISpecDB).where(APISpecDB.is_archived == False).order_by(APISpecDB.id)
+        return stream_in_session(statement, APISpecDB.toAPISpec)
 
     async def api_specs_post(self, api_spec: APISpec) -> APISpec:
         """
@@ -109,10 +397,11 @@ class APISpecsApiImpl(BaseAPISpecsApi):
         Returns:
             APISpec: 생성된 API 스펙 정보
         """
-        print("--------------- 1111 :::", api_spec)
-        with DatabaseSessionManager() as db:
-            # spec_content를 JSON 형식으로 변환 (유틸리티 함수 사용)
-            spec_content = safe_json_dumps(api_spec.spec_content)
+        log_payload(logger, "API spec create request", api_spec.model_dump_json, project_id=api_spec.project_id, version=api_spec.version)
+
+        def _create(db: Session) -> APISpec:
+            # spec_content를 JSON 형식으로 변환 (유틸리티 함수 사용), 감싼 여부는 마커로 함께 저장
+            spec_content, spec_content_wrapped = dump_spec_content(api_spec.spec_content)
 
             # 새 API 스펙 객체 생성
             new_api_spec_db = APISpecDB(
@@ -121,6 +410,8 @@ class APISpecsApiImpl(BaseAPISpecsApi):
                 title=api_spec.title,
                 description=api_spec.description,
                 spec_content=spec_content,  # JSON 문자열로 변환된 content
+                spec_content_wrapped=spec_content_wrapped,
+                spec_content_hash=content_hash(spec_content),
                 is_archived=False,
                 access_role=api_spec.access_role,
                 created_by=api_spec.created_by,
@@ -129,17 +420,114 @@ class APISpecsApiImpl(BaseAPISpecsApi):
                 updated_at=datetime.now()
             )
             
-            # 데이터베이스에 API 스펙 추가
+            # 데이터베이스에 API 스펙과 첫 리비전(스냅샷) 추가
             db.add(new_api_spec_db)
+            db.flush()
+            add_revision(db, new_api_spec_db.id, api_spec.spec_content, created_by=api_spec.created_by)
+            # 검색 색인과 사용처 색인은 한 번 파싱한 문서로 함께 갱신
+            document = load_document(api_spec.spec_content)
+            index_api_specs(db, [search_row(new_api_spec_db.id, api_spec.project_id, api_spec.title, api_spec.description, document)])
+            index_usages(db, [], usage_rows(new_api_spec_db.id, document))
             db.commit()
             db.refresh(new_api_spec_db)
+            logger.info("API spec created", extra={"api_spec_id": new_api_spec_db.id, "project_id": new_api_spec_db.project_id, "spec_size": len(spec_content)})
             
             # 생성된 API 스펙 정보 반환
             return new_api_spec_db.toAPISpec()
 
+        return await run_in_session(_create)
+
+    async def api_specs_batch_post(self, api_specs: List[APISpec]) -> List[BatchItemResult]:
+        """
+        여러 API 스펙을 한 트랜잭션에서 다중 행 INSERT로 생성하는 메서드
+        항목별로 검증하여 실패한 항목은 건너뛰고, 나머지는 한 번의 executemany로 추가한다.
+
+        Args:
+            api_specs (List[APISpec]): 생성할 API 스펙 목록
+
+        Returns:
+            List[BatchItemResult]: 요청 순서의 항목별 결과 (201 생성, 400 필수 값 누락, 409 버전 중복)
+
+        Raises:
+            HTTPException: 항목 수가 DB_BATCH_SIZE_MAX를 넘는 경우 (400), 추가 중 제약 조건 위반 (409)
+        """
+        if len(api_specs) > DB_BATCH_SIZE_MAX:
+            raise HTTPException(status_code=400, detail=f"Batch size exceeds {DB_BATCH_SIZE_MAX}")
+
+        results: List[Optional[BatchItemResult]] = [None] * len(api_specs)
+        pending: Dict[tuple, int] = {}
+        for index, api_spec in enumerate(api_specs):
+            missing = [name for name in ("project_id", "version", "title", "spec_content") if getattr(api_spec, name) is None]
+            if missing:
+                results[index] = BatchItemResult(index=index, status=400, error=f"Missing required fields: {', '.join(missing)}")
+            elif (api_spec.project_id, api_spec.version) in pending:
+                results[index] = BatchItemResult(index=index, status=409, error="Duplicate project_id and version in batch")
+            else:
+                pending[(api_spec.project_id, api_spec.version)] = index
+
+        def _create(db: Session) -> None:
+            # 이미 존재하는 (project_id, version) 한 번에 조회
+            if pending:
+                existing = db.execute(
+                    select(APISpecDB.project_id, APISpecDB.version)
+                    .where(tuple_(APISpecDB.project_id, APISpecDB.version).in_(list(pending)))
+                ).all()
+                for key in existing:
+                    index = pending.pop(tuple(key), None)
+                    if index is not None:
+                        results[index] = BatchItemResult(index=index, status=409, error="API spec version already exists")
+
+            now = datetime.now()
+            rows = []
+            for index in pending.values():
+                api_spec = api_specs[index]
+                spec_content, spec_content_wrapped = dump_spec_content(api_spec.spec_content)
+                rows.append({
+                    "project_id": api_spec.project_id,
+                    "version": api_spec.version,
+                    "title": api_spec.title,
+                    "description": api_spec.description,
+                    "spec_content": spec_content,
+                    "spec_content_wrapped": spec_content_wrapped,
+                    "spec_content_hash": content_hash(spec_content),
+                    "is_archived": False,
+                    "access_role": api_spec.access_role,
+                    "created_by": api_spec.created_by,
+                    "created_at": now,
+                    "updated_by": api_spec.created_by,
+                    "updated_at": now,
+                })
+
+            try:
+                ids = insert_many(db, APISpecDB, rows, ("project_id", "version"))
+                # 생성된 스펙마다 첫 리비전(스냅샷)을 함께 추가
+                db.add_all([
+                    new_revision(api_spec_id, 1, api_specs[index].spec_content, created_by=api_specs[index].created_by, created_at=now)
+                    for index, api_spec_id in zip(pending.values(), ids)
+                ])
+                documents = [load_document(api_specs[index].spec_content) for index in pending.values()]
+                index_api_specs(db, [
+                    search_row(api_spec_id, api_specs[index].project_id, api_specs[index].title, api_specs[index].description, document)
+                    for index, api_spec_id, document in zip(pending.values(), ids, documents)
+                ])
+                index_usages(db, [], [
+                    row for api_spec_id, document in zip(ids, documents) for row in usage_rows(api_spec_id, document)
+                ])
+                db.commit()
+            except IntegrityError as e:
+                db.rollback()
+                raise HTTPException(status_code=409, detail=f"Batch insert failed: {e.orig}")
+
+            for index, api_spec_id in zip(pending.values(), ids):
+                results[index] = BatchItemResult(index=index, status=201, id=api_spec_id)
+            logger.info("API specs created in batch", extra={"requested_count": len(api_specs), "created_count": len(ids)})
+
+        await run_in_session(_create)
+        return results
+
     async def api_specs_api_spec_id_get(self, api_spec_id: int) -> APISpec:
         """
-        특정 ID의 API 스펙 정보를 조회하는 메서드
+        특정 ID의 API 스펙 정보를 조회하는 메서드 (캐시 우선)
         
         Args:
             api_spec_id (int): 조회할 API 스펙 ID
@@ -150,90 +538,485 @@ class APISpecsApiImpl(BaseAPISpecsApi):
         Raises:
             HTTPException: API 스펙이 존재하지 않을 경우
         """
-        with DatabaseSessionManager() as db:
-            # 데이터베이스에서 API 스펙 조회 (삭제되지 않은 API 스펙만)
-            api_spec_db = db.query(APISpecDB).filter(
+        cached = await self._cached_api_spec(api_spec_id)
+        if cached.api_spec is None:
+            cached.api_spec = APISpec.model_validate_json(cached.body)
+        return cached.api_spec
+
+    async def api_specs_api_spec_id_validators(self, api_spec_id: int) -> Validators:
+        """
+        특정 ID의 API 스펙 검증자(ETag, Last-Modified)를 계산하는 메서드 (조건부 요청의 304 검사용)
+        캐시에 없으면 기본 키로 row_version, updated_at 컬럼만 조회하므로 spec_content를 읽지 않는다.
+        ETag는 row_version을 담으므로 그대로 수정/삭제의 If-Match로 쓸 수 있다.
+
+        Args:
+            api_spec_id (int): 조회할 API 스펙 ID
+
+        Returns:
+            Validators: API 스펙 검증자
+
+        Raises:
+            HTTPException: API 스펙이 존재하지 않을 경우
+        """
+        cached = await api_spec_cache.aget(api_spec_id)
+        if cached is not MISSING:
+            return cached.validators
+
+        def _query(db: Session) -> Validators:
+            row = db.query(APISpecDB.row_version, APISpecDB.updated_at).filter(
                 APISpecDB.id == api_spec_id,
                 APISpecDB.is_archived == False
             ).first()
-            
+
             # API 스펙이 존재하지 않으면 404 에러 발생
-            if api_spec_db is None:
+            if row is None:
                 raise HTTPException(status_code=404, detail=f"API Spec with ID {api_spec_id} not found")
-            
-            # 조회된 API 스펙 정보 반환
-            return api_spec_db.toAPISpec()
 
-    async def api_specs_api_spec_id_put(self, api_spec_id: int, api_spec: APISpec) -> APISpec:
+            return Validators(etag=version_etag(row.row_version), last_modified=row.updated_at)
+
+        return await run_in_session(_query)
+
+    async def api_specs_api_spec_id_get_json(self, api_spec_id: int) -> bytes:
         """
-        특정 ID의 API 스펙 정보를 업데이트하는 메서드
-        
+        특정 ID의 API 스펙을 직렬화된 JSON 본문으로 조회하는 메서드 (캐시 우선)
+        저장된 spec_content를 파싱/재직렬화하지 않고 응답 본문에 그대로 사용한다.
+
         Args:
-            api_spec_id (int): 업데이트할 API 스펙 ID
-            api_spec (APISpec): 업데이트할 API 스펙 정보
-            
+            api_spec_id (int): 조회할 API 스펙 ID
+
         Returns:
-            APISpec: 업데이트된 API 스펙 정보
-            
+            bytes: APISpec JSON 본문
+
+        Raises:
+            HTTPException: API 스펙이 존재하지 않을 경우
+        """
+        return (await self._cached_api_spec(api_spec_id)).body
+
+    async def api_specs_api_spec_id_get_json_with_validators(self, api_spec_id: int) -> Tuple[bytes, Optional[Validators]]:
+        """
+        특정 ID의 API 스펙 JSON 본문과 그 본문을 만든 행의 검증자를 함께 조회하는 메서드 (캐시 우선)
+        캐시에 없으면 한 번의 조회로 본문과 검증자를 만들므로 ETag가 본문과 다른 버전을 가리키지 않는다.
+
+        Args:
+            api_spec_id (int): 조회할 API 스펙 ID
+
+        Returns:
+            Tuple[bytes, Optional[Validators]]: APISpec JSON 본문과 검증자
+
         Raises:
             HTTPException: API 스펙이 존재하지 않을 경우
         """
-        with DatabaseSessionManager() as db:
+        cached = await self._cached_api_spec(api_spec_id)
+        return cached.body, cached.validators
+
+    async def _cached_api_spec(self, api_spec_id: int) -> "CachedAPISpec":
+        """
+        캐시에서 API 스펙을 찾고, 없으면 데이터베이스에서 읽어 캐시에 저장하는 메서드
+
+        Raises:
+            HTTPException: API 스펙이 존재하지 않을 경우
+        """
+        cached = await api_spec_cache.aget(api_spec_id)
+        if cached is not MISSING:
+            return cached
+
+        def _query(db: Session) -> CachedAPISpec:
             # 데이터베이스에서 API 스펙 조회 (삭제되지 않은 API 스펙만)
             api_spec_db = db.query(APISpecDB).filter(
                 APISpecDB.id == api_spec_id,
                 APISpecDB.is_archived == False
             ).first()
-            
+
             # API 스펙이 존재하지 않으면 404 에러 발생
             if api_spec_db is None:
                 raise HTTPException(status_code=404, detail=f"API Spec with ID {api_spec_id} not found")
+
+            return CachedAPISpec(
+                body=api_spec_db.toAPISpecJSON(),
+                validators=Validators(
+                    etag=version_etag(api_spec_db.row_version),
+                    last_modified=api_spec_db.updated_at,
+                ),
+            )
+
+        cached = await run_in_session(_query)
+        await api_spec_cache.aset(api_spec_id, cached)
+        return cached
+
+    async def api_specs_api_spec_id_put(self, api_spec_id: int, api_spec: APISpec, if_match: Optional[str] = None) -> APISpec:
+        """
+        특정 ID의 API 스펙 정보를 업데이트하는 메서드 (row_version 비교 수정)
+        
+        Args:
+            api_spec_id (int): 업데이트할 API 스펙 ID
+            api_spec (APISpec): 업데이트할 API 스펙 정보
+            if_match (Optional[str]): If-Match 헤더 (조회 시 받은 ETag)
             
-            # API 스펙 정보 업데이트
-            api_spec_db.project_id = api_spec.project_id if api_spec.project_id else api_spec_db.project_id
-            api_spec_db.version = api_spec.version if api_spec.version else api_spec_db.version
-            api_spec_db.title = api_spec.title if api_spec.title else api_spec_db.title
-            api_spec_db.description = api_spec.description if api_spec.description is not None else api_spec_db.description
+        Returns:
+            APISpec: 업데이트된 API 스펙 정보
             
-            # spec_content가 제공된 경우 JSON 형식으로 변환하여 저장
+        Raises:
+            HTTPException: API 스펙이 존재하지 않을 경우 (404), If-Match가 없거나 (428) 그 사이 수정된 경우 (412)
+        """
+        versions = if_match_versions(if_match)
+
+        # 제공된 필드만 수정 (빈 값이면 기존 값 유지)
+        values: Dict[str, Any] = {"updated_at": datetime.now()}
+        if api_spec.project_id:
+            values["project_id"] = api_spec.project_id
+        if api_spec.version:
+            values["version"] = api_spec.version
+        if api_spec.title:
+            values["title"] = api_spec.title
+        if api_spec.description is not None:
+            values["description"] = api_spec.description
+        if api_spec.access_role is not None:
+            values["access_role"] = api_spec.access_role
+
+        # spec_content가 제공된 경우 JSON 형식으로 변환하여 저장
+        if api_spec.spec_content is not None:
+            spec_content, spec_content_wrapped = dump_spec_content(api_spec.spec_content)
+            values.update(
+                spec_content=spec_content,
+                spec_content_wrapped=spec_content_wrapped,
+                spec_content_hash=content_hash(spec_content),
+            )
+
+        def _update(db: Session) -> APISpec:
+            active = [APISpecDB.is_archived == False]
+
+            # spec_content가 바뀌면 이전 내용으로 리비전(델타)을 만들므로, 읽은 버전 그대로일 때만 수정한다.
+            # (잠그지 않고 읽은 뒤 그 사이 다른 수정이 있으면 아래 UPDATE가 실패하여 412)
+            previous = None
+            expected = versions
             if api_spec.spec_content is not None:
-                api_spec_db.spec_content = safe_json_dumps(api_spec.spec_content)
-                
-            api_spec_db.access_role = api_spec.access_role if api_spec.access_role is not None else api_spec_db.access_role
-            api_spec_db.updated_by = api_spec.updated_by if api_spec.updated_by else api_spec_db.updated_by
-            api_spec_db.updated_at = datetime.now()
-            
+                previous = db.execute(
+                    select(APISpecDB.spec_content, APISpecDB.spec_content_wrapped, APISpecDB.spec_content_hash, APISpecDB.row_version)
+                    .where(APISpecDB.id == api_spec_id, *active)
+                ).first()
+                if previous is None:
+                    raise HTTPException(status_code=404, detail=f"API Spec with ID {api_spec_id} not found")
+                expected = [previous.row_version] if versions is None or previous.row_version in versions else []
+
+            # 단일 UPDATE ... WHERE id = ? AND is_archived = 0 AND row_version IN (...) (삭제되지 않은 API 스펙만)
+            api_spec_db = compare_and_swap(db, APISpecDB, api_spec_id, values, expected, active)
+
+            # API 스펙이 없으면 404, 버전이 다르면 412 에러 발생
+            if api_spec_db is None:
+                raise precondition_failed_or_not_found(row_exists(db, APISpecDB, api_spec_id, active), f"API Spec with ID {api_spec_id} not found")
+
+            # 검색/사용처 색인 갱신 (내용이 바뀌면 다시 추출하고, 제목 등만 바뀌면 검색 색인의 해당 컬럼만 수정)
+            search_values = {key: values[key] for key in ("project_id", "title", "description") if key in values}
+            if previous is not None and previous.spec_content_hash != values["spec_content_hash"]:
+                # 요청 본문의 created_by는 스펙 생성자이므로 수정자로 기록하지 않는다. (인증된 수정자 정보가 없어 NULL)
+                add_revision(db, api_spec_id, api_spec.spec_content, stored_spec_content(previous))
+                document = load_document(api_spec.spec_content)
+                index_api_specs(db, [search_row(api_spec_id, api_spec_db.project_id, api_spec_db.title, api_spec_db.description, document)])
+                index_usages(db, [api_spec_id], usage_rows(api_spec_id, document))
+            elif search_values and not update_search_metadata(db, api_spec_id, search_values):
+                index_api_specs(db, [search_row(api_spec_id, api_spec_db.project_id, api_spec_db.title, api_spec_db.description, stored_spec_content(api_spec_db))])
+
+            # 커밋 시 만료되므로 응답 모델은 먼저 변환
+            updated = api_spec_db.toAPISpec()
+
             # 변경사항 커밋
             db.commit()
-            db.refresh(api_spec_db)
-            
+            logger.info("API spec updated", extra={"api_spec_id": api_spec_id})
+
             # 업데이트된 API 스펙 정보 반환
-            return api_spec_db.toAPISpec()
+            return updated
+
+        updated = await run_in_session(_update)
+        # 커밋 후 캐시 무효화
+        await api_spec_cache.adelete(api_spec_id)
+        return updated
 
-    async def api_specs_api_spec_id_delete(self, api_spec_id: int) -> None:
+    async def api_specs_api_spec_id_patch(self, api_spec_id: int, patch: Any, merge: bool, if_match: Optional[str]) -> APISpec:
         """
-        특정 ID의 API 스펙을 삭제하는 메서드 (논리적 삭제 - is_archived 플래그 설정)
-        
+        spec_content에 JSON Patch(RFC 6902) 또는 JSON Merge Patch(RFC 7386)를 적용하는 메서드
+        spec_content_hash로 캐시한 파싱 문서에 패치를 적용하므로(바뀐 경로만 복사) 전체 내용을 다시 보내거나 파싱하지 않는다.
+        패치한 문서는 JSON으로 저장한다. (YAML로 저장된 스펙도 JSON이 된다.)
+
         Args:
-            api_spec_id (int): 삭제할 API 스펙 ID
-            
+            api_spec_id (int): 수정할 API 스펙 ID
+            patch (Any): JSON Patch 연산 목록 또는 Merge Patch 문서
+            merge (bool): Merge Patch이면 True
+            if_match (Optional[str]): If-Match 헤더 (조회 시 받은 ETag)
+
+        Returns:
+            APISpec: 수정된 API 스펙 정보
+
         Raises:
-            HTTPException: API 스펙이 존재하지 않을 경우
+            HTTPException: API 스펙이 존재하지 않을 경우 (404), If-Match가 없거나 (428) 현재 ETag와 다를 경우 (412),
+                패치를 적용할 수 없는 경우 (422)
         """
-        with DatabaseSessionManager() as db:
-            # 데이터베이스에서 API 스펙 조회 (삭제되지 않은 API 스펙만)
-            api_spec_db = db.query(APISpecDB).filter(
-                APISpecDB.id == api_spec_id,
-                APISpecDB.is_archived == False
+        versions = if_match_versions(if_match)
+
+        def _patch(db: Session) -> APISpec:
+            active = [APISpecDB.is_archived == False]
+
+            # 잠그지 않고 읽은 버전에 패치를 적용하고, 수정은 그 버전일 때만 한다. (compare-and-swap)
+            row = db.execute(
+                select(APISpecDB.row_version, APISpecDB.spec_content, APISpecDB.spec_content_wrapped, APISpecDB.spec_content_hash)
+                .where(APISpecDB.id == api_spec_id, *active)
             ).first()
-            
-            # API 스펙이 존재하지 않으면 404 에러 발생
-            if api_spec_db is None:
+            if row is None:
                 raise HTTPException(status_code=404, detail=f"API Spec with ID {api_spec_id} not found")
+            if versions is not None and row.row_version not in versions:
+                raise precondition_failed()
+
+            try:
+                document = (merge_patch if merge else apply_patch)(spec_tree(row).value, patch)
+            except JsonPatchError as e:
+                raise HTTPException(status_code=422, detail=f"Patch cannot be applied: {e}")
+
+            spec_content = spec_content_from_document(document)
+            stored, wrapped = dump_spec_content(spec_content)
+            stored_hash = content_hash(stored)
+            if stored_hash == row.spec_content_hash:
+                return db.get(APISpecDB, api_spec_id).toAPISpec()
+
+            api_spec_db = compare_and_swap(db, APISpecDB, api_spec_id, {
+                "spec_content": stored,
+                "spec_content_wrapped": wrapped,
+                "spec_content_hash": stored_hash,
+                "updated_at": datetime.now(),
+            }, [row.row_version], active)
+            if api_spec_db is None:
+                raise precondition_failed_or_not_found(row_exists(db, APISpecDB, api_spec_id, active), f"API Spec with ID {api_spec_id} not found")
+            add_revision(db, api_spec_id, spec_content, stored_spec_content(row))
+            index_api_specs(db, [search_row(api_spec_id, api_spec_db.project_id, api_spec_db.title, api_spec_db.description, document)])
+            index_usages(db, [api_spec_id], usage_rows(api_spec_id, document))
+            updated = api_spec_db.toAPISpec()
+
+            db.commit()
+            # 패치한 문서를 새 내용 해시의 파싱 트리로 등록 (바뀌지 않은 하위 트리는 이전 문서와 공유)
+            if isinstance(document, (dict, list)):
+                spec_tree_cache.set(stored_hash, hash_tree(document))
+            logger.info("API spec patched", extra={"api_spec_id": api_spec_id, "merge_patch": merge, "spec_size": len(stored)})
+            return updated
+
+        updated = await run_in_session(_patch)
+        await api_spec_cache.adelete(api_spec_id)
+        return updated
+
+    async def api_specs_api_spec_id_delete(self, api_spec_id: int, if_match: Optional[str] = None) -> None:
+        """
+        특정 ID의 API 스펙을 삭제하는 메서드 (논리적 삭제 - is_archived 플래그 설정, row_version 비교)
+        
+        Args:
+            api_spec_id (int): 삭제할 API 스펙 ID
+            if_match (Optional[str]): If-Match 헤더 (조회 시 받은 ETag)
             
-            # API 스펙 논리적 삭제 (is_archived 플래그 설정)
-            api_spec_db.is_archived = True
-            api_spec_db.updated_at = datetime.now()
-            
+        Raises:
+            HTTPException: API 스펙이 존재하지 않을 경우 (404), If-Match가 없거나 (428) 그 사이 수정된 경우 (412)
+        """
+        versions = if_match_versions(if_match)
+
+        def _archive(db: Session) -> None:
+            # API 스펙 논리적 삭제 (단일 UPDATE로 is_archived 플래그 설정, 삭제되지 않은 API 스펙만)
+            active = [APISpecDB.is_archived == False]
+            if compare_and_swap(db, APISpecDB, api_spec_id, {"is_archived": True, "updated_at": datetime.now()}, versions, active) is None:
+                raise precondition_failed_or_not_found(row_exists(db, APISpecDB, api_spec_id, active), f"API Spec with ID {api_spec_id} not found")
+            remove_from_index(db, api_spec_id)
+            remove_usages(db, api_spec_id)
+
             # 변경사항 커밋
             db.commit()
+            logger.info("API spec archived", extra={"api_spec_id": api_spec_id})
+
+        await run_in_session(_archive)
+        # 커밋 후 캐시 무효화
+        await api_spec_cache.adelete(api_spec_id)
+
+    async def api_specs_api_spec_id_content_get(self, api_spec_id: int, pointers: List[str]) -> bytes:
+        """
+        spec_content에서 JSON Pointer(RFC 6901)가 가리키는 부분만 조회하는 메서드
+        spec_content_hash로 캐시한 파싱 트리에서 값을 찾으므로, 캐시 적중 시 spec_content를 읽거나 파싱하지 않고
+        응답 크기(직렬화 비용)는 요청한 하위 트리 크기에만 비례한다.
+
+        Args:
+            api_spec_id (int): 조회할 API 스펙 ID
+            pointers (List[str]): JSON Pointer 목록 (예: /paths/~1users, 빈 문자열은 문서 전체)
+
+        Returns:
+            bytes: {pointer: 값} JSON 본문
+
+        Raises:
+            HTTPException: 잘못된 JSON Pointer이거나 개수 초과 (400), API 스펙 또는 Pointer가 가리키는 값이 없을 경우 (404)
+        """
+        if len(pointers) > SPEC_CONTENT_POINTERS_MAX:
+            raise HTTPException(status_code=400, detail=f"At most {SPEC_CONTENT_POINTERS_MAX} pointers are allowed")
+        for pointer in pointers:
+            try:
+                parse_pointer(pointer)
+            except JsonPatchError as e:
+                raise HTTPException(status_code=400, detail=str(e))
+
+        def _select(db: Session, *columns) -> Any:
+            row = db.execute(
+                select(APISpecDB.spec_content_hash, *columns).where(APISpecDB.id == api_spec_id, APISpecDB.is_archived == False)
+            ).first()
+            if row is None:
+                raise HTTPException(status_code=404, detail=f"API Spec with ID {api_spec_id} not found")
+            return row
+
+        def _tree(db: Session) -> HashNode:
+            # 파싱한 트리가 캐시에 있으면 해시만 읽는다.
+            row = _select(db)
+            tree = spec_tree_cache.get(row.spec_content_hash) if row.spec_content_hash is not None else MISSING
+            if tree is MISSING:
+                tree = spec_tree(_select(db, APISpecDB.spec_content, APISpecDB.spec_content_wrapped))
+            return tree
+
+        document = (await run_in_session(_tree)).value
+        values = {}
+        for pointer in pointers:
+            try:
+                values[pointer] = resolve_pointer(document, pointer)
+            except JsonPatchError as e:
+                raise HTTPException(status_code=404, detail=f"Pointer {pointer!r} not found: {e}")
+        return json.dumps(values, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+    async def api_specs_api_spec_id_revisions_get(self, api_spec_id: int, limit: int = DEFAULT_PAGE_SIZE, before: Optional[int] = None) -> List[APISpecRevision]:
+        """
+        API 스펙의 리비전 목록을 최신순으로 조회하는 메서드 (spec_content 제외)
+
+        Args:
+            api_spec_id (int): API 스펙 ID
+            limit (int): 최대 개수
+            before (Optional[int]): 이 리비전 번호보다 이전 리비전만 조회
+
+        Returns:
+            List[APISpecRevision]: 리비전 목록
+
+        Raises:
+            HTTPException: API 스펙이 존재하지 않을 경우
+        """
+        def _query(db: Session) -> List[APISpecRevision]:
+            if db.scalar(select(APISpecDB.id).where(APISpecDB.id == api_spec_id, APISpecDB.is_archived == False)) is None:
+                raise HTTPException(status_code=404, detail=f"API Spec with ID {api_spec_id} not found")
+            return list_revisions(db, api_spec_id, limit, before)
+
+        return await run_in_session(_query)
+
+    async def api_specs_api_spec_id_revisions_revision_get(self, api_spec_id: int, revision: int) -> APISpecRevision:
+        """
+        API 스펙의 특정 리비전을 복원하여 조회하는 메서드
+
+        Args:
+            api_spec_id (int): API 스펙 ID
+            revision (int): 리비전 번호
+
+        Returns:
+            APISpecRevision: spec_content가 채워진 리비전
+
+        Raises:
+            HTTPException: API 스펙 또는 리비전이 존재하지 않을 경우
+        """
+        def _query(db: Session) -> APISpecRevision:
+            if db.scalar(select(APISpecDB.id).where(APISpecDB.id == api_spec_id, APISpecDB.is_archived == False)) is None:
+                raise HTTPException(status_code=404, detail=f"API Spec with ID {api_spec_id} not found")
+            found = load_revision(db, api_spec_id, revision)
+            if found is None:
+                raise HTTPException(status_code=404, detail=f"Revision {revision} of API Spec {api_spec_id} not found")
+            return found
+
+        return await run_in_session(_query)
+
+    async def api_specs_api_spec_id_diff_other_id_get(self, api_spec_id: int, other_id: int) -> APISpecDiff:
+        """
+        두 API 스펙의 구조적 차이를 조회하는 메서드
+        비교 결과는 두 스펙의 spec_content_hash 쌍으로 캐시하여, 같은 내용끼리의 반복 비교는 해시만 조회한다.
+
+        Args:
+            api_spec_id (int): 기준 API 스펙 ID
+            other_id (int): 비교할 API 스펙 ID
+
+        Returns:
+            APISpecDiff: 추가/삭제/변경된 경로, 오퍼레이션, 스키마와 하위 호환성을 깨는 변경 목록
+
+        Raises:
+            HTTPException: API 스펙이 존재하지 않을 경우
+        """
+        ids = (api_spec_id, other_id)
+
+        def _select(db: Session, *columns) -> Dict[int, Any]:
+            rows = db.execute(
+                select(APISpecDB.id, APISpecDB.spec_content_hash, *columns).where(APISpecDB.id.in_(ids), APISpecDB.is_archived == False)
+            ).all()
+            found = {row.id: row for row in rows}
+            for spec_id in ids:
+                if spec_id not in found:
+                    raise HTTPException(status_code=404, detail=f"API Spec with ID {spec_id} not found")
+            return found
+
+        def _diff(db: Session) -> Any:
+            # 파싱한 트리가 모두 캐시에 있으면 spec_content를 읽지 않는다.
+            rows = _select(db)
+            trees = {spec_id: spec_tree_cache.get(row.spec_content_hash) if row.spec_content_hash is not None else MISSING for spec_id, row in rows.items()}
+            if any(tree is MISSING for tree in trees.values()):
+                rows = _select(db, APISpecDB.spec_content, APISpecDB.spec_content_wrapped)
+                trees = {spec_id: spec_tree(row) for spec_id, row in rows.items()}
+            key = (rows[api_spec_id].spec_content_hash, rows[other_id].spec_content_hash)
+            return key, diff_specs(trees[api_spec_id], trees[other_id])
+
+        def _hashes(db: Session) -> Any:
+            rows = _select(db)
+            return rows[api_spec_id].spec_content_hash, rows[other_id].spec_content_hash
+
+        key = await run_in_session(_hashes)
+        result = await api_spec_diff_cache.aget(key) if None not in key else MISSING
+        if result is MISSING:
+            # 내용을 읽은 시점의 해시로 저장 (두 조회 사이에 스펙이 수정되어도 다른 내용의 결과가 저장되지 않음)
+            key, result = await run_in_session(_diff)
+            if None not in key:
+                await api_spec_diff_cache.aset(key, result)
+        return APISpecDiff.model_validate({**result, "api_spec_id": api_spec_id, "other_api_spec_id": other_id})
+
+    async def api_specs_search_get(self, q: str, limit: int = DEFAULT_PAGE_SIZE, cursor: Optional[str] = None, project_id: Optional[int] = None) -> Page[APISpecSearchResult]:
+        """
+        검색 색인에서 API 스펙을 관련도 순으로 검색하는 메서드
+
+        Args:
+            q (str): 검색어 (경로, operationId, 태그, 요약, 스키마 이름, 제목, 설명)
+            limit (int): 페이지 크기
+            cursor (Optional[str]): 이전 페이지의 next_cursor
+            project_id (Optional[int]): 이 프로젝트의 스펙만 검색
+
+        Returns:
+            Page[APISpecSearchResult]: 검색 결과 페이지
+        """
+        def _query(db: Session) -> Page[APISpecSearchResult]:
+            return search_api_specs(db, q, limit, cursor, project_id)
+
+        return await run_in_session(_query)
+
+    async def api_specs_usages_get(self, component: Optional[str] = None, operation: Optional[str] = None, limit: int = DEFAULT_PAGE_SIZE, cursor: Optional[str] = None) -> Page[APISpecUsage]:
+        """
+        컴포넌트나 오퍼레이션을 선언하거나 참조하는 API 스펙을 사용처 색인에서 조회하는 메서드
+        (spec_content를 파싱하지 않고 색인 인덱스만 읽는다.)
+
+        Args:
+            component (Optional[str]): 컴포넌트 이름 (User, schemas/User 또는 #/components/schemas/User)
+            operation (Optional[str]): 오퍼레이션 (METHOD /path)
+            limit (int): 페이지 크기
+            cursor (Optional[str]): 이전 페이지의 next_cursor
+
+        Returns:
+            Page[APISpecUsage]: 사용처 목록 (component는 선언과 $ref 참조, operation은 선언)
+
+        Raises:
+            HTTPException: component와 operation 중 정확히 하나가 주어지지 않은 경우 (400)
+        """
+        if (component is None) == (operation is None):
+            raise HTTPException(status_code=400, detail="Exactly one of component or operation is required")
+        if component is not None:
+            name, kinds = normalize_component(component), ("component", "ref")
+        else:
+            name, kinds = normalize_operation(operation), ("operation",)
+
+        def _query(db: Session) -> Page[APISpecUsage]:
+            return find_usages(db, name, kinds, limit, cursor)
+
+        return await run_in_session(_query)
@@ -1,23 +1,39 @@
 # coding: utf-8
 
-from typing import List, Dict, Any
+from typing import List, Dict, Any, AsyncIterator, Optional
 from api_hub.apis.projects_api_base import BaseProjectsApi
 from api_hub.models.project import Project
 from fastapi import Depends, HTTPException
 from sqlalchemy.orm import Session, relationship
-from api_hub.db.database import DatabaseSessionManager, get_db, Base
+from api_hub.db.database import DatabaseSessionManager, get_db, Base, BigIntegerPK, DB_BATCH_SIZE_MAX, compare_and_swap, row_exists, run_in_session, select_by_ids, stream_in_session
+from api_hub.models.batch_item_result import BatchItemResult
+from api_hub.pagination import DEFAULT_PAGE_SIZE, Page, paginate
+from api_hub.conditional import Validators, if_match_versions, precondition_failed_or_not_found
+from api_hub.cache import MISSING, ModelCodec, create_cache
 
 from datetime import datetime
-from sqlalchemy import Column, Integer, String, Text, DateTime, Boolean, BigInteger
-from sqlalchemy.ext.declarative import declarative_base
+import logging
+from sqlalchemy import Column, Integer, String, Text, DateTime, Boolean, BigInteger, select, text, update, Index
 
-class ProjectDB(declarative_base()):
+logger = logging.getLogger(__name__)
+
+# 목록 페이지 ETag에 반영하는 컬럼
+LIST_VALIDATOR_COLUMNS = ("id", "updated_at", "row_version")
+
+# 프로젝트 단건 조회 캐시 (project_id -> Project)
+project_cache = create_cache("cache.projects", codec=ModelCodec(Project))
+
+class ProjectDB(Base):
     """
     프로젝트 데이터베이스 모델 클래스
     schema.sql의 projects 테이블 구조를 따름
     """
     __tablename__ = 'projects'
-    id = Column(BigInteger, primary_key=True, autoincrement=True, comment='프로젝트 아이디')
+    __table_args__ = (
+        # 목록 키셋 페이지네이션 (is_archived = 0 ORDER BY updated_at, id)
+        Index('ix_projects_is_archived_updated_at', 'is_archived', 'updated_at', 'id'),
+    )
+    id = Column(BigIntegerPK, primary_key=True, autoincrement=True, comment='프로젝트 아이디')
     name = Column(String(100), nullable=False, comment='프로젝트 이름')
     description = Column(String(500), nullable=True, comment='프로젝트 설명')
     is_archived = Column(Boolean, default=False, comment='프로젝트 삭제 여부')
@@ -25,6 +41,7 @@ class ProjectDB(declarative_base()):
     created_at = Column(DateTime, default=datetime.now, nullable=False, comment='프로젝트 생성일')
     updated_by = Column(BigInteger, comment='프로젝트 수정자 아이디')
     updated_at = Column(DateTime, default=datetime.now, onupdate=datetime.now, comment='프로젝트 수정일')
+    row_version = Column(BigInteger, nullable=False, default=1, server_default=text('1'), comment='행 버전 (수정할 때마다 1 증가, 낙관적 동시성 제어)')
 
     # creator = relationship("UserDB", foreign_keys=[created_by])
     # updator = relationship("UserDB", foreign_keys=[updated_by])
@@ -44,7 +61,8 @@ class ProjectDB(declarative_base()):
             created_by=self.created_by,
             created_at=self.created_at,
             updated_by=self.updated_by,
-            updated_at=self.updated_at
+            updated_at=self.updated_at,
+            row_version=self.row_version
         )
     
     def toProjectDB(self, project: Project):
@@ -65,17 +83,71 @@ class ProjectApiImpl(BaseProjectsApi):
     BaseProjectApi를 상속받아 프로젝트 관련 API 엔드포인트를 구현합니다.
     """
 
-    async def projects_get(self) -> List[Project]:
+    async def projects_get(self, limit: int = DEFAULT_PAGE_SIZE, cursor: Optional[str] = None, sort: str = "id") -> Page[Project]:
         """
-        모든 프로젝트 목록을 반환하는 메서드
+        프로젝트 목록을 키셋 페이지 단위로 반환하는 메서드
         
+        Args:
+            limit (int): 페이지 크기
+            cursor (Optional[str]): 이전 페이지의 다음 페이지 커서
+            sort (str): 정렬 키 (id 또는 updated_at)
+
+        Returns:
+            Page[Project]: 프로젝트 객체 페이지 (같은 행으로 계산한 검증자 포함)
+        """
+        def _query(db: Session) -> Page[Project]:
+            # 데이터베이스에서 프로젝트 한 페이지 반환 (삭제되지 않은 프로젝트만)
+            query = db.query(ProjectDB).filter(ProjectDB.is_archived == False)
+            return paginate(query, ProjectDB, limit, cursor, sort, convert=ProjectDB.toProject, validator_columns=LIST_VALIDATOR_COLUMNS)
+
+        return await run_in_session(_query)
+
+    async def projects_validators(self, limit: int = DEFAULT_PAGE_SIZE, cursor: Optional[str] = None, sort: str = "id") -> Validators:
+        """
+        프로젝트 목록 한 페이지의 검증자(ETag, Last-Modified)를 계산하는 메서드 (조건부 요청의 304 검사용)
+        LIST_VALIDATOR_COLUMNS 컬럼만 조회한다. 같은 초 안의 수정도 row_version으로 구분된다.
+
+        Args:
+            limit (int): 페이지 크기
+            cursor (Optional[str]): 이전 페이지의 다음 페이지 커서
+            sort (str): 정렬 키 (id 또는 updated_at)
+
         Returns:
-            List[Project]: 프로젝트 객체 리스트
+            Validators: 페이지 검증자
+        """
+        def _query(db: Session) -> Validators:
+            query = db.query(*[getattr(ProjectDB, name) for name in LIST_VALIDATOR_COLUMNS]).filter(ProjectDB.is_archived == False)
+            return paginate(query, ProjectDB, limit, cursor, sort, validator_columns=LIST_VALIDATOR_COLUMNS).validators
+
+        return await run_in_session(_query)
+
+    async def projects_by_ids_get(self, ids: List[int]) -> List[Project]:
         """
-        with DatabaseSessionManager() as db:
-            # 데이터베이스에서 모든 프로젝트 반환 (삭제되지 않은 프로젝트만)
-            projects = db.query(ProjectDB).filter(ProjectDB.is_archived == False).all() if db else []
-            return [project.toProject() for project in projects]
+        여러 ID의 프로젝트를 IN 절 쿼리로 한 번에 조회하는 메서드
+
+        Args:
+            ids (List[int]): 조회할 프로젝트 ID 목록
+
+        Returns:
+            List[Project]: 요청 순서의 프로젝트 목록 (없거나 삭제된 ID는 제외)
+        """
+        def _query(db: Session) -> List[Project]:
+            rows = select_by_ids(db, ProjectDB, ids, ProjectDB.is_archived == False)
+            return [row.toProject() for row in rows]
+
+        return await run_in_session(_query)
+
+    def projects_stream(self) -> AsyncIterator[Project]:
+        """
+        모든 프로젝트를 id 순으로 한 건씩 내보내는 메서드 (내보내기/대시보드용 스트리밍)
+        서버 사이드 커서(yield_per)로 읽으므로 전체 목록을 메모리에 적재하지 않는다.
+
+        Returns:
+            AsyncIterator[Project]: 프로젝트 객체 스트림
+        """
+        # 삭제되지 않은 프로젝트만 id 순으로 조회
+        statement = select(ProjectDB).where(ProjectDB.is_archived == False).order_by(ProjectDB.id)
+        return stream_in_session(statement, ProjectDB.toProject)
 
     async def projects_post(self, project: Project) -> Project:
         """
@@ -87,7 +159,7 @@ class ProjectApiImpl(BaseProjectsApi):
         Returns:
             Project: 생성된 프로젝트 정보
         """
-        with DatabaseSessionManager() as db:
+        def _create(db: Session) -> Project:
             # 새 프로젝트 객체 생성
             new_project_db = ProjectDB(
                 name=project.name,
@@ -103,13 +175,58 @@ class ProjectApiImpl(BaseProjectsApi):
             db.add(new_project_db)
             db.commit()
             db.refresh(new_project_db)
+            logger.info("Project created", extra={"project_id": new_project_db.id})
             
             # 생성된 프로젝트 정보 반환
             return new_project_db.toProject()
 
+        return await run_in_session(_create)
+
+    async def projects_archive_post(self, project_ids: List[int]) -> List[BatchItemResult]:
+        """
+        여러 프로젝트를 한 번의 UPDATE로 논리적 삭제(is_archived 플래그 설정)하는 메서드
+
+        Args:
+            project_ids (List[int]): 삭제할 프로젝트 ID 목록
+
+        Returns:
+            List[BatchItemResult]: 요청 순서의 항목별 결과 (200 삭제, 404 없거나 이미 삭제됨)
+
+        Raises:
+            HTTPException: 항목 수가 DB_BATCH_SIZE_MAX를 넘는 경우 (400)
+        """
+        if len(project_ids) > DB_BATCH_SIZE_MAX:
+            raise HTTPException(status_code=400, detail=f"Batch size exceeds {DB_BATCH_SIZE_MAX}")
+
+        def _archive(db: Session) -> set:
+            criteria = [ProjectDB.id.in_(set(project_ids)), ProjectDB.is_archived == False]
+            statement = update(ProjectDB).where(*criteria).values(is_archived=True, updated_at=datetime.now(), row_version=ProjectDB.row_version + 1)
+            if db.get_bind().dialect.update_returning:
+                archived = set(db.scalars(statement.returning(ProjectDB.id)))
+            else:
+                # RETURNING 미지원 DB는 같은 트랜잭션에서 대상 행을 잠근 뒤 수정
+                archived = set(db.scalars(select(ProjectDB.id).where(*criteria).with_for_update()))
+                db.execute(statement)
+            db.commit()
+            logger.info("Projects archived", extra={"requested_count": len(project_ids), "archived_count": len(archived)})
+            return archived
+
+        archived = await run_in_session(_archive) if project_ids else set()
+        for project_id in archived:
+            await project_cache.adelete(project_id)
+        results = []
+        for index, project_id in enumerate(project_ids):
+            if project_id in archived:
+                # 같은 ID가 여러 번 요청되면 처음 항목만 삭제된 것으로 처리
+                archived.discard(project_id)
+                results.append(BatchItemResult(index=index, status=200, id=project_id))
+            else:
+                results.append(BatchItemResult(index=index, status=404, id=project_id, error=f"Project with ID {project_id} not found"))
+        return results
+
     async def projects_project_id_get(self, project_id: int) -> Project:
         """
-        특정 ID의 프로젝트 정보를 조회하는 메서드
+        특정 ID의 프로젝트 정보를 조회하는 메서드 (캐시 우선)
         
         Args:
             project_id (int): 조회할 프로젝트 ID
@@ -120,7 +237,11 @@ class ProjectApiImpl(BaseProjectsApi):
         Raises:
             HTTPException: 프로젝트가 존재하지 않을 경우
         """
-        with DatabaseSessionManager() as db:
+        cached = await project_cache.aget(project_id)
+        if cached is not MISSING:
+            return cached
+
+        def _query(db: Session) -> Project:
             # 데이터베이스에서 프로젝트 조회 (삭제되지 않은 프로젝트만)
             project_db = db.query(ProjectDB).filter(
                 ProjectDB.id == project_id,
@@ -134,70 +255,83 @@ class ProjectApiImpl(BaseProjectsApi):
             # 조회된 프로젝트 정보 반환
             return project_db.toProject()
 
-    async def projects_project_id_put(self, project_id: int, project: Project) -> Project:
+        project = await run_in_session(_query)
+        await project_cache.aset(project_id, project)
+        return project
+
+    async def projects_project_id_put(self, project_id: int, project: Project, if_match: Optional[str] = None) -> Project:
         """
-        특정 ID의 프로젝트 정보를 업데이트하는 메서드
+        특정 ID의 프로젝트 정보를 업데이트하는 메서드 (row_version 비교 수정)
         
         Args:
             project_id (int): 업데이트할 프로젝트 ID
             project (Project): 업데이트할 프로젝트 정보
+            if_match (Optional[str]): If-Match 헤더 (조회 시 받은 ETag)
             
         Returns:
             Project: 업데이트된 프로젝트 정보
             
         Raises:
-            HTTPException: 프로젝트가 존재하지 않을 경우
+            HTTPException: 프로젝트가 존재하지 않을 경우 (404), If-Match가 없거나 (428) 그 사이 수정된 경우 (412)
         """
-        with DatabaseSessionManager() as db:
-            # 데이터베이스에서 프로젝트 조회 (삭제되지 않은 프로젝트만)
-            project_db = db.query(ProjectDB).filter(
-                ProjectDB.id == project_id,
-                ProjectDB.is_archived == False
-            ).first()
-            
-            # 프로젝트가 존재하지 않으면 404 에러 발생
+        versions = if_match_versions(if_match)
+
+        # 제공된 필드만 수정 (빈 값이면 기존 값 유지)
+        values: Dict[str, Any] = {"updated_at": datetime.now()}
+        if project.name:
+            values["name"] = project.name
+        if project.description is not None:
+            values["description"] = project.description
+
+        def _update(db: Session) -> Project:
+            # 단일 UPDATE ... WHERE id = ? AND is_archived = 0 AND row_version IN (...) (삭제되지 않은 프로젝트만)
+            active = [ProjectDB.is_archived == False]
+            project_db = compare_and_swap(db, ProjectDB, project_id, values, versions, active)
+
+            # 프로젝트가 없으면 404, 버전이 다르면 412 에러 발생
             if project_db is None:
-                raise HTTPException(status_code=404, detail=f"Project with ID {project_id} not found")
-            
-            # 프로젝트 정보 업데이트
-            project_db.name = project.name if project.name else project_db.name
-            project_db.description = project.description if project.description is not None else project_db.description
-            project_db.updated_by = project.updated_by if project.updated_by else project_db.updated_by
-            project_db.updated_at = datetime.now()
-            
+                raise precondition_failed_or_not_found(row_exists(db, ProjectDB, project_id, active), f"Project with ID {project_id} not found")
+
+            # 커밋 시 만료되므로 응답 모델은 먼저 변환
+            updated = project_db.toProject()
+
             # 변경사항 커밋
             db.commit()
-            db.refresh(project_db)
-            
+            logger.info("Project updated", extra={"project_id": project_id})
+
             # 업데이트된 프로젝트 정보 반환
-            return project_db.toProject()
+            return updated
 
-    async def projects_project_id_delete(self, project_id: int) -> None:
+        updated = await run_in_session(_update)
+        # 커밋 후 캐시 무효화
+        await project_cache.adelete(project_id)
+        return updated
+
+    async def projects_project_id_delete(self, project_id: int, if_match: Optional[str] = None) -> None:
         """
-        특정 ID의 프로젝트를 삭제하는 메서드 (논리적 삭제 - is_archived 플래그 설정)
+        특정 ID의 프로젝트를 삭제하는 메서드 (논리적 삭제 - is_archived 플래그 설정, row_version 비교)
         
         Args:
             project_id (int): 삭제할 프로젝트 ID
+            if_match (Optional[str]): If-Match 헤더 (조회 시 받은 ETag)
             
         Raises:
-            HTTPException: 프로젝트가 존재하지 않을 경우
+            HTTPException: 프로젝트가 존재하지 않을 경우 (404), If-Match가 없거나 (428) 그 사이 수정된 경우 (412)
         """
-        with DatabaseSessionManager() as db:
-            # 데이터베이스에서 프로젝트 조회 (삭제되지 않은 프로젝트만)
-            project_db = db.query(ProjectDB).filter(
-                ProjectDB.id == project_id,
-                ProjectDB.is_archived == False
-            ).first()
-            
-            # 프로젝트가 존재하지 않으면 404 에러 발생
-            if project_db is None:
-                raise HTTPException(status_code=404, detail=f"Project with ID {project_id} not found")
-            
-            # 프로젝트 논리적 삭제 (is_archived 플래그 설정)
-            project_db.is_archived = True
-            project_db.updated_at = datetime.now()
-            
+        versions = if_match_versions(if_match)
+
+        def _delete(db: Session) -> None:
+            # 프로젝트 논리적 삭제 (단일 UPDATE로 is_archived 플래그 설정, 삭제되지 않은 프로젝트만)
+            active = [ProjectDB.is_archived == False]
+            if compare_and_swap(db, ProjectDB, project_id, {"is_archived": True, "updated_at": datetime.now()}, versions, active) is None:
+                raise precondition_failed_or_not_found(row_exists(db, ProjectDB, project_id, active), f"Project with ID {project_id} not found")
+
             # 변경사항 커밋
             db.commit()
+            logger.info("Project archived", extra={"project_id": project_id})
+
+        await run_in_session(_delete)
+        # 커밋 후 캐시 무효화
+        await project_cache.adelete(project_id)
 
 
@@ -1,24 +1,34 @@
 # coding: utf-8
 
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 from api_hub.apis.project_credentials_api_base import BaseProjectCredentialsApi
 from api_hub.models.project_credential import ProjectCredential
 from fastapi import Depends, HTTPException
 from sqlalchemy.orm import Session, relationship
-from api_hub.db.database import DatabaseSessionManager, get_db, Base
+from api_hub.db.database import DatabaseSessionManager, get_db, Base, BigIntegerPK, compare_and_delete, compare_and_swap, row_exists, run_in_session
+from api_hub.conditional import if_match_versions, precondition_failed_or_not_found
+from api_hub.pagination import DEFAULT_PAGE_SIZE, Page, paginate
 
 from datetime import datetime, timedelta
-from sqlalchemy import Column, Integer, String, Text, DateTime, Boolean, BigInteger, ForeignKey
-from sqlalchemy.ext.declarative import declarative_base
+from sqlalchemy import Column, Integer, String, Text, DateTime, Boolean, BigInteger, ForeignKey, Index, text
+import logging
 import secrets
 
-class ProjectCredentialDB(declarative_base()):
+logger = logging.getLogger(__name__)
+
+class ProjectCredentialDB(Base):
     """
     프로젝트 Credential 데이터베이스 모델 클래스
     schema.sql의 project_credentials 테이블 구조를 따름
     """
     __tablename__ = 'project_credentials'
-    id = Column(BigInteger, primary_key=True, autoincrement=True, comment='프로젝트 Credential 아이디')
+    __table_args__ = (
+        # API 키 인증 조회 (api_key = ?)
+        Index('ix_project_credentials_api_key', 'api_key', unique=True),
+        # 프로젝트별 Credential 조회 (project_id = ?)
+        Index('ix_project_credentials_project_id', 'project_id'),
+    )
+    id = Column(BigIntegerPK, primary_key=True, autoincrement=True, comment='프로젝트 Credential 아이디')
     project_id = Column(BigInteger, comment='프로젝트 아이디')
     api_key_name = Column(String(255), nullable=False, comment='API 키 이름')
     api_key = Column(String(255), nullable=False, comment='API 키')
@@ -26,6 +36,7 @@ class ProjectCredentialDB(declarative_base()):
     created_by = Column(BigInteger, comment='API 문서 생성자 아이디')
     created_at = Column(DateTime, default=datetime.now, nullable=False, comment='프로젝트 Credential 생성일')
     expires_at = Column(DateTime, default=lambda: datetime.now() + timedelta(days=90), nullable=False, comment='프로젝트 Credential 만료일 기본 90일')
+    row_version = Column(BigInteger, nullable=False, default=1, server_default=text('1'), comment='행 버전 (수정할 때마다 1 증가, 낙관적 동시성 제어)')
 
     def toProjectCredential(self):
         """
@@ -42,7 +53,8 @@ class ProjectCredentialDB(declarative_base()):
             api_secret=self.api_secret,
             created_by=self.created_by,
             created_at=self.created_at,
-            expires_at=self.expires_at
+            expires_at=self.expires_at,
+            row_version=self.row_version
         )
     
     def toProjectCredentialDB(self, project_credential: ProjectCredential):
@@ -69,19 +81,23 @@ class ProjectCredentialsApi(BaseProjectCredentialsApi):
     BaseProjectCredentialsApi를 상속받아 구현
     """
 
-    async def project_credentials_get(self) -> List[ProjectCredential]:
+    async def project_credentials_get(self, limit: int = DEFAULT_PAGE_SIZE, cursor: Optional[str] = None) -> Page[ProjectCredential]:
         """
-        모든 프로젝트 Credential 목록을 반환하는 메서드
+        프로젝트 Credential 목록을 키셋 페이지 단위(id 순)로 반환하는 메서드
         
+        Args:
+            limit (int): 페이지 크기
+            cursor (Optional[str]): 이전 페이지의 다음 페이지 커서
+
         Returns:
-            List[ProjectCredential]: 프로젝트 Credential 객체 리스트
+            Page[ProjectCredential]: 프로젝트 Credential 객체 페이지
         """
-        with DatabaseSessionManager() as db:
-            # 데이터베이스에서 모든 프로젝트 Credential 조회
-            credentials = db.query(ProjectCredentialDB).all()
-            
-            # 조회된 프로젝트 Credential을 API 모델로 변환하여 반환
-            return [credential.toProjectCredential() for credential in credentials]
+        def _query(db: Session) -> Page[ProjectCredential]:
+            # 데이터베이스에서 프로젝트 Credential 한 페이지 조회 후 API 모델로 변환하여 반환
+            query = db.query(ProjectCredentialDB)
+            return paginate(query, ProjectCredentialDB, limit, cursor, convert=ProjectCredentialDB.toProjectCredential)
+
+        return await run_in_session(_query)
 
     async def project_credentials_post(self, project_credential: ProjectCredential) -> ProjectCredential:
         """
@@ -93,7 +109,7 @@ class ProjectCredentialsApi(BaseProjectCredentialsApi):
         Returns:
             ProjectCredential: 생성된 프로젝트 Credential 정보
         """
-        with DatabaseSessionManager() as db:
+        def _create(db: Session) -> ProjectCredential:
             # API 키와 시크릿 생성
             api_key = secrets.token_urlsafe(32)
             api_secret = secrets.token_urlsafe(64)
@@ -118,33 +134,35 @@ class ProjectCredentialsApi(BaseProjectCredentialsApi):
             db.add(new_credential_db)
             db.commit()
             db.refresh(new_credential_db)
+            # api_key는 기록하지 않는다.
+            logger.info("Project credential created", extra={"project_credential_id": new_credential_db.id, "project_id": new_credential_db.project_id})
             
             # 생성된 프로젝트 Credential 정보 반환
             return new_credential_db.toProjectCredential()
 
-    async def project_credentials_project_credential_id_delete(self, project_credential_id: int) -> None:
+        return await run_in_session(_create)
+
+    async def project_credentials_project_credential_id_delete(self, project_credential_id: int, if_match: Optional[str] = None) -> None:
         """
-        특정 프로젝트 Credential을 삭제하는 메서드
+        특정 프로젝트 Credential을 삭제하는 메서드 (row_version 비교)
         
         Args:
             project_credential_id (int): 삭제할 프로젝트 Credential ID
+            if_match (Optional[str]): If-Match 헤더 (조회 시 받은 ETag)
             
         Raises:
-            HTTPException: 프로젝트 Credential이 존재하지 않을 경우
+            HTTPException: 프로젝트 Credential이 존재하지 않을 경우 (404), If-Match가 없거나 (428) 그 사이 수정된 경우 (412)
         """
-        with DatabaseSessionManager() as db:
-            # 데이터베이스에서 특정 프로젝트 Credential 조회
-            credential = db.query(ProjectCredentialDB).filter(
-                ProjectCredentialDB.id == project_credential_id
-            ).first()
-            
-            # 프로젝트 Credential이 존재하지 않으면 404 에러 발생
-            if credential is None:
-                raise HTTPException(status_code=404, detail=f"Project Credential with ID {project_credential_id} not found")
-            
-            # 데이터베이스에서 프로젝트 Credential 삭제
-            db.delete(credential)
+        versions = if_match_versions(if_match)
+
+        def _delete(db: Session) -> None:
+            # 단일 DELETE ... WHERE id = ? AND row_version IN (...)
+            if not compare_and_delete(db, ProjectCredentialDB, project_credential_id, versions):
+                raise precondition_failed_or_not_found(row_exists(db, ProjectCredentialDB, project_credential_id), f"Project Credential with ID {project_credential_id} not found")
             db.commit()
+            logger.info("Project credential deleted", extra={"project_credential_id": project_credential_id})
+
+        await run_in_session(_delete)
 
     async def project_credentials_project_credential_id_get(self, project_credential_id: int) -> ProjectCredential:
         """
@@ -159,7 +177,7 @@ class ProjectCredentialsApi(BaseProjectCredentialsApi):
         Raises:
             HTTPException: 프로젝트 Credential이 존재하지 않을 경우
         """
-        with DatabaseSessionManager() as db:
+        def _query(db: Session) -> ProjectCredential:
             # 데이터베이스에서 특정 프로젝트 Credential 조회
             credential = db.query(ProjectCredentialDB).filter(
                 ProjectCredentialDB.id == project_credential_id
@@ -172,59 +190,68 @@ class ProjectCredentialsApi(BaseProjectCredentialsApi):
             # 조회된 프로젝트 Credential을 API 모델로 변환하여 반환
             return credential.toProjectCredential()
 
-    async def project_credentials_project_id_get(self, project_id: int) -> List[ProjectCredential]:
+        return await run_in_session(_query)
+
+    async def project_credentials_project_id_get(self, project_id: int, limit: int = DEFAULT_PAGE_SIZE, cursor: Optional[str] = None) -> Page[ProjectCredential]:
         """
-        특정 프로젝트의 모든 Credential 목록을 반환하는 메서드
+        특정 프로젝트의 Credential 목록을 키셋 페이지 단위(id 순)로 반환하는 메서드
         
         Args:
             project_id (int): 조회할 프로젝트 ID
+            limit (int): 페이지 크기
+            cursor (Optional[str]): 이전 페이지의 다음 페이지 커서
             
         Returns:
-            List[ProjectCredential]: 프로젝트 Credential 객체 리스트
+            Page[ProjectCredential]: 프로젝트 Credential 객체 페이지
         """
-        with DatabaseSessionManager() as db:
-            # 데이터베이스에서 특정 프로젝트의 모든 Credential 조회
-            credentials = db.query(ProjectCredentialDB).filter(
-                ProjectCredentialDB.project_id == project_id
-            ).all()
-            
-            # 조회된 프로젝트 Credential을 API 모델로 변환하여 반환
-            return [credential.toProjectCredential() for credential in credentials]
+        def _query(db: Session) -> Page[ProjectCredential]:
+            # 데이터베이스에서 특정 프로젝트의 Credential 한 페이지 조회 (ix_project_credentials_project_id 인덱스 사용)
+            query = db.query(ProjectCredentialDB).filter(ProjectCredentialDB.project_id == project_id)
+            return paginate(query, ProjectCredentialDB, limit, cursor, convert=ProjectCredentialDB.toProjectCredential)
 
-    async def project_credentials_project_credential_id_put(self, project_credential_id: int, project_credential: ProjectCredential) -> ProjectCredential:
+        return await run_in_session(_query)
+
+    async def project_credentials_project_credential_id_put(self, project_credential_id: int, project_credential: ProjectCredential, if_match: Optional[str] = None) -> ProjectCredential:
         """
-        특정 프로젝트 Credential 정보를 업데이트하는 메서드
+        특정 프로젝트 Credential 정보를 업데이트하는 메서드 (row_version 비교 수정)
         
         Args:
             project_credential_id (int): 업데이트할 프로젝트 Credential ID
             project_credential (ProjectCredential): 업데이트할 프로젝트 Credential 정보
+            if_match (Optional[str]): If-Match 헤더 (조회 시 받은 ETag)
             
         Returns:
             ProjectCredential: 업데이트된 프로젝트 Credential 정보
             
         Raises:
-            HTTPException: 프로젝트 Credential이 존재하지 않을 경우
+            HTTPException: 프로젝트 Credential이 존재하지 않을 경우 (404), If-Match가 없거나 (428) 그 사이 수정된 경우 (412)
         """
-        with DatabaseSessionManager() as db:
-            # 데이터베이스에서 특정 프로젝트 Credential 조회
-            credential = db.query(ProjectCredentialDB).filter(
-                ProjectCredentialDB.id == project_credential_id
-            ).first()
+        versions = if_match_versions(if_match)
+
+        # 프로젝트 Credential 정보 업데이트 (만료일만 변경 가능)
+        values: Dict[str, Any] = {}
+        if project_credential.expires_at:
+            values["expires_at"] = project_credential.expires_at
+
+        def _update(db: Session) -> ProjectCredential:
+            # 단일 UPDATE ... WHERE id = ? AND row_version IN (...)
+            credential = compare_and_swap(db, ProjectCredentialDB, project_credential_id, values, versions)
             
-            # 프로젝트 Credential이 존재하지 않으면 404 에러 발생
+            # 프로젝트 Credential이 없으면 404, 버전이 다르면 412 에러 발생
             if credential is None:
-                raise HTTPException(status_code=404, detail=f"Project Credential with ID {project_credential_id} not found")
-            
-            # 프로젝트 Credential 정보 업데이트
-            if project_credential.expires_at:
-                credential.expires_at = project_credential.expires_at
+                raise precondition_failed_or_not_found(row_exists(db, ProjectCredentialDB, project_credential_id), f"Project Credential with ID {project_credential_id} not found")
             
+            # 커밋 시 만료되므로 응답 모델은 먼저 변환
+            updated = credential.toProjectCredential()
+
             # 변경사항 커밋
             db.commit()
-            db.refresh(credential)
+            logger.info("Project credential updated", extra={"project_credential_id": project_credential_id})
             
             # 업데이트된 프로젝트 Credential 정보 반환
-            return credential.toProjectCredential()
+            return updated
+
+        return await run_in_session(_update)
 
 
 
@@ -1,23 +1,34 @@
 # coding: utf-8
 
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 from api_hub.apis.project_members_api_base import BaseProjectMembersApi
 from api_hub.models.project_member import ProjectMember
 from fastapi import Depends, HTTPException
 from sqlalchemy.orm import Session, relationship
-from api_hub.db.database import DatabaseSessionManager, get_db, Base
+from api_hub.db.database import DatabaseSessionManager, get_db, Base, BigIntegerPK, DB_BATCH_SIZE_MAX, insert_many, run_in_session
+from api_hub.models.batch_item_result import BatchItemResult
+from api_hub.pagination import DEFAULT_PAGE_SIZE, Page, paginate
 
 from datetime import datetime
-from sqlalchemy import Column, Integer, String, Text, DateTime, Boolean, BigInteger, ForeignKey
-from sqlalchemy.ext.declarative import declarative_base
+import logging
+from sqlalchemy import Column, Integer, String, Text, DateTime, Boolean, BigInteger, ForeignKey, select, tuple_, Index, UniqueConstraint
+from sqlalchemy.exc import IntegrityError
 
-class ProjectMemberDB(declarative_base()):
+logger = logging.getLogger(__name__)
+
+class ProjectMemberDB(Base):
     """
     프로젝트 멤버 데이터베이스 모델 클래스
     schema.sql의 project_members 테이블 구조를 따름
     """
     __tablename__ = 'project_members'
-    id = Column(BigInteger, primary_key=True, autoincrement=True, comment='프로젝트 멤버 아이디')
+    __table_args__ = (
+        # 멤버 중복 확인/프로젝트별 멤버 조회 (project_id = ? AND user_id = ?)
+        UniqueConstraint('project_id', 'user_id', name='uq_project_members_project_id_user_id'),
+        # 사용자별 프로젝트 조회 (user_id = ?)
+        Index('ix_project_members_user_id', 'user_id'),
+    )
+    id = Column(BigIntegerPK, primary_key=True, autoincrement=True, comment='프로젝트 멤버 아이디')
     project_id = Column(BigInteger, comment='프로젝트 아이디')
     user_id = Column(BigInteger, comment='사용자 아이디')
     member_role = Column(String(20), nullable=False, comment='프로젝트 멤버 역할')
@@ -56,17 +67,23 @@ class ProjectMemberApiImpl(BaseProjectMembersApi):
     BaseProjectMembersApi를 상속받아 프로젝트 멤버 관련 API 엔드포인트를 구현합니다.
     """
 
-    async def project_members_get(self) -> List[ProjectMember]:
+    async def project_members_get(self, limit: int = DEFAULT_PAGE_SIZE, cursor: Optional[str] = None) -> Page[ProjectMember]:
         """
-        모든 프로젝트 멤버 목록을 반환하는 메서드
+        프로젝트 멤버 목록을 키셋 페이지 단위(id 순)로 반환하는 메서드
         
+        Args:
+            limit (int): 페이지 크기
+            cursor (Optional[str]): 이전 페이지의 다음 페이지 커서
+
         Returns:
-            List[ProjectMember]: 프로젝트 멤버 객체 리스트
+            Page[ProjectMember]: 프로젝트 멤버 객체 페이지
         """
-        with DatabaseSessionManager() as db:
-            # 데이터베이스에서 모든 프로젝트 멤버 반환
-            project_members = db.query(ProjectMemberDB).all() if db else []
-            return [member.toProjectMember() for member in project_members]
+        def _query(db: Session) -> Page[ProjectMember]:
+            # 데이터베이스에서 프로젝트 멤버 한 페이지 반환
+            query = db.query(ProjectMemberDB)
+            return paginate(query, ProjectMemberDB, limit, cursor, convert=ProjectMemberDB.toProjectMember)
+
+        return await run_in_session(_query)
 
     async def project_members_post(self, project_member: ProjectMember) -> ProjectMember:
         """
@@ -78,7 +95,7 @@ class ProjectMemberApiImpl(BaseProjectMembersApi):
         Returns:
             ProjectMember: 생성된 프로젝트 멤버 정보
         """
-        with DatabaseSessionManager() as db:
+        def _create(db: Session) -> ProjectMember:
             # 이미 존재하는 프로젝트 멤버인지 확인
             existing_member = db.query(ProjectMemberDB).filter(
                 ProjectMemberDB.project_id == project_member.project_id,
@@ -96,16 +113,82 @@ class ProjectMemberApiImpl(BaseProjectMembersApi):
                 created_at=datetime.now()
             )
 
-            print("--------- new projet member db ::::", new_member_db.project_id, new_member_db.user_id, new_member_db.member_role, new_member_db.created_at)
-            
             # 데이터베이스에 프로젝트 멤버 추가
             db.add(new_member_db)
             db.commit()
             db.refresh(new_member_db)
+            logger.info("Project member created", extra={"project_member_id": new_member_db.id, "project_id": new_member_db.project_id, "user_id": new_member_db.user_id})
             
             # 생성된 프로젝트 멤버 정보 반환
             return new_member_db.toProjectMember()
 
+        return await run_in_session(_create)
+
+    async def project_members_batch_post(self, project_members: List[ProjectMember]) -> List[BatchItemResult]:
+        """
+        여러 프로젝트 멤버를 한 트랜잭션에서 다중 행 INSERT로 추가하는 메서드
+        항목별로 검증하여 실패한 항목은 건너뛰고, 나머지는 한 번의 executemany로 추가한다.
+
+        Args:
+            project_members (List[ProjectMember]): 추가할 프로젝트 멤버 목록
+
+        Returns:
+            List[BatchItemResult]: 요청 순서의 항목별 결과 (201 생성, 400 필수 값 누락, 409 이미 멤버)
+
+        Raises:
+            HTTPException: 항목 수가 DB_BATCH_SIZE_MAX를 넘는 경우 (400), 추가 중 제약 조건 위반 (409)
+        """
+        if len(project_members) > DB_BATCH_SIZE_MAX:
+            raise HTTPException(status_code=400, detail=f"Batch size exceeds {DB_BATCH_SIZE_MAX}")
+
+        results: List[Optional[BatchItemResult]] = [None] * len(project_members)
+        pending: Dict[tuple, int] = {}
+        for index, project_member in enumerate(project_members):
+            missing = [name for name in ("project_id", "user_id", "member_role") if getattr(project_member, name) is None]
+            if missing:
+                results[index] = BatchItemResult(index=index, status=400, error=f"Missing required fields: {', '.join(missing)}")
+            elif (project_member.project_id, project_member.user_id) in pending:
+                results[index] = BatchItemResult(index=index, status=409, error="Duplicate project_id and user_id in batch")
+            else:
+                pending[(project_member.project_id, project_member.user_id)] = index
+
+        def _create(db: Session) -> None:
+            # 이미 멤버인 (project_id, user_id) 한 번에 조회
+            if pending:
+                existing = db.execute(
+                    select(ProjectMemberDB.project_id, ProjectMemberDB.user_id)
+                    .where(tuple_(ProjectMemberDB.project_id, ProjectMemberDB.user_id).in_(list(pending)))
+                ).all()
+                for key in existing:
+                    index = pending.pop(tuple(key), None)
+                    if index is not None:
+                        results[index] = BatchItemResult(index=index, status=409, error="User is already a member of this project")
+
+            now = datetime.now()
+            rows = [
+                {
+                    "project_id": project_members[index].project_id,
+                    "user_id": project_members[index].user_id,
+                    "member_role": project_members[index].member_role,
+                    "created_at": now,
+                }
+                for index in pending.values()
+            ]
+
+            try:
+                ids = insert_many(db, ProjectMemberDB, rows, ("project_id", "user_id"))
+                db.commit()
+            except IntegrityError as e:
+                db.rollback()
+                raise HTTPException(status_code=409, detail=f"Batch insert failed: {e.orig}")
+
+            for index, project_member_id in zip(pending.values(), ids):
+                results[index] = BatchItemResult(index=index, status=201, id=project_member_id)
+            logger.info("Project members created in batch", extra={"requested_count": len(project_members), "created_count": len(ids)})
+
+        await run_in_session(_create)
+        return results
+
     async def project_members_project_member_id_get(self, project_member_id: int) -> ProjectMember:
         """
         특정 프로젝트의 모든 멤버 목록을 반환하는 메서드
@@ -116,7 +199,7 @@ class ProjectMemberApiImpl(BaseProjectMembersApi):
         Returns:
             List[ProjectMember]: 프로젝트 멤버 객체 리스트
         """
-        with DatabaseSessionManager() as db:
+        def _query(db: Session) -> ProjectMember:
             # 데이터베이스에서 특정 프로젝트의 모든 멤버 조회
             project_members = db.query(ProjectMemberDB).filter(
                 ProjectMemberDB.id == project_member_id
@@ -124,6 +207,8 @@ class ProjectMemberApiImpl(BaseProjectMembersApi):
             
             return project_members.toProjectMember()
 
+        return await run_in_session(_query)
+
     async def project_members_project_member_id_put(self, project_member_id: int, project_member: ProjectMember) -> ProjectMember:
         """
         특정 프로젝트의 특정 사용자 멤버 정보를 업데이트하는 메서드
@@ -139,7 +224,7 @@ class ProjectMemberApiImpl(BaseProjectMembersApi):
         Raises:
             HTTPException: 프로젝트 멤버가 존재하지 않을 경우
         """
-        with DatabaseSessionManager() as db:
+        def _update(db: Session) -> ProjectMember:
             # 데이터베이스에서 특정 프로젝트의 특정 사용자 멤버 조회
             member_db = db.query(ProjectMemberDB).filter(
                 ProjectMemberDB.id == project_member_id
@@ -155,10 +240,13 @@ class ProjectMemberApiImpl(BaseProjectMembersApi):
             # 변경사항 커밋
             db.commit()
             db.refresh(member_db)
+            logger.info("Project member updated", extra={"project_member_id": project_member_id})
             
             # 업데이트된 프로젝트 멤버 정보 반환
             return member_db.toProjectMember()
 
+        return await run_in_session(_update)
+
     async def project_members_project_id_user_id_delete(self, project_member_id: int) -> None:
         """
         특정 프로젝트의 특정 사용자 멤버를 삭제하는 메서드
@@ -170,7 +258,7 @@ class ProjectMemberApiImpl(BaseProjectMembersApi):
         Raises:
             HTTPException: 프로젝트 멤버가 존재하지 않을 경우
         """
-        with DatabaseSessionManager() as db:
+        def _delete(db: Session) -> None:
             # 데이터베이스에서 특정 프로젝트의 특정 사용자 멤버 조회
             member_db = db.query(ProjectMemberDB).filter(
                 ProjectMemberDB.id == project_member_id
@@ -183,3 +271,6 @@ class ProjectMemberApiImpl(BaseProjectMembersApi):
             # 프로젝트 멤버 삭제
             db.delete(member_db)
             db.commit()
+            logger.info("Project member deleted", extra={"project_member_id": project_member_id})
+
+        await run_in_session(_delete)
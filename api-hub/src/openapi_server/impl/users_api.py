@@ -1,21 +1,25 @@
 # coding: utf-8
 
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 from api_hub.apis.users_api_base import BaseUsersApi
 from api_hub.models.user import User
 from fastapi import Depends, FastAPI, HTTPException
 from sqlalchemy.orm import Session
-from api_hub.db.database import DatabaseSessionManager, get_db
+from api_hub.db.database import DatabaseSessionManager, get_db, Base, compare_and_delete, compare_and_swap, row_exists, run_in_session, select_by_ids
+from api_hub.conditional import if_match_versions, precondition_failed_or_not_found
+from api_hub.pagination import DEFAULT_PAGE_SIZE, Page, paginate
 
 from datetime import datetime
-from sqlalchemy import Column, Integer, String, Text, DateTime
-from sqlalchemy.ext.declarative import declarative_base
+import logging
+from sqlalchemy import BigInteger, Column, Integer, String, Text, DateTime, text
+
+logger = logging.getLogger(__name__)
 
 # 사용자 데이터를 저장할 임시 데이터베이스 (실제 구현에서는 데이터베이스 연결이 필요)
 # users_db: Dict[int, User] = {}
 # next_user_id = 1  # 사용자 ID 자동 증가를 위한 변수
 
-class UsersDB(declarative_base()):
+class UsersDB(Base):
     __tablename__ = 'users'
     id = Column(Integer, primary_key=True)
     email = Column(String(255), nullable=False, unique=True)
@@ -23,9 +27,10 @@ class UsersDB(declarative_base()):
     full_name = Column(String(100), nullable=False)
     created_at = Column(DateTime, default=datetime.now)
     updated_at = Column(DateTime, default=datetime.now, onupdate=datetime.now)  
+    row_version = Column(BigInteger, nullable=False, default=1, server_default=text('1'), comment='행 버전 (수정할 때마다 1 증가, 낙관적 동시성 제어)')
 
     def toUser(self):
-        return User(id=self.id, email=self.email, full_name=self.full_name, password=self.password_hash, created_at=self.created_at, updated_at=self.updated_at)
+        return User(id=self.id, email=self.email, full_name=self.full_name, password=self.password_hash, created_at=self.created_at, updated_at=self.updated_at, row_version=self.row_version)
 
     def toUserDB(self, user: User):
         return UsersDB(id=user.id, email=user.email, password_hash=user.password, full_name=user.full_name, created_at=user.created_at, updated_at=user.updated_at)  
@@ -36,18 +41,38 @@ class UsersApiImpl(BaseUsersApi):
     BaseUsersApi를 상속받아 사용자 관련 API 엔드포인트를 구현합니다.
     """
 
-    async def users_get(self, db: Session = Depends(get_db)) -> List[User]:
+    async def users_get(self, limit: int = DEFAULT_PAGE_SIZE, cursor: Optional[str] = None, sort: str = "id") -> Page[User]:
         """
-        모든 사용자 목록을 반환하는 메서드
+        사용자 목록을 키셋 페이지 단위로 반환하는 메서드
         
+        Args:
+            limit (int): 페이지 크기
+            cursor (Optional[str]): 이전 페이지의 다음 페이지 커서
+            sort (str): 정렬 키 (id 또는 updated_at)
+
+        Returns:
+            Page[User]: 사용자 객체 페이지
+        """
+        def _query(db: Session) -> Page[User]:
+            # 데이터베이스에서 사용자 한 페이지 반환
+            return paginate(db.query(UsersDB), UsersDB, limit, cursor, sort, convert=UsersDB.toUser)
+
+        return await run_in_session(_query)
+
+    async def users_by_ids_get(self, ids: List[int]) -> List[User]:
+        """
+        여러 ID의 사용자를 IN 절 쿼리로 한 번에 조회하는 메서드
+
+        Args:
+            ids (List[int]): 조회할 사용자 ID 목록
+
         Returns:
-            List[User]: 사용자 객체 리스트
+            List[User]: 요청 순서의 사용자 목록 (없는 ID는 제외)
         """
-        with DatabaseSessionManager() as db:
-            # 데이터베이스에서 모든 사용자 반환
-            users = db.query(UsersDB).all() if db else []
-            print('------------- ::::', users)
-            return [user.toUser() for user in users]
+        def _query(db: Session) -> List[User]:
+            return [row.toUser() for row in select_by_ids(db, UsersDB, ids)]
+
+        return await run_in_session(_query)
 
     async def users_post(self, user: User) -> User:
         """
@@ -62,8 +87,8 @@ class UsersApiImpl(BaseUsersApi):
         global next_user_id
         
         # ID가 없으면 자동 할당
-        # DatabaseSessionManager를 사용하여 데이터베이스 세션 생성
-        with DatabaseSessionManager() as db:
+        # run_in_session을 사용하여 데이터베이스 세션에서 실행
+        def _create(db: Session) -> User:
             # 이미 존재하는 이메일인지 확인
             existing_user = db.query(UsersDB).filter(UsersDB.email == user.email).first()
             if existing_user:
@@ -82,10 +107,13 @@ class UsersApiImpl(BaseUsersApi):
             db.add(new_user_db)
             db.commit()
             db.refresh(new_user_db)
+            logger.info("User created", extra={"user_id": new_user_db.id})
             
             # 생성된 사용자 정보 반환
             return new_user_db.toUser()
 
+        return await run_in_session(_create)
+
     async def users_user_id_get(self, user_id: int) -> User:
         """
         특정 ID의 사용자 정보를 조회하는 메서드
@@ -99,8 +127,8 @@ class UsersApiImpl(BaseUsersApi):
         Raises:
             HTTPException: 사용자가 존재하지 않을 경우
         """
-        # DatabaseSessionManager를 사용하여 데이터베이스 세션 생성
-        with DatabaseSessionManager() as db:
+        # run_in_session을 사용하여 데이터베이스 세션에서 실행
+        def _query(db: Session) -> User:
             # 데이터베이스에서 사용자 조회
             user_db = db.query(UsersDB).filter(UsersDB.id == user_id).first()
             
@@ -111,67 +139,77 @@ class UsersApiImpl(BaseUsersApi):
             # 조회된 사용자 정보 반환
             return user_db.toUser()
 
-    async def users_user_id_put(self, user_id: int, user: User) -> User:
+        return await run_in_session(_query)
+
+    async def users_user_id_put(self, user_id: int, user: User, if_match: Optional[str] = None) -> User:
         """
-        특정 ID의 사용자 정보를 업데이트하는 메서드
+        특정 ID의 사용자 정보를 업데이트하는 메서드 (row_version 비교 수정)
         
         Args:
             user_id (int): 업데이트할 사용자 ID
             user (User): 업데이트할 사용자 정보
+            if_match (Optional[str]): If-Match 헤더 (조회 시 받은 ETag)
             
         Returns:
             User: 업데이트된 사용자 정보
             
         Raises:
-            HTTPException: 사용자가 존재하지 않을 경우
+            HTTPException: 사용자가 존재하지 않을 경우 (404), If-Match가 없거나 (428) 그 사이 수정된 경우 (412)
         """
-        # DatabaseSessionManager를 사용하여 데이터베이스 세션 생성
-        with DatabaseSessionManager() as db:
-            # 데이터베이스에서 사용자 조회
-            user_db = db.query(UsersDB).filter(UsersDB.id == user_id).first()
+        versions = if_match_versions(if_match)
+
+        # 제공된 필드만 수정 (빈 값이면 기존 값 유지)
+        values: Dict[str, Any] = {"updated_at": datetime.now()}
+        if user.email:
+            values["email"] = user.email
+        if user.full_name:
+            values["full_name"] = user.full_name
+        # 비밀번호가 제공된 경우 해시하여 저장
+        if user.password:
+            values["password_hash"] = user.password
+
+        # run_in_session을 사용하여 데이터베이스 세션에서 실행
+        def _update(db: Session) -> User:
+            # 단일 UPDATE ... WHERE id = ? AND row_version IN (...)
+            user_db = compare_and_swap(db, UsersDB, user_id, values, versions)
             
-            # 사용자가 존재하지 않으면 404 에러 발생
+            # 사용자가 없으면 404, 버전이 다르면 412 에러 발생
             if user_db is None:
-                raise HTTPException(status_code=404, detail=f"User with ID {user_id} not found")
-            
-            # 사용자 정보 업데이트
-            user_db.email = user.email if user.email else user_db.email
-            user_db.full_name = user.full_name if user.full_name else user_db.full_name
-            
-            # 비밀번호가 제공된 경우 해시하여 저장
-            if user.password:
-                user_db.password_hash = (user.password)
-                
-            user_db.updated_at = datetime.now()
+                raise precondition_failed_or_not_found(row_exists(db, UsersDB, user_id), f"User with ID {user_id} not found")
             
+            # 커밋 시 만료되므로 응답 모델은 먼저 변환
+            updated = user_db.toUser()
+
             # 변경사항 커밋
             db.commit()
-            db.refresh(user_db)
+            logger.info("User updated", extra={"user_id": user_id})
             
             # 업데이트된 사용자 정보 반환
-            return user_db.toUser()
+            return updated
 
-    async def users_user_id_delete(self, user_id: int) -> None:
+        return await run_in_session(_update)
+
+    async def users_user_id_delete(self, user_id: int, if_match: Optional[str] = None) -> None:
         """
-        특정 ID의 사용자를 삭제하는 메서드
+        특정 ID의 사용자를 삭제하는 메서드 (row_version 비교)
         
         Args:
             user_id (int): 삭제할 사용자 ID
+            if_match (Optional[str]): If-Match 헤더 (조회 시 받은 ETag)
             
         Raises:
-            HTTPException: 사용자가 존재하지 않을 경우
+            HTTPException: 사용자가 존재하지 않을 경우 (404), If-Match가 없거나 (428) 그 사이 수정된 경우 (412)
         """
-        # DatabaseSessionManager를 사용하여 데이터베이스 세션 생성
-        with DatabaseSessionManager() as db:
-            # 데이터베이스에서 사용자 조회
-            user_db = db.query(UsersDB).filter(UsersDB.id == user_id).first()
-            
-            # 사용자가 존재하지 않으면 404 에러 발생
-            if user_db is None:
-                raise HTTPException(status_code=404, detail=f"User with ID {user_id} not found")
-            
-            # 사용자 삭제
-            db.delete(user_db)
+        versions = if_match_versions(if_match)
+
+        # run_in_session을 사용하여 데이터베이스 세션에서 실행
+        def _delete(db: Session) -> None:
+            # 단일 DELETE ... WHERE id = ? AND row_version IN (...)
+            if not compare_and_delete(db, UsersDB, user_id, versions):
+                raise precondition_failed_or_not_found(row_exists(db, UsersDB, user_id), f"User with ID {user_id} not found")
             
             # 변경사항 커밋
             db.commit()
+            logger.info("User deleted", extra={"user_id": user_id})
+
+        await run_in_session(_delete)
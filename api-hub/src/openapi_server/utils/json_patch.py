@@ -0,0 +1,312 @@
+"""
+JSON Pointer(RFC 6901) / JSON Patch(RFC 6902) / JSON Merge Patch(RFC 7386) 유틸리티 모듈
+
+스펙 리비전은 이전 리비전 대비 JSON Patch(델타)로 저장되며, 조회 시 스냅샷에 델타를 차례로 적용하여 복원한다.
+PATCH /api_specs/{id}는 캐시한 파싱 문서에 JSON Patch 또는 Merge Patch를 적용한다.
+"""
+
+import copy
+from typing import Any, Dict, List, Tuple
+
+
+class JsonPatchError(ValueError):
+    """JSON Pointer/Patch를 해석하거나 적용할 수 없을 때 발생하는 예외"""
+
+
+def escape_token(token: str) -> str:
+    """
+    JSON Pointer 참조 토큰을 이스케이프하는 함수
+
+    Examples:
+        >>> escape_token("a/b~c")
+        'a~1b~0c'
+    """
+    return token.replace("~", "~0").replace("/", "~1")
+
+
+def unescape_token(token: str) -> str:
+    """JSON Pointer 참조 토큰의 이스케이프를 해제하는 함수"""
+    return token.replace("~1", "/").replace("~0", "~")
+
+
+def parse_pointer(pointer: str) -> List[str]:
+    """
+    JSON Pointer를 참조 토큰 목록으로 변환하는 함수
+
+    Examples:
+        >>> parse_pointer("/paths/~1users/get")
+        ['paths', '/users', 'get']
+        >>> parse_pointer("")
+        []
+    """
+    if pointer == "":
+        return []
+    if not pointer.startswith("/"):
+        raise JsonPatchError(f"Invalid JSON pointer: {pointer!r}")
+    return [unescape_token(token) for token in pointer[1:].split("/")]
+
+
+def _array_index(token: str, length: int, allow_end: bool) -> int:
+    # 배열 인덱스는 선행 0이 없는 10진수만 허용 (RFC 6901)
+    if token == "-" and allow_end:
+        return length
+    if not token.isdigit() or (len(token) > 1 and token[0] == "0"):
+        raise JsonPatchError(f"Invalid array index: {token!r}")
+    index = int(token)
+    if index > length or (index == length and not allow_end):
+        raise JsonPatchError(f"Array index out of range: {token}")
+    return index
+
+
+def _child(container: Any, token: str) -> Any:
+    if isinstance(container, dict):
+        if token not in container:
+            raise JsonPatchError(f"Member not found: {token!r}")
+        return container[token]
+    if isinstance(container, list):
+        return container[_array_index(token, len(container), allow_end=False)]
+    raise JsonPatchError(f"Cannot reference {token!r} in a scalar value")
+
+
+def resolve_pointer(document: Any, pointer: str) -> Any:
+    """
+    JSON Pointer가 가리키는 값을 반환하는 함수
+
+    Args:
+        document (Any): JSON 문서
+        pointer (str): JSON Pointer (예: /paths/~1users/get)
+
+    Returns:
+        Any: 가리키는 값
+
+    Raises:
+        JsonPatchError: 경로가 없거나 잘못된 경우
+    """
+    value = document
+    for token in parse_pointer(pointer):
+        value = _child(value, token)
+    return value
+
+
+def json_equal(a: Any, b: Any) -> bool:
+    """
+    JSON 값 비교 (True와 1처럼 파이썬에서 같다고 보는 다른 JSON 타입을 구분한다.)
+    """
+    if isinstance(a, bool) or isinstance(b, bool):
+        return type(a) is type(b) and a == b
+    if isinstance(a, dict):
+        return isinstance(b, dict) and a.keys() == b.keys() and all(json_equal(a[key], b[key]) for key in a)
+    if isinstance(a, list):
+        return isinstance(b, list) and len(a) == len(b) and all(json_equal(x, y) for x, y in zip(a, b))
+    if isinstance(a, (int, float)) and isinstance(b, (int, float)):
+        return a == b
+    return type(a) is type(b) and a == b
+
+
+def diff(source: Any, target: Any, path: str = "") -> List[Dict[str, Any]]:
+    """
+    source를 target으로 바꾸는 JSON Patch 연산 목록을 만드는 함수
+    객체는 멤버 단위로, 배열은 앞/뒤 공통 요소를 제외한 구간만 비교하여 변경된 부분만 기록한다.
+
+    Args:
+        source (Any): 이전 JSON 문서
+        target (Any): 새 JSON 문서
+        path (str): 비교를 시작할 JSON Pointer (재귀 호출용)
+
+    Returns:
+        List[Dict[str, Any]]: JSON Patch 연산 목록 (같으면 빈 목록)
+
+    Examples:
+        >>> diff({"a": 1, "b": 2}, {"a": 1, "c": 3})
+        [{'op': 'remove', 'path': '/b'}, {'op': 'add', 'path': '/c', 'value': 3}]
+    """
+    if json_equal(source, target):
+        return []
+    if isinstance(source, dict) and isinstance(target, dict):
+        operations: List[Dict[str, Any]] = []
+        for key in source:
+            if key not in target:
+                operations.append({"op": "remove", "path": f"{path}/{escape_token(key)}"})
+        for key, value in target.items():
+            child = f"{path}/{escape_token(key)}"
+            if key not in source:
+                operations.append({"op": "add", "path": child, "value": copy.deepcopy(value)})
+            else:
+                operations.extend(diff(source[key], value, child))
+        return operations
+    if isinstance(source, list) and isinstance(target, list):
+        return _diff_list(source, target, path)
+    return [{"op": "replace", "path": path, "value": copy.deepcopy(target)}]
+
+
+def _diff_list(source: List[Any], target: List[Any], path: str) -> List[Dict[str, Any]]:
+    # 앞/뒤 공통 요소는 건너뛰고 가운데 구간만 비교 (요소 삽입/삭제 시 뒤쪽 전체가 바뀌는 것을 방지)
+    start = 0
+    while start < len(source) and start < len(target) and json_equal(source[start], target[start]):
+        start += 1
+    end = 0
+    while (
+        end < len(source) - start
+        and end < len(target) - start
+        and json_equal(source[len(source) - 1 - end], target[len(target) - 1 - end])
+    ):
+        end += 1
+    old = source[start:len(source) - end]
+    new = target[start:len(target) - end]
+
+    operations: List[Dict[str, Any]] = []
+    for offset in range(min(len(old), len(new))):
+        operations.extend(diff(old[offset], new[offset], f"{path}/{start + offset}"))
+    # 남는 요소는 같은 위치에서 반복 삭제하고, 모자라는 요소는 순서대로 삽입
+    for _ in range(len(old) - len(new)):
+        operations.append({"op": "remove", "path": f"{path}/{start + len(new)}"})
+    for offset in range(len(old), len(new)):
+        operations.append({"op": "add", "path": f"{path}/{start + offset}", "value": copy.deepcopy(new[offset])})
+    return operations
+
+
+def _split(pointer: str) -> Tuple[List[str], str]:
+    tokens = parse_pointer(pointer)
+    if not tokens:
+        raise JsonPatchError("The root cannot be the target of this operation")
+    return tokens[:-1], tokens[-1]
+
+
+def _parent(document: Any, tokens: List[str]) -> Any:
+    parent = document
+    for token in tokens:
+        parent = _child(parent, token)
+    return parent
+
+
+def _add(document: Any, pointer: str, value: Any) -> Any:
+    if pointer == "":
+        return value
+    tokens, last = _split(pointer)
+    parent = _parent(document, tokens)
+    if isinstance(parent, dict):
+        parent[last] = value
+    elif isinstance(parent, list):
+        parent.insert(_array_index(last, len(parent), allow_end=True), value)
+    else:
+        raise JsonPatchError(f"Cannot add to a scalar value at {pointer!r}")
+    return document
+
+
+def _remove(document: Any, pointer: str) -> Any:
+    tokens, last = _split(pointer)
+    parent = _parent(document, tokens)
+    if isinstance(parent, dict):
+        if last not in parent:
+            raise JsonPatchError(f"Member not found: {pointer!r}")
+        return parent.pop(last)
+    if isinstance(parent, list):
+        return parent.pop(_array_index(last, len(parent), allow_end=False))
+    raise JsonPatchError(f"Cannot remove from a scalar value at {pointer!r}")
+
+
+def _own_path(document: Any, tokens: List[str], owned: Dict[int, Any]) -> Any:
+    # tokens 경로의 컨테이너(루트 포함)를 복사본으로 바꿔 수정 가능하게 만든다. (이미 복사한 컨테이너는 그대로 사용)
+    if isinstance(document, (dict, list)) and id(document) not in owned:
+        document = copy.copy(document)
+        owned[id(document)] = document
+    container = document
+    for token in tokens:
+        child = _child(container, token)
+        if isinstance(child, (dict, list)) and id(child) not in owned:
+            child = copy.copy(child)
+            owned[id(child)] = child
+            if isinstance(container, dict):
+                container[token] = child
+            else:
+                container[int(token)] = child
+        container = child
+    return document
+
+
+def apply_patch(document: Any, patch: List[Dict[str, Any]]) -> Any:
+    """
+    JSON Patch(RFC 6902)를 적용한 새 문서를 반환하는 함수 (원본은 변경하지 않음)
+    수정하는 경로의 컨테이너만 복사하고 나머지 하위 트리는 원본과 공유하므로, 비용은 문서 크기가 아니라
+    변경 크기와 경로 깊이에 비례한다. (반환된 문서와 원본은 이후에도 변경하지 않아야 한다.)
+
+    Args:
+        document (Any): JSON 문서
+        patch (List[Dict[str, Any]]): add/remove/replace/move/copy/test 연산 목록
+
+    Returns:
+        Any: 패치가 적용된 문서
+
+    Raises:
+        JsonPatchError: 연산이 잘못되었거나 test 연산이 실패한 경우 (문서는 변경되지 않음)
+    """
+    if not isinstance(patch, list):
+        raise JsonPatchError("A JSON patch must be an array of operations")
+    result = document
+    owned: Dict[int, Any] = {}
+
+    def writable(pointer: str) -> Any:
+        # pointer의 부모까지의 경로를 수정 가능하게 만든 문서
+        return _own_path(result, parse_pointer(pointer)[:-1], owned)
+
+    for operation in patch:
+        if not isinstance(operation, dict) or not isinstance(operation.get("path"), str):
+            raise JsonPatchError(f"Invalid patch operation: {operation!r}")
+        op, path = operation.get("op"), operation["path"]
+        if op in ("add", "replace", "test") and "value" not in operation:
+            raise JsonPatchError(f"Missing value for {op} operation at {path!r}")
+        if op in ("move", "copy") and not isinstance(operation.get("from"), str):
+            raise JsonPatchError(f"Missing from for {op} operation at {path!r}")
+
+        if op == "add":
+            result = _add(writable(path), path, copy.deepcopy(operation["value"]))
+        elif op == "remove":
+            result = writable(path)
+            _remove(result, path)
+        elif op == "replace":
+            if path == "":
+                result = copy.deepcopy(operation["value"])
+            else:
+                resolve_pointer(result, path)
+                result = writable(path)
+                _remove(result, path)
+                result = _add(result, path, copy.deepcopy(operation["value"]))
+        elif op == "move":
+            source = operation["from"]
+            if source == path:
+                continue
+            if path.startswith(source + "/"):
+                raise JsonPatchError(f"Cannot move {source!r} into its own child {path!r}")
+            result = writable(source)
+            value = _remove(result, source)
+            result = _add(writable(path), path, value)
+        elif op == "copy":
+            value = copy.deepcopy(resolve_pointer(result, operation["from"]))
+            result = _add(writable(path), path, value)
+        elif op == "test":
+            if not json_equal(resolve_pointer(result, path), operation["value"]):
+                raise JsonPatchError(f"Test failed at {path!r}")
+        else:
+            raise JsonPatchError(f"Unsupported patch operation: {op!r}")
+    return result
+
+
+def merge_patch(document: Any, patch: Any) -> Any:
+    """
+    JSON Merge Patch(RFC 7386)를 적용한 새 문서를 반환하는 함수 (원본은 변경하지 않음)
+    패치가 객체가 아니면 문서 전체를 바꾸고, 객체이면 멤버별로 재귀 병합한다. (null 값은 멤버 삭제)
+    수정하는 객체만 복사하고 나머지 하위 트리는 원본과 공유한다.
+
+    Examples:
+        >>> merge_patch({"a": 1, "b": {"c": 2}}, {"a": None, "b": {"d": 3}})
+        {'b': {'c': 2, 'd': 3}}
+    """
+    if not isinstance(patch, dict):
+        return copy.deepcopy(patch)
+    result = dict(document) if isinstance(document, dict) else {}
+    for key, value in patch.items():
+        if value is None:
+            result.pop(key, None)
+        else:
+            result[key] = merge_patch(result.get(key), value)
+    return result
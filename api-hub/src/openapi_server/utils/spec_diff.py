@@ -0,0 +1,286 @@
+"""
+OpenAPI 구조 비교(diff) 모듈
+
+두 문서를 위에서부터 하위 트리 해시로 비교하여 해시가 같은 하위 트리는 내려가지 않고 건너뛴다.
+큰 스펙(수 MB)이라도 파이썬 수준의 비교는 실제로 바뀐 경로를 따라서만 일어난다.
+
+비교 결과:
+    - 추가/삭제/변경된 경로(paths), 오퍼레이션(METHOD /path), 스키마(components.schemas 또는 definitions)
+    - 하위 호환성을 깨는 변경(breaking changes) 목록
+    - 값 단위 변경 목록 (JSON Pointer, 최대 max_changes개)
+"""
+
+import hashlib
+import json
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple
+
+import yaml
+
+from openapi_server.utils.json_patch import escape_token
+
+# OpenAPI 경로 항목에서 오퍼레이션을 나타내는 키
+HTTP_METHODS = ("get", "put", "post", "delete", "options", "head", "patch", "trace")
+
+# 이 깊이보다 얕은 노드(루트, paths, components 등)는 자식 해시로 해시를 계산한다.
+# 상위 노드를 통째로 직렬화하지 않으므로 문서 전체 직렬화는 문서당 한 번으로 줄어든다.
+MERKLE_DEPTH = 2
+
+# 해시 계산용 정규화 직렬화 (인코더를 매번 만들지 않도록 재사용)
+_canonical_json = json.JSONEncoder(sort_keys=True, separators=(",", ":"), default=str).encode
+
+
+def load_document(spec_content: Any) -> Any:
+    """
+    spec_content(JSON 또는 YAML 문자열)를 파싱하는 함수
+    객체/배열로 파싱되지 않으면 값을 그대로 반환한다.
+
+    Examples:
+        >>> load_document('openapi: 3.0.0')
+        {'openapi': '3.0.0'}
+    """
+    if not isinstance(spec_content, str):
+        return spec_content
+    try:
+        document = json.loads(spec_content)
+    except ValueError:
+        try:
+            document = yaml.safe_load(spec_content)
+        except yaml.YAMLError:
+            return spec_content
+        # YAML의 정수 키(응답 코드 등)와 날짜 값을 JSON과 같은 형태(문자열)로 맞춘다.
+        document = json.loads(json.dumps(document, default=str))
+    return document if isinstance(document, (dict, list)) else spec_content
+
+
+class HashNode:
+    """
+    하위 트리 해시를 가진 JSON 값 노드
+
+    얕은 노드(깊이 MERKLE_DEPTH 미만의 객체/배열)의 해시는 자식 해시로 계산하고(머클 트리),
+    그보다 깊은 노드는 키를 정렬하여 직렬화한 JSON 전체를 해시한다. (C 구현인 json.dumps를 써서
+    노드마다 파이썬에서 해시하는 것보다 훨씬 빠르다.) 해시와 자식 노드는 처음 사용할 때 계산한다.
+    같은 위치의 노드는 두 문서에서 깊이가 같으므로 항상 같은 방식으로 해시된다.
+
+    Attributes:
+        value (Any): 원래 JSON 값
+        depth (int): 루트로부터의 깊이
+    """
+
+    __slots__ = ("value", "depth", "_digest", "_children")
+
+    def __init__(self, value: Any, depth: int = 0):
+        self.value = value
+        self.depth = depth
+        self._digest: Optional[bytes] = None
+        self._children: Any = None
+
+    @property
+    def digest(self) -> bytes:
+        """하위 트리 전체의 해시 (객체 키 순서와 무관)"""
+        if self._digest is None:
+            if self.depth < MERKLE_DEPTH and isinstance(self.value, dict):
+                children = self.children
+                parts = [b"{"]
+                for key in sorted(children):
+                    parts.extend((_canonical_json(key).encode(), children[key].digest))
+                data = b"".join(parts)
+            elif self.depth < MERKLE_DEPTH and isinstance(self.value, list):
+                data = b"".join([b"["] + [child.digest for child in self.children])
+            else:
+                data = _canonical_json(self.value).encode()
+            self._digest = hashlib.blake2b(data, digest_size=16).digest()
+        return self._digest
+
+    @property
+    def children(self) -> Any:
+        """객체면 키 -> HashNode, 배열이면 HashNode 목록, 스칼라면 None"""
+        if self._children is None:
+            if isinstance(self.value, dict):
+                self._children = {key: HashNode(child, self.depth + 1) for key, child in self.value.items()}
+            elif isinstance(self.value, list):
+                self._children = [HashNode(child, self.depth + 1) for child in self.value]
+        return self._children
+
+    def get(self, key: str) -> Optional["HashNode"]:
+        """객체 노드의 자식을 반환한다. (없거나 객체가 아니면 None)"""
+        if isinstance(self.value, dict):
+            return self.children.get(key)
+        return None
+
+    def keys(self) -> Set[str]:
+        return set(self.value) if isinstance(self.value, dict) else set()
+
+
+def hash_tree(value: Any) -> HashNode:
+    """JSON 값의 루트 HashNode를 만드는 함수"""
+    return HashNode(value)
+
+
+def _same(a: Optional[HashNode], b: Optional[HashNode]) -> bool:
+    if a is None or b is None:
+        return a is b
+    return a.digest == b.digest
+
+
+def iter_changes(a: HashNode, b: HashNode, pointer: str = "") -> Iterator[Tuple[str, str]]:
+    """
+    두 트리의 값 단위 변경을 (JSON Pointer, added|removed|changed)로 내보내는 제너레이터
+    해시가 같은 하위 트리는 건너뛰며, 길이가 다른 배열은 배열 전체를 changed로 보고한다.
+    """
+    if a.digest == b.digest:
+        return
+    if isinstance(a.children, dict) and isinstance(b.children, dict):
+        for key in a.children:
+            if key not in b.children:
+                yield f"{pointer}/{escape_token(key)}", "removed"
+        for key, child in b.children.items():
+            if key not in a.children:
+                yield f"{pointer}/{escape_token(key)}", "added"
+            elif a.children[key].digest != child.digest:
+                yield from iter_changes(a.children[key], child, f"{pointer}/{escape_token(key)}")
+        return
+    if isinstance(a.children, list) and isinstance(b.children, list) and len(a.children) == len(b.children):
+        for index, (x, y) in enumerate(zip(a.children, b.children)):
+            if x.digest != y.digest:
+                yield from iter_changes(x, y, f"{pointer}/{index}")
+        return
+    yield pointer, "changed"
+
+
+def _schemas(root: HashNode) -> HashNode:
+    components = root.get("components")
+    schemas = components.get("schemas") if components is not None else None
+    if schemas is None:
+        schemas = root.get("definitions")  # Swagger 2.0
+    return schemas if schemas is not None else hash_tree({})
+
+
+def _parameters(operation: HashNode, path_item: HashNode) -> Dict[Tuple[Any, Any], Any]:
+    parameters: Dict[Tuple[Any, Any], Any] = {}
+    for owner in (path_item, operation):
+        for parameter in (owner.value.get("parameters") or []) if isinstance(owner.value, dict) else []:
+            if isinstance(parameter, dict):
+                parameters[(parameter.get("name"), parameter.get("in"))] = parameter
+    return parameters
+
+
+def _operation_breaking_changes(
+    label: str, a: HashNode, b: HashNode, a_path: HashNode, b_path: HashNode
+) -> List[str]:
+    breaking: List[str] = []
+    old_parameters = _parameters(a, a_path)
+    for key, parameter in _parameters(b, b_path).items():
+        old = old_parameters.get(key)
+        if parameter.get("required") and not (old and old.get("required")):
+            breaking.append(f"{label}: parameter '{key[0]}' in {key[1]} is now required")
+    for key in old_parameters.keys() - _parameters(b, b_path).keys():
+        if key[1] == "path":
+            breaking.append(f"{label}: path parameter '{key[0]}' removed")
+
+    a_body, b_body = a.get("requestBody"), b.get("requestBody")
+    if b_body is not None and isinstance(b_body.value, dict) and b_body.value.get("required"):
+        if a_body is None or not (isinstance(a_body.value, dict) and a_body.value.get("required")):
+            breaking.append(f"{label}: request body is now required")
+
+    a_responses, b_responses = a.get("responses"), b.get("responses")
+    if a_responses is not None and b_responses is not None and not _same(a_responses, b_responses):
+        for status in sorted(a_responses.keys() - b_responses.keys()):
+            breaking.append(f"{label}: response {status} removed")
+    return breaking
+
+
+def _schema_breaking_changes(name: str, a: HashNode, b: HashNode) -> List[str]:
+    breaking: List[str] = []
+    if not isinstance(a.value, dict) or not isinstance(b.value, dict):
+        return breaking
+    if a.value.get("type") != b.value.get("type"):
+        breaking.append(f"schema {name}: type changed from {a.value.get('type')} to {b.value.get('type')}")
+    a_properties, b_properties = a.get("properties"), b.get("properties")
+    if a_properties is not None and not _same(a_properties, b_properties):
+        for prop in sorted(a_properties.keys() - (b_properties.keys() if b_properties is not None else set())):
+            breaking.append(f"schema {name}: property '{prop}' removed")
+        if b_properties is not None:
+            for prop in sorted(a_properties.keys() & b_properties.keys()):
+                old, new = a_properties.get(prop), b_properties.get(prop)
+                if isinstance(old.value, dict) and isinstance(new.value, dict) and old.value.get("type") != new.value.get("type"):
+                    breaking.append(f"schema {name}: property '{prop}' type changed from {old.value.get('type')} to {new.value.get('type')}")
+    old_required = set(a.value.get("required") or [])
+    for prop in sorted(set(b.value.get("required") or []) - old_required):
+        breaking.append(f"schema {name}: property '{prop}' is now required")
+    return breaking
+
+
+def diff_specs(a: Any, b: Any, max_changes: int = 1000) -> Dict[str, Any]:
+    """
+    두 OpenAPI 문서를 구조적으로 비교하는 함수
+
+    Args:
+        a (Any): 기준 문서 (파싱된 JSON 또는 hash_tree로 만든 HashNode, HashNode는 계산한 해시를 재사용한다.)
+        b (Any): 비교 대상 문서
+        max_changes (int): changes에 담을 최대 변경 수
+
+    Returns:
+        Dict[str, Any]: SpecDiff 모델 필드 (added_paths, removed_paths, changed_paths,
+            added_operations, removed_operations, changed_operations, added_schemas, removed_schemas,
+            changed_schemas, breaking_changes, changes, truncated)
+    """
+    a_root = a if isinstance(a, HashNode) else hash_tree(a)
+    b_root = b if isinstance(b, HashNode) else hash_tree(b)
+    result: Dict[str, Any] = {
+        "identical": a_root.digest == b_root.digest,
+        "added_paths": [], "removed_paths": [], "changed_paths": [],
+        "added_operations": [], "removed_operations": [], "changed_operations": [],
+        "added_schemas": [], "removed_schemas": [], "changed_schemas": [],
+        "breaking_changes": [], "changes": [], "truncated": False,
+    }
+    if result["identical"]:
+        return result
+
+    a_paths = a_root.get("paths") or hash_tree({})
+    b_paths = b_root.get("paths") or hash_tree({})
+    if not _same(a_paths, b_paths):
+        result["added_paths"] = sorted(b_paths.keys() - a_paths.keys())
+        result["removed_paths"] = sorted(a_paths.keys() - b_paths.keys())
+        for path in result["removed_paths"]:
+            result["breaking_changes"].append(f"path {path} removed")
+        for path in sorted(a_paths.keys() & b_paths.keys()):
+            a_item, b_item = a_paths.get(path), b_paths.get(path)
+            if _same(a_item, b_item):
+                continue
+            result["changed_paths"].append(path)
+            a_methods = {m for m in HTTP_METHODS if a_item.get(m) is not None}
+            b_methods = {m for m in HTTP_METHODS if b_item.get(m) is not None}
+            for method in HTTP_METHODS:
+                label = f"{method.upper()} {path}"
+                if method in b_methods and method not in a_methods:
+                    result["added_operations"].append(label)
+                elif method in a_methods and method not in b_methods:
+                    result["removed_operations"].append(label)
+                    result["breaking_changes"].append(f"operation {label} removed")
+                elif method in a_methods and not _same(a_item.get(method), b_item.get(method)):
+                    result["changed_operations"].append(label)
+                    result["breaking_changes"].extend(
+                        _operation_breaking_changes(label, a_item.get(method), b_item.get(method), a_item, b_item)
+                    )
+        for path in result["added_paths"]:
+            result["added_operations"].extend(f"{m.upper()} {path}" for m in HTTP_METHODS if b_paths.get(path).get(m) is not None)
+        for path in result["removed_paths"]:
+            result["removed_operations"].extend(f"{m.upper()} {path}" for m in HTTP_METHODS if a_paths.get(path).get(m) is not None)
+
+    a_schemas, b_schemas = _schemas(a_root), _schemas(b_root)
+    if not _same(a_schemas, b_schemas):
+        result["added_schemas"] = sorted(b_schemas.keys() - a_schemas.keys())
+        result["removed_schemas"] = sorted(a_schemas.keys() - b_schemas.keys())
+        for name in result["removed_schemas"]:
+            result["breaking_changes"].append(f"schema {name} removed")
+        for name in sorted(a_schemas.keys() & b_schemas.keys()):
+            if not _same(a_schemas.get(name), b_schemas.get(name)):
+                result["changed_schemas"].append(name)
+                result["breaking_changes"].extend(_schema_breaking_changes(name, a_schemas.get(name), b_schemas.get(name)))
+
+    for pointer, change in iter_changes(a_root, b_root):
+        if len(result["changes"]) >= max_changes:
+            result["truncated"] = True
+            break
+        result["changes"].append({"pointer": pointer, "change": change})
+    return result
@@ -2,8 +2,9 @@
 유틸리티 모듈 - 다양한 유틸리티 함수 모음
 """
 
+import hashlib
 import json
-from typing import Any, Dict, Union
+from typing import Any, Dict, Tuple, Union
 
 def safe_json_dumps(data: Any) -> str:
     """
@@ -35,6 +36,66 @@ def safe_json_dumps(data: Any) -> str:
         # 변환 실패 시 기본 JSON 객체 반환
         return json.dumps({"error": f"Invalid data format: {str(e)}", "content": str(data)})
 
+# safe_json_dumps가 문자열을 감쌀 때 만드는 JSON 객체의 앞/뒤 부분
+WRAPPED_CONTENT_PREFIX = '{"content": '
+WRAPPED_CONTENT_SUFFIX = '}'
+
+def wrapped_content_literal(json_str: str) -> str:
+    """
+    {"content": ...} 형태로 감싸 저장된 JSON 문자열에서 content 값의 JSON 리터럴을 잘라내는 함수
+    파싱 없이 문자열 슬라이스만 수행하므로, 저장된 JSON을 그대로 응답 본문에 넣을 수 있다.
+
+    Args:
+        json_str (str): safe_json_dumps로 감싸 저장된 JSON 문자열
+
+    Returns:
+        str: content 값의 JSON 리터럴 (따옴표/이스케이프 포함)
+
+    Raises:
+        ValueError: 감싼 형태가 아닌 경우
+
+    Examples:
+        >>> wrapped_content_literal('{"content": "hello"}')
+        '"hello"'
+    """
+    if not (json_str.startswith(WRAPPED_CONTENT_PREFIX) and json_str.endswith(WRAPPED_CONTENT_SUFFIX)):
+        raise ValueError("content is not wrapped")
+    return json_str[len(WRAPPED_CONTENT_PREFIX):-len(WRAPPED_CONTENT_SUFFIX)]
+
+def dump_spec_content(data: Any) -> Tuple[str, bool]:
+    """
+    spec_content를 저장용 JSON 문자열로 변환하고, {"content": ...}로 감쌌는지 여부를 함께 반환하는 함수
+    감싼 여부는 저장 마커로 함께 기록되어 읽을 때 json.loads 없이 content 리터럴을 잘라낼 수 있게 한다.
+
+    Args:
+        data (Any): 변환할 데이터
+
+    Returns:
+        Tuple[str, bool]: (JSON 문자열, content로 감쌌는지 여부)
+
+    Examples:
+        >>> dump_spec_content("hello")
+        ('{"content": "hello"}', True)
+        >>> dump_spec_content({"name": "test"})
+        ('{"name": "test"}', False)
+    """
+    json_str = safe_json_dumps(data)
+    wrapped = not isinstance(data, (dict, list)) and json_str.startswith(WRAPPED_CONTENT_PREFIX)
+    return json_str, wrapped
+
+def content_hash(json_str: str) -> str:
+    """
+    저장된 JSON 문자열의 SHA-256 해시(16진수)를 반환하는 함수
+    내용을 읽지 않고 변경 여부를 판단(ETag)할 수 있도록 저장 시 함께 기록한다.
+
+    Args:
+        json_str (str): 저장할 JSON 문자열
+
+    Returns:
+        str: 64자리 16진수 해시
+    """
+    return hashlib.sha256(json_str.encode("utf-8")).hexdigest()
+
 def parse_json_content(json_str: str) -> str:
     """
     JSON 문자열을 파싱하고 다시 문자열로 반환하는 함수
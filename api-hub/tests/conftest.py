@@ -1,13 +1,27 @@
+import asyncio
+import os
+import tempfile
+
+# 테스트는 로컬 SQLite 파일 데이터베이스를 사용한다. (api_hub import 이전에 설정)
+os.environ.setdefault(
+    "DATABASE_URL",
+    "sqlite:///" + os.path.join(tempfile.mkdtemp(prefix="api_hub_test_"), "api_hub.db"),
+)
+
 import pytest
 from fastapi import FastAPI
 from fastapi.testclient import TestClient
 
+from api_hub.cache import clear_caches
+from api_hub.db import database
+from api_hub.impl_registry import impl_registry
 from api_hub.main import app as application
 
 
 @pytest.fixture
 def app() -> FastAPI:
     application.dependency_overrides = {}
+    impl_registry.clear_overrides()
 
     return application
 
@@ -15,3 +29,23 @@ def app() -> FastAPI:
 @pytest.fixture
 def client(app) -> TestClient:
     return TestClient(app)
+
+
+@pytest.fixture
+def db_tables():
+    """impl 모델 테이블을 생성하고 테스트 이후 삭제하는 fixture"""
+    metadata = database.load_models()
+    metadata.create_all(bind=database.engine)
+    yield
+    metadata.drop_all(bind=database.engine)
+    clear_caches()
+
+
+@pytest.fixture(params=[False, True], ids=["sync", "async"])
+def db_mode(request, monkeypatch):
+    """동기/비동기 세션 모드를 모두 실행하는 fixture"""
+    monkeypatch.setattr(database, "DB_ASYNC_MODE", request.param)
+    yield request.param
+    if request.param:
+        asyncio.run(database.close_async_db())
+        monkeypatch.setattr(database, "AsyncSessionLocal", None)
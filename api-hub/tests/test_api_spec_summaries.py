@@ -0,0 +1,44 @@
+# coding: utf-8
+
+from fastapi.testclient import TestClient
+
+
+API_SPEC = {"project_id": 1, "version": "1.0.0", "title": "Example", "description": "Example spec", "spec_content": "{\"openapi\": \"3.1.0\"}", "access_role": "admin", "created_by": 1}
+
+
+def test_api_specs_without_content(client: TestClient, db_tables):
+    client.post("/api_specs", json=API_SPEC)
+
+    response = client.get("/api_specs", params={"include_content": "false"})
+    assert response.status_code == 200
+    item = response.json()[0]
+    assert "spec_content" not in item
+    assert item["title"] == "Example"
+    assert "updated_at" in item
+
+
+def test_api_specs_fields(client: TestClient, db_tables):
+    client.post("/api_specs", json=API_SPEC)
+
+    response = client.get("/api_specs", params={"fields": "id,title,version"})
+    assert response.status_code == 200
+    assert set(response.json()[0]) == {"id", "title", "version"}
+
+    assert client.get("/api_specs", params={"fields": "spec_content"}).status_code == 400
+
+
+def test_project_api_specs(client: TestClient, db_tables):
+    client.post("/api_specs", json=API_SPEC)
+    client.post("/api_specs", json=dict(API_SPEC, version="1.0.1"))
+    client.post("/api_specs", json=dict(API_SPEC, project_id=2))
+
+    response = client.get("/projects/1/api_specs", params={"limit": 1})
+    assert response.status_code == 200
+    assert [item["version"] for item in response.json()] == ["1.0.0"]
+    assert "spec_content" not in response.json()[0]
+
+    response = client.get("/projects/1/api_specs", params={"limit": 1, "cursor": response.headers["X-Next-Cursor"]})
+    assert [item["version"] for item in response.json()] == ["1.0.1"]
+
+    response = client.get("/projects/1/api_specs", params={"include_content": "true"})
+    assert [item["spec_content"] for item in response.json()] == [API_SPEC["spec_content"]] * 2
@@ -0,0 +1,65 @@
+# coding: utf-8
+
+import pytest
+from fastapi.testclient import TestClient
+
+from api_hub.db import database
+
+
+def _api_spec(version, **kwargs):
+    return dict({"project_id": 1, "version": version, "title": "Example", "spec_content": "{}", "access_role": "admin", "created_by": 1}, **kwargs)
+
+
+@pytest.mark.parametrize("returning", [True, False], ids=["returning", "reselect"])
+def test_api_specs_batch(client: TestClient, db_tables, monkeypatch, returning):
+    monkeypatch.setattr(database.engine.dialect, "insert_executemany_returning_sort_by_parameter_order", returning)
+    client.post("/api_specs", json=_api_spec("0.9.0"))
+
+    response = client.post("/api_specs:batch", json=[
+        _api_spec("1.0.0"),
+        _api_spec("1.0.0"),
+        _api_spec("0.9.0"),
+        _api_spec("2.0.0", title=None),
+        _api_spec("1.1.0", project_id=2),
+    ])
+    assert response.status_code == 200
+    results = response.json()
+    assert [item["status"] for item in results] == [201, 409, 409, 400, 201]
+    assert [item["index"] for item in results] == [0, 1, 2, 3, 4]
+
+    for item, version in ((results[0], "1.0.0"), (results[4], "1.1.0")):
+        assert client.get(f"/api_specs/{item['id']}").json()["version"] == version
+
+
+def test_api_specs_batch_too_large(client: TestClient, db_tables, monkeypatch):
+    from openapi_server.impl import api_specs_api
+
+    monkeypatch.setattr(api_specs_api, "DB_BATCH_SIZE_MAX", 1)
+    assert client.post("/api_specs:batch", json=[_api_spec("1.0.0"), _api_spec("1.0.1")]).status_code == 400
+
+
+def test_project_members_batch(client: TestClient, db_tables):
+    client.post("/project_members", json={"project_id": 1, "user_id": 1, "member_role": "owner"})
+
+    response = client.post("/project_members:batch", json=[
+        {"project_id": 1, "user_id": 1, "member_role": "viewer"},
+        {"project_id": 1, "user_id": 2, "member_role": "viewer"},
+        {"project_id": 1, "user_id": 3},
+        {"project_id": 1, "user_id": 2, "member_role": "editor"},
+    ])
+    assert [item["status"] for item in response.json()] == [409, 201, 400, 409]
+    member_id = response.json()[1]["id"]
+    assert client.get(f"/project_members/{member_id}").json()["user_id"] == 2
+
+
+def test_projects_archive(client: TestClient, db_tables):
+    ids = [client.post("/projects", json={"name": f"Project {n}", "created_by": 1}).json()["id"] for n in range(3)]
+    client.get(f"/projects/{ids[0]}")
+    client.delete(f"/projects/{ids[2]}", headers={"If-Match": "*"})
+
+    response = client.post("/projects:archive", json=[ids[0], ids[1], ids[2], ids[0], 999])
+    assert [item["status"] for item in response.json()] == [200, 200, 404, 404, 404]
+
+    # 캐시된 프로젝트도 무효화된다
+    assert client.get(f"/projects/{ids[0]}").status_code == 404
+    assert client.get("/projects").json() == []
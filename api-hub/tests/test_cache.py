@@ -0,0 +1,189 @@
+# coding: utf-8
+
+import asyncio
+import json
+import pickle
+import threading
+import time
+
+import fakeredis
+import pytest
+from fastapi.testclient import TestClient
+
+from api_hub.cache import MISSING, LRUCache, ModelCodec, RedisCacheBackend
+from api_hub.metrics import registry
+from api_hub.models.project import Project
+from openapi_server.impl import api_specs_api, project_api
+
+
+API_SPEC = {"project_id": 1, "version": "1.0.0", "title": "Example", "spec_content": "{\"openapi\": \"3.1.0\"}", "access_role": "admin", "created_by": 1}
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_lru_eviction():
+    cache = LRUCache("test_cache.lru", max_size=2, ttl=0)
+    cache.set(1, "a")
+    cache.set(2, "b")
+    assert cache.get(1) == "a"
+    cache.set(3, "c")
+
+    # 가장 오래 사용되지 않은 2가 제거된다
+    assert cache.get(2) is MISSING
+    assert cache.get(1) == "a" and cache.get(3) == "c"
+    assert cache.evictions.value == 1
+    assert registry.snapshot()["test_cache.lru.size"] == 2
+
+
+def test_ttl_expiration():
+    clock = FakeClock()
+    cache = LRUCache("test_cache.ttl", max_size=10, ttl=5, clock=clock)
+    cache.set("key", None)
+    assert cache.get("key") is None
+
+    clock.now = 5
+    assert cache.get("key") is MISSING
+    assert cache.expirations.value == 1
+    assert len(cache) == 0
+
+
+def test_disabled_cache():
+    cache = LRUCache("test_cache.disabled", max_size=0)
+    cache.set("key", "value")
+    assert cache.get("key") is MISSING
+
+
+def _no_db(*args, **kwargs):
+    raise AssertionError("database must not be used")
+
+
+def test_api_spec_cache(client: TestClient, db_tables, monkeypatch):
+    api_spec_id = client.post("/api_specs", json=API_SPEC).json()["id"]
+    body = client.get(f"/api_specs/{api_spec_id}").json()
+    hits = api_specs_api.api_spec_cache.hits.value
+
+    # 캐시 적중 시 데이터베이스를 사용하지 않는다
+    monkeypatch.setattr(api_specs_api, "run_in_session", _no_db)
+    assert client.get(f"/api_specs/{api_spec_id}").json() == body
+    assert api_specs_api.api_spec_cache.hits.value > hits
+    monkeypatch.undo()
+
+    # 삭제 시 무효화
+    assert client.delete(f"/api_specs/{api_spec_id}", headers={"If-Match": "*"}).status_code in (200, 204)
+    assert client.get(f"/api_specs/{api_spec_id}").status_code == 404
+
+
+def test_project_cache(client: TestClient, db_tables, monkeypatch):
+    project_id = client.post("/projects", json={"name": "Example", "created_by": 1}).json()["id"]
+    assert client.get(f"/projects/{project_id}").json()["name"] == "Example"
+
+    monkeypatch.setattr(project_api, "run_in_session", _no_db)
+    assert client.get(f"/projects/{project_id}").json()["name"] == "Example"
+    monkeypatch.undo()
+
+    # 삭제 시 무효화
+    client.delete(f"/projects/{project_id}", headers={"If-Match": "*"})
+    assert client.get(f"/projects/{project_id}").status_code == 404
+
+
+def test_create_cache_backend():
+    from api_hub.cache import create_cache
+
+    assert isinstance(create_cache("test_cache.memory", backend="memory"), LRUCache)
+    with pytest.raises(ValueError):
+        create_cache("test_cache.unknown", backend="unknown")
+
+
+def test_redis_backend_invalidation():
+    server = fakeredis.FakeServer()
+    # 운영과 같이 각 워커가 구독 스레드(subscribe=True)로 무효화 메시지를 받는다
+    worker_a = RedisCacheBackend("test_cache.redis", fakeredis.FakeRedis(server=server), ttl=60)
+    worker_b = RedisCacheBackend("test_cache.redis", fakeredis.FakeRedis(server=server), ttl=60)
+    try:
+        assert worker_a._listener is not None and worker_b._listener is not None
+
+        # 공유 저장소를 통해 다른 워커에서도 조회되고 로컬 캐시에 채워진다
+        worker_a.set(1, {"title": "Example"})
+        assert worker_b.get(1) == {"title": "Example"}
+        assert worker_b.local.get("1") == {"title": "Example"}
+
+        # 쓰기 워커의 무효화 발행으로 다른 워커의 로컬 항목도 제거된다
+        received = worker_b.invalidations_received.value
+        worker_a.delete(1)
+        for _ in range(100):
+            if worker_b.local.get("1") is MISSING:
+                break
+            time.sleep(0.02)
+        assert worker_b.local.get("1") is MISSING
+        assert worker_b.get(1) is MISSING
+        assert worker_b.invalidations_received.value > received
+    finally:
+        worker_a.close()
+        worker_b.close()
+
+
+class DictRedis:
+    """RedisCacheBackend가 사용하는 명령만 구현한 메모리 클라이언트 (bytes만 저장)"""
+
+    def __init__(self):
+        self.data = {}
+        self.published = []
+
+    def get(self, key):
+        return self.data.get(key)
+
+    def set(self, key, value, px=None):
+        assert isinstance(value, bytes)
+        self.data[key] = value
+
+    def delete(self, *keys):
+        for key in keys:
+            self.data.pop(key, None)
+
+    def publish(self, channel, message):
+        self.published.append((channel, message))
+
+    def scan_iter(self, match):
+        return [key for key in self.data if key.startswith(match.rstrip("*"))]
+
+
+def test_redis_backend_stores_json(monkeypatch):
+    client = DictRedis()
+    diffs = RedisCacheBackend("test_cache.redis_json", client, ttl=60, subscribe=False)
+    projects = RedisCacheBackend("test_cache.redis_model", client, ttl=60, subscribe=False, codec=ModelCodec(Project))
+    specs = RedisCacheBackend("test_cache.redis_spec", client, ttl=60, subscribe=False, codec=api_specs_api.CachedAPISpecCodec())
+    cached = api_specs_api.CachedAPISpec(body=b'{"id":1,"title":"\xea\xb0\x80"}', validators=api_specs_api.Validators(etag='"v2"', last_modified=None))
+
+    diffs.set((1, 2), {"identical": False, "added_paths": ["/a"]})
+    projects.set(1, Project(id=1, name="Example", row_version=3))
+    specs.set(1, cached)
+    # 공유 저장소에는 JSON만 저장된다 (pickle 역직렬화 없음)
+    for data in client.data.values():
+        json.loads(data)
+    monkeypatch.setattr(pickle, "loads", lambda *args, **kwargs: (_ for _ in ()).throw(AssertionError("pickle")))
+
+    for cache in (diffs, projects, specs):
+        cache.local.clear()
+    assert diffs.get((1, 2)) == {"identical": False, "added_paths": ["/a"]}
+    assert projects.get(1) == Project(id=1, name="Example", row_version=3)
+    assert specs.get(1) == cached
+
+    async def _main():
+        # 이벤트 루프에서는 Redis 호출을 스레드에서 실행한다
+        loop_thread = threading.get_ident()
+        calls = []
+        get = client.get
+        monkeypatch.setattr(client, "get", lambda key: calls.append(threading.get_ident()) or get(key))
+        projects.local.clear()
+        assert (await projects.aget(1)).row_version == 3
+        assert calls and loop_thread not in calls
+        await projects.adelete(1)
+        assert await projects.aget(1) is MISSING
+
+    asyncio.run(_main())
@@ -0,0 +1,133 @@
+# coding: utf-8
+
+from datetime import datetime
+
+from fastapi.testclient import TestClient
+from sqlalchemy import update
+
+from api_hub.cache import clear_caches
+from api_hub.db.database import SessionLocal
+from api_hub.conditional import Validators, http_date, make_etag
+from openapi_server.impl.api_specs_api import APISpecDB, APISpecsApiImpl
+from openapi_server.impl.project_api import ProjectApiImpl, ProjectDB
+
+
+API_SPEC = {"project_id": 1, "version": "1.0.0", "title": "Example", "spec_content": "{\"openapi\": \"3.1.0\"}", "access_role": "admin", "created_by": 1}
+
+
+def test_make_etag():
+    assert make_etag(1, "a") == make_etag(1, "a")
+    assert make_etag(1, "a") != make_etag(1, "b")
+    assert make_etag(1).startswith('"') and make_etag(1).endswith('"')
+    assert Validators(etag=make_etag(1)).for_variant("x").etag != make_etag(1)
+
+
+def test_api_spec_get_not_modified(client: TestClient, db_tables, monkeypatch):
+    api_spec_id = client.post("/api_specs", json=API_SPEC).json()["id"]
+
+    response = client.get(f"/api_specs/{api_spec_id}")
+    assert response.status_code == 200
+    etag = response.headers["ETag"]
+    last_modified = response.headers["Last-Modified"]
+
+    # 304 응답에는 spec_content를 읽지 않는다
+    def _fail(self):
+        raise AssertionError("spec_content must not be loaded")
+
+    monkeypatch.setattr(APISpecDB, "toAPISpecJSON", _fail)
+    response = client.get(f"/api_specs/{api_spec_id}", headers={"If-None-Match": etag})
+    assert response.status_code == 304
+    assert response.headers["ETag"] == etag
+    assert response.content == b""
+    assert client.get(f"/api_specs/{api_spec_id}", headers={"If-None-Match": f'"other", W/{etag}'}).status_code == 304
+    assert client.get(f"/api_specs/{api_spec_id}", headers={"If-Modified-Since": last_modified}).status_code == 304
+    monkeypatch.undo()
+
+    # 수정은 항상 row_version을 올린다. (ETag는 row_version에서 만든다.)
+    with SessionLocal() as db:
+        api_spec = db.get(APISpecDB, api_spec_id)
+        api_spec.updated_at = datetime(2030, 1, 1)
+        api_spec.row_version += 1
+        db.commit()
+    clear_caches()
+    response = client.get(f"/api_specs/{api_spec_id}", headers={"If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.headers["ETag"] != etag
+    assert response.headers["Last-Modified"] == http_date(datetime(2030, 1, 1))
+
+
+def test_list_not_modified(client: TestClient, db_tables):
+    client.post("/api_specs", json=API_SPEC)
+    client.post("/projects", json={"name": "Example", "created_by": 1})
+
+    for url in ("/api_specs", "/api_specs?include_content=false", "/projects/1/api_specs", "/projects"):
+        response = client.get(url)
+        assert response.status_code == 200
+        etag = response.headers["ETag"]
+        assert client.get(url, headers={"If-None-Match": etag}).status_code == 304
+
+    # 표현(쿼리)이 다르면 ETag도 다르다
+    assert client.get("/api_specs").headers["ETag"] != client.get("/api_specs?include_content=false").headers["ETag"]
+
+    etag = client.get("/api_specs").headers["ETag"]
+    client.post("/api_specs", json=dict(API_SPEC, version="1.0.1"))
+    assert client.get("/api_specs", headers={"If-None-Match": etag}).status_code == 200
+
+
+def test_list_etag_changes_within_same_second(client: TestClient, db_tables):
+    api_spec_id = client.post("/api_specs", json=API_SPEC).json()["id"]
+    project_id = client.post("/projects", json={"name": "Example", "created_by": 1}).json()["id"]
+    etags = {url: client.get(url).headers["ETag"] for url in ("/api_specs", "/projects")}
+
+    # updated_at이 같은 초 안에 머물러도 row_version이 바뀌면 목록 ETag가 바뀐다
+    client.put(f"/api_specs/{api_spec_id}", json={"title": "Renamed"}, headers={"If-Match": "*"})
+    client.put(f"/projects/{project_id}", json={"name": "Renamed"}, headers={"If-Match": "*"})
+    with SessionLocal() as db:
+        for model, row_id in ((APISpecDB, api_spec_id), (ProjectDB, project_id)):
+            db.get(model, row_id).updated_at = datetime(2030, 1, 1)
+        db.commit()
+    for url, etag in etags.items():
+        assert client.get(url, headers={"If-None-Match": etag}).status_code == 200
+    etags = {url: client.get(url).headers["ETag"] for url in etags}
+
+    with SessionLocal() as db:
+        for model, row_id in ((APISpecDB, api_spec_id), (ProjectDB, project_id)):
+            # updated_at의 onupdate가 적용되지 않도록 같은 값을 명시한다
+            db.execute(update(model).where(model.id == row_id).values(row_version=model.row_version + 1, updated_at=datetime(2030, 1, 1)))
+        db.commit()
+    for url, etag in etags.items():
+        assert client.get(url, headers={"If-None-Match": etag}).status_code == 200
+
+
+def test_plain_get_takes_validators_from_the_served_rows(client: TestClient, db_tables, monkeypatch):
+    api_spec_id = client.post("/api_specs", json=API_SPEC).json()["id"]
+    client.post("/projects", json={"name": "Example", "created_by": 1})
+    clear_caches()
+
+    # 조건부 헤더가 없으면 검증자를 따로 조회하지 않고 본문을 만든 행(캐시 항목)의 값을 사용한다
+    def _fail(*args, **kwargs):
+        raise AssertionError("validators queried separately")
+
+    monkeypatch.setattr(APISpecsApiImpl, "api_specs_api_spec_id_validators", _fail)
+    monkeypatch.setattr(APISpecsApiImpl, "api_specs_validators", _fail)
+    monkeypatch.setattr(ProjectApiImpl, "projects_validators", _fail)
+    response = client.get(f"/api_specs/{api_spec_id}")
+    assert response.status_code == 200
+    assert response.headers["ETag"] == '"v1"' and "Last-Modified" in response.headers
+    etags = {}
+    for url in ("/api_specs", "/api_specs?include_content=false", "/projects/1/api_specs", "/projects"):
+        response = client.get(url)
+        assert response.status_code == 200 and "Last-Modified" in response.headers
+        etags[url] = response.headers["ETag"]
+    monkeypatch.undo()
+
+    # 같은 행으로 계산하므로 조건부 요청의 검증자와 ETag가 같다
+    assert client.get(f"/api_specs/{api_spec_id}", headers={"If-None-Match": '"v1"'}).status_code == 304
+    for url, etag in etags.items():
+        assert client.get(url, headers={"If-None-Match": etag}).status_code == 304
+
+
+def test_if_modified_since_older(client: TestClient, db_tables):
+    api_spec_id = client.post("/api_specs", json=API_SPEC).json()["id"]
+    since = http_date(datetime(2000, 1, 1))
+    assert client.get(f"/api_specs/{api_spec_id}", headers={"If-Modified-Since": since}).status_code == 200
@@ -0,0 +1,95 @@
+# coding: utf-8
+
+import asyncio
+import threading
+
+from fastapi.testclient import TestClient
+
+from api_hub.db import database, threadpool
+from api_hub.metrics import registry
+from openapi_server.impl.project_api import ProjectDB
+
+
+def test_to_async_url():
+    assert database.to_async_url("mysql+pymysql://u:p@h:3306/db") == "mysql+aiomysql://u:p@h:3306/db"
+    assert database.to_async_url("sqlite:///./api-hub.db") == "sqlite+aiosqlite:///./api-hub.db"
+    assert database.to_async_url("mysql+asyncmy://u:p@h/db") == "mysql+asyncmy://u:p@h/db"
+
+
+def test_run_in_session(db_tables, db_mode):
+    def _count(db):
+        return db.query(ProjectDB).count()
+
+    assert asyncio.run(database.run_in_session(_count)) == 0
+
+
+def test_projects_roundtrip(client: TestClient, db_tables, db_mode):
+    response = client.post("/projects", json={"name": "Example Project", "created_by": 1})
+    assert response.status_code == 200
+    project_id = response.json()["id"]
+
+    response = client.get("/projects/{project_id}".format(project_id=project_id))
+    assert response.status_code == 200
+    assert response.json()["name"] == "Example Project"
+
+    response = client.get("/projects")
+    assert [project["id"] for project in response.json()] == [project_id]
+
+
+def test_run_in_session_offloads_to_threadpool(db_tables, monkeypatch):
+    pool = threadpool.BoundedThreadPool(max_workers=2, name="test_threadpool")
+    monkeypatch.setattr(database, "DB_ASYNC_MODE", False)
+    monkeypatch.setattr(threadpool, "impl_threadpool", pool)
+    caller_thread = threading.get_ident()
+
+    def _thread(db):
+        return threading.get_ident()
+
+    try:
+        assert asyncio.run(database.run_in_session(_thread)) != caller_thread
+    finally:
+        pool.shutdown()
+
+    snapshot = registry.snapshot()
+    assert snapshot["test_threadpool.completed"] == 1
+    assert snapshot["test_threadpool.queue_depth"] == 0
+    assert snapshot["test_threadpool.wait_seconds"]["count"] == 1
+    assert snapshot["test_threadpool.max_workers"] == 2
+
+
+def test_threadpool_cancelled_before_start_releases_queue_depth():
+    pool = threadpool.BoundedThreadPool(max_workers=1, name="test_cancel_threadpool")
+    started, release = threading.Event(), threading.Event()
+
+    def _block():
+        started.set()
+        release.wait(5)
+
+    async def _main():
+        running = asyncio.ensure_future(pool.run(_block))
+        await asyncio.get_running_loop().run_in_executor(None, started.wait, 5)
+        # 작업자가 하나뿐이므로 두 번째 작업은 대기열에 남아 있다가 취소된다
+        queued = asyncio.ensure_future(pool.run(lambda: None))
+        await asyncio.sleep(0)
+        assert registry.snapshot()["test_cancel_threadpool.queue_depth"] == 1
+        queued.cancel()
+        await asyncio.gather(queued, return_exceptions=True)
+        # 취소가 실행기까지 전달되면 작업자가 아직 막혀 있는 동안 대기열 깊이가 줄어든다
+        for _ in range(100):
+            if registry.snapshot()["test_cancel_threadpool.queue_depth"] == 0:
+                break
+            await asyncio.sleep(0.01)
+        release.set()
+        await running
+
+    asyncio.run(_main())
+    pool.shutdown()
+    snapshot = registry.snapshot()
+    assert snapshot["test_cancel_threadpool.queue_depth"] == 0
+    assert snapshot["test_cancel_threadpool.completed"] == 1
+
+
+def test_metrics_endpoint(client: TestClient):
+    response = client.get("/metrics")
+    assert response.status_code == 200
+    assert "db.pool_size" in response.json()
@@ -0,0 +1,46 @@
+# coding: utf-8
+
+from fastapi.testclient import TestClient
+from sqlalchemy import event
+
+from api_hub.db import database
+from api_hub.pagination import parse_ids
+
+
+def _api_spec(version):
+    return {"project_id": 1, "version": version, "title": "Example", "spec_content": "{}", "access_role": "admin", "created_by": 1}
+
+
+def test_parse_ids():
+    assert parse_ids("3, 1,3,,2") == [3, 1, 2]
+
+
+def test_api_specs_by_ids(client: TestClient, db_tables, monkeypatch):
+    ids = [client.post("/api_specs", json=_api_spec(f"1.0.{n}")).json()["id"] for n in range(3)]
+    client.delete(f"/api_specs/{ids[1]}", headers={"If-Match": "*"})
+
+    statements = []
+    monkeypatch.setattr(database, "DB_IN_CHUNK_SIZE", 2)
+    listener = lambda conn, cursor, statement, *args: statements.append(statement)
+    event.listen(database.engine, "before_cursor_execute", listener)
+    try:
+        response = client.get("/api_specs", params={"ids": f"{ids[2]},{ids[1]},999,{ids[0]}"})
+    finally:
+        event.remove(database.engine, "before_cursor_execute", listener)
+
+    assert response.status_code == 200
+    assert [item["id"] for item in response.json()] == [ids[2], ids[0]]
+    assert len(statements) == 2
+    assert client.get("/api_specs", params={"ids": "1,a"}).status_code == 400
+
+
+def test_projects_and_users_by_ids(client: TestClient, db_tables):
+    project_ids = [client.post("/projects", json={"name": f"Project {n}", "created_by": 1}).json()["id"] for n in range(2)]
+    assert [item["id"] for item in client.get("/projects", params={"ids": f"{project_ids[1]},{project_ids[0]}"}).json()] == project_ids[::-1]
+
+    with database.SessionLocal() as db:
+        from openapi_server.impl.users_api import UsersDB
+
+        db.add_all([UsersDB(id=n, email=f"user{n}@example.com", password_hash="x", full_name=f"User {n}") for n in (1, 2)])
+        db.commit()
+    assert [item["email"] for item in client.get("/users", params={"ids": "2,1"}).json()] == ["user2@example.com", "user1@example.com"]
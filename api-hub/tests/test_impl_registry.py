@@ -0,0 +1,78 @@
+# coding: utf-8
+
+import asyncio
+
+import pytest
+from fastapi import HTTPException
+from fastapi.testclient import TestClient
+
+from api_hub.apis.projects_api import get_impl
+from api_hub.apis.projects_api_base import BaseProjectsApi
+from api_hub.impl_registry import ImplRegistry, impl_registry
+from api_hub.models.project import Project
+from api_hub.pagination import Page
+
+
+class FakeProjectsApi:
+    """테스트용 프로젝트 구현체 (BaseProjectsApi.subclasses에 등록되지 않도록 상속하지 않음)"""
+
+    def __init__(self):
+        self.started = False
+        self.stopped = False
+
+    async def on_startup(self):
+        self.started = True
+
+    def on_shutdown(self):
+        self.stopped = True
+
+    async def projects_get(self, limit, cursor, sort):
+        return Page(items=[Project(id=7, name="Fake Project")])
+
+    async def projects_validators(self, limit, cursor, sort):
+        return None
+
+
+def test_impl_is_singleton():
+    assert impl_registry.get(BaseProjectsApi) is impl_registry.get(BaseProjectsApi)
+    assert impl_registry.provider(BaseProjectsApi) is get_impl
+
+
+def test_override_impl(client: TestClient):
+    impl_registry.override(BaseProjectsApi, FakeProjectsApi())
+
+    response = client.get("/projects")
+    assert response.status_code == 200
+    assert response.json()[0]["name"] == "Fake Project"
+
+
+def test_dependency_override(app, client: TestClient):
+    app.dependency_overrides[get_impl] = FakeProjectsApi
+
+    response = client.get("/projects")
+    assert response.json()[0]["id"] == 7
+
+
+def test_lifecycle_hooks():
+    class BaseFakeApi:
+        subclasses = (FakeProjectsApi,)
+
+    registry = ImplRegistry()
+    registry.provider(BaseFakeApi)
+
+    asyncio.run(registry.startup())
+    instance = registry.get(BaseFakeApi)
+    assert instance.started
+
+    asyncio.run(registry.shutdown())
+    assert instance.stopped
+    assert registry.get(BaseFakeApi) is not instance
+
+
+def test_not_implemented():
+    class BaseMissingApi:
+        subclasses = ()
+
+    with pytest.raises(HTTPException) as exc_info:
+        ImplRegistry().provider(BaseMissingApi)()
+    assert exc_info.value.status_code == 500
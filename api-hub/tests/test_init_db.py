@@ -0,0 +1,121 @@
+# coding: utf-8
+
+from sqlalchemy import create_engine, event, inspect, text
+
+from sqlalchemy.orm import Session
+
+from api_hub.db import cli, database
+from openapi_server.impl.api_spec_search import search_api_specs
+from openapi_server.impl.api_spec_usages import find_usages
+
+SPEC_CONTENT = '{"openapi": "3.1.0", "paths": {"/users": {"get": {"operationId": "listUsers", "responses": {"200": {"content": {"application/json": {"schema": {"$ref": "#/components/schemas/User"}}}}}}}}, "components": {"schemas": {"User": {"type": "object"}}}}'
+
+
+def _engine(tmp_path):
+    return create_engine("sqlite:///" + str(tmp_path / "init.db"))
+
+
+def test_init_db_creates_missing_tables_once(tmp_path):
+    engine = _engine(tmp_path)
+    connects = []
+    event.listen(engine, "connect", lambda *args: connects.append(1))
+
+    result = database.init_db(engine)
+    assert {"api_specs", "projects", "project_members", "project_credentials", "users"} <= set(result.created_tables)
+    assert result.elapsed >= 0
+    assert len(connects) == 1
+
+    again = database.init_db(engine)
+    assert again.created_tables == []
+    assert again.created_indexes == []
+
+
+def test_init_db_creates_missing_indexes(tmp_path):
+    engine = _engine(tmp_path)
+    database.init_db(engine)
+    with engine.begin() as connection:
+        connection.execute(text("DROP INDEX ix_project_members_user_id"))
+
+    result = database.init_db(engine)
+    assert result.created_tables == []
+    assert result.created_indexes == ["ix_project_members_user_id"]
+    assert "ix_project_members_user_id" in {index["name"] for index in inspect(engine).get_indexes("project_members")}
+
+
+def test_init_db_adds_missing_columns(tmp_path):
+    engine = _engine(tmp_path)
+    database.init_db(engine)
+    # row_version, spec_content_hash 등이 추가되기 전에 만든 데이터베이스
+    with engine.begin() as connection:
+        connection.execute(text("INSERT INTO projects (id, name, is_archived, created_at) VALUES (1, 'Old', 0, CURRENT_TIMESTAMP)"))
+        connection.execute(text("ALTER TABLE projects DROP COLUMN row_version"))
+        connection.execute(text("ALTER TABLE api_specs DROP COLUMN spec_content_hash"))
+
+    result = database.init_db(engine)
+    assert result.created_tables == []
+    assert sorted(result.added_columns) == ["api_specs.spec_content_hash", "projects.row_version"]
+    with engine.connect() as connection:
+        assert connection.execute(text("SELECT row_version FROM projects WHERE id = 1")).scalar() == 1
+    assert database.init_db(engine).added_columns == []
+
+
+def test_cli(tmp_path, monkeypatch, capsys):
+    monkeypatch.setattr(database, "engine", _engine(tmp_path))
+    assert cli.main([]) == 0
+    out = capsys.readouterr().out
+    assert "tables created:" in out and "columns added:" in out
+
+
+def _insert_legacy_api_specs(engine):
+    # 색인 테이블이 생기기 전에 저장된 스펙 (spec_content_hash/spec_content_wrapped 없음, 두 번째는 삭제됨)
+    with engine.begin() as connection:
+        for api_spec_id, archived in ((1, 0), (2, 1), (3, 0)):
+            connection.execute(
+                text(
+                    "INSERT INTO api_specs (id, project_id, version, title, spec_content, is_archived, access_role, created_at) "
+                    "VALUES (:id, 1, :version, 'Legacy', :spec_content, :archived, 'admin', CURRENT_TIMESTAMP)"
+                ),
+                {"id": api_spec_id, "version": f"1.0.{api_spec_id}", "spec_content": SPEC_CONTENT, "archived": archived},
+            )
+
+
+def _indexed(engine):
+    with Session(engine) as db:
+        found = [item.id for item in search_api_specs(db, "listUsers", 10).items]
+        used = sorted({item.api_spec_id for item in find_usages(db, "schemas/User", ("ref",), 10).items})
+    return sorted(found), used
+
+
+def test_cli_reindexes_existing_api_specs(tmp_path, monkeypatch, capsys):
+    engine = _engine(tmp_path)
+    monkeypatch.setattr(database, "engine", engine)
+    database.init_db(engine)
+    _insert_legacy_api_specs(engine)
+    assert _indexed(engine) == ([], [])
+
+    assert cli.main(["--reindex", "--batch-size", "1"]) == 0
+    assert "api specs reindexed: 2" in capsys.readouterr().out
+    assert _indexed(engine) == ([1, 3], [1, 3])
+
+    # 다시 실행해도 항목이 중복되지 않는다
+    assert cli.main(["--reindex"]) == 0
+    with engine.connect() as connection:
+        assert connection.execute(text("SELECT COUNT(*) FROM api_spec_usages WHERE name = 'schemas/User' AND kind = 'ref'")).scalar() == 2
+
+
+def test_cli_reindexes_when_index_tables_are_created(tmp_path, monkeypatch, capsys):
+    engine = _engine(tmp_path)
+    monkeypatch.setattr(database, "engine", engine)
+    database.init_db(engine)
+    with engine.begin() as connection:
+        for table in ("api_spec_search_fts", "api_spec_search", "api_spec_usages"):
+            connection.execute(text(f"DROP TABLE {table}"))
+    _insert_legacy_api_specs(engine)
+
+    assert cli.main([]) == 0
+    assert "api specs reindexed: 2" in capsys.readouterr().out
+    assert _indexed(engine) == ([1, 3], [1, 3])
+
+    # 색인 테이블이 이미 있으면 다시 색인하지 않는다
+    assert cli.main([]) == 0
+    assert "reindexed" not in capsys.readouterr().out
@@ -0,0 +1,88 @@
+# coding: utf-8
+
+import pytest
+
+from openapi_server.utils.json_patch import JsonPatchError, apply_patch, diff, merge_patch, resolve_pointer
+
+
+@pytest.mark.parametrize(
+    "source, target",
+    [
+        ({"a": 1, "b": {"c": [1, 2, 3]}}, {"a": 1, "b": {"c": [1, 3]}, "d": None}),
+        ([1, 2, 3, 4], [0, 1, 2, 3, 4]),
+        ([1, 2, 3, 4], [1, 4]),
+        ({"a": True}, {"a": 1}),
+        ({"a/b": {"~": 1}}, {"a/b": {"~": 2}}),
+        ("text", {"openapi": "3.1.0"}),
+    ],
+)
+def test_diff_round_trip(source, target):
+    patch = diff(source, target)
+    assert apply_patch(source, patch) == target
+
+
+def test_diff_keeps_unchanged_array_tail():
+    source = {"tags": [{"name": n} for n in range(100)]}
+    target = {"tags": [{"name": -1}] + source["tags"]}
+    assert diff(source, target) == [{"op": "add", "path": "/tags/0", "value": {"name": -1}}]
+
+
+def test_apply_operations():
+    document = {"a": {"b": [1, 2]}, "c": "x"}
+    patched = apply_patch(document, [
+        {"op": "add", "path": "/a/b/-", "value": 3},
+        {"op": "move", "from": "/c", "path": "/d"},
+        {"op": "copy", "from": "/a/b", "path": "/e"},
+        {"op": "replace", "path": "/a/b/0", "value": 0},
+        {"op": "test", "path": "/d", "value": "x"},
+    ])
+    assert patched == {"a": {"b": [0, 2, 3]}, "d": "x", "e": [1, 2, 3]}
+    # 원본은 변경되지 않는다
+    assert document == {"a": {"b": [1, 2]}, "c": "x"}
+
+
+def test_apply_copies_only_changed_path():
+    document = {"paths": {"/a": {"get": {"summary": "a"}}, "/b": {"get": {"summary": "b"}}}, "components": {"schemas": {}}}
+    patched = apply_patch(document, [
+        {"op": "replace", "path": "/paths/~1a/get/summary", "value": "A"},
+        {"op": "add", "path": "/paths/~1a/get/tags", "value": ["x"]},
+    ])
+    assert patched["paths"]["/a"]["get"] == {"summary": "A", "tags": ["x"]}
+    assert document["paths"]["/a"]["get"] == {"summary": "a"}
+    # 바뀌지 않은 하위 트리는 원본과 공유한다
+    assert patched["paths"]["/b"] is document["paths"]["/b"]
+    assert patched["components"] is document["components"]
+
+
+def test_merge_patch():
+    document = {"title": "Goodbye!", "author": {"givenName": "John", "familyName": "Doe"}, "tags": ["example", "sample"], "content": "text"}
+    patched = merge_patch(document, {"title": "Hello!", "phoneNumber": "+01-123-456-7890", "author": {"familyName": None}, "tags": ["example"]})
+    assert patched == {"title": "Hello!", "author": {"givenName": "John"}, "tags": ["example"], "content": "text", "phoneNumber": "+01-123-456-7890"}
+    assert document["author"] == {"givenName": "John", "familyName": "Doe"}
+    assert merge_patch({"a": 1}, ["b"]) == ["b"]
+    assert merge_patch("text", {"a": {"b": None}}) == {"a": {}}
+
+
+@pytest.mark.parametrize(
+    "patch",
+    [
+        [{"op": "remove", "path": "/missing"}],
+        [{"op": "replace", "path": "/a/5", "value": 1}],
+        [{"op": "test", "path": "/a/0", "value": True}],
+        [{"op": "move", "from": "/a", "path": "/a/0"}],
+        [{"op": "add", "path": "/a/01", "value": 1}],
+        [{"op": "unknown", "path": "/a"}],
+        {"op": "add"},
+    ],
+)
+def test_apply_invalid(patch):
+    with pytest.raises(JsonPatchError):
+        apply_patch({"a": [1]}, patch)
+
+
+def test_resolve_pointer():
+    document = {"paths": {"/users": {"get": {"tags": ["Users"]}}}}
+    assert resolve_pointer(document, "/paths/~1users/get/tags/0") == "Users"
+    assert resolve_pointer(document, "") is document
+    with pytest.raises(JsonPatchError):
+        resolve_pointer(document, "paths")
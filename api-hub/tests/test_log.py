@@ -0,0 +1,56 @@
+# coding: utf-8
+
+import io
+import json
+import logging
+
+from api_hub import log
+
+
+def test_json_formatter_includes_extra_fields():
+    record = logging.LogRecord("api_hub.test", logging.INFO, __file__, 1, "API spec created", (), None)
+    record.api_spec_id = 7
+    entry = json.loads(log.JsonFormatter().format(record))
+    assert entry["message"] == "API spec created"
+    assert entry["level"] == "INFO"
+    assert entry["api_spec_id"] == 7
+
+
+def test_setup_logging_writes_through_queue(monkeypatch):
+    stream = io.StringIO()
+    monkeypatch.setattr(log.sys, "stderr", stream)
+    log.setup_logging(level="INFO", fmt="json")
+    try:
+        logging.getLogger("api_hub.test").info("hello", extra={"project_id": 3})
+    finally:
+        # 큐에 남은 로그를 출력한 뒤 종료
+        log.shutdown_logging()
+    entry = json.loads(stream.getvalue().splitlines()[-1])
+    assert entry["message"] == "hello"
+    assert entry["project_id"] == 3
+
+
+def test_log_payload_off_by_default(caplog):
+    built = []
+    logger = logging.getLogger("api_hub.test")
+    with caplog.at_level(logging.DEBUG):
+        log.log_payload(logger, "payload", lambda: built.append(1) or "x")
+    assert built == []
+    assert caplog.records == []
+
+
+def test_log_payload_sampled_and_truncated(caplog, monkeypatch):
+    monkeypatch.setattr(log, "LOG_PAYLOADS", True)
+    monkeypatch.setattr(log, "LOG_PAYLOAD_MAX_CHARS", 4)
+    logger = logging.getLogger("api_hub.test")
+    with caplog.at_level(logging.DEBUG):
+        monkeypatch.setattr(log, "LOG_PAYLOAD_SAMPLE_RATE", 0.0)
+        log.log_payload(logger, "payload", "abcdefgh")
+        assert caplog.records == []
+
+        monkeypatch.setattr(log, "LOG_PAYLOAD_SAMPLE_RATE", 1.0)
+        log.log_payload(logger, "payload", "abcdefgh", api_spec_id=1)
+    record = caplog.records[-1]
+    assert record.payload == "abcd"
+    assert record.payload_size == 8
+    assert record.payload_truncated is True
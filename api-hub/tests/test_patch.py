@@ -0,0 +1,65 @@
+# coding: utf-8
+
+import json
+
+from fastapi.testclient import TestClient
+
+from openapi_server.impl import api_specs_api
+
+SPEC = {"openapi": "3.0.0", "info": {"title": "Example"}, "paths": {"/users": {"get": {"summary": "List users"}}}}
+JSON_PATCH = {"Content-Type": "application/json-patch+json"}
+MERGE_PATCH = {"Content-Type": "application/merge-patch+json"}
+
+
+def _create(client):
+    return client.post("/api_specs", json={"project_id": 1, "version": "1.0.0", "title": "Example", "spec_content": json.dumps(SPEC), "access_role": "admin", "created_by": 1}).json()["id"]
+
+
+def _patch(client, api_spec_id, body, headers):
+    return client.patch(f"/api_specs/{api_spec_id}", content=json.dumps(body), headers=headers)
+
+
+def test_patch_applies_json_patch_and_merge_patch(client: TestClient, db_tables, monkeypatch):
+    api_spec_id = _create(client)
+    etag = client.get(f"/api_specs/{api_spec_id}").headers["ETag"]
+    # 캐시한 파싱 문서에 패치를 적용하므로 spec_content를 다시 파싱하지 않는다
+    client.get(f"/api_specs/{api_spec_id}/content", params={"pointer": ""})
+    monkeypatch.setattr(api_specs_api, "load_document", lambda content: (_ for _ in ()).throw(AssertionError("parsed")))
+    # 새 ETag는 패치 결과의 row_version으로 만들고 검증자를 다시 조회하지 않는다
+    monkeypatch.setattr(api_specs_api.APISpecsApiImpl, "api_specs_api_spec_id_validators", lambda *args: (_ for _ in ()).throw(AssertionError("queried")))
+
+    response = _patch(client, api_spec_id, [{"op": "add", "path": "/paths/~1orders", "value": {"post": {"summary": "Create order"}}}], {**JSON_PATCH, "If-Match": etag})
+    assert response.status_code == 200, response.text
+    assert json.loads(response.json()["spec_content"])["paths"]["/orders"] == {"post": {"summary": "Create order"}}
+    assert response.headers["ETag"] == '"v2"' != etag
+    etag = response.headers["ETag"]
+
+    response = _patch(client, api_spec_id, {"info": {"title": "Shop"}, "paths": {"/users": None}}, {**MERGE_PATCH, "If-Match": etag})
+    assert response.status_code == 200, response.text
+    monkeypatch.undo()
+
+    content = json.loads(client.get(f"/api_specs/{api_spec_id}").json()["spec_content"])
+    assert content == {"openapi": "3.0.0", "info": {"title": "Shop"}, "paths": {"/orders": {"post": {"summary": "Create order"}}}}
+    # 패치마다 리비전이 추가되고, 검색/사용처 색인도 갱신된다
+    assert [r["revision"] for r in client.get(f"/api_specs/{api_spec_id}/revisions").json()] == [3, 2, 1]
+    assert json.loads(client.get(f"/api_specs/{api_spec_id}/revisions/2").json()["spec_content"])["info"]["title"] == "Example"
+    assert client.get("/api_specs/usages", params={"operation": "POST /orders"}).json()[0]["api_spec_id"] == api_spec_id
+    assert client.get("/api_specs/usages", params={"operation": "GET /users"}).json() == []
+
+
+def test_patch_preconditions_and_errors(client: TestClient, db_tables):
+    api_spec_id = _create(client)
+    etag = client.get(f"/api_specs/{api_spec_id}").headers["ETag"]
+    replace = [{"op": "replace", "path": "/info/title", "value": "New"}]
+
+    assert _patch(client, api_spec_id, replace, JSON_PATCH).status_code == 428
+    assert _patch(client, api_spec_id, replace, {**JSON_PATCH, "If-Match": '"stale"'}).status_code == 412
+    assert _patch(client, api_spec_id, [{"op": "remove", "path": "/missing"}], {**JSON_PATCH, "If-Match": etag}).status_code == 422
+    assert _patch(client, api_spec_id, replace, {"Content-Type": "text/plain", "If-Match": etag}).status_code == 415
+    assert client.patch(f"/api_specs/{api_spec_id}", content="{", headers={**JSON_PATCH, "If-Match": etag}).status_code == 400
+    assert _patch(client, 999, replace, {**JSON_PATCH, "If-Match": etag}).status_code == 404
+
+    # 먼저 반영된 수정이 있으면 같은 ETag로 보낸 두 번째 수정은 거절된다
+    assert _patch(client, api_spec_id, replace, {"Content-Type": "application/json", "If-Match": etag}).status_code == 200
+    assert _patch(client, api_spec_id, {"info": {"title": "Other"}}, {**MERGE_PATCH, "If-Match": etag}).status_code == 412
+    assert json.loads(client.get(f"/api_specs/{api_spec_id}").json()["spec_content"])["info"]["title"] == "New"
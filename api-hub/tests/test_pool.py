@@ -0,0 +1,65 @@
+# coding: utf-8
+
+import asyncio
+
+import pytest
+from sqlalchemy import create_engine, exc
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from api_hub.db.pool import (
+    InstrumentedAsyncAdaptedQueuePool,
+    InstrumentedQueuePool,
+    instrument_pool,
+    warm_up_async_pool,
+    warm_up_pool,
+)
+from api_hub.metrics import registry
+
+
+def test_pool_metrics_and_warm_up(tmp_path):
+    engine = create_engine(
+        "sqlite:///" + str(tmp_path / "pool.db"),
+        poolclass=InstrumentedQueuePool,
+        pool_size=2,
+        max_overflow=0,
+        pool_timeout=0.05,
+    )
+    metrics = instrument_pool(engine, "test.pool")
+
+    assert warm_up_pool(engine) == 2
+    assert metrics.connects.value == 2
+    snapshot = registry.snapshot()
+    assert snapshot["test.pool.checked_in"] == 2
+    assert snapshot["test.pool.checked_out"] == 0
+
+    connections = [engine.connect(), engine.connect()]
+    # 예열된 커넥션을 재사용하므로 새 연결이 없다.
+    assert metrics.connects.value == 2
+    assert registry.snapshot()["test.pool.checked_out"] == 2
+    with pytest.raises(exc.TimeoutError):
+        engine.connect()
+    assert metrics.timeouts.value == 1
+    assert metrics.wait_seconds.count >= 5
+    for connection in connections:
+        connection.close()
+
+    # dispose로 풀이 다시 만들어져도 같은 지표에 기록된다.
+    engine.dispose()
+    assert engine.pool.metrics is metrics
+
+
+def test_async_warm_up(tmp_path):
+    engine = create_async_engine(
+        "sqlite+aiosqlite:///" + str(tmp_path / "pool.db"),
+        poolclass=InstrumentedAsyncAdaptedQueuePool,
+        pool_size=3,
+    )
+    metrics = instrument_pool(engine.sync_engine, "test.async_pool")
+
+    async def run():
+        opened = await warm_up_async_pool(engine)
+        await engine.dispose()
+        return opened
+
+    assert asyncio.run(run()) == 3
+    assert metrics.connects.value == 3
@@ -0,0 +1,68 @@
+# coding: utf-8
+
+import json
+
+from fastapi.testclient import TestClient
+from sqlalchemy import select
+
+from api_hub.db import database
+from openapi_server.impl import api_spec_revisions
+from openapi_server.impl.api_spec_revisions import APISpecRevisionDB
+
+
+def _spec(paths):
+    return json.dumps({"openapi": "3.1.0", "info": {"title": "Example"}, "paths": paths})
+
+
+def test_revisions_store_deltas_and_reconstruct(client: TestClient, db_tables, monkeypatch):
+    monkeypatch.setattr(api_spec_revisions, "SPEC_REVISION_SNAPSHOT_INTERVAL", 3)
+    contents = [_spec({f"/items/{n}": {"get": {"summary": "x" * 200}} for n in range(count)}) for count in range(1, 6)]
+    api_spec_id = client.post("/api_specs", json={"project_id": 1, "version": "1.0.0", "title": "Example", "spec_content": contents[0], "access_role": "admin", "created_by": 1}).json()["id"]
+    for content in contents[1:]:
+        assert client.put(f"/api_specs/{api_spec_id}", json={"spec_content": content}, headers={"If-Match": "*"}).status_code == 200
+    # 내용이 같으면 리비전을 추가하지 않는다
+    client.put(f"/api_specs/{api_spec_id}", json={"spec_content": contents[-1]}, headers={"If-Match": "*"})
+
+    revisions = client.get(f"/api_specs/{api_spec_id}/revisions").json()
+    assert [r["revision"] for r in revisions] == [5, 4, 3, 2, 1]
+    assert [r["is_snapshot"] for r in revisions] == [False, True, False, False, True]
+    assert all(r.get("spec_content") is None for r in revisions)
+    assert [r["revision"] for r in client.get(f"/api_specs/{api_spec_id}/revisions?before=4&limit=2").json()] == [3, 2]
+
+    with database.DatabaseSessionManager() as db:
+        rows = db.scalars(select(APISpecRevisionDB).where(APISpecRevisionDB.api_spec_id == api_spec_id)).all()
+        deltas = [row for row in rows if not row.is_snapshot]
+        assert all(len(row.content) < 400 for row in deltas)
+
+    for number, content in enumerate(contents, start=1):
+        revision = client.get(f"/api_specs/{api_spec_id}/revisions/{number}").json()
+        assert json.loads(revision["spec_content"]) == json.loads(content)
+
+    assert client.get(f"/api_specs/{api_spec_id}/revisions/6").status_code == 404
+    assert client.get("/api_specs/999/revisions").status_code == 404
+
+
+def test_legacy_spec_gets_initial_revision(client: TestClient, db_tables):
+    api_spec_id = client.post("/api_specs", json={"project_id": 1, "version": "1.0.0", "title": "Example", "spec_content": "plain text", "access_role": "admin", "created_by": 1}).json()["id"]
+    # 리비전 기능 이전에 만들어진 스펙처럼 리비전을 지운다
+    with database.DatabaseSessionManager() as db:
+        db.query(APISpecRevisionDB).delete()
+        db.commit()
+
+    client.put(f"/api_specs/{api_spec_id}", json={"spec_content": "changed text", "created_by": 1}, headers={"If-Match": "*"})
+    assert client.get(f"/api_specs/{api_spec_id}/revisions/1").json()["spec_content"] == "plain text"
+    revision = client.get(f"/api_specs/{api_spec_id}/revisions/2").json()
+    assert revision["spec_content"] == "changed text"
+    # 본문의 created_by(스펙 생성자)를 수정 리비전의 작성자로 기록하지 않는다
+    assert revision["created_by"] is None
+
+
+def test_batch_post_creates_revisions(client: TestClient, db_tables):
+    results = client.post("/api_specs:batch", json=[
+        {"project_id": 1, "version": f"1.0.{n}", "title": "Example", "spec_content": _spec({}), "access_role": "admin", "created_by": 1}
+        for n in range(2)
+    ]).json()
+    for result in results:
+        revision = client.get(f"/api_specs/{result['id']}/revisions/1").json()
+        assert revision["is_snapshot"] is True
+        assert json.loads(revision["spec_content"]) == json.loads(_spec({}))
@@ -0,0 +1,80 @@
+# coding: utf-8
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import Column, Integer, MetaData, String, Table, create_engine, insert, select
+
+from api_hub.db import database
+from api_hub.db.routing import PrimaryStickinessMiddleware, ReplicaSet
+
+metadata = MetaData()
+items = Table("items", metadata, Column("id", Integer, primary_key=True), Column("name", String(50)))
+
+
+@pytest.fixture
+def engines(tmp_path):
+    """주 DB와 복제본을 별도의 SQLite 파일로 만들고, 어느 쪽에서 읽었는지 구분되도록 다른 행을 넣는다."""
+    primary = create_engine("sqlite:///" + str(tmp_path / "primary.db"))
+    replica = create_engine("sqlite:///" + str(tmp_path / "replica.db"))
+    for engine, name in ((primary, "primary"), (replica, "replica")):
+        metadata.create_all(engine)
+        with engine.begin() as connection:
+            connection.execute(insert(items).values(id=1, name=name))
+    yield primary, replica
+    primary.dispose()
+    replica.dispose()
+
+
+def _name(db):
+    return db.execute(select(items.c.name).where(items.c.id == 1)).scalar_one()
+
+
+def test_reads_replica_and_writes_primary(engines):
+    primary, replica = engines
+    SessionLocal = database.create_sessionmaker(primary, ReplicaSet([replica]))
+
+    with SessionLocal() as db:
+        assert _name(db) == "replica"
+        db.execute(insert(items).values(id=2, name="new"))
+        # 같은 세션에서 쓰기 이후의 읽기는 주 DB
+        assert _name(db) == "primary"
+        db.commit()
+
+    with primary.connect() as connection:
+        assert connection.execute(select(items.c.name).where(items.c.id == 2)).scalar_one() == "new"
+    with replica.connect() as connection:
+        assert connection.execute(select(items.c.id).where(items.c.id == 2)).first() is None
+
+
+def test_without_replicas_uses_primary(engines):
+    primary, _ = engines
+    with database.create_sessionmaker(primary, ReplicaSet())() as db:
+        assert _name(db) == "primary"
+
+
+def test_sticky_primary_after_write(engines, monkeypatch):
+    primary, replica = engines
+    monkeypatch.setattr(database, "SessionLocal", database.create_sessionmaker(primary, ReplicaSet([replica])))
+
+    app = FastAPI()
+    app.add_middleware(PrimaryStickinessMiddleware, sticky_seconds=60)
+
+    @app.get("/items/1")
+    async def read_item():
+        return {"name": await database.run_in_session(_name)}
+
+    @app.post("/items")
+    async def create_item():
+        def _insert(db):
+            db.execute(insert(items).values(name="new"))
+            db.commit()
+
+        await database.run_in_session(_insert)
+        return {}
+
+    client = TestClient(app)
+    assert client.get("/items/1", headers={"X-Client-Id": "a"}).json() == {"name": "replica"}
+    client.post("/items", headers={"X-Client-Id": "a"})
+    assert client.get("/items/1", headers={"X-Client-Id": "a"}).json() == {"name": "primary"}
+    assert client.get("/items/1", headers={"X-Client-Id": "b"}).json() == {"name": "replica"}
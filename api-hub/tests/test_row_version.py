@@ -0,0 +1,89 @@
+# coding: utf-8
+
+import pytest
+from fastapi.testclient import TestClient
+
+from api_hub.conditional import if_match_versions
+from api_hub.db import database
+from openapi_server.impl.project_api import ProjectDB
+from openapi_server.impl.users_api import UsersDB
+
+API_SPEC = {"project_id": 1, "version": "1.0.0", "title": "Example", "spec_content": "{\"openapi\": \"3.1.0\"}", "access_role": "admin", "created_by": 1}
+
+
+@pytest.fixture(params=[True, False], ids=["returning", "reread"])
+def returning(request, monkeypatch):
+    """UPDATE ... RETURNING 지원 DB와 미지원 DB(MySQL, rowcount 후 다시 읽기)를 모두 실행하는 fixture"""
+    monkeypatch.setattr(database.engine.dialect, "update_returning", request.param)
+    return request.param
+
+
+def test_if_match_versions():
+    assert if_match_versions('"v3"') == [3]
+    # If-Match는 강한 비교이므로 약한 ETag는 일치하지 않는다
+    assert if_match_versions('"v1", W/"v2", "other"') == [1]
+    assert if_match_versions("*") is None
+    assert if_match_versions('"stale"') == []
+
+
+def test_api_spec_compare_and_swap(client: TestClient, db_tables, returning):
+    api_spec_id = client.post("/api_specs", json=API_SPEC).json()["id"]
+    etag = client.get(f"/api_specs/{api_spec_id}").headers["ETag"]
+    assert etag == '"v1"'
+
+    assert client.put(f"/api_specs/{api_spec_id}", json={"title": "No precondition"}).status_code == 428
+    assert client.delete(f"/api_specs/{api_spec_id}").status_code == 428
+
+    # 같은 버전을 보고 수정한 두 요청 중 먼저 반영된 요청만 성공한다
+    response = client.put(f"/api_specs/{api_spec_id}", json={"title": "First"}, headers={"If-Match": etag})
+    assert response.status_code == 200
+    assert response.json()["row_version"] == 2 and response.headers["ETag"] == '"v2"'
+    assert client.put(f"/api_specs/{api_spec_id}", json={"title": "Second"}, headers={"If-Match": etag}).status_code == 412
+    assert client.get(f"/api_specs/{api_spec_id}").json()["title"] == "First"
+
+    assert client.delete(f"/api_specs/{api_spec_id}", headers={"If-Match": etag}).status_code == 412
+    assert client.delete(f"/api_specs/{api_spec_id}", headers={"If-Match": '"v2"'}).status_code == 200
+    assert client.get(f"/api_specs/{api_spec_id}").status_code == 404
+    assert client.delete(f"/api_specs/{api_spec_id}", headers={"If-Match": '"v3"'}).status_code == 404
+
+
+def test_project_compare_and_swap(client: TestClient, db_tables, returning):
+    project_ids = [client.post("/projects", json={"name": f"Project {n}", "created_by": 1}).json()["id"] for n in range(2)]
+    response = client.get(f"/projects/{project_ids[0]}")
+    assert response.headers["ETag"] == '"v1"'
+
+    response = client.put(f"/projects/{project_ids[0]}", json={"name": "Renamed"}, headers={"If-Match": '"v1"'})
+    assert response.status_code == 200 and response.headers["ETag"] == '"v2"'
+    assert client.put(f"/projects/{project_ids[0]}", json={"name": "Lost"}, headers={"If-Match": '"v1"'}).status_code == 412
+    assert client.put("/projects/999", json={"name": "Missing"}, headers={"If-Match": '"v1"'}).status_code == 404
+
+    # 논리적 삭제는 where 조건(is_archived)의 컬럼을 바꾸므로 RETURNING 미지원 DB에서도 기본 키로 다시 읽어야 한다
+    deleted = client.post("/projects", json={"name": "Deleted", "created_by": 1}).json()["id"]
+    assert client.delete(f"/projects/{deleted}", headers={"If-Match": "*"}).status_code == 200
+    assert client.get(f"/projects/{deleted}").status_code == 404
+    assert client.delete(f"/projects/{deleted}", headers={"If-Match": "*"}).status_code == 404
+
+    # 일괄 삭제도 row_version을 올려 이전 ETag로 보낸 수정이 덮어쓰지 못한다
+    assert client.post("/projects:archive", json=project_ids).status_code == 200
+    with database.SessionLocal() as db:
+        assert [db.get(ProjectDB, project_id).row_version for project_id in project_ids] == [3, 2]
+
+
+def test_user_and_credential_compare_and_swap(client: TestClient, db_tables, returning):
+    with database.SessionLocal() as db:
+        db.add(UsersDB(id=1, email="user1@example.com", password_hash="x", full_name="User 1"))
+        db.commit()
+    assert client.get("/users/1").headers["ETag"] == '"v1"'
+    response = client.put("/users/1", json={"full_name": "Renamed"}, headers={"If-Match": '"v1"'})
+    assert response.status_code == 200 and response.json()["full_name"] == "Renamed"
+    assert client.delete("/users/1", headers={"If-Match": '"v1"'}).status_code == 412
+    assert client.delete("/users/1", headers={"If-Match": response.headers["ETag"]}).status_code == 200
+    assert client.get("/users/1").status_code == 404
+
+    credential = client.post("/project_credentials", json={"project_id": 1, "api_key_name": "ci", "created_by": 1}).json()
+    assert credential["row_version"] == 1
+    url = f"/project_credentials/{credential['id']}"
+    response = client.put(url, json={"expires_at": "2030-01-01T00:00:00"}, headers={"If-Match": '"v1"'})
+    assert response.status_code == 200 and response.headers["ETag"] == '"v2"'
+    assert client.put(url, json={"expires_at": "2031-01-01T00:00:00"}, headers={"If-Match": '"v1"'}).status_code == 412
+    assert client.delete(url, headers={"If-Match": '"v2"'}).status_code == 200
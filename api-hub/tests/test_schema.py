@@ -0,0 +1,33 @@
+# coding: utf-8
+
+from sqlalchemy import inspect
+
+from api_hub.db import database
+
+
+def test_shared_metadata():
+    metadata = database.load_models()
+    assert {"api_specs", "projects", "project_members", "project_credentials", "users"} <= set(metadata.tables)
+
+
+def test_indexes(db_tables):
+    inspector = inspect(database.engine)
+
+    def index_columns(table):
+        columns = [index["column_names"] for index in inspector.get_indexes(table)]
+        columns += [constraint["column_names"] for constraint in inspector.get_unique_constraints(table)]
+        return columns
+
+    assert ["project_id", "is_archived"] in index_columns("api_specs")
+    assert ["project_id", "version"] in index_columns("api_specs")
+    assert ["api_key"] in index_columns("project_credentials")
+    assert ["project_id"] in index_columns("project_credentials")
+    assert ["user_id"] in index_columns("project_members")
+
+
+def test_project_spec_lookup_uses_index(db_tables):
+    with database.engine.connect() as connection:
+        plan = connection.exec_driver_sql(
+            "EXPLAIN QUERY PLAN SELECT id FROM api_specs WHERE project_id = 1 AND is_archived = 0"
+        ).all()
+    assert "ix_api_specs_project_id_is_archived" in " ".join(str(row[-1]) for row in plan)
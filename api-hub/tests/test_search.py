@@ -0,0 +1,78 @@
+# coding: utf-8
+
+import json
+
+from fastapi.testclient import TestClient
+
+from openapi_server.impl.api_spec_search import extract_search_terms
+
+
+def _spec(title, paths, schemas=()):
+    return json.dumps({
+        "openapi": "3.0.0",
+        "info": {"title": title, "version": "1.0.0"},
+        "tags": [{"name": "commerce"}],
+        "paths": paths,
+        "components": {"schemas": {name: {"type": "object"} for name in schemas}},
+    })
+
+
+def _create(client, version, title, spec_content, project_id=1):
+    return client.post("/api_specs", json={"project_id": project_id, "version": version, "title": title, "spec_content": spec_content, "access_role": "admin", "created_by": 1}).json()["id"]
+
+
+def test_extract_search_terms():
+    terms = extract_search_terms(_spec("Shop", {"/orders/{order_id}": {"get": {"operationId": "getOrderById", "summary": "Find an order", "tags": ["orders"]}}}, ["OrderLine"]))
+    assert terms.split("\n") == ["Shop", "commerce", "/orders/{order_id}", "getOrderById", "get Order By Id", "Find an order", "orders", "OrderLine", "Order Line"]
+    assert extract_search_terms("plain text") == "plain text"
+
+
+def test_search_ranks_and_paginates(client: TestClient, db_tables):
+    orders = _create(client, "1.0.0", "Orders", _spec("Shop", {"/orders": {"get": {"operationId": "listOrders"}}}, ["Order"]))
+    invoices = _create(client, "1.0.1", "Billing", _spec("Billing", {"/invoices": {"get": {"summary": "List invoices for an order"}}}))
+    _create(client, "1.0.2", "Users", _spec("Accounts", {"/users": {"get": {"operationId": "listUsers"}}}, ["User"]), project_id=2)
+
+    # 제목과 경로/스키마에 일치하는 스펙이 요약에만 일치하는 스펙보다 앞에 온다.
+    results = client.get("/api_specs/search", params={"q": "order"}).json()
+    assert [result["id"] for result in results] == [orders, invoices]
+    assert results[0]["version"] == "1.0.0" and results[0]["score"] >= results[1]["score"]
+
+    # camelCase operationId의 단어, 태그, 여러 단어(AND)로 검색
+    assert [r["title"] for r in client.get("/api_specs/search", params={"q": "users"}).json()] == ["Users"]
+    assert len(client.get("/api_specs/search", params={"q": "commerce"}).json()) == 3
+    assert client.get("/api_specs/search", params={"q": "commerce", "project_id": 2}).json()[0]["title"] == "Users"
+    assert client.get("/api_specs/search", params={"q": "invoices order"}).json()[0]["id"] == invoices
+    # FTS 문법 문자는 검색어로 해석하지 않는다.
+    assert client.get("/api_specs/search", params={"q": '"order* OR ('}).status_code == 200
+    assert client.get("/api_specs/search", params={"q": "***"}).json() == []
+    # 단어 끝의 *는 접두어 검색
+    assert client.get("/api_specs/search", params={"q": "invo"}).json() == []
+    assert [r["id"] for r in client.get("/api_specs/search", params={"q": "invo*"}).json()] == [invoices]
+
+    first = client.get("/api_specs/search", params={"q": "commerce", "limit": 2})
+    assert len(first.json()) == 2
+    second = client.get("/api_specs/search", params={"q": "commerce", "limit": 2, "cursor": first.headers["X-Next-Cursor"]})
+    assert len(second.json()) == 1 and "X-Next-Cursor" not in second.headers
+    assert {r["id"] for r in first.json() + second.json()} == {r["id"] for r in client.get("/api_specs/search", params={"q": "commerce"}).json()}
+    assert client.get("/api_specs/search", params={"q": "commerce", "cursor": "bad"}).status_code == 400
+
+
+def test_search_index_follows_updates_and_archive(client: TestClient, db_tables):
+    api_spec_id = _create(client, "1.0.0", "Orders", _spec("Shop", {"/orders": {}}))
+    client.put(f"/api_specs/{api_spec_id}", json={"spec_content": _spec("Shop", {"/payments": {}})}, headers={"If-Match": "*"})
+    assert client.get("/api_specs/search", params={"q": "orders"}).json()[0]["title"] == "Orders"
+    assert client.get("/api_specs/search", params={"q": "payments"}).json()[0]["id"] == api_spec_id
+
+    client.put(f"/api_specs/{api_spec_id}", json={"title": "Checkout"}, headers={"If-Match": "*"})
+    assert client.get("/api_specs/search", params={"q": "checkout"}).json()[0]["id"] == api_spec_id
+
+    client.delete(f"/api_specs/{api_spec_id}", headers={"If-Match": "*"})
+    assert client.get("/api_specs/search", params={"q": "payments"}).json() == []
+
+
+def test_batch_post_indexes_specs(client: TestClient, db_tables):
+    client.post("/api_specs:batch", json=[
+        {"project_id": 1, "version": f"1.0.{n}", "title": f"Batch {n}", "spec_content": _spec("Shop", {f"/items{n}": {}}), "access_role": "admin", "created_by": 1}
+        for n in range(2)
+    ])
+    assert [r["title"] for r in client.get("/api_specs/search", params={"q": "items1"}).json()] == ["Batch 1"]
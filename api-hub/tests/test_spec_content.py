@@ -0,0 +1,52 @@
+# coding: utf-8
+
+import json
+
+from fastapi.testclient import TestClient
+
+from api_hub.db.database import SessionLocal
+from openapi_server.impl import api_specs_api
+from openapi_server.impl.api_specs_api import APISpecDB
+from openapi_server.utils.util import dump_spec_content, wrapped_content_literal
+
+
+SPEC_CONTENT = json.dumps({"openapi": "3.1.0", "info": {"title": "한글 \"quoted\"\n"}})
+API_SPEC = {"project_id": 1, "version": "1.0.0", "title": "Example", "spec_content": SPEC_CONTENT, "access_role": "admin", "created_by": 1}
+
+
+def test_dump_spec_content():
+    assert dump_spec_content("hello") == ('{"content": "hello"}', True)
+    assert dump_spec_content({"content": "x", "other": 1}) == ('{"content": "x", "other": 1}', False)
+    assert json.loads(wrapped_content_literal(dump_spec_content(SPEC_CONTENT)[0])) == SPEC_CONTENT
+
+
+def test_api_spec_get_does_not_reparse(client: TestClient, db_tables, monkeypatch):
+    api_spec_id = client.post("/api_specs", json=API_SPEC).json()["id"]
+
+    def _fail(*args, **kwargs):
+        raise AssertionError("spec_content must not be parsed")
+
+    monkeypatch.setattr(api_specs_api, "parse_json_content", _fail)
+    monkeypatch.setattr(api_specs_api.json, "loads", _fail)
+    response = client.get(f"/api_specs/{api_spec_id}")
+    monkeypatch.undo()
+
+    assert response.status_code == 200
+    body = response.json()
+    assert body["id"] == api_spec_id
+    assert body["title"] == "Example"
+    assert body["spec_content"] == SPEC_CONTENT
+
+
+def test_api_spec_get_legacy_row(client: TestClient, db_tables):
+    # 마커 없이 저장된 기존 데이터는 파싱 경로로 읽는다
+    with SessionLocal() as db:
+        row = APISpecDB(project_id=1, version="0.1.0", title="Legacy", spec_content='{"content": "legacy"}', access_role="admin")
+        db.add(row)
+        db.commit()
+        api_spec_id = row.id
+
+    response = client.get(f"/api_specs/{api_spec_id}")
+    assert response.status_code == 200
+    assert response.json()["spec_content"] == "legacy"
+    assert client.get("/api_specs/999").status_code == 404
@@ -0,0 +1,118 @@
+# coding: utf-8
+
+import json
+
+from fastapi.testclient import TestClient
+
+from openapi_server.impl import api_specs_api
+from openapi_server.utils import spec_diff
+from openapi_server.utils.spec_diff import diff_specs, load_document
+
+BASE = {
+    "openapi": "3.0.0",
+    "info": {"title": "Example", "version": "1.0.0"},
+    "paths": {
+        "/users": {
+            "get": {"responses": {"200": {"description": "ok"}, "404": {"description": "missing"}}},
+            "post": {"parameters": [{"name": "dry_run", "in": "query"}], "responses": {"201": {"description": "created"}}},
+        },
+        "/legacy": {"get": {"responses": {"200": {"description": "ok"}}}},
+    },
+    "components": {"schemas": {
+        "User": {"type": "object", "required": ["id"], "properties": {"id": {"type": "integer"}, "name": {"type": "string"}}},
+        "Old": {"type": "object"},
+    }},
+}
+
+
+def _changed():
+    target = json.loads(json.dumps(BASE))
+    target["info"]["version"] = "2.0.0"
+    del target["paths"]["/legacy"]
+    target["paths"]["/orders"] = {"get": {"responses": {"200": {"description": "ok"}}}}
+    del target["paths"]["/users"]["get"]["responses"]["404"]
+    target["paths"]["/users"]["post"]["parameters"][0]["required"] = True
+    target["paths"]["/users"]["delete"] = {"responses": {"204": {"description": "deleted"}}}
+    user = target["components"]["schemas"]["User"]
+    user["required"].append("email")
+    user["properties"]["email"] = {"type": "string"}
+    user["properties"]["id"]["type"] = "string"
+    del user["properties"]["name"]
+    del target["components"]["schemas"]["Old"]
+    return target
+
+
+def test_diff_specs_reports_paths_operations_schemas_and_breaking_changes():
+    result = diff_specs(BASE, _changed())
+    assert not result["identical"]
+    assert result["added_paths"] == ["/orders"]
+    assert result["removed_paths"] == ["/legacy"]
+    assert result["changed_paths"] == ["/users"]
+    assert result["added_operations"] == ["DELETE /users", "GET /orders"]
+    assert result["removed_operations"] == ["GET /legacy"]
+    assert result["changed_operations"] == ["GET /users", "POST /users"]
+    assert result["removed_schemas"] == ["Old"]
+    assert result["changed_schemas"] == ["User"]
+    assert set(result["breaking_changes"]) == {
+        "path /legacy removed",
+        "GET /users: response 404 removed",
+        "POST /users: parameter 'dry_run' in query is now required",
+        "schema Old removed",
+        "schema User: property 'name' removed",
+        "schema User: property 'id' type changed from integer to string",
+        "schema User: property 'email' is now required",
+    }
+    assert {"pointer": "/info/version", "change": "changed"} in result["changes"]
+    assert {"pointer": "/paths/~1orders", "change": "added"} in result["changes"]
+
+
+def test_diff_specs_prunes_unchanged_subtrees(monkeypatch):
+    base = {"paths": {f"/items/{n}": {"get": {"summary": "x" * 50}} for n in range(2000)}}
+    target = json.loads(json.dumps(base))
+    target["paths"]["/items/7"]["get"]["summary"] = "changed"
+
+    visited = []
+    iter_changes = spec_diff.iter_changes
+
+    def counting(a, b, pointer=""):
+        visited.append(pointer)
+        return iter_changes(a, b, pointer)
+
+    monkeypatch.setattr(spec_diff, "iter_changes", counting)
+    result = diff_specs(base, target)
+    assert result["changes"] == [{"pointer": "/paths/~1items~17/get/summary", "change": "changed"}]
+    assert result["changed_operations"] == ["GET /items/7"]
+    # 변경이 없는 2000개 경로 중 바뀐 경로의 하위 트리만 내려간다.
+    assert len(visited) < 10
+    assert diff_specs(base, json.loads(json.dumps(base)))["identical"]
+
+
+def test_load_document_accepts_yaml():
+    assert load_document("paths:\n  /a:\n    get:\n      responses:\n        200:\n          description: ok\n") == {
+        "paths": {"/a": {"get": {"responses": {"200": {"description": "ok"}}}}}
+    }
+    assert load_document("plain text") == "plain text"
+
+
+def test_diff_endpoint_caches_by_content_hash(client: TestClient, db_tables, monkeypatch):
+    versions = iter(range(100))
+
+    def create(content):
+        return client.post("/api_specs", json={"project_id": 1, "version": f"1.0.{next(versions)}", "title": "Example", "spec_content": json.dumps(content), "access_role": "admin", "created_by": 1}).json()["id"]
+
+    base_id, other_id = create(BASE), create(_changed())
+    calls = []
+    monkeypatch.setattr(api_specs_api, "diff_specs", lambda a, b: calls.append(1) or diff_specs(a, b))
+
+    response = client.get(f"/api_specs/{base_id}/diff/{other_id}")
+    assert response.status_code == 200
+    body = response.json()
+    assert body["api_spec_id"] == base_id and body["other_api_spec_id"] == other_id
+    assert body["removed_paths"] == ["/legacy"]
+    assert client.get(f"/api_specs/{base_id}/diff/{other_id}").json() == body
+    # 같은 내용의 다른 스펙끼리도 캐시된 결과를 사용한다.
+    assert client.get(f"/api_specs/{create(BASE)}/diff/{other_id}").json()["removed_paths"] == ["/legacy"]
+    assert len(calls) == 1
+
+    assert client.get(f"/api_specs/{base_id}/diff/{base_id}").json()["identical"] is True
+    assert client.get(f"/api_specs/{base_id}/diff/999").status_code == 404
@@ -0,0 +1,57 @@
+# coding: utf-8
+
+import json
+
+from fastapi.testclient import TestClient
+
+from openapi_server.impl import api_specs_api
+
+SPEC = {
+    "openapi": "3.0.0",
+    "paths": {
+        "/users": {"get": {"summary": "List users"}},
+        "/users/{id}": {"get": {"summary": "Get a user"}},
+    },
+    "components": {"schemas": {"User": {"type": "object"}}},
+    "tags": [{"name": "users"}, {"name": "admin"}],
+}
+
+
+def _create(client):
+    return client.post("/api_specs", json={"project_id": 1, "version": "1.0.0", "title": "Example", "spec_content": json.dumps(SPEC), "access_role": "admin", "created_by": 1}).json()["id"]
+
+
+def test_content_returns_parts_by_pointer(client: TestClient, db_tables, monkeypatch):
+    api_spec_id = _create(client)
+    parses = []
+    load_document = api_specs_api.load_document
+    monkeypatch.setattr(api_specs_api, "load_document", lambda content: parses.append(1) or load_document(content))
+
+    response = client.get(f"/api_specs/{api_spec_id}/content", params={"pointer": "/paths/~1users/get"})
+    assert response.status_code == 200
+    assert response.json() == {"/paths/~1users/get": {"summary": "List users"}}
+
+    # 여러 Pointer를 한 번에 조회하고, 파싱한 트리는 내용 해시로 캐시되어 다시 파싱하지 않는다.
+    response = client.get(f"/api_specs/{api_spec_id}/content", params={"pointer": ["/components/schemas/User", "/tags/1/name", ""]})
+    assert response.json() == {"/components/schemas/User": {"type": "object"}, "/tags/1/name": "admin", "": SPEC}
+    assert len(parses) == 1
+
+    # 스펙이 바뀌지 않았으면 304
+    etag = response.headers["ETag"]
+    assert client.get(f"/api_specs/{api_spec_id}/content", params={"pointer": ["/components/schemas/User", "/tags/1/name", ""]}, headers={"If-None-Match": etag}).status_code == 304
+    assert client.get(f"/api_specs/{api_spec_id}/content", params={"pointer": "/tags"}, headers={"If-None-Match": etag}).status_code == 200
+
+    # 수정하면 새 내용에서 조회
+    changed = json.loads(json.dumps(SPEC))
+    changed["paths"]["/users"]["get"]["summary"] = "List all users"
+    client.put(f"/api_specs/{api_spec_id}", json={"spec_content": json.dumps(changed)}, headers={"If-Match": "*"})
+    assert client.get(f"/api_specs/{api_spec_id}/content", params={"pointer": "/paths/~1users/get/summary"}).json() == {"/paths/~1users/get/summary": "List all users"}
+
+
+def test_content_errors(client: TestClient, db_tables):
+    api_spec_id = _create(client)
+    assert client.get(f"/api_specs/{api_spec_id}/content", params={"pointer": "paths"}).status_code == 400
+    assert client.get(f"/api_specs/{api_spec_id}/content").status_code == 422
+    assert client.get(f"/api_specs/{api_spec_id}/content", params={"pointer": "/paths/~1orders"}).status_code == 404
+    assert client.get(f"/api_specs/{api_spec_id}/content", params={"pointer": "/tags/2"}).status_code == 404
+    assert client.get("/api_specs/999/content", params={"pointer": "/paths"}).status_code == 404
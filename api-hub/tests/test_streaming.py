@@ -0,0 +1,35 @@
+# coding: utf-8
+
+import json
+
+from fastapi.testclient import TestClient
+
+
+def test_projects_stream_ndjson(client: TestClient, db_tables, db_mode):
+    project_ids = [
+        client.post("/projects", json={"name": "Project {}".format(i), "created_by": 1}).json()["id"]
+        for i in range(3)
+    ]
+
+    response = client.get("/projects", params={"stream": "ndjson"})
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    lines = response.text.splitlines()
+    assert [json.loads(line)["id"] for line in lines] == project_ids
+
+
+def test_api_specs_stream_json_array(client: TestClient, db_tables, db_mode):
+    response = client.get("/api_specs", params={"stream": "json"})
+    assert response.status_code == 200
+    assert response.json() == []
+
+    api_spec = {"project_id": 1, "version": "1.0.0", "title": "Example", "spec_content": "{}", "access_role": "admin", "created_by": 1}
+    client.post("/api_specs", json=api_spec)
+    client.post("/api_specs", json=dict(api_spec, version="1.0.1"))
+
+    response = client.get("/api_specs", params={"stream": "json"})
+    assert [item["version"] for item in response.json()] == ["1.0.0", "1.0.1"]
+
+
+def test_invalid_stream_format(client: TestClient, db_tables):
+    assert client.get("/projects", params={"stream": "csv"}).status_code == 422
@@ -0,0 +1,77 @@
+# coding: utf-8
+
+from contextlib import contextmanager
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import event
+
+from api_hub.db import database
+
+
+API_SPEC = {"project_id": 1, "version": "1.0.0", "title": "Example", "spec_content": "{\"openapi\": \"3.1.0\"}", "access_role": "admin", "created_by": 1}
+
+
+@contextmanager
+def captured_statements():
+    statements = []
+
+    def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement.split()[0].upper())
+
+    event.listen(database.engine, "before_cursor_execute", _before_cursor_execute)
+    try:
+        yield statements
+    finally:
+        event.remove(database.engine, "before_cursor_execute", _before_cursor_execute)
+
+
+@pytest.mark.parametrize("returning", [True, False], ids=["returning", "reread"])
+def test_api_spec_put_single_statement(client: TestClient, db_tables, monkeypatch, returning):
+    monkeypatch.setattr(database.engine.dialect, "update_returning", returning)
+    api_spec_id = client.post("/api_specs", json=API_SPEC).json()["id"]
+
+    # spec_content와 검색 색인 대상(프로젝트/제목/설명)을 바꾸지 않으면 UPDATE 한 번으로 끝난다
+    with captured_statements() as statements:
+        response = client.put(f"/api_specs/{api_spec_id}", json={"access_role": "viewer"}, headers={"If-Match": "*"})
+    assert response.status_code == 200
+    assert response.json()["access_role"] == "viewer"
+    assert response.json()["version"] == "1.0.0"
+    assert statements == (["UPDATE"] if returning else ["UPDATE", "SELECT"])
+
+    # 제목을 바꾸면 검색 색인의 제목만 함께 수정한다
+    with captured_statements() as statements:
+        response = client.put(f"/api_specs/{api_spec_id}", json={"title": "Renamed"}, headers={"If-Match": "*"})
+    assert response.json()["title"] == "Renamed"
+    assert statements == (["UPDATE", "UPDATE"] if returning else ["UPDATE", "SELECT", "UPDATE"])
+
+    response = client.put(f"/api_specs/{api_spec_id}", json={"spec_content": "changed"}, headers={"If-Match": "*"})
+    assert response.status_code == 200
+    assert response.json()["title"] == "Renamed"
+    assert response.json()["spec_content"] == "changed"
+
+    # 캐시도 무효화되어 수정된 내용이 조회된다
+    assert client.get(f"/api_specs/{api_spec_id}").json()["spec_content"] == "changed"
+
+
+def test_project_put_and_delete(client: TestClient, db_tables):
+    project_id = client.post("/projects", json={"name": "Example", "description": "desc", "created_by": 1}).json()["id"]
+    client.get(f"/projects/{project_id}")
+
+    response = client.put(f"/projects/{project_id}", json={"name": "Renamed"}, headers={"If-Match": "*"})
+    assert response.status_code == 200
+    assert response.json()["name"] == "Renamed"
+    assert response.json()["description"] == "desc"
+    assert client.get(f"/projects/{project_id}").json()["name"] == "Renamed"
+
+    with captured_statements() as statements:
+        client.delete(f"/projects/{project_id}", headers={"If-Match": "*"})
+    assert statements == ["UPDATE"]
+
+    assert client.put(f"/projects/{project_id}", json={"name": "Again"}, headers={"If-Match": "*"}).status_code == 404
+    assert client.delete(f"/projects/{project_id}", headers={"If-Match": "*"}).status_code == 404
+
+
+def test_api_spec_delete_missing(client: TestClient, db_tables):
+    assert client.delete("/api_specs/999", headers={"If-Match": "*"}).status_code == 404
+    assert client.put("/api_specs/999", json={"title": "Missing"}, headers={"If-Match": "*"}).status_code == 404
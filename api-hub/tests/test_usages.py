@@ -0,0 +1,88 @@
+# coding: utf-8
+
+import json
+
+from fastapi.testclient import TestClient
+
+from openapi_server.impl.api_spec_usages import extract_usages
+
+ORDERS = {
+    "openapi": "3.0.0",
+    "paths": {
+        "/orders": {
+            "parameters": [{"$ref": "#/components/parameters/Limit"}],
+            "post": {"requestBody": {"content": {"application/json": {"schema": {"$ref": "#/components/schemas/Order"}}}}},
+        },
+    },
+    "components": {
+        "parameters": {"Limit": {"name": "limit", "in": "query"}},
+        "schemas": {"Order": {"properties": {"buyer": {"$ref": "#/components/schemas/User"}}}, "User": {"type": "object"}},
+    },
+}
+USERS = {
+    "swagger": "2.0",
+    "paths": {"/users": {"get": {"responses": {"200": {"schema": {"$ref": "#/definitions/User"}}}}}},
+    "definitions": {"User": {"type": "object"}},
+}
+
+
+def _create(client, version, content):
+    return client.post("/api_specs", json={"project_id": 1, "version": version, "title": "Example", "spec_content": json.dumps(content), "access_role": "admin", "created_by": 1}).json()["id"]
+
+
+def _usages(client, **params):
+    response = client.get("/api_specs/usages", params=params)
+    assert response.status_code == 200, response.text
+    return [(usage["api_spec_id"], usage["kind"], usage["name"], usage["source"]) for usage in response.json()]
+
+
+def test_extract_usages_normalizes_refs():
+    assert extract_usages(ORDERS) == [
+        ("component", "parameters/Limit", None),
+        ("component", "schemas/Order", None),
+        ("component", "schemas/User", None),
+        ("operation", "POST /orders", None),
+        ("ref", "parameters/Limit", "/orders"),
+        ("ref", "schemas/Order", "POST /orders"),
+        ("ref", "schemas/User", "schemas/Order"),
+    ]
+    # Swagger 2.0의 definitions도 schemas/이름으로 색인한다.
+    assert ("ref", "schemas/User", "GET /users") in extract_usages(USERS)
+    assert extract_usages("plain text") == []
+
+
+def test_usages_endpoint_reads_incrementally_updated_index(client: TestClient, db_tables):
+    orders, users = _create(client, "1.0.0", ORDERS), _create(client, "1.0.1", USERS)
+
+    assert sorted(_usages(client, component="User")) == [
+        (orders, "component", "schemas/User", None),
+        (orders, "ref", "schemas/User", "schemas/Order"),
+        (users, "component", "schemas/User", None),
+        (users, "ref", "schemas/User", "GET /users"),
+    ]
+    assert _usages(client, component="#/components/parameters/Limit") == [
+        (orders, "component", "parameters/Limit", None),
+        (orders, "ref", "parameters/Limit", "/orders"),
+    ]
+    assert _usages(client, operation="post /orders") == [(orders, "operation", "POST /orders", None)]
+
+    # 페이지 나누기
+    first = client.get("/api_specs/usages", params={"component": "User", "limit": 3})
+    assert len(first.json()) == 3
+    rest = client.get("/api_specs/usages", params={"component": "User", "limit": 3, "cursor": first.headers["X-Next-Cursor"]}).json()
+    assert len(rest) == 1
+
+    # 내용이 바뀌면 해당 스펙의 항목만 다시 색인하고, 삭제(보관)하면 색인에서 제거한다.
+    changed = json.loads(json.dumps(USERS))
+    changed["paths"]["/users"]["post"] = changed["paths"]["/users"].pop("get")
+    assert client.put(f"/api_specs/{users}", json={"spec_content": json.dumps(changed)}, headers={"If-Match": "*"}).status_code == 200
+    assert _usages(client, operation="GET /users") == []
+    assert _usages(client, operation="POST /users") == [(users, "operation", "POST /users", None)]
+    assert client.delete(f"/api_specs/{orders}", headers={"If-Match": "*"}).status_code == 200
+    assert {usage[0] for usage in _usages(client, component="schemas/User")} == {users}
+
+
+def test_usages_endpoint_requires_one_query(client: TestClient, db_tables):
+    assert client.get("/api_specs/usages").status_code == 400
+    assert client.get("/api_specs/usages", params={"component": "User", "operation": "GET /users"}).status_code == 400
+    assert client.get("/api_specs/usages", params={"operation": "/users"}).status_code == 400
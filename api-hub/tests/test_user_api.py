@@ -126,7 +126,8 @@ def test_update_user():
         json={
             "username": "updated_user",
             "email": "updated@example.com"
-        }
+        },
+        headers={"If-Match": "*"}
     )
     assert response.status_code == 200
     data = response.json()
@@ -147,7 +148,7 @@ def test_delete_user():
     user_id = create_response.json()["id"]
     
     # 사용자 삭제
-    response = client.delete(f"/users/{user_id}")
+    response = client.delete(f"/users/{user_id}", headers={"If-Match": "*"})
     assert response.status_code == 204
     
     # 삭제된 사용자 조회 시도
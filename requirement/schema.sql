@@ -1,3 +1,5 @@
+-- 새 데이터베이스용 스키마 (모든 테이블을 DROP 후 다시 생성한다. 기존 데이터베이스는 api-hub-init-db 또는 upgrade.sql로 업그레이드)
+
 -- 사용자 테이블
 DROP TABLE IF EXISTS users;
 CREATE TABLE users (
@@ -6,7 +8,8 @@ CREATE TABLE users (
     password_hash VARCHAR(255) NOT NULL comment '사용자 비밀번호',
     full_name VARCHAR(100) NOT NULL comment '사용자 이름',
     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP NOT NULL comment '사용자 생성일',
-    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP comment '사용자 수정일'
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP comment '사용자 수정일',
+    row_version BIGINT NOT NULL DEFAULT 1 comment '행 버전 (수정할 때마다 1 증가, 낙관적 동시성 제어)'
 ) comment '사용자 테이블';
 
 -- 프로젝트 테이블
@@ -19,7 +22,9 @@ CREATE TABLE projects (
     created_by BIGINT comment '프로젝트 생성자 아이디',
     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP NOT NULL comment '프로젝트 생성일',
     updated_by BIGINT comment '프로젝트 수정자 아이디' ,
-    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP comment '프로젝트 수정일'
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP comment '프로젝트 수정일',
+    row_version BIGINT NOT NULL DEFAULT 1 comment '행 버전 (수정할 때마다 1 증가, 낙관적 동시성 제어)',
+    INDEX ix_projects_is_archived_updated_at (is_archived, updated_at, id)
 ) comment '프로젝트 테이블';
 
 -- 프로젝트 멤버 테이블
@@ -30,7 +35,8 @@ CREATE TABLE project_members (
     user_id BIGINT comment '사용자 아이디',
     member_role VARCHAR(20) NOT NULL comment '프로젝트 멤버 역할',
     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP NOT NULL comment '프로젝트 멤버 생성일',
-    UNIQUE(project_id, user_id)
+    UNIQUE(project_id, user_id),
+    INDEX ix_project_members_user_id (user_id)
 ) comment '프로젝트 멤버 테이블';
 
 -- API 문서 테이블
@@ -42,15 +48,58 @@ CREATE TABLE api_specs (
     title VARCHAR(255) NOT NULL comment 'API 문서 제목',
     description TEXT comment 'API 문서 설명',
     spec_content JSON comment 'API 문서 내용',
+    spec_content_hash CHAR(64) comment 'API 문서 내용 SHA-256 해시 (ETag 계산용)',
+    spec_content_wrapped BOOLEAN comment 'API 문서 내용을 {"content": ...}로 감싸 저장했는지 여부',
     is_archived BOOLEAN DEFAULT FALSE comment 'API 문서 삭제 여부',
     access_role VARCHAR(20) NOT NULL comment 'API 문서 접근 역할',
     created_by BIGINT comment 'API 문서 생성자 아이디',
     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP NOT NULL comment 'API 문서 생성일',
     updated_by BIGINT comment '프로젝트 수정자 아이디' ,
     updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP comment 'API 문서 수정일',
-    UNIQUE(project_id, version)
+    row_version BIGINT NOT NULL DEFAULT 1 comment '행 버전 (수정할 때마다 1 증가, 낙관적 동시성 제어)',
+    UNIQUE(project_id, version),
+    INDEX ix_api_specs_project_id_is_archived (project_id, is_archived),
+    INDEX ix_api_specs_is_archived_updated_at (is_archived, updated_at, id)
 ) comment 'API 문서 테이블';
 
+-- API 문서 리비전 테이블 (이전 리비전 대비 JSON Patch, 주기적으로 전체 스냅샷)
+DROP TABLE IF EXISTS api_spec_revisions;
+CREATE TABLE api_spec_revisions (
+    id BIGINT AUTO_INCREMENT PRIMARY KEY comment 'API 문서 리비전 아이디',
+    api_spec_id BIGINT NOT NULL comment 'API 문서 아이디',
+    revision INT NOT NULL comment '리비전 번호 (1부터 증가)',
+    is_snapshot BOOLEAN NOT NULL comment '전체 문서(스냅샷) 여부, 아니면 이전 리비전 대비 JSON Patch',
+    content LONGTEXT NOT NULL comment '스냅샷 JSON 문서 또는 JSON Patch',
+    spec_content_hash CHAR(64) NOT NULL comment '이 리비전의 API 문서 내용 SHA-256 해시',
+    created_by BIGINT comment '리비전 생성자 아이디',
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP NOT NULL comment '리비전 생성일',
+    UNIQUE KEY uq_api_spec_revisions_api_spec_id_revision (api_spec_id, revision)
+) comment 'API 문서 리비전 테이블';
+
+-- API 문서 검색 색인 테이블 (API 문서 내용에서 추출한 검색어, FULLTEXT 인덱스)
+DROP TABLE IF EXISTS api_spec_search;
+CREATE TABLE api_spec_search (
+    api_spec_id BIGINT PRIMARY KEY comment 'API 문서 아이디',
+    project_id BIGINT comment '프로젝트 아이디',
+    title VARCHAR(255) NOT NULL comment 'API 문서 제목',
+    description TEXT comment 'API 문서 설명',
+    terms MEDIUMTEXT NOT NULL comment 'API 문서 내용에서 추출한 검색어 (경로, operationId, 태그, 요약, 스키마 이름)',
+    INDEX ix_api_spec_search_project_id (project_id),
+    FULLTEXT INDEX ix_api_spec_search_fulltext (title, description, terms)
+) comment 'API 문서 검색 색인 테이블';
+
+-- API 문서 사용처 색인 테이블 (API 문서 내용에서 추출한 컴포넌트, 오퍼레이션, $ref 참조)
+DROP TABLE IF EXISTS api_spec_usages;
+CREATE TABLE api_spec_usages (
+    id BIGINT AUTO_INCREMENT PRIMARY KEY comment '사용처 아이디',
+    api_spec_id BIGINT NOT NULL comment 'API 문서 아이디',
+    kind VARCHAR(16) NOT NULL comment 'component, operation, ref',
+    name VARCHAR(512) NOT NULL comment '컴포넌트 이름, 오퍼레이션(METHOD /path) 또는 $ref 대상',
+    source VARCHAR(512) comment '$ref를 포함한 컴포넌트/오퍼레이션/경로',
+    INDEX ix_api_spec_usages_name_kind (name, kind, id),
+    INDEX ix_api_spec_usages_api_spec_id (api_spec_id)
+) comment 'API 문서 사용처 색인 테이블';
+
 -- 프로젝트 Credential 테이블
 DROP TABLE IF EXISTS project_credentials;
 CREATE TABLE project_credentials (
@@ -61,7 +110,10 @@ CREATE TABLE project_credentials (
     api_secret VARCHAR(255) NOT NULL comment 'API 시크릿',
     created_by BIGINT comment 'API 문서 생성자 아이디',
     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP NOT NULL comment '프로젝트 Credential 생성일',
-    expires_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP NOT NULL comment '프로젝트 Credential 만료일 기본 90일'
+    expires_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP NOT NULL comment '프로젝트 Credential 만료일 기본 90일',
+    row_version BIGINT NOT NULL DEFAULT 1 comment '행 버전 (수정할 때마다 1 증가, 낙관적 동시성 제어)',
+    UNIQUE INDEX ix_project_credentials_api_key (api_key),
+    INDEX ix_project_credentials_project_id (project_id)
 ) comment '프로젝트 Credential 테이블';
 
 -- Foreign Key 관계
@@ -72,5 +124,8 @@ ALTER TABLE project_members ADD FOREIGN KEY (user_id) REFERENCES users(id);
 ALTER TABLE api_specs ADD FOREIGN KEY (project_id) REFERENCES projects(id);
 ALTER TABLE api_specs ADD FOREIGN KEY (created_by) REFERENCES users(id);
 ALTER TABLE api_specs ADD FOREIGN KEY (updated_by) REFERENCES users(id);
+ALTER TABLE api_spec_revisions ADD FOREIGN KEY (api_spec_id) REFERENCES api_specs(id);
+ALTER TABLE api_spec_search ADD FOREIGN KEY (api_spec_id) REFERENCES api_specs(id);
+ALTER TABLE api_spec_usages ADD FOREIGN KEY (api_spec_id) REFERENCES api_specs(id);
 ALTER TABLE project_credentials ADD FOREIGN KEY (project_id) REFERENCES projects(id);
 ALTER TABLE project_credentials ADD FOREIGN KEY (created_by) REFERENCES users(id);
\ No newline at end of file
@@ -0,0 +1,23 @@
+-- 기존 데이터베이스 업그레이드 (schema.sql의 DROP/CREATE 없이 데이터를 유지한 채 적용)
+-- api-hub-init-db는 없는 테이블, 컬럼, 인덱스를 자동으로 추가하므로 보통은 이 스크립트를 직접 실행할 필요가 없다.
+-- init-db를 실행할 수 없는 환경에서만 아래 문장을 순서대로 적용한다. (이미 있는 컬럼/인덱스의 문장은 건너뛴다)
+-- 새 테이블(api_spec_revisions, api_spec_search, api_spec_usages)은 schema.sql의 CREATE TABLE 문을 그대로 사용한다.
+-- api_spec_search, api_spec_usages를 직접 만든 경우 기존 API 스펙으로 색인을 채우도록 `api-hub-init-db --reindex`를 실행한다.
+
+-- API 문서 내용 해시와 감싸기 여부 (NULL인 기존 행은 다음 수정 전까지 조회 시 캐시 없이 파싱)
+ALTER TABLE api_specs ADD COLUMN spec_content_hash CHAR(64) comment 'API 문서 내용 SHA-256 해시 (ETag 계산용)';
+ALTER TABLE api_specs ADD COLUMN spec_content_wrapped BOOLEAN comment 'API 문서 내용을 {"content": ...}로 감싸 저장했는지 여부';
+
+-- 행 버전 (기존 행은 1부터 시작)
+ALTER TABLE users ADD COLUMN row_version BIGINT NOT NULL DEFAULT 1 comment '행 버전 (수정할 때마다 1 증가, 낙관적 동시성 제어)';
+ALTER TABLE projects ADD COLUMN row_version BIGINT NOT NULL DEFAULT 1 comment '행 버전 (수정할 때마다 1 증가, 낙관적 동시성 제어)';
+ALTER TABLE api_specs ADD COLUMN row_version BIGINT NOT NULL DEFAULT 1 comment '행 버전 (수정할 때마다 1 증가, 낙관적 동시성 제어)';
+ALTER TABLE project_credentials ADD COLUMN row_version BIGINT NOT NULL DEFAULT 1 comment '행 버전 (수정할 때마다 1 증가, 낙관적 동시성 제어)';
+
+-- 조회 인덱스
+CREATE INDEX ix_projects_is_archived_updated_at ON projects (is_archived, updated_at, id);
+CREATE INDEX ix_project_members_user_id ON project_members (user_id);
+CREATE INDEX ix_api_specs_project_id_is_archived ON api_specs (project_id, is_archived);
+CREATE INDEX ix_api_specs_is_archived_updated_at ON api_specs (is_archived, updated_at, id);
+CREATE UNIQUE INDEX ix_project_credentials_api_key ON project_credentials (api_key);
+CREATE INDEX ix_project_credentials_project_id ON project_credentials (project_id);